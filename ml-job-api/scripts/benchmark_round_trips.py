@@ -0,0 +1,289 @@
+"""
+Benchmark of the database round-trips and latency of the hot job and labelling write paths.
+
+Runs the service methods behind the endpoints against the configured PostgreSQL database,
+counting every statement, BEGIN, COMMIT and ROLLBACK sent over the connection. The records
+it creates are deleted at the end. Run it from the `ml-job-api` directory:
+
+    python -m scripts.benchmark_round_trips --iterations 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from datetime import timedelta
+
+from sqlalchemy import event
+
+from src.common.utils import (
+    generate_uuid,
+    get_current_utc_datetime,
+)
+from src.infrastructure.clients import celery_client
+from src.infrastructure.storages import (
+    lfs_files_dir_path,
+    postgres_async_engine,
+    postgres_async_session_maker,
+)
+from src.jobs.clients import JobCeleryQueue
+from src.jobs.dto import (
+    JobCreateDTO,
+    JobEditDTO,
+    JobEndDTO,
+    JobProgressDTO,
+    JobUpdateDTO,
+)
+from src.jobs.repositories import JobPostgresRepository
+from src.jobs.service import JobService
+from src.jobs.storages import JobLFSStorage
+from src.jobs.types import (
+    EndActionType,
+    JobType,
+    PhaseType,
+)
+from src.labellings.dto import (
+    LabellingCreateDTO,
+    LabellingEditDTO,
+)
+from src.labellings.repositories import LabellingPostgresRepository
+from src.labellings.service import LabellingService
+from src.labellings.types import SpectrumSetType
+from src.settings.jobs import job_settings
+
+
+#
+
+
+class RoundTripCounter:
+    """
+    Counter of the round-trips the engine sends to the database.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the counter with zero round-trips.
+        """
+
+        self.count = 0
+
+    def increment(self, *args, **kwargs) -> None:
+        """
+        Count a round-trip, used as a listener of the engine events.
+        """
+
+        self.count += 1
+
+
+def get_job_service(postgres_async_session) -> JobService:
+    """
+    Construct a JobService as the API dependency does, without the usage index and event broker.
+
+    Parameters:
+        postgres_async_session (AsyncSession): Asynchronous database session for PostgreSQL operations.
+
+    Returns:
+        JobService: Service instance under benchmark.
+    """
+
+    return JobService(
+        JobPostgresRepository(postgres_async_session),
+        JobCeleryQueue(celery_client, job_settings.job_inspect_timeout),
+        JobLFSStorage(lfs_files_dir_path),
+    )
+
+
+async def create_job(phase: PhaseType) -> JobCreateDTO:
+    """
+    Insert a benchmark job record in the given phase.
+
+    Parameters:
+        phase (PhaseType): Phase of the job.
+
+    Returns:
+        JobCreateDTO: The inserted job fields.
+    """
+
+    job_id = generate_uuid()
+    dto = JobCreateDTO(
+        job_id=job_id,
+        dir_path=f"/JOBS/job_benchmark_{job_id}",
+        type=JobType.ACTIVE_ML,
+        phase=phase,
+        label="benchmark",
+        created_at=get_current_utc_datetime(),
+    )
+
+    async with postgres_async_session_maker() as postgres_async_session:
+        await JobPostgresRepository(postgres_async_session).create(dto)
+
+    return dto
+
+
+async def create_labelling(job_id) -> LabellingCreateDTO:
+    """
+    Insert a benchmark labelling record of the given job.
+
+    Parameters:
+        job_id (UUID): Unique identifier of the job of the labelling.
+
+    Returns:
+        LabellingCreateDTO: The inserted labelling fields.
+    """
+
+    dto = LabellingCreateDTO(
+        labelling_id=generate_uuid(),
+        job_id=job_id,
+        spectrum_filename="spec-benchmark.fits",
+        spectrum_set=SpectrumSetType.CANDIDATE,
+        sequence_iteration=1,
+    )
+
+    async with postgres_async_session_maker() as postgres_async_session:
+        await LabellingPostgresRepository(postgres_async_session).create(dto)
+
+    return dto
+
+
+async def measure(
+    name: str,
+    counter: RoundTripCounter,
+    iterations: int,
+    prepare: Callable[[], Awaitable],
+    run: Callable[..., Awaitable],
+) -> None:
+    """
+    Measure the round-trips and latency of a write path and print them.
+
+    Parameters:
+        name (str): Name of the measured endpoint.
+        counter (RoundTripCounter): Counter listening to the events of the engine.
+        iterations (int): Number of measured calls.
+        prepare (Callable[[], Awaitable]): Coroutine function creating the fixture of a single call, not measured.
+        run (Callable[..., Awaitable]): Coroutine function of a session and the fixture running the measured call.
+    """
+
+    round_trips = []
+    latencies = []
+
+    for _ in range(iterations):
+        fixture = await prepare()
+
+        async with postgres_async_session_maker() as postgres_async_session:
+            # Open the connection first, so the checkout is not counted
+            await postgres_async_session.connection()
+            await postgres_async_session.commit()
+
+            counter.count = 0
+            started = time.perf_counter()
+
+            await run(postgres_async_session, fixture)
+
+            latencies.append(time.perf_counter() - started)
+            round_trips.append(counter.count)
+
+    print(
+        f"{name:<40} round-trips={statistics.mean(round_trips):>5.1f} "
+        f"latency p50={statistics.median(latencies) * 1000:>7.2f} ms "
+        f"max={max(latencies) * 1000:>7.2f} ms"
+    )
+
+
+#
+
+
+async def main(iterations: int) -> None:
+    """
+    Run the benchmark of every hot write path.
+
+    Parameters:
+        iterations (int): Number of measured calls per write path.
+    """
+
+    counter = RoundTripCounter()
+    sync_engine = postgres_async_engine.sync_engine
+    job_ids = []
+
+    async def prepare_processing_job() -> JobCreateDTO:
+        dto = await create_job(PhaseType.PROCESSING)
+        job_ids.append(dto.job_id)
+
+        return dto
+
+    async def prepare_ended_job() -> JobCreateDTO:
+        dto = await create_job(PhaseType.ERROR)
+        job_ids.append(dto.job_id)
+
+        return dto
+
+    async def prepare_labelling() -> LabellingCreateDTO:
+        job_dto = await prepare_processing_job()
+
+        return await create_labelling(job_dto.job_id)
+
+    async def end_job(postgres_async_session, dto: JobCreateDTO) -> None:
+        started_at = get_current_utc_datetime()
+        end_dto = JobEndDTO(started_at=started_at, ended_at=started_at + timedelta(seconds=1))
+
+        await get_job_service(postgres_async_session).manage_job_by_job_id_and_end_action(
+            dto.job_id, EndActionType.COMPLETE, end_dto
+        )
+
+    async def report_progress(postgres_async_session, dto: JobCreateDTO) -> None:
+        await get_job_service(postgres_async_session).report_job_progress_by_job_id(
+            dto.job_id, JobProgressDTO(stage="benchmark")
+        )
+
+    async def edit_job(postgres_async_session, dto: JobCreateDTO) -> None:
+        await get_job_service(postgres_async_session).edit_job_by_job_id(
+            dto.job_id, JobEditDTO(description="Edited by the benchmark")
+        )
+
+    async def remove_job(postgres_async_session, dto: JobCreateDTO) -> None:
+        await get_job_service(postgres_async_session).remove_job_by_job_id(dto.job_id)
+
+    async def edit_labelling(postgres_async_session, dto: LabellingCreateDTO) -> None:
+        labelling_service = LabellingService(
+            LabellingPostgresRepository(postgres_async_session), get_job_service(postgres_async_session)
+        )
+
+        await labelling_service.edit_labelling_by_labelling_id(dto.labelling_id, LabellingEditDTO(user_label="STAR"))
+
+    for event_name in ("before_cursor_execute", "begin", "commit", "rollback"):
+        event.listen(sync_engine, event_name, counter.increment)
+
+    try:
+        await measure("POST /jobs/{id}/end/COMPLETE", counter, iterations, prepare_processing_job, end_job)
+        await measure("POST /jobs/{id}/progress", counter, iterations, prepare_processing_job, report_progress)
+        await measure("PATCH /jobs/{id}", counter, iterations, prepare_processing_job, edit_job)
+        await measure("DELETE /jobs/{id}", counter, iterations, prepare_ended_job, remove_job)
+        await measure("PATCH /labellings/{id}", counter, iterations, prepare_labelling, edit_labelling)
+
+    finally:
+        for event_name in ("before_cursor_execute", "begin", "commit", "rollback"):
+            event.remove(sync_engine, event_name, counter.increment)
+
+        async with postgres_async_session_maker() as postgres_async_session:
+            job_repository = JobPostgresRepository(postgres_async_session)
+
+            for job_id in job_ids:
+                try:
+                    await job_repository.update_by_job_id(job_id, JobUpdateDTO(phase=PhaseType.ERROR))
+                    await job_repository.delete_by_job_id_and_phases(job_id, {PhaseType.ERROR})
+
+                except Exception:
+                    pass
+
+        await postgres_async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the database round-trips of the hot write paths.")
+    parser.add_argument("--iterations", type=int, default=100, help="Number of measured calls per write path")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations))
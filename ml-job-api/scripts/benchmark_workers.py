@@ -0,0 +1,163 @@
+"""
+Benchmark of the request throughput of a running API, and check of its job phase transitions under races.
+
+Start the API with a given number of Uvicorn workers, e.g. `api_workers=1` and then `api_workers=8`,
+and compare the reported throughput. The race check creates jobs and removes each of them with
+concurrent requests spread over the workers, exactly one of which must succeed. Run it from the
+`ml-job-api` directory:
+
+    python -m scripts.benchmark_workers --url http://localhost:8000/api --concurrency 32 --duration 10
+"""
+
+import argparse
+import http.client
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+
+#
+
+
+class Client:
+    """
+    Minimal keep-alive HTTP client of the API, one per thread.
+    """
+
+    def __init__(self, url: str) -> None:
+        """
+        Initialize a client of the API under the given base URL.
+
+        Parameters:
+            url (str): Base URL of the API, e.g. "http://localhost:8000/api".
+        """
+
+        split_url = urlsplit(url)
+
+        self.host = split_url.netloc
+        self.base_path = split_url.path.rstrip("/")
+        self.connection = http.client.HTTPConnection(self.host, timeout=30)
+
+    def request(self, method: str, path: str, body: dict | None = None) -> tuple[int, bytes]:
+        """
+        Send a request and read its whole response, reconnecting once if the connection was closed.
+
+        Parameters:
+            method (str): HTTP method of the request.
+            path (str): Path of the request under the base URL.
+            body (dict | None): Optional JSON body of the request.
+
+        Returns:
+            tuple[int, bytes]: Status code and body of the response.
+        """
+
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        payload = json.dumps(body) if body is not None else None
+
+        for attempt in range(2):
+            try:
+                self.connection.request(method, f"{self.base_path}{path}", payload, headers)
+                response = self.connection.getresponse()
+
+                return response.status, response.read()
+
+            except (ConnectionError, http.client.HTTPException):
+                self.connection.close()
+                self.connection = http.client.HTTPConnection(self.host, timeout=30)
+
+                if attempt:
+                    raise
+
+
+def measure_throughput(url: str, concurrency: int, duration: float, path: str) -> None:
+    """
+    Send requests to an endpoint from concurrent clients for a while and print the throughput and latency.
+
+    Parameters:
+        url (str): Base URL of the API.
+        concurrency (int): Number of concurrent clients.
+        duration (float): Seconds the endpoint is loaded for.
+        path (str): Path of the loaded GET endpoint.
+    """
+
+    deadline = time.perf_counter() + duration
+
+    def load() -> tuple[list[float], int]:
+        client = Client(url)
+        latencies = []
+        errors = 0
+
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            status, _ = client.request("GET", path)
+            latencies.append(time.perf_counter() - started)
+            errors += status >= 400
+
+        return latencies, errors
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        results = list(executor.map(lambda _: load(), range(concurrency)))
+
+    latencies = sorted(latency for thread_latencies, _ in results for latency in thread_latencies)
+    errors = sum(thread_errors for _, thread_errors in results)
+
+    print(
+        f"GET {path:<36} throughput={len(latencies) / duration:>8.1f} req/s "
+        f"p50={statistics.median(latencies) * 1000:>7.2f} ms "
+        f"p99={latencies[int(len(latencies) * 0.99)] * 1000:>7.2f} ms errors={errors}"
+    )
+
+
+def check_races(url: str, concurrency: int, races: int) -> None:
+    """
+    Remove new jobs with concurrent requests and print the number of races not won by exactly one request.
+
+    Parameters:
+        url (str): Base URL of the API.
+        concurrency (int): Number of concurrent requests per job.
+        races (int): Number of jobs raced on.
+    """
+
+    violations = 0
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        clients = [Client(url) for _ in range(concurrency)]
+
+        for _ in range(races):
+            status, body = clients[0].request("POST", "/jobs/", {"type": "DATA_PREPROCESSING", "label": "benchmark"})
+
+            if status != 201:
+                raise RuntimeError(f"Cannot create benchmark job, status={status}.")
+
+            job_id = json.loads(body)["job_id"]
+            barrier = threading.Barrier(concurrency)
+
+            def remove(client: Client) -> int:
+                barrier.wait()
+                status, _ = client.request("DELETE", f"/jobs/{job_id}")
+
+                return status
+
+            statuses = list(executor.map(remove, clients))
+            violations += statuses.count(204) != 1 or any(status not in (204, 404, 409) for status in statuses)
+
+    print(f"DELETE /jobs/{{id}} x{concurrency:<26} races={races} violations={violations}")
+
+
+#
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the throughput and race safety of a running API.")
+    parser.add_argument("--url", default="http://localhost:8000/api", help="Base URL of the API")
+    parser.add_argument("--concurrency", type=int, default=32, help="Number of concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds each endpoint is loaded for")
+    parser.add_argument("--races", type=int, default=20, help="Number of jobs removed by concurrent requests")
+    args = parser.parse_args()
+
+    measure_throughput(args.url, args.concurrency, args.duration, "/jobs/?limit=20&count=false")
+    measure_throughput(args.url, args.concurrency, args.duration, "/jobs/?limit=20")
+    check_races(args.url, args.concurrency, args.races)
@@ -6,8 +6,8 @@ set -e
 # Run all pending database migrations
 alembic upgrade head
 
-# Launch the FastAPI application via Gunicorn with Uvicorn workers
+# Launch the FastAPI application via Gunicorn with Uvicorn workers, one per CPU core unless configured
 exec gunicorn "src.main:app" \
     -k uvicorn.workers.UvicornWorker \
     --bind 0.0.0.0:8000 \
-    --workers 1
+    --workers "${api_workers:-$(nproc)}"
@@ -0,0 +1,391 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterator,
+)
+from contextlib import contextmanager
+from typing import Any
+
+
+#
+
+
+class LRUCache:
+    """
+    Thread-safe in-process cache evicting least recently used values to stay within a byte budget.
+
+    Each value is stored with a version, e.g. the modification time, inode and size of its source file.
+    A lookup with a different version invalidates the stored value, so stale values are never returned.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Initialize an empty cache.
+
+        Parameters:
+            max_size (int): Maximum total size in bytes of the cached values, zero disables the cache.
+        """
+
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[Hashable, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Hashable) -> Any | None:
+        """
+        Get a cached value and mark it as most recently used.
+
+        Parameters:
+            key (Hashable): The key of the value.
+            version (Hashable): The current version of the value source.
+
+        Returns:
+            Any | None: The cached value, or None if it is missing or stale.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] != version:
+                if entry is not None:
+                    self._remove(key)
+
+                self.misses += 1
+
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry[1]
+
+    def set(self, key: Hashable, version: Hashable, value: Any, size: int) -> None:
+        """
+        Cache a value, evicting least recently used values beyond the byte budget.
+
+        Values larger than the whole budget are not cached.
+
+        Parameters:
+            key (Hashable): The key of the value.
+            version (Hashable): The version of the value source.
+            value (Any): The value to cache.
+            size (int): Approximate size of the value in bytes.
+        """
+
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (version, value, size)
+            self.size += size
+
+            while self.size > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        """
+        Remove a cached value, the caller must hold the lock.
+
+        Parameters:
+            key (Hashable): The key of the value.
+        """
+
+        _, _, size = self._entries.pop(key)
+        self.size -= size
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get the usage statistics of the cache.
+
+        Returns:
+            dict[str, int]: Numbers of hits, misses, evictions and entries, and current and maximum size in bytes.
+        """
+
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                size=self.size,
+                max_size=self.max_size,
+            )
+
+
+class _HandleEntry:
+    """
+    Cached handle with the lock serializing its use and the number of threads using or waiting for it.
+
+    A handle removed from the cache while in use is closed by the last thread releasing it.
+    """
+
+    def __init__(self, version: Hashable, handle: Any) -> None:
+        """
+        Initialize an entry of a freshly opened handle.
+
+        Parameters:
+            version (Hashable): The version of the file of the handle.
+            handle (Any): The open handle.
+        """
+
+        self.version = version
+        self.handle = handle
+        self.lock = threading.Lock()
+        self.users = 0
+        self.removed = False
+
+
+class HandleCache:
+    """
+    Thread-safe in-process cache keeping a bounded number of open file handles, closing least recently used ones.
+
+    Each handle is stored with a version, e.g. the modification time, inode and size of its file.
+    A lookup with a different version drops the stored handle and opens the file again. The lock of
+    the cache is only held to look up and insert handles: a missing file is opened outside of it,
+    once, while other threads asking for the same file wait, and each handle is used under its own
+    lock, so different files are read in parallel. A handle is never closed while a thread uses it.
+    """
+
+    def __init__(self, max_entries: int, close: Callable[[Any], None]) -> None:
+        """
+        Initialize an empty cache.
+
+        Parameters:
+            max_entries (int): Maximum number of open handles, zero disables the cache.
+            close (Callable[[Any], None]): Function closing a handle that is evicted or stale.
+        """
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._close = close
+        self._entries: OrderedDict[Hashable, _HandleEntry] = OrderedDict()
+        self._openings: dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def use(self, key: Hashable, version: Hashable, opener: Callable[[], Any]) -> Iterator[Any]:
+        """
+        Use a cached handle, opening and caching it if it is missing or stale.
+
+        Parameters:
+            key (Hashable): The key of the handle, e.g. the path of its file.
+            version (Hashable): The current version of the file.
+            opener (Callable[[], Any]): Function opening the handle.
+
+        Returns:
+            Iterator[Any]: Context yielding the open handle.
+        """
+
+        if not self.max_entries:
+            with self._lock:
+                self.misses += 1
+
+            handle = opener()
+
+            try:
+                yield handle
+
+            finally:
+                self._close(handle)
+
+            return
+
+        entry = self._acquire(key, version, opener)
+
+        try:
+            with entry.lock:
+                yield entry.handle
+
+        finally:
+            with self._lock:
+                entry.users -= 1
+
+                if entry.removed and not entry.users:
+                    self._close(entry.handle)
+
+    def _acquire(self, key: Hashable, version: Hashable, opener: Callable[[], Any]) -> _HandleEntry:
+        """
+        Look up a cached handle and register its use, opening the file if it is missing or stale.
+
+        Parameters:
+            key (Hashable): The key of the handle.
+            version (Hashable): The current version of the file.
+            opener (Callable[[], Any]): Function opening the handle.
+
+        Returns:
+            _HandleEntry: The entry of the handle, to be released by the caller.
+        """
+
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+
+                if entry is not None and entry.version == version:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    entry.users += 1
+
+                    return entry
+
+                opening = self._openings.get(key)
+
+                if opening is None:
+                    if entry is not None:
+                        self._remove(key)
+
+                    opening = self._openings[key] = threading.Event()
+                    self.misses += 1
+
+                    break
+
+            # Another thread is opening the file, look it up again once it is done
+            opening.wait()
+
+        try:
+            handle = opener()
+
+        except BaseException:
+            with self._lock:
+                del self._openings[key]
+
+            opening.set()
+
+            raise
+
+        entry = _HandleEntry(version, handle)
+        entry.users += 1
+
+        with self._lock:
+            self._entries[key] = entry
+            del self._openings[key]
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+        opening.set()
+
+        return entry
+
+    def _remove(self, key: Hashable) -> None:
+        """
+        Remove a cached handle, closing it unless in use, the caller must hold the lock.
+
+        Parameters:
+            key (Hashable): The key of the handle.
+        """
+
+        entry = self._entries.pop(key)
+        entry.removed = True
+
+        if not entry.users:
+            self._close(entry.handle)
+
+    def clear(self) -> None:
+        """
+        Remove all cached handles, closing those not in use at once and the others once released.
+        """
+
+        with self._lock:
+            while self._entries:
+                self._remove(next(iter(self._entries)))
+
+
+class JSONDiskCache:
+    """
+    On-disk cache of JSON-serializable values shared by all processes mounting the same directory.
+
+    Values are stored with their version and written atomically, so concurrent readers never
+    observe partially written files. There is no eviction, the directory is meant to be pruned externally.
+    """
+
+    def __init__(self, dir_path: str) -> None:
+        """
+        Initialize the cache in the given directory, creating it if needed.
+
+        Parameters:
+            dir_path (str): Absolute path to the cache directory.
+        """
+
+        self.dir_path = dir_path
+
+        os.makedirs(dir_path, exist_ok=True)
+
+    def _get_file_path(self, key: str) -> str:
+        """
+        Compute the path of the file storing the value of a key.
+
+        Parameters:
+            key (str): The key of the value.
+
+        Returns:
+            str: Absolute path of the cache file.
+        """
+
+        digest = hashlib.sha256(key.encode()).hexdigest()
+
+        return os.path.join(self.dir_path, f"{digest}.json")
+
+    def get(self, key: str, version: list[Any]) -> Any | None:
+        """
+        Get a cached value.
+
+        Parameters:
+            key (str): The key of the value.
+            version (list[Any]): The current version of the value source.
+
+        Returns:
+            Any | None: The cached value, or None if it is missing, stale or unreadable.
+        """
+
+        try:
+            with open(self._get_file_path(key), "r", encoding="utf-8") as file_reader:
+                entry = json.load(file_reader)
+
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("key") != key or entry.get("version") != version:
+            return None
+
+        return entry.get("value")
+
+    def set(self, key: str, version: list[Any], value: Any) -> None:
+        """
+        Cache a value, failures to write are ignored as the cache is only an optimization.
+
+        Parameters:
+            key (str): The key of the value.
+            version (list[Any]): The version of the value source.
+            value (Any): The JSON-serializable value to cache.
+        """
+
+        file_path = self._get_file_path(key)
+        tmp_file_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            with open(tmp_file_path, "w", encoding="utf-8") as file_writer:
+                json.dump(dict(key=key, version=version, value=value), file_writer)
+
+            os.replace(tmp_file_path, file_path)
+
+        except (OSError, TypeError, ValueError):
+            try:
+                os.remove(tmp_file_path)
+
+            except OSError:
+                pass
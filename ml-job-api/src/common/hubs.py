@@ -0,0 +1,66 @@
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+#
+
+
+class BroadcastHub:
+    """
+    In-process fan-out of published messages to every current subscriber of the event loop.
+
+    Each subscriber reads from its own bounded queue, so a slow subscriber never blocks publishers
+    or other subscribers. A subscriber falling behind by `max_queue_size` messages is dropped,
+    and receives None once it has read the messages still queued. Messages must be published
+    from the thread running the event loop.
+    """
+
+    def __init__(self, max_queue_size: int) -> None:
+        """
+        Initialize a hub without subscribers.
+
+        Parameters:
+            max_queue_size (int): Maximum number of messages queued for a single subscriber.
+        """
+
+        self.max_queue_size = max_queue_size
+        self._queues: set[asyncio.Queue] = set()
+
+    def publish(self, message: Any) -> None:
+        """
+        Queue a message for every current subscriber, dropping the subscribers whose queue is full.
+
+        Parameters:
+            message (Any): The message, shared by all subscribers, so it must not be mutated.
+        """
+
+        for queue in list(self._queues):
+            try:
+                queue.put_nowait(message)
+
+            except asyncio.QueueFull:
+                self._queues.discard(queue)
+
+                # Oldest message makes room for the end of the subscription
+                queue.get_nowait()
+                queue.put_nowait(None)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue]:
+        """
+        Subscribe to the messages published until the context exits.
+
+        Returns:
+            Iterator[asyncio.Queue]: Queue of the published messages, None once the subscriber is dropped.
+        """
+
+        queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._queues.add(queue)
+
+        try:
+            yield queue
+
+        finally:
+            self._queues.discard(queue)
@@ -0,0 +1,62 @@
+import hashlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import (
+    func,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+#
+
+
+class PostgresAdvisoryLock:
+    """
+    Session-level PostgreSQL advisory lock electing a single holder among all processes sharing the database.
+
+    The lock is held on a dedicated connection in autocommit mode, so no transaction stays open while
+    it is held, and it is released by PostgreSQL itself if the holding process dies. Used to run
+    a periodic task in only one of several API workers.
+    """
+
+    def __init__(self, engine: AsyncEngine, name: str) -> None:
+        """
+        Initialize the lock of the given name.
+
+        Parameters:
+            engine (AsyncEngine): Engine of the database the lock is taken in.
+            name (str): Name of the lock, hashed to the 64-bit key of the advisory lock.
+        """
+
+        self.engine = engine
+        self.name = name
+        self.key = int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+
+    @asynccontextmanager
+    async def try_hold(self) -> AsyncIterator[bool]:
+        """
+        Try to take the lock without waiting, and hold it until the context exits.
+
+        Returns:
+            AsyncIterator[bool]: Whether the lock was taken, False if another process holds it.
+        """
+
+        async with self.engine.connect() as connection:
+            connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            acquired = await connection.scalar(select(func.pg_try_advisory_lock(self.key)))
+
+            try:
+                yield bool(acquired)
+
+            finally:
+                if acquired:
+                    try:
+                        await connection.scalar(select(func.pg_advisory_unlock(self.key)))
+
+                    except BaseException:
+                        # Never return a connection possibly still holding the lock to the pool
+                        await connection.invalidate()
+
+                        raise
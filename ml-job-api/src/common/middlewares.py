@@ -0,0 +1,108 @@
+import zlib
+
+from starlette.exceptions import HTTPException
+from starlette.status import (
+    HTTP_400_BAD_REQUEST,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+)
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+
+#
+
+
+class GZipRequestMiddleware:
+    """
+    Pure ASGI middleware transparently decompressing gzip-encoded request bodies.
+
+    Requests with the `Content-Encoding: gzip` header are decompressed incrementally, chunk by chunk,
+    as the application receives them, so streamed bodies are never buffered as a whole.
+    Every chunk is decompressed up to the remaining allowance only, so a small compressed body
+    expanding past `max_size` bytes is rejected before it is expanded in memory.
+    The `Content-Encoding` and `Content-Length` headers are removed from the request scope.
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int) -> None:
+        """
+        Wrap an ASGI application.
+
+        Parameters:
+            app (ASGIApp): The wrapped ASGI application.
+            max_size (int): Maximum number of bytes a request body may decompress to.
+        """
+
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI call, decompressing the request body when it is gzip-encoded.
+
+        Parameters:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+
+        if headers.get(b"content-encoding", b"").strip().lower() != b"gzip":
+            await self.app(scope, receive, send)
+            return
+
+        scope = dict(scope)
+        scope["headers"] = [
+            (name, value) for name, value in scope["headers"] if name not in (b"content-encoding", b"content-length")
+        ]
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        decompressed_size = 0
+
+        async def receive_decompressed() -> Message:
+            nonlocal decompressed_size
+
+            message = await receive()
+
+            if message["type"] != "http.request":
+                return message
+
+            more_body = message.get("more_body", False)
+            data = message.get("body", b"")
+            chunks = []
+
+            try:
+                while True:
+                    # Decompress at most one byte past the allowance, enough to detect an oversized body
+                    chunk = decompressor.decompress(data, self.max_size - decompressed_size + 1)
+                    decompressed_size += len(chunk)
+
+                    if decompressed_size > self.max_size:
+                        raise HTTPException(
+                            status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail=f"Cannot decompress gzip request body larger than {self.max_size} bytes.",
+                        )
+
+                    chunks.append(chunk)
+                    data = decompressor.unconsumed_tail
+
+                    if not data:
+                        break
+
+                if not more_body:
+                    chunks.append(decompressor.flush())
+
+            except zlib.error:
+                raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Cannot decompress gzip request body.")
+
+            return {"type": "http.request", "body": b"".join(chunks), "more_body": more_body}
+
+        await self.app(scope, receive_decompressed, send)
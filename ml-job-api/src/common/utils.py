@@ -1,11 +1,21 @@
+import base64
+import json
 import os
+from collections.abc import AsyncIterator
 from datetime import (
     datetime,
     timezone,
 )
+from email.utils import (
+    format_datetime,
+    parsedate_to_datetime,
+)
+from typing import Any
 from uuid import (
+    NAMESPACE_URL,
     UUID,
     uuid4,
+    uuid5,
 )
 
 
@@ -23,6 +33,20 @@ def generate_uuid() -> UUID:
     return uuid4()
 
 
+def generate_deterministic_uuid(name: str) -> UUID:
+    """
+    Generate a UUID5 derived from the given name, so the same name always yields the same UUID.
+
+    Parameters:
+        name (str): Name to derive the UUID from, e.g. an idempotency key with an item index.
+
+    Returns:
+        UUID: A version-5 UUID.
+    """
+
+    return uuid5(NAMESPACE_URL, name)
+
+
 #
 
 
@@ -103,3 +127,182 @@ def get_norm_path(parent_path: str, prefix: str | None = None, child_name: str |
     norm_path = os.path.normpath(path)
 
     return norm_path
+
+
+#
+
+
+async def iterate_lines(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Split an asynchronous stream of byte chunks into non-empty lines.
+
+    Parameters:
+        stream (AsyncIterator[bytes]): Stream of byte chunks with arbitrary boundaries.
+
+    Returns:
+        AsyncIterator[bytes]: Stream of lines without line terminators.
+    """
+
+    buffer = b""
+
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+
+        for line in lines:
+            if line.strip():
+                yield line
+
+    if buffer.strip():
+        yield buffer
+
+
+#
+
+
+def encode_cursor(position: list[Any]) -> str:
+    """
+    Encode the position of a listed entry into an opaque URL-safe cursor.
+
+    Parameters:
+        position (list[Any]): JSON-serializable position of the entry in the listing order.
+
+    Returns:
+        str: The cursor.
+    """
+
+    return base64.urlsafe_b64encode(json.dumps(position, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list[Any]:
+    """
+    Decode a cursor created by `encode_cursor`.
+
+    Parameters:
+        cursor (str): The cursor.
+
+    Returns:
+        list[Any]: The position of the entry in the listing order.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+    except (ValueError, TypeError) as e:
+        raise ValueError("Cursor is malformed.") from e
+
+    if not isinstance(position, list):
+        raise ValueError("Cursor is malformed.")
+
+    return position
+
+
+#
+
+
+def negotiate_media_type(accept: str | None, media_types: list[str]) -> str | None:
+    """
+    Choose the response media type best matching the `Accept` header of a request.
+
+    Media ranges are weighed by their `q` parameter, and exact media types take precedence over
+    wildcards of equal weight. Ties are resolved by the order of `media_types`.
+
+    Parameters:
+        accept (str | None): Value of the `Accept` header, any media type is acceptable if omitted.
+        media_types (list[str]): Media types the response can be rendered as, in order of preference.
+
+    Returns:
+        str | None: The chosen media type, or None if none of `media_types` is acceptable.
+    """
+
+    if not accept:
+        return media_types[0]
+
+    weights = {}
+
+    for media_range in accept.split(","):
+        media_type, *media_params = [part.strip() for part in media_range.split(";")]
+        weight = 1.0
+
+        for media_param in media_params:
+            key, _, value = media_param.partition("=")
+
+            if key.strip() == "q":
+                try:
+                    weight = float(value)
+
+                except ValueError:
+                    weight = 0.0
+
+        weights[media_type.lower()] = weight
+
+    best_media_type, best_rank = None, (0.0, 0)
+
+    for media_type in media_types:
+        main_type = media_type.split("/")[0]
+
+        for media_range, specificity in ((media_type, 2), (f"{main_type}/*", 1), ("*/*", 0)):
+            if media_range in weights:
+                rank = (weights[media_range], specificity)
+
+                if rank[0] > 0 and rank > best_rank:
+                    best_media_type, best_rank = media_type, rank
+
+                break
+
+    return best_media_type
+
+
+def get_http_datetime(value: datetime) -> str:
+    """
+    Format a datetime as an HTTP date, e.g. for the `Last-Modified` header.
+
+    Parameters:
+        value (datetime): A timezone-aware datetime.
+
+    Returns:
+        str: The datetime in the IMF-fixdate format, e.g. "Wed, 28 May 2025 09:30:00 GMT".
+    """
+
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(if_none_match: str | None, if_modified_since: str | None, etag: str, modified_at: datetime) -> bool:
+    """
+    Evaluate the conditional headers of a GET request against the current representation of a resource.
+
+    `If-None-Match` takes precedence over `If-Modified-Since`, and entity tags are compared weakly.
+    An unparsable `If-Modified-Since` date is ignored.
+
+    Parameters:
+        if_none_match (str | None): Value of the `If-None-Match` header.
+        if_modified_since (str | None): Value of the `If-Modified-Since` header.
+        etag (str): The quoted entity tag of the current representation.
+        modified_at (datetime): Timezone-aware datetime the resource was last modified.
+
+    Returns:
+        bool: True if the client already holds the current representation and 304 should be returned.
+    """
+
+    if if_none_match is not None:
+        entity_tags = [entity_tag.strip().removeprefix("W/") for entity_tag in if_none_match.split(",")]
+
+        return "*" in entity_tags or etag.removeprefix("W/") in entity_tags
+
+    if if_modified_since is not None:
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since)
+
+        except (TypeError, ValueError):
+            return False
+
+        if modified_since.tzinfo is None:
+            modified_since = modified_since.replace(tzinfo=timezone.utc)
+
+        # HTTP dates have a precision of whole seconds
+        return modified_at.replace(microsecond=0) <= modified_since
+
+    return False
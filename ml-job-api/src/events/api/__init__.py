@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+from src.events.api.rest import rest_router
+
+
+events_api_router = APIRouter(prefix="/events")
+
+events_api_router.include_router(rest_router)
+
+
+__all__ = [
+    "events_api_router",
+]
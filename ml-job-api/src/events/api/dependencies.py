@@ -0,0 +1,27 @@
+from src.events.brokers import EventPostgresBroker
+from src.events.service import EventService
+from src.infrastructure.hubs import event_hub
+from src.infrastructure.storages import postgres_async_engine
+from src.settings.events import event_settings
+
+
+def get_broker_using_postgres() -> EventPostgresBroker:
+    """
+    Construct an EventPostgresBroker publishing change events through PostgreSQL notifications.
+
+    Returns:
+        EventPostgresBroker: Broker delivering change events to all API workers on the configured channel.
+    """
+
+    return EventPostgresBroker(postgres_async_engine, event_settings.event_channel)
+
+
+def get_service_using_hub() -> EventService:
+    """
+    Construct an EventService streaming the change events of the in-process event hub.
+
+    Returns:
+        EventService: Service instance for streaming job and file change events to clients.
+    """
+
+    return EventService(event_hub, event_settings.event_heartbeat_interval)
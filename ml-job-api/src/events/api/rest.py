@@ -0,0 +1,55 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+    Query,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from fastapi_restful.cbv import cbv
+
+from src.events.api.dependencies import get_service_using_hub
+from src.events.params import EventStreamParams
+from src.events.resources import rest_resources
+from src.events.service import EventService
+
+
+rest_router = APIRouter(
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": rest_resources["HTTP_422"]},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": rest_resources["HTTP_500"]},
+    },
+)
+
+
+@cbv(rest_router)
+class EventRESTRouter:
+    """
+    RESTful API router for streaming change events.
+    """
+
+    service: EventService = Depends(get_service_using_hub)
+
+    @rest_router.get(
+        path="/",
+        tags=["Events: Stream"],
+        response_class=StreamingResponse,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {
+                "description": rest_resources["stream"]["HTTP_200"],
+                "content": {"text/event-stream": {}},
+            },
+        },
+        summary=rest_resources["stream"]["SUMMARY"],
+        description=rest_resources["stream"]["DESCRIPTION"],
+    )
+    async def stream_events(
+        self,
+        params: EventStreamParams = Query(title="Selection of the streamed events"),
+    ) -> StreamingResponse:
+        # Proxies must neither cache nor buffer the stream, so events reach clients at once
+        return StreamingResponse(
+            self.service.stream_events(params),
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            media_type="text/event-stream",
+        )
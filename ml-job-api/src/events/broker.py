@@ -0,0 +1,46 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import Callable
+
+from src.events.entity import EventEntity
+
+
+class EventBroker(ABC):
+    """
+    Broker interface for delivering change events published by any API worker to all API workers.
+    """
+
+    @abstractmethod
+    async def publish(self, entity: EventEntity) -> None:
+        """
+        Publish a change event to all API workers.
+
+        Parameters:
+            entity (EventEntity): The change event.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def publish_batch(self, entities: list[EventEntity]) -> None:
+        """
+        Publish multiple change events to all API workers at once.
+
+        Parameters:
+            entities (list[EventEntity]): The change events, delivered in their order.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def listen(self, callback: Callable[[EventEntity], None]) -> None:
+        """
+        Deliver the change events published by any API worker to a callback, until the broker connection is lost.
+
+        Parameters:
+            callback (Callable[[EventEntity], None]): Function called with every published event.
+        """
+
+        raise NotImplementedError
@@ -0,0 +1,6 @@
+from src.events.brokers.postgres import EventPostgresBroker
+
+
+__all__ = [
+    "EventPostgresBroker",
+]
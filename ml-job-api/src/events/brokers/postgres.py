@@ -0,0 +1,103 @@
+import asyncio
+import logging
+from collections.abc import Callable
+
+from pydantic import ValidationError
+from sqlalchemy import (
+    func,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.events.broker import EventBroker
+from src.events.entity import EventEntity
+
+
+logger = logging.getLogger(__name__)
+
+
+class EventPostgresBroker(EventBroker):
+    """
+    PostgreSQL-backed implementation of EventBroker using LISTEN/NOTIFY.
+
+    Events are published as JSON payloads of notifications on a single channel, so they reach every
+    API worker connected to the database without another message broker. Each listening API worker
+    holds one dedicated connection, whatever the number of its streaming clients.
+    """
+
+    def __init__(self, postgres_async_engine: AsyncEngine, channel: str) -> None:
+        """
+        Initialize the broker with an async SQLAlchemy engine.
+
+        Parameters:
+            postgres_async_engine (AsyncEngine): An AsyncEngine bound to the PostgreSQL database.
+            channel (str): Name of the notification channel.
+        """
+
+        self.engine = postgres_async_engine
+        self.channel = channel
+
+    async def publish(self, entity: EventEntity) -> None:
+        """
+        Send a change event as a notification, delivered to the listeners once the statement commits.
+
+        Parameters:
+            entity (EventEntity): The change event.
+        """
+
+        async with self.engine.begin() as connection:
+            await connection.execute(select(func.pg_notify(self.channel, entity.model_dump_json(exclude_none=True))))
+
+    async def publish_batch(self, entities: list[EventEntity]) -> None:
+        """
+        Send multiple change events as notifications of a single transaction, delivered together once it commits.
+
+        Parameters:
+            entities (list[EventEntity]): The change events, delivered in their order.
+        """
+
+        if not entities:
+            return
+
+        async with self.engine.begin() as connection:
+            for entity in entities:
+                await connection.execute(
+                    select(func.pg_notify(self.channel, entity.model_dump_json(exclude_none=True)))
+                )
+
+    async def listen(self, callback: Callable[[EventEntity], None]) -> None:
+        """
+        Listen on the notification channel with a dedicated connection, until the connection is closed.
+
+        Malformed payloads are logged and skipped.
+
+        Parameters:
+            callback (Callable[[EventEntity], None]): Function called with every published event.
+        """
+
+        terminated = asyncio.Event()
+
+        def receive(_connection: object, _pid: int, _channel: str, payload: str) -> None:
+            try:
+                entity = EventEntity.model_validate_json(payload)
+
+            except ValidationError:
+                logger.warning("Cannot parse event published on channel='%s'.", self.channel)
+
+                return
+
+            callback(entity)
+
+        async with self.engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+
+            driver_connection.add_termination_listener(lambda _connection: terminated.set())
+            await driver_connection.add_listener(self.channel, receive)
+
+            try:
+                await terminated.wait()
+
+            finally:
+                if not driver_connection.is_closed():
+                    await driver_connection.remove_listener(self.channel, receive)
@@ -0,0 +1,30 @@
+import asyncio
+import logging
+
+from src.events.api.dependencies import get_broker_using_postgres
+from src.infrastructure.hubs import event_hub
+from src.settings.events import event_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+async def forward_published_events() -> None:
+    """
+    Forward the change events published by any API worker to the streaming clients of this API worker.
+
+    The broker connection is kept open for the whole lifetime of the application, and opened again
+    `event_retry_interval` seconds after it is lost. Events published meanwhile are not delivered.
+    Cancel the task to stop it.
+    """
+
+    broker = get_broker_using_postgres()
+
+    while True:
+        try:
+            await broker.listen(event_hub.publish)
+
+        except Exception:
+            logger.exception("Cannot listen for published change events.")
+
+        await asyncio.sleep(event_settings.event_retry_interval)
@@ -0,0 +1,6 @@
+from src.events.params.stream import EventStreamParams
+
+
+__all__ = [
+    "EventStreamParams",
+]
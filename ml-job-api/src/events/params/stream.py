@@ -0,0 +1,35 @@
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.events.resources import stream_resources
+from src.events.types import EventType
+
+
+class EventStreamParams(BaseModel):
+    """
+    Query parameters for selecting the change events streamed to a client.
+    """
+
+    event_type: list[EventType] | None = Field(
+        None,
+        description=stream_resources["event_type"]["DESCRIPTION"],
+        examples=stream_resources["event_type"]["EXAMPLES"],
+    )
+
+    job_id: UUID | None = Field(
+        None,
+        description=stream_resources["job_id"]["DESCRIPTION"],
+        examples=stream_resources["job_id"]["EXAMPLES"],
+    )
+
+    dir_path: str | None = Field(
+        None,
+        min_length=stream_resources["dir_path"]["MIN_LENGTH"],
+        pattern=stream_resources["dir_path"]["PATTERN"],
+        description=stream_resources["dir_path"]["DESCRIPTION"],
+        examples=stream_resources["dir_path"]["EXAMPLES"],
+    )
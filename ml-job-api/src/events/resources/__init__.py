@@ -0,0 +1,12 @@
+from src.events.resources.api import rest_resources
+from src.events.resources.entity import (
+    event_resources,
+    stream_resources,
+)
+
+
+__all__ = [
+    "event_resources",
+    "rest_resources",
+    "stream_resources",
+]
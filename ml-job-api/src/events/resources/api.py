@@ -0,0 +1,22 @@
+"""
+Centralized API metadata definitions.
+"""
+
+rest_resources = {
+    "HTTP_422": "Unprocessable Entity — one or more input parameters failed validation",
+    "HTTP_500": "Internal Server Error — an unexpected error occurred during processing",
+    "stream": {
+        "HTTP_200": "Change events streamed as server-sent events",
+        "SUMMARY": "Stream job and file change events",
+        "DESCRIPTION": (
+            "Streams the phase transitions and progress reports of jobs, and the files and directories added, "
+            "modified or deleted under the watched directory of the shared files directory, as server-sent events "
+            "named by their `event_type` with the event as JSON data, so clients do not need to poll listings. "
+            "Events can be limited by query parameters `event_type`, `job_id` for job events and `dir_path` for "
+            "entry events. Only changes happening while connected are streamed, and a comment is sent every few "
+            "seconds of inactivity to keep the connection open; clients falling behind are disconnected and "
+            "should reload the listings they show after reconnecting. "
+            "Possible errors: 422 for invalid inputs, 500 for backend failures."
+        ),
+    },
+}
@@ -0,0 +1,51 @@
+"""
+Centralized entity metadata definitions.
+"""
+
+event_resources = {
+    "event_type": {
+        "DESCRIPTION": "Type of the change, a job phase transition or progress report, or a change of a stored entry",
+        "EXAMPLES": ["JOB_PHASE"],
+    },
+    "occurred_at": {
+        "DESCRIPTION": "UTC datetime when the change was observed by the API",
+        "EXAMPLES": ["2025-06-04T10:12:00Z"],
+    },
+    "job_id": {
+        "DESCRIPTION": "ID of the changed job, for job events",
+        "EXAMPLES": ["3fa85f64-5717-4562-b3fc-2c963f66afa6"],
+    },
+    "phase": {
+        "DESCRIPTION": "Phase the job moved to, for job phase events",
+        "EXAMPLES": ["COMPLETED"],
+    },
+    "progress": {
+        "DESCRIPTION": "Latest execution progress snapshot reported by the worker, for job progress events",
+        "EXAMPLES": [{"stage": "training", "epoch": 3, "epochs_total": 10, "loss": 0.42}],
+    },
+    "parent_dir_path": {
+        "DESCRIPTION": "Path to the directory containing the changed file or directory, for entry events",
+        "EXAMPLES": ["/JOBS/job_lamost_2025_spectra_learning_3fa85f64-5717-4562-b3fc-2c963f66afa6"],
+    },
+    "name": {
+        "DESCRIPTION": "Name of the changed file or directory, for entry events",
+        "EXAMPLES": ["predictions.h5"],
+    },
+}
+
+stream_resources = {
+    "event_type": {
+        "DESCRIPTION": "Types of the events streamed, all types if omitted",
+        "EXAMPLES": [["JOB_PHASE", "ENTRY_ADDED"]],
+    },
+    "job_id": {
+        "DESCRIPTION": "ID of the only job whose events are streamed, the events of all jobs if omitted",
+        "EXAMPLES": ["3fa85f64-5717-4562-b3fc-2c963f66afa6"],
+    },
+    "dir_path": {
+        "MIN_LENGTH": 1,
+        "PATTERN": r"^(?:[\\/](?:[^\\/]+(?:[\\/][^\\/]+)*)?)$",
+        "DESCRIPTION": "Path to the directory whose entries, including nested ones, are streamed, all if omitted",
+        "EXAMPLES": ["/JOBS"],
+    },
+}
@@ -0,0 +1,6 @@
+from src.events.serializers.read import EventReadSerializer
+
+
+__all__ = [
+    "EventReadSerializer",
+]
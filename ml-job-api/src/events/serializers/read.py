@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.events.resources import event_resources
+from src.events.types import EventType
+from src.jobs.types import PhaseType
+
+
+class EventReadSerializer(BaseModel):
+    """
+    Serializer model for a change event of a job or of a stored file or directory.
+    """
+
+    event_type: EventType = Field(
+        ...,
+        description=event_resources["event_type"]["DESCRIPTION"],
+        examples=event_resources["event_type"]["EXAMPLES"],
+    )
+
+    occurred_at: datetime = Field(
+        ...,
+        description=event_resources["occurred_at"]["DESCRIPTION"],
+        examples=event_resources["occurred_at"]["EXAMPLES"],
+    )
+
+    job_id: UUID | None = Field(
+        None,
+        description=event_resources["job_id"]["DESCRIPTION"],
+        examples=event_resources["job_id"]["EXAMPLES"],
+    )
+
+    phase: PhaseType | None = Field(
+        None,
+        description=event_resources["phase"]["DESCRIPTION"],
+        examples=event_resources["phase"]["EXAMPLES"],
+    )
+
+    progress: dict[str, Any] | None = Field(
+        None,
+        description=event_resources["progress"]["DESCRIPTION"],
+        examples=event_resources["progress"]["EXAMPLES"],
+    )
+
+    parent_dir_path: str | None = Field(
+        None,
+        description=event_resources["parent_dir_path"]["DESCRIPTION"],
+        examples=event_resources["parent_dir_path"]["EXAMPLES"],
+    )
+
+    name: str | None = Field(
+        None,
+        description=event_resources["name"]["DESCRIPTION"],
+        examples=event_resources["name"]["EXAMPLES"],
+    )
@@ -0,0 +1,60 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from src.common.hubs import BroadcastHub
+from src.events.params import EventStreamParams
+from src.events.serializers import EventReadSerializer
+from src.events.utils import (
+    encode_event,
+    match_event,
+)
+
+
+class EventService:
+    """
+    Business logic layer for streaming job and file change events to clients.
+    """
+
+    def __init__(self, hub: BroadcastHub, heartbeat_interval: float) -> None:
+        """
+        Initialize the event service with the in-process hub of change events.
+
+        Parameters:
+            hub (BroadcastHub): Hub the change events received by the API worker are published to.
+            heartbeat_interval (float): Seconds without events after which a comment keeps the stream open.
+        """
+
+        self.hub = hub
+        self.heartbeat_interval = heartbeat_interval
+
+    async def stream_events(self, params: EventStreamParams) -> AsyncIterator[bytes]:
+        """
+        Stream the change events selected by the client as server-sent events, until the client disconnects
+        or falls too far behind.
+
+        Parameters:
+            params (EventStreamParams): Query parameters selecting the types, job and directory of the events.
+
+        Returns:
+            AsyncIterator[bytes]: Stream of server-sent event messages and keep-alive comments.
+        """
+
+        with self.hub.subscribe() as queue:
+            yield b": connected\n\n"
+
+            while True:
+                try:
+                    entity = await asyncio.wait_for(queue.get(), self.heartbeat_interval)
+
+                except TimeoutError:
+                    yield b": heartbeat\n\n"
+
+                    continue
+
+                if entity is None:
+                    return
+
+                if match_event(entity, params):
+                    serializer = EventReadSerializer(**entity.model_dump())
+
+                    yield encode_event(entity.event_type, serializer.model_dump_json(exclude_none=True))
@@ -0,0 +1,6 @@
+from src.events.types.event import EventType
+
+
+__all__ = [
+    "EventType",
+]
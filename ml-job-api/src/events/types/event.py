@@ -0,0 +1,13 @@
+from enum import StrEnum
+
+
+class EventType(StrEnum):
+    """
+    Enumeration type of change events published to the clients.
+    """
+
+    JOB_PHASE = "JOB_PHASE"
+    JOB_PROGRESS = "JOB_PROGRESS"
+    ENTRY_ADDED = "ENTRY_ADDED"
+    ENTRY_MODIFIED = "ENTRY_MODIFIED"
+    ENTRY_DELETED = "ENTRY_DELETED"
@@ -0,0 +1,111 @@
+import os
+
+from watchfiles import Change
+
+from src.common.utils import (
+    get_current_utc_datetime,
+    get_norm_path,
+)
+from src.events.entity import EventEntity
+from src.events.params import EventStreamParams
+from src.events.types import EventType
+
+
+#
+
+
+entry_event_types = {
+    Change.added: EventType.ENTRY_ADDED,
+    Change.modified: EventType.ENTRY_MODIFIED,
+    Change.deleted: EventType.ENTRY_DELETED,
+}
+
+
+def is_watched_entry(abs_path: str, abs_root_dir_path: str) -> bool:
+    """
+    Check whether changes of an entry of the shared files directory are published.
+
+    Hidden entries, e.g. upload sessions and the trash, and temporary files replaced into place
+    once written are not published.
+
+    Parameters:
+        abs_path (str): Absolute path of the changed file or directory.
+        abs_root_dir_path (str): Absolute path to the root of the shared files directory.
+
+    Returns:
+        bool: True if changes of the entry are published.
+    """
+
+    rel_path = os.path.relpath(abs_path, abs_root_dir_path)
+
+    return not abs_path.endswith(".tmp") and not any(part.startswith(".") for part in rel_path.split(os.sep))
+
+
+def get_entry_events(changes: set[tuple[Change, str]], abs_root_dir_path: str) -> list[EventEntity]:
+    """
+    Convert a batch of filesystem changes into entry change events, ordered by path.
+
+    Parameters:
+        changes (set[tuple[Change, str]]): Kinds and absolute paths of the changed files and directories.
+        abs_root_dir_path (str): Absolute path to the root of the shared files directory.
+
+    Returns:
+        list[EventEntity]: The entry change events.
+    """
+
+    occurred_at = get_current_utc_datetime()
+
+    return [
+        EventEntity(
+            event_type=entry_event_types[change],
+            occurred_at=occurred_at,
+            parent_dir_path=get_norm_path(os.path.relpath(os.path.dirname(abs_path), abs_root_dir_path), prefix="/"),
+            name=os.path.basename(abs_path),
+        )
+        for change, abs_path in sorted(changes, key=lambda change: (change[1], change[0]))
+    ]
+
+
+#
+
+
+def match_event(entity: EventEntity, params: EventStreamParams) -> bool:
+    """
+    Check whether a change event is selected by the stream parameters of a client.
+
+    Parameters:
+        entity (EventEntity): The change event.
+        params (EventStreamParams): Types, job and directory of the streamed events.
+
+    Returns:
+        bool: True if the event is streamed to the client.
+    """
+
+    if params.event_type and entity.event_type not in params.event_type:
+        return False
+
+    if params.job_id is not None and entity.job_id is not None and params.job_id != entity.job_id:
+        return False
+
+    if params.dir_path is not None and entity.parent_dir_path is not None:
+        dir_path = get_norm_path(params.dir_path)
+        entry_path = get_norm_path(entity.parent_dir_path, child_name=entity.name)
+
+        return dir_path == os.sep or entry_path.startswith(f"{dir_path}{os.sep}")
+
+    return True
+
+
+def encode_event(event: str, data: str) -> bytes:
+    """
+    Encode a message of a server-sent event stream.
+
+    Parameters:
+        event (str): Name of the event.
+        data (str): Single-line data of the event, e.g. compact JSON.
+
+    Returns:
+        bytes: The message terminated by a blank line.
+    """
+
+    return f"event: {event}\ndata: {data}\n\n".encode()
@@ -0,0 +1,53 @@
+import asyncio
+import logging
+
+import aiofiles.os
+from watchfiles import awatch
+
+from src.common.utils import get_norm_path
+from src.events.api.dependencies import get_broker_using_postgres
+from src.events.utils import (
+    get_entry_events,
+    is_watched_entry,
+)
+from src.infrastructure.locks import entry_watch_lock
+from src.infrastructure.storages import lfs_files_dir_path
+from src.settings.events import event_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+async def watch_entries() -> None:
+    """
+    Publish the files and directories changed under the watched directory to the streaming clients of all API workers.
+
+    Only the API worker holding the watch advisory lock watches the shared files directory, and publishes
+    the changes through the event broker, so the directory is watched once whatever the number of API
+    workers, and every API worker forwards the changes to its clients like the job events. The other API
+    workers try to take the lock every `event_retry_interval` seconds, so one of them takes over the watch
+    if its holder stops. Changes are reported by inotify and grouped for `event_watch_debounce` milliseconds;
+    changes written by workers on other hosts of a network filesystem are not reported. The watch is started
+    again `event_retry_interval` seconds after a failure. Cancel the task to stop it.
+    """
+
+    abs_watched_dir_path = get_norm_path(event_settings.event_watch_dir_path, prefix=lfs_files_dir_path)
+    broker = get_broker_using_postgres()
+
+    while True:
+        try:
+            async with entry_watch_lock.try_hold() as held:
+                if held:
+                    await aiofiles.os.makedirs(abs_watched_dir_path, exist_ok=True)
+
+                    async for changes in awatch(
+                        abs_watched_dir_path,
+                        watch_filter=lambda _change, abs_path: is_watched_entry(abs_path, lfs_files_dir_path),
+                        debounce=event_settings.event_watch_debounce,
+                    ):
+                        await broker.publish_batch(get_entry_events(changes, lfs_files_dir_path))
+
+        except Exception:
+            logger.exception("Cannot watch directory='%s' for changes.", event_settings.event_watch_dir_path)
+
+        await asyncio.sleep(event_settings.event_retry_interval)
@@ -1,14 +1,32 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.files.indexes import UsagePostgresIndex
+from src.files.readers import DatasetHDF5Reader
 from src.files.repositories import FileLFSRepository
 from src.files.service import FileService
-from src.infrastructure.storages import lfs_files_dir_path
+from src.infrastructure.caches import dataset_handle_cache
+from src.infrastructure.storages import (
+    get_postgres_async_session,
+    lfs_files_dir_path,
+)
+from src.settings.files import file_settings
 
 
-def get_service_using_lfs() -> FileService:
+def get_service_using_lfs_and_postgres(
+    postgres_async_session: AsyncSession = Depends(get_postgres_async_session),
+) -> FileService:
     """
     Construct a FileService backed by the local filesystem repository.
 
     This dependency factory builds a FileLFSRepository with the configured
-    shared files directory path, and injects it into a FileService instance.
+    shared files directory path, a DatasetHDF5Reader slicing the datasets
+    of stored HDF5 files through the shared handle cache, and a UsagePostgresIndex
+    keeping the disk usage of directories using the injected AsyncSession,
+    and injects them into a FileService instance.
+
+    Parameters:
+        postgres_async_session (AsyncSession): Asynchronous database session for PostgreSQL operations.
 
     Returns:
         FileService: Service instance for handling file and directory operations
@@ -16,5 +34,7 @@ def get_service_using_lfs() -> FileService:
     """
 
     lfs_repository = FileLFSRepository(lfs_files_dir_path)
+    hdf5_reader = DatasetHDF5Reader(lfs_files_dir_path, dataset_handle_cache, file_settings.dataset_slice_max_values)
+    postgres_index = UsagePostgresIndex(postgres_async_session)
 
-    return FileService(lfs_repository)
+    return FileService(lfs_repository, hdf5_reader, postgres_index)
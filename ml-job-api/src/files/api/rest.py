@@ -1,36 +1,74 @@
+from urllib.parse import quote
+from uuid import UUID
+
 from fastapi import (
     APIRouter,
+    Body,
     Depends,
     File,
+    Header,
     HTTPException,
     Path,
     Query,
+    Request,
     UploadFile,
     status,
 )
 from fastapi.responses import (
+    FileResponse,
     JSONResponse,
+    ORJSONResponse,
+    Response,
     StreamingResponse,
 )
 from fastapi_restful.cbv import cbv
 
-from src.files.api.dependencies import get_service_using_lfs
+from src.common.utils import (
+    get_http_datetime,
+    is_not_modified,
+    negotiate_media_type,
+)
+from src.files.api.dependencies import get_service_using_lfs_and_postgres
+from src.files.dto import UploadCreateDTO
 from src.files.errors import (
+    DatasetInvalidSliceError,
+    DatasetNotExistError,
+    DeletionNotExistError,
     DirectoryAlreadyExistError,
     DirectoryNotExistError,
+    EntryInvalidPathError,
     FileNotExistError,
+    UploadChecksumMismatchError,
+    UploadIncompleteError,
+    UploadInvalidChunkError,
+    UploadNotExistError,
+    UsageNotExistError,
 )
 from src.files.params import (
+    ChunkLocateParams,
+    DatasetSliceParams,
+    DirectoryArchiveParams,
     EntryListParams,
     EntryLocateParams,
+    UsageLocateParams,
+)
+from src.files.resources import (
+    archive_resources,
+    rest_resources,
 )
-from src.files.resources import rest_resources
 from src.files.serializers import (
+    DatasetListSerializer,
+    DatasetSliceSerializer,
+    DeletionListSerializer,
+    DeletionReadSerializer,
     DirectoryReadSerializer,
     EntryListSerializer,
     FileReadSerializer,
+    UploadReadSerializer,
+    UsageReadSerializer,
 )
 from src.files.service import FileService
+from src.files.utils import get_file_etag
 
 
 rest_router = APIRouter(
@@ -47,7 +85,139 @@ class FileRESTRouter:
     RESTful API router for files and directories data operations.
     """
 
-    service: FileService = Depends(get_service_using_lfs)
+    service: FileService = Depends(get_service_using_lfs_and_postgres)
+
+    @rest_router.post(
+        path="/uploads/",
+        tags=["Files: Upload"],
+        response_class=JSONResponse,
+        response_model=UploadReadSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_201_CREATED,
+        responses={
+            status.HTTP_201_CREATED: {"description": rest_resources["initialize_upload"]["HTTP_201"]},
+            status.HTTP_400_BAD_REQUEST: {"description": rest_resources["initialize_upload"]["HTTP_400"]},
+            status.HTTP_409_CONFLICT: {"description": rest_resources["initialize_upload"]["HTTP_409"]},
+        },
+        summary=rest_resources["initialize_upload"]["SUMMARY"],
+        description=rest_resources["initialize_upload"]["DESCRIPTION"],
+    )
+    async def initialize_upload(
+        self,
+        dto: UploadCreateDTO = Body(title="Location, size and checksum of the file to upload"),
+    ) -> UploadReadSerializer:
+        try:
+            return await self.service.initialize_upload(dto)
+
+        except EntryInvalidPathError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        except DirectoryAlreadyExistError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    @rest_router.get(
+        path="/uploads/{upload_id}",
+        tags=["Files: Upload"],
+        response_class=JSONResponse,
+        response_model=UploadReadSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["retrieve_upload"]["HTTP_200"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["retrieve_upload"]["HTTP_404"]},
+        },
+        summary=rest_resources["retrieve_upload"]["SUMMARY"],
+        description=rest_resources["retrieve_upload"]["DESCRIPTION"],
+    )
+    async def retrieve_upload(
+        self,
+        upload_id: UUID = Path(title="Upload ID"),
+    ) -> UploadReadSerializer:
+        try:
+            return await self.service.retrieve_upload(upload_id)
+
+        except UploadNotExistError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    @rest_router.put(
+        path="/uploads/{upload_id}/chunk",
+        tags=["Files: Upload"],
+        response_class=JSONResponse,
+        response_model=None,
+        status_code=status.HTTP_204_NO_CONTENT,
+        responses={
+            status.HTTP_204_NO_CONTENT: {"description": rest_resources["upload_chunk"]["HTTP_204"]},
+            status.HTTP_400_BAD_REQUEST: {"description": rest_resources["upload_chunk"]["HTTP_400"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["upload_chunk"]["HTTP_404"]},
+        },
+        summary=rest_resources["upload_chunk"]["SUMMARY"],
+        description=rest_resources["upload_chunk"]["DESCRIPTION"],
+    )
+    async def upload_chunk(
+        self,
+        request: Request,
+        upload_id: UUID = Path(title="Upload ID"),
+        params: ChunkLocateParams = Query(title="Location parameters of the chunk"),
+    ) -> None:
+        try:
+            await self.service.upload_chunk(upload_id, params, request.stream())
+
+        except UploadInvalidChunkError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        except UploadNotExistError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    @rest_router.post(
+        path="/uploads/{upload_id}/complete",
+        tags=["Files: Upload"],
+        response_class=JSONResponse,
+        response_model=FileReadSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_201_CREATED,
+        responses={
+            status.HTTP_201_CREATED: {"description": rest_resources["complete_upload"]["HTTP_201"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["complete_upload"]["HTTP_404"]},
+            status.HTTP_409_CONFLICT: {"description": rest_resources["complete_upload"]["HTTP_409"]},
+        },
+        summary=rest_resources["complete_upload"]["SUMMARY"],
+        description=rest_resources["complete_upload"]["DESCRIPTION"],
+    )
+    async def complete_upload(
+        self,
+        upload_id: UUID = Path(title="Upload ID"),
+    ) -> FileReadSerializer:
+        try:
+            return await self.service.complete_upload(upload_id)
+
+        except UploadNotExistError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+        except (UploadIncompleteError, UploadChecksumMismatchError, DirectoryAlreadyExistError) as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    @rest_router.delete(
+        path="/uploads/{upload_id}",
+        tags=["Files: Upload"],
+        response_class=JSONResponse,
+        response_model=None,
+        status_code=status.HTTP_204_NO_CONTENT,
+        responses={
+            status.HTTP_204_NO_CONTENT: {"description": rest_resources["remove_upload"]["HTTP_204"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["remove_upload"]["HTTP_404"]},
+        },
+        summary=rest_resources["remove_upload"]["SUMMARY"],
+        description=rest_resources["remove_upload"]["DESCRIPTION"],
+    )
+    async def remove_upload(
+        self,
+        upload_id: UUID = Path(title="Upload ID"),
+    ) -> None:
+        try:
+            await self.service.remove_upload(upload_id)
+
+        except UploadNotExistError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
     @rest_router.post(
         path="/{filename}/upload",
@@ -58,6 +228,8 @@ class FileRESTRouter:
         status_code=status.HTTP_201_CREATED,
         responses={
             status.HTTP_201_CREATED: {"description": rest_resources["upload"]["HTTP_201"]},
+            status.HTTP_400_BAD_REQUEST: {"description": rest_resources["upload"]["HTTP_400"]},
+            status.HTTP_409_CONFLICT: {"description": rest_resources["upload"]["HTTP_409"]},
         },
         summary=rest_resources["upload"]["SUMMARY"],
         description=rest_resources["upload"]["DESCRIPTION"],
@@ -68,16 +240,26 @@ class FileRESTRouter:
         params: EntryLocateParams = Query(title="Location parameters of the file"),
         file: UploadFile = File(title="File to upload"),
     ) -> FileReadSerializer:
-        return await self.service.upload_file_by_filename(filename, params, file)
+        try:
+            return await self.service.upload_file_by_filename(filename, params, file)
+
+        except EntryInvalidPathError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        except DirectoryAlreadyExistError as e:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
     @rest_router.get(
         path="/{filename}/download",
         tags=["Files: Load"],
-        response_class=StreamingResponse,
+        response_class=FileResponse,
         status_code=status.HTTP_200_OK,
         responses={
             status.HTTP_200_OK: {"description": rest_resources["download"]["HTTP_200"]},
+            status.HTTP_206_PARTIAL_CONTENT: {"description": rest_resources["download"]["HTTP_206"]},
+            status.HTTP_304_NOT_MODIFIED: {"description": rest_resources["download"]["HTTP_304"]},
             status.HTTP_404_NOT_FOUND: {"description": rest_resources["download"]["HTTP_404"]},
+            status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE: {"description": rest_resources["download"]["HTTP_416"]},
         },
         summary=rest_resources["download"]["SUMMARY"],
         description=rest_resources["download"]["DESCRIPTION"],
@@ -86,17 +268,112 @@ class FileRESTRouter:
         self,
         filename: str = Path(title="Name of the file"),
         params: EntryLocateParams = Query(title="Location parameters of the file"),
-    ) -> StreamingResponse:
+        if_none_match: str | None = Header(None, title="Entity tags of the file held by the client"),
+        if_modified_since: str | None = Header(None, title="Modification date of the file held by the client"),
+    ) -> Response:
         try:
-            return StreamingResponse(
-                await self.service.download_file_by_filename(filename, params),
-                headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-                media_type="application/octet-stream",
-            )
+            file_path, file = await self.service.download_file_by_filename(filename, params)
 
         except FileNotExistError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
+        headers = {
+            "ETag": get_file_etag(file.size, file.modified_at),
+            "Last-Modified": get_http_datetime(file.modified_at),
+        }
+
+        if is_not_modified(if_none_match, if_modified_since, headers["ETag"], file.modified_at):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        # Range and If-Range headers are handled by the response, full files are sent by the server if it supports it
+        return FileResponse(
+            file_path,
+            headers=headers,
+            media_type="application/octet-stream",
+            filename=filename,
+        )
+
+    @rest_router.get(
+        path="/{filename}/datasets",
+        tags=["Files: Datasets"],
+        response_class=JSONResponse,
+        response_model=DatasetListSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["list_datasets"]["HTTP_200"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["list_datasets"]["HTTP_404"]},
+        },
+        summary=rest_resources["list_datasets"]["SUMMARY"],
+        description=rest_resources["list_datasets"]["DESCRIPTION"],
+    )
+    async def list_datasets(
+        self,
+        filename: str = Path(title="Name of the HDF5 file"),
+        params: EntryLocateParams = Query(title="Location parameters of the file"),
+    ) -> DatasetListSerializer:
+        try:
+            return await self.service.list_datasets_by_filename(filename, params)
+
+        except (FileNotExistError, DatasetNotExistError) as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    @rest_router.get(
+        path="/{filename}/datasets/slice",
+        tags=["Files: Datasets"],
+        response_class=ORJSONResponse,
+        response_model=DatasetSliceSerializer,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {
+                "description": rest_resources["retrieve_dataset_slice"]["HTTP_200"],
+                "content": {"application/octet-stream": {}},
+            },
+            status.HTTP_400_BAD_REQUEST: {"description": rest_resources["retrieve_dataset_slice"]["HTTP_400"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["retrieve_dataset_slice"]["HTTP_404"]},
+            status.HTTP_406_NOT_ACCEPTABLE: {"description": rest_resources["retrieve_dataset_slice"]["HTTP_406"]},
+        },
+        summary=rest_resources["retrieve_dataset_slice"]["SUMMARY"],
+        description=rest_resources["retrieve_dataset_slice"]["DESCRIPTION"],
+    )
+    async def retrieve_dataset_slice(
+        self,
+        filename: str = Path(title="Name of the HDF5 file"),
+        params: DatasetSliceParams = Query(title="Location parameters of the file and slice of the dataset"),
+        accept: str | None = Header(None, title="Media types acceptable for the response"),
+    ) -> Response:
+        media_type = negotiate_media_type(accept, ["application/json", "application/octet-stream"])
+
+        if media_type is None:
+            raise HTTPException(
+                status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                detail="Dataset slice can only be returned as 'application/json' or 'application/octet-stream'.",
+            )
+
+        try:
+            if media_type == "application/octet-stream":
+                data, dataset_slice = await self.service.retrieve_packed_dataset_slice_by_filename(filename, params)
+
+                return Response(
+                    data,
+                    headers={
+                        "X-Dataset-Dtype": dataset_slice.dtype,
+                        "X-Dataset-Shape": ",".join(map(str, dataset_slice.shape)),
+                    },
+                    media_type=media_type,
+                )
+
+            dataset_slice = await self.service.retrieve_dataset_slice_by_filename(filename, params)
+
+        except DatasetInvalidSliceError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        except (FileNotExistError, DatasetNotExistError) as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+        # Responses are rendered directly, so the already constructed serializer is not validated again
+        return ORJSONResponse({key: value for key, value in dataset_slice if value is not None})
+
     @rest_router.delete(
         path="/{filename}",
         tags=["Files: CRUD"],
@@ -130,6 +407,7 @@ class FileRESTRouter:
         status_code=status.HTTP_201_CREATED,
         responses={
             status.HTTP_201_CREATED: {"description": rest_resources["initialize_directory"]["HTTP_201"]},
+            status.HTTP_400_BAD_REQUEST: {"description": rest_resources["initialize_directory"]["HTTP_400"]},
             status.HTTP_409_CONFLICT: {"description": rest_resources["initialize_directory"]["HTTP_409"]},
         },
         summary=rest_resources["initialize_directory"]["SUMMARY"],
@@ -143,6 +421,9 @@ class FileRESTRouter:
         try:
             return await self.service.initialize_directory_by_dirname(dirname, params)
 
+        except EntryInvalidPathError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
         except DirectoryAlreadyExistError as e:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
@@ -150,10 +431,11 @@ class FileRESTRouter:
         path="/directories/{dirname}",
         tags=["Directories: CRUD"],
         response_class=JSONResponse,
-        response_model=None,
-        status_code=status.HTTP_204_NO_CONTENT,
+        response_model=DeletionReadSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_202_ACCEPTED,
         responses={
-            status.HTTP_204_NO_CONTENT: {"description": rest_resources["remove_directory"]["HTTP_204"]},
+            status.HTTP_202_ACCEPTED: {"description": rest_resources["remove_directory"]["HTTP_202"]},
             status.HTTP_404_NOT_FOUND: {"description": rest_resources["remove_directory"]["HTTP_404"]},
         },
         summary=rest_resources["remove_directory"]["SUMMARY"],
@@ -163,13 +445,88 @@ class FileRESTRouter:
         self,
         dirname: str = Path(title="Name of the directory"),
         params: EntryLocateParams = Query(title="Location parameters of the directory"),
-    ) -> None:
+    ) -> DeletionReadSerializer:
+        try:
+            return await self.service.remove_directory_by_dirname(dirname, params)
+
+        except DirectoryNotExistError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    @rest_router.get(
+        path="/deletions/",
+        tags=["Directories: CRUD"],
+        response_class=JSONResponse,
+        response_model=DeletionListSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["list_deletions"]["HTTP_200"]},
+        },
+        summary=rest_resources["list_deletions"]["SUMMARY"],
+        description=rest_resources["list_deletions"]["DESCRIPTION"],
+    )
+    async def list_deletions(self) -> DeletionListSerializer:
+        return await self.service.list_deletions()
+
+    @rest_router.get(
+        path="/deletions/{deletion_id}",
+        tags=["Directories: CRUD"],
+        response_class=JSONResponse,
+        response_model=DeletionReadSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["retrieve_deletion"]["HTTP_200"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["retrieve_deletion"]["HTTP_404"]},
+        },
+        summary=rest_resources["retrieve_deletion"]["SUMMARY"],
+        description=rest_resources["retrieve_deletion"]["DESCRIPTION"],
+    )
+    async def retrieve_deletion(
+        self,
+        deletion_id: UUID = Path(title="Deletion ID"),
+    ) -> DeletionReadSerializer:
+        try:
+            return await self.service.retrieve_deletion(deletion_id)
+
+        except DeletionNotExistError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    @rest_router.get(
+        path="/directories/{dirname}/download",
+        tags=["Directories: Load"],
+        response_class=StreamingResponse,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {
+                "description": rest_resources["download_directory"]["HTTP_200"],
+                "content": {media_type: {} for media_type in archive_resources["media_types"].values()},
+            },
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["download_directory"]["HTTP_404"]},
+        },
+        summary=rest_resources["download_directory"]["SUMMARY"],
+        description=rest_resources["download_directory"]["DESCRIPTION"],
+    )
+    async def download_directory(
+        self,
+        dirname: str = Path(title="Name of the directory"),
+        params: DirectoryArchiveParams = Query(title="Location and archive parameters of the directory"),
+    ) -> StreamingResponse:
         try:
-            await self.service.remove_directory_by_dirname(dirname, params)
+            archive = await self.service.download_directory_by_dirname(dirname, params)
 
         except DirectoryNotExistError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
+        archive_filename = quote(f"{dirname}{archive_resources['extensions'][params.archive_type]}")
+
+        # Archive is generated in a thread pool while sent, so the event loop never reads or compresses files
+        return StreamingResponse(
+            archive,
+            headers={"Content-Disposition": f"attachment; filename*=utf-8''{archive_filename}"},
+            media_type=archive_resources["media_types"][params.archive_type],
+        )
+
     @rest_router.get(
         path="/",
         tags=["Files: List"],
@@ -193,3 +550,27 @@ class FileRESTRouter:
 
         except DirectoryNotExistError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    @rest_router.get(
+        path="/usages/",
+        tags=["Files: List"],
+        response_class=JSONResponse,
+        response_model=UsageReadSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["retrieve_usage"]["HTTP_200"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["retrieve_usage"]["HTTP_404"]},
+        },
+        summary=rest_resources["retrieve_usage"]["SUMMARY"],
+        description=rest_resources["retrieve_usage"]["DESCRIPTION"],
+    )
+    async def retrieve_usage(
+        self,
+        params: UsageLocateParams = Query(title="Location parameters of the directory"),
+    ) -> UsageReadSerializer:
+        try:
+            return await self.service.retrieve_usage(params)
+
+        except UsageNotExistError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,6 @@
+from src.files.dto.upload import UploadCreateDTO
+
+
+__all__ = [
+    "UploadCreateDTO",
+]
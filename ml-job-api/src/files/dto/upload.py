@@ -0,0 +1,43 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.files.resources import upload_resources
+
+
+class UploadCreateDTO(BaseModel):
+    """
+    Data Transfer Object model for creating a resumable upload session of a file.
+    """
+
+    filename: str = Field(
+        ...,
+        min_length=upload_resources["filename"]["MIN_LENGTH"],
+        max_length=upload_resources["filename"]["MAX_LENGTH"],
+        pattern=upload_resources["filename"]["PATTERN"],
+        description=upload_resources["filename"]["DESCRIPTION"],
+        examples=upload_resources["filename"]["EXAMPLES"],
+    )
+
+    parent_dir_path: str = Field(
+        ...,
+        min_length=upload_resources["parent_dir_path"]["MIN_LENGTH"],
+        pattern=upload_resources["parent_dir_path"]["PATTERN"],
+        description=upload_resources["parent_dir_path"]["DESCRIPTION"],
+        examples=upload_resources["parent_dir_path"]["EXAMPLES"],
+    )
+
+    size: int = Field(
+        ...,
+        ge=upload_resources["size"]["MIN_VALUE"],
+        description=upload_resources["size"]["DESCRIPTION"],
+        examples=upload_resources["size"]["EXAMPLES"],
+    )
+
+    sha256: str | None = Field(
+        None,
+        pattern=upload_resources["sha256"]["PATTERN"],
+        description=upload_resources["sha256"]["DESCRIPTION"],
+        examples=upload_resources["sha256"]["EXAMPLES"],
+    )
@@ -1,4 +1,6 @@
 from datetime import datetime
+from typing import Any
+from uuid import UUID
 
 from pydantic import (
     BaseModel,
@@ -7,8 +9,12 @@ from pydantic import (
 )
 
 from src.files.resources import (
+    dataset_resources,
+    deletion_resources,
     directory_resources,
     file_resources,
+    upload_resources,
+    usage_resources,
 )
 
 
@@ -62,3 +68,204 @@ class DirectoryEntity(BaseModel):
         description=directory_resources["parent_dir_path"]["DESCRIPTION"],
         examples=directory_resources["parent_dir_path"]["EXAMPLES"],
     )
+
+
+class UploadEntity(BaseModel):
+    """
+    Entity model representing a resumable upload session of a file.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    upload_id: UUID = Field(
+        ...,
+        description=upload_resources["upload_id"]["DESCRIPTION"],
+        examples=upload_resources["upload_id"]["EXAMPLES"],
+    )
+
+    filename: str = Field(
+        ...,
+        description=upload_resources["filename"]["DESCRIPTION"],
+        examples=upload_resources["filename"]["EXAMPLES"],
+    )
+
+    parent_dir_path: str = Field(
+        ...,
+        description=upload_resources["parent_dir_path"]["DESCRIPTION"],
+        examples=upload_resources["parent_dir_path"]["EXAMPLES"],
+    )
+
+    size: int = Field(
+        ...,
+        description=upload_resources["size"]["DESCRIPTION"],
+        examples=upload_resources["size"]["EXAMPLES"],
+    )
+
+    sha256: str | None = Field(
+        None,
+        description=upload_resources["sha256"]["DESCRIPTION"],
+        examples=upload_resources["sha256"]["EXAMPLES"],
+    )
+
+    received: list[tuple[int, int]] = Field(
+        ...,
+        description=upload_resources["received"]["DESCRIPTION"],
+        examples=upload_resources["received"]["EXAMPLES"],
+    )
+
+    created_at: datetime = Field(
+        ...,
+        description=upload_resources["created_at"]["DESCRIPTION"],
+        examples=upload_resources["created_at"]["EXAMPLES"],
+    )
+
+
+class DeletionEntity(BaseModel):
+    """
+    Entity model representing the background deletion of a directory moved to the trash.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    deletion_id: UUID = Field(
+        ...,
+        description=deletion_resources["deletion_id"]["DESCRIPTION"],
+        examples=deletion_resources["deletion_id"]["EXAMPLES"],
+    )
+
+    dir_path: str = Field(
+        ...,
+        description=deletion_resources["dir_path"]["DESCRIPTION"],
+        examples=deletion_resources["dir_path"]["EXAMPLES"],
+    )
+
+    size: int | None = Field(
+        None,
+        description=deletion_resources["size"]["DESCRIPTION"],
+        examples=deletion_resources["size"]["EXAMPLES"],
+    )
+
+    removed: int = Field(
+        ...,
+        description=deletion_resources["removed"]["DESCRIPTION"],
+        examples=deletion_resources["removed"]["EXAMPLES"],
+    )
+
+    requested_at: datetime = Field(
+        ...,
+        description=deletion_resources["requested_at"]["DESCRIPTION"],
+        examples=deletion_resources["requested_at"]["EXAMPLES"],
+    )
+
+    completed_at: datetime | None = Field(
+        None,
+        description=deletion_resources["completed_at"]["DESCRIPTION"],
+        examples=deletion_resources["completed_at"]["EXAMPLES"],
+    )
+
+
+class UsageEntity(BaseModel):
+    """
+    Entity model representing the recursive disk usage of a directory kept in the usage index.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    dir_path: str = Field(
+        ...,
+        description=usage_resources["dir_path"]["DESCRIPTION"],
+        examples=usage_resources["dir_path"]["EXAMPLES"],
+    )
+
+    size: int = Field(
+        ...,
+        description=usage_resources["size"]["DESCRIPTION"],
+        examples=usage_resources["size"]["EXAMPLES"],
+    )
+
+    file_count: int = Field(
+        ...,
+        description=usage_resources["file_count"]["DESCRIPTION"],
+        examples=usage_resources["file_count"]["EXAMPLES"],
+    )
+
+    updated_at: datetime = Field(
+        ...,
+        description=usage_resources["updated_at"]["DESCRIPTION"],
+        examples=usage_resources["updated_at"]["EXAMPLES"],
+    )
+
+    reconciled_at: datetime | None = Field(
+        None,
+        description=usage_resources["reconciled_at"]["DESCRIPTION"],
+        examples=usage_resources["reconciled_at"]["EXAMPLES"],
+    )
+
+
+class DatasetEntity(BaseModel):
+    """
+    Entity model representing a dataset of an HDF5 file stored in the system storage.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str = Field(
+        ...,
+        description=dataset_resources["name"]["DESCRIPTION"],
+        examples=dataset_resources["name"]["EXAMPLES"],
+    )
+
+    shape: list[int] = Field(
+        ...,
+        description=dataset_resources["shape"]["DESCRIPTION"],
+        examples=dataset_resources["shape"]["EXAMPLES"],
+    )
+
+    dtype: str = Field(
+        ...,
+        description=dataset_resources["dtype"]["DESCRIPTION"],
+        examples=dataset_resources["dtype"]["EXAMPLES"],
+    )
+
+
+class DatasetSliceEntity(DatasetEntity):
+    """
+    Entity model representing a slice of rows and columns of a dataset of an HDF5 file.
+
+    The values are either kept as nested lists, or packed as little-endian bytes in C order.
+    """
+
+    row_start: int = Field(
+        ...,
+        description=dataset_resources["row_start"]["DESCRIPTION"],
+        examples=dataset_resources["row_start"]["EXAMPLES"],
+    )
+
+    row_stop: int = Field(
+        ...,
+        description=dataset_resources["row_stop"]["DESCRIPTION"],
+        examples=dataset_resources["row_stop"]["EXAMPLES"],
+    )
+
+    column_start: int | None = Field(
+        None,
+        description=dataset_resources["column_start"]["DESCRIPTION"],
+        examples=dataset_resources["column_start"]["EXAMPLES"],
+    )
+
+    column_stop: int | None = Field(
+        None,
+        description=dataset_resources["column_stop"]["DESCRIPTION"],
+        examples=dataset_resources["column_stop"]["EXAMPLES"],
+    )
+
+    values: Any | None = Field(
+        None,
+        description=dataset_resources["values"]["DESCRIPTION"],
+        examples=dataset_resources["values"]["EXAMPLES"],
+    )
+
+    data: bytes | None = Field(
+        None,
+        description=dataset_resources["data"]["DESCRIPTION"],
+    )
@@ -1,12 +1,34 @@
 from src.files.errors.already_exist import DirectoryAlreadyExistError
+from src.files.errors.dataset import (
+    DatasetInvalidSliceError,
+    DatasetNotExistError,
+)
+from src.files.errors.deletion import DeletionNotExistError
+from src.files.errors.invalid_path import EntryInvalidPathError
 from src.files.errors.not_exist import (
     DirectoryNotExistError,
     FileNotExistError,
 )
+from src.files.errors.upload import (
+    UploadChecksumMismatchError,
+    UploadIncompleteError,
+    UploadInvalidChunkError,
+    UploadNotExistError,
+)
+from src.files.errors.usage import UsageNotExistError
 
 
 __all__ = [
+    "DatasetInvalidSliceError",
+    "DatasetNotExistError",
+    "DeletionNotExistError",
     "DirectoryAlreadyExistError",
     "DirectoryNotExistError",
+    "EntryInvalidPathError",
     "FileNotExistError",
+    "UploadChecksumMismatchError",
+    "UploadIncompleteError",
+    "UploadInvalidChunkError",
+    "UploadNotExistError",
+    "UsageNotExistError",
 ]
@@ -0,0 +1,17 @@
+from src.common.errors import BaseError
+
+
+class DatasetNotExistError(BaseError):
+    """
+    Raised when a requested dataset cannot be found, or its file cannot be read as an HDF5 file.
+    """
+
+    message = "Dataset does not exist."
+
+
+class DatasetInvalidSliceError(BaseError):
+    """
+    Raised when a requested slice of a dataset cannot be selected, exceeds the size limit, or cannot be packed.
+    """
+
+    message = "Dataset slice is invalid."
@@ -0,0 +1,9 @@
+from src.common.errors import BaseError
+
+
+class DeletionNotExistError(BaseError):
+    """
+    Raised when a requested deletion cannot be found, or its record has expired.
+    """
+
+    message = "Deletion does not exist."
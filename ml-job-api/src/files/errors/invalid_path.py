@@ -0,0 +1,9 @@
+from src.common.errors import BaseError
+
+
+class EntryInvalidPathError(BaseError):
+    """
+    Raised when a file or directory would be written into a location reserved by the storage itself.
+    """
+
+    message = "Entry path is invalid."
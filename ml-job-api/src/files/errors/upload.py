@@ -0,0 +1,33 @@
+from src.common.errors import BaseError
+
+
+class UploadNotExistError(BaseError):
+    """
+    Raised when a requested upload session cannot be found.
+    """
+
+    message = "Upload does not exist."
+
+
+class UploadInvalidChunkError(BaseError):
+    """
+    Raised when a chunk of an upload does not fit into the declared size of the uploaded file.
+    """
+
+    message = "Upload chunk is invalid."
+
+
+class UploadIncompleteError(BaseError):
+    """
+    Raised when completing an upload whose file has not been fully received.
+    """
+
+    message = "Upload is incomplete."
+
+
+class UploadChecksumMismatchError(BaseError):
+    """
+    Raised when the received file of an upload does not match its declared checksum.
+    """
+
+    message = "Upload checksum does not match."
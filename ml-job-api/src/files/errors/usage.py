@@ -0,0 +1,9 @@
+from src.common.errors import BaseError
+
+
+class UsageNotExistError(BaseError):
+    """
+    Raised when the disk usage of a requested directory is not kept in the usage index.
+    """
+
+    message = "Directory usage does not exist."
@@ -0,0 +1,97 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+from src.files.entities import UsageEntity
+
+
+class UsageIndex(ABC):
+    """
+    Index interface for the recursive disk usage of the directories of stored files.
+    """
+
+    @abstractmethod
+    async def get_by_dir_path(self, dir_path: str) -> UsageEntity:
+        """
+        Retrieve the recursive disk usage of a directory.
+
+        Parameters:
+            dir_path (str): Relative path of the directory.
+
+        Returns:
+            UsageEntity: The usage entity of the directory.
+
+        Raises:
+            UsageNotExistError: If the directory is not indexed.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_parent_dir_path(self, parent_dir_path: str, limit: int) -> list[UsageEntity]:
+        """
+        List the recursive disk usage of the direct subdirectories of a directory, the largest ones first.
+
+        Parameters:
+            parent_dir_path (str): Relative path of the parent directory.
+            limit (int): Maximum number of subdirectories returned.
+
+        Returns:
+            list[UsageEntity]: A list of usage entities ordered by size descending.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_by_dir_path(self, dir_path: str, size: int, file_count: int) -> None:
+        """
+        Add a change of size and number of files to a directory and all its ancestors,
+        indexing the missing ones.
+
+        Parameters:
+            dir_path (str): Relative path of the directory the change happened in.
+            size (int): Change of the size in bytes, negative if files were removed or shrunk.
+            file_count (int): Change of the number of regular files, negative if files were removed.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_by_dir_path(self, dir_path: str) -> None:
+        """
+        Remove a directory with all its subdirectories from the index, subtracting its usage from its ancestors.
+
+        Parameters:
+            dir_path (str): Relative path of the removed directory.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def replace_by_dir_path(self, dir_path: str, usages: dict[str, tuple[int, int]]) -> None:
+        """
+        Replace the usage of a directory and all its subdirectories with the result of a scan of the storage,
+        adjusting its ancestors by the difference.
+
+        Parameters:
+            dir_path (str): Relative path of the scanned directory.
+            usages (dict[str, tuple[int, int]]):
+                Recursive size and number of files by relative directory path, empty if the directory is missing.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_reconciliation(self, interval: int) -> bool:
+        """
+        Claim the reconciliation of the whole index, so only one API worker scans the storage at a time.
+
+        Parameters:
+            interval (int): Seconds after the latest reconciliation a new one is due.
+
+        Returns:
+            bool: True if the reconciliation is due and was claimed by the caller.
+        """
+
+        raise NotImplementedError
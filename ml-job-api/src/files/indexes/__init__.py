@@ -0,0 +1,6 @@
+from src.files.indexes.postgres import UsagePostgresIndex
+
+
+__all__ = [
+    "UsagePostgresIndex",
+]
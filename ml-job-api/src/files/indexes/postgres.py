@@ -0,0 +1,294 @@
+import os
+from datetime import (
+    datetime,
+    timedelta,
+)
+
+from sqlalchemy import (
+    ColumnElement,
+    delete,
+    func,
+    or_,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.utils import (
+    get_current_utc_datetime,
+    get_norm_path,
+)
+from src.files.entities import UsageEntity
+from src.files.errors import UsageNotExistError
+from src.files.index import UsageIndex
+from src.files.models import DirectoryUsagePostgresModel
+from src.files.utils import get_dir_path_ancestors
+
+
+class UsagePostgresIndex(UsageIndex):
+    """
+    PostgreSQL-backed implementation of UsageIndex using SQLAlchemy AsyncSession.
+
+    Every directory row holds the totals of its whole subtree, so the usage of any directory is read
+    by its primary key. A change is added to the rows of the directory and all its ancestors in one upsert,
+    ordered from the root, so concurrent changes lock the shared rows in the same order. The row of the root
+    directory also records the latest reconciliation of the whole index.
+    """
+
+    model = DirectoryUsagePostgresModel
+
+    root_dir_path = "/"
+
+    def __init__(self, postgres_async_session: AsyncSession) -> None:
+        """
+        Initialize the index with an async SQLAlchemy session.
+
+        Parameters:
+            postgres_async_session (AsyncSession): An AsyncSession bound to the PostgreSQL engine.
+        """
+
+        self.session = postgres_async_session
+
+    def _is_in_subtree(self, dir_path: str) -> ColumnElement[bool]:
+        """
+        Build the condition matching the rows of a directory and all its subdirectories.
+
+        Parameters:
+            dir_path (str): Normalized relative path of the directory.
+
+        Returns:
+            ColumnElement[bool]: The condition over directory usage records.
+        """
+
+        if dir_path == self.root_dir_path:
+            return true()
+
+        return or_(self.model.dir_path == dir_path, self.model.dir_path.startswith(f"{dir_path}/", autoescape=True))
+
+    async def _add_by_dir_paths(self, dir_paths: list[str], size: int, file_count: int, updated_at: datetime) -> None:
+        """
+        Add a change of size and number of files to the rows of directories, inserting the missing ones.
+
+        Totals never drop below zero, so a change racing with a reconciliation cannot make them negative.
+
+        Parameters:
+            dir_paths (list[str]): Normalized relative paths of the directories, ordered from the root.
+            size (int): Change of the size in bytes.
+            file_count (int): Change of the number of regular files.
+            updated_at (datetime): UTC datetime of the change.
+        """
+
+        if not dir_paths:
+            return
+
+        rows = [
+            dict(
+                dir_path=dir_path,
+                parent_dir_path=os.path.dirname(dir_path) if dir_path != self.root_dir_path else None,
+                size=max(size, 0),
+                file_count=max(file_count, 0),
+                updated_at=updated_at,
+            )
+            for dir_path in dir_paths
+        ]
+        query = insert(self.model).values(rows)
+        query = query.on_conflict_do_update(
+            index_elements=[self.model.dir_path],
+            set_=dict(
+                size=func.greatest(self.model.size + size, 0),
+                file_count=func.greatest(self.model.file_count + file_count, 0),
+                updated_at=query.excluded.updated_at,
+            ),
+        )
+
+        await self.session.execute(query)
+
+    async def _get_totals_by_dir_path(self, dir_path: str) -> tuple[int, int] | None:
+        """
+        Read the totals of a directory without loading its record into the session.
+
+        Parameters:
+            dir_path (str): Normalized relative path of the directory.
+
+        Returns:
+            tuple[int, int] | None: Size in bytes and number of regular files, or None if the directory is not indexed.
+        """
+
+        query = select(self.model.size, self.model.file_count).where(self.model.dir_path == dir_path)
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+
+        if row is None:
+            return None
+
+        return row.size, row.file_count
+
+    async def get_by_dir_path(self, dir_path: str) -> UsageEntity:
+        """
+        Fetch the usage record of a directory by its path key.
+
+        Parameters:
+            dir_path (str): Relative path of the directory.
+
+        Returns:
+            UsageEntity: The usage entity of the directory.
+
+        Raises:
+            UsageNotExistError: If the directory is not indexed.
+        """
+
+        dir_path = get_norm_path(dir_path)
+        orm = await self.session.get(self.model, dir_path)
+
+        if not orm:
+            raise UsageNotExistError(f"Cannot get usage of directory='{dir_path}'.")
+
+        return UsageEntity.model_validate(orm)
+
+    async def list_by_parent_dir_path(self, parent_dir_path: str, limit: int) -> list[UsageEntity]:
+        """
+        Retrieve the usage records of the direct subdirectories of a directory, the largest ones first.
+
+        Parameters:
+            parent_dir_path (str): Relative path of the parent directory.
+            limit (int): Maximum number of subdirectories returned.
+
+        Returns:
+            list[UsageEntity]: A list of usage entities ordered by size descending.
+        """
+
+        query = (
+            select(self.model)
+            .where(self.model.parent_dir_path == get_norm_path(parent_dir_path))
+            .order_by(self.model.size.desc(), self.model.dir_path)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        orms = result.scalars().all()
+
+        return [UsageEntity.model_validate(orm) for orm in orms]
+
+    async def update_by_dir_path(self, dir_path: str, size: int, file_count: int) -> None:
+        """
+        Add a change of size and number of files to a directory and all its ancestors in one upsert.
+
+        Parameters:
+            dir_path (str): Relative path of the directory the change happened in.
+            size (int): Change of the size in bytes, negative if files were removed or shrunk.
+            file_count (int): Change of the number of regular files, negative if files were removed.
+        """
+
+        await self._add_by_dir_paths(get_dir_path_ancestors(dir_path), size, file_count, get_current_utc_datetime())
+        await self.session.commit()
+
+    async def delete_by_dir_path(self, dir_path: str) -> None:
+        """
+        Delete the usage records of a directory and all its subdirectories, subtracting its totals from its ancestors.
+
+        Parameters:
+            dir_path (str): Relative path of the removed directory.
+        """
+
+        dir_paths = get_dir_path_ancestors(dir_path)
+        totals = await self._get_totals_by_dir_path(dir_paths[-1])
+
+        if totals is None:
+            return
+
+        await self._add_by_dir_paths(dir_paths[:-1], -totals[0], -totals[1], get_current_utc_datetime())
+        await self.session.execute(delete(self.model).where(self._is_in_subtree(dir_paths[-1])))
+        await self.session.commit()
+
+    async def replace_by_dir_path(self, dir_path: str, usages: dict[str, tuple[int, int]]) -> None:
+        """
+        Replace the usage records of a directory and all its subdirectories in one transaction,
+        adjusting its ancestors by the difference of its totals.
+
+        Parameters:
+            dir_path (str): Relative path of the scanned directory.
+            usages (dict[str, tuple[int, int]]):
+                Recursive size and number of files by relative directory path, empty if the directory is missing.
+        """
+
+        dir_paths = get_dir_path_ancestors(dir_path)
+        previous_size, previous_file_count = await self._get_totals_by_dir_path(dir_paths[-1]) or (0, 0)
+        size, file_count = usages.get(dir_paths[-1], (0, 0))
+        reconciled_at = get_current_utc_datetime()
+
+        await self.session.execute(delete(self.model).where(self._is_in_subtree(dir_paths[-1])))
+
+        if usages:
+            rows = [
+                dict(
+                    dir_path=usage_dir_path,
+                    parent_dir_path=os.path.dirname(usage_dir_path) if usage_dir_path != self.root_dir_path else None,
+                    size=usage_size,
+                    file_count=usage_file_count,
+                    updated_at=reconciled_at,
+                    reconciled_at=reconciled_at,
+                )
+                for usage_dir_path, (usage_size, usage_file_count) in usages.items()
+            ]
+
+            await self.session.execute(insert(self.model), rows)
+
+        if size != previous_size or file_count != previous_file_count:
+            await self._add_by_dir_paths(
+                dir_paths[:-1], size - previous_size, file_count - previous_file_count, reconciled_at
+            )
+
+        await self.session.commit()
+
+    async def claim_reconciliation(self, interval: int) -> bool:
+        """
+        Claim the reconciliation of the whole index in a single conditional statement on the root record.
+
+        The condition is evaluated by the database, so concurrent API workers cannot claim the same
+        reconciliation twice.
+
+        Parameters:
+            interval (int): Seconds after the latest reconciliation a new one is due.
+
+        Returns:
+            bool: True if the reconciliation is due and was claimed by the caller.
+        """
+
+        claimed_at = get_current_utc_datetime()
+        query = (
+            update(self.model)
+            .where(
+                self.model.dir_path == self.root_dir_path,
+                or_(
+                    self.model.reconciled_at.is_(None),
+                    self.model.reconciled_at <= claimed_at - timedelta(seconds=interval),
+                ),
+            )
+            .values(reconciled_at=claimed_at)
+            .returning(self.model.dir_path)
+        )
+        result = await self.session.execute(query)
+        claimed = result.scalar_one_or_none() is not None
+
+        if not claimed:
+            # Index is empty on the first start, so the root record is created already claimed
+            query = (
+                insert(self.model)
+                .values(
+                    dir_path=self.root_dir_path,
+                    parent_dir_path=None,
+                    size=0,
+                    file_count=0,
+                    updated_at=claimed_at,
+                    reconciled_at=claimed_at,
+                )
+                .on_conflict_do_nothing(index_elements=[self.model.dir_path])
+                .returning(self.model.dir_path)
+            )
+            result = await self.session.execute(query)
+            claimed = result.scalar_one_or_none() is not None
+
+        await self.session.commit()
+
+        return claimed
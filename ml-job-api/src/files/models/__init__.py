@@ -0,0 +1,6 @@
+from src.files.models.postgres import DirectoryUsagePostgresModel
+
+
+__all__ = [
+    "DirectoryUsagePostgresModel",
+]
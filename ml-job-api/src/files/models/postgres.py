@@ -0,0 +1,66 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    String,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+from src.common.models import BasePostgresModel
+from src.files.resources import usage_resources
+
+
+class DirectoryUsagePostgresModel(BasePostgresModel):
+    """
+    SQLAlchemy ORM model for the `directory_usages` table, representing the recursive disk usage
+    of every directory of the shared files directory.
+    """
+
+    __tablename__ = "directory_usages"
+
+    repr_columns = (
+        "dir_path",
+        "size",
+        "file_count",
+    )
+
+    dir_path: Mapped[str] = mapped_column(
+        String(usage_resources["dir_path"]["MAX_LENGTH"]),
+        primary_key=True,
+        comment="Directory path",
+    )
+
+    parent_dir_path: Mapped[str | None] = mapped_column(
+        String(usage_resources["dir_path"]["MAX_LENGTH"]),
+        nullable=True,
+        index=True,
+        comment="Directory parent directory path",
+    )
+
+    size: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        comment="Directory recursive size of regular files",
+    )
+
+    file_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        comment="Directory recursive number of regular files",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Directory usage latest update datetime",
+    )
+
+    reconciled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Directory usage latest reconciliation datetime",
+    )
@@ -1,8 +1,16 @@
+from src.files.params.archive import DirectoryArchiveParams
+from src.files.params.chunk import ChunkLocateParams
+from src.files.params.dataset import DatasetSliceParams
 from src.files.params.list import EntryListParams
 from src.files.params.locate import EntryLocateParams
+from src.files.params.usage import UsageLocateParams
 
 
 __all__ = [
+    "ChunkLocateParams",
+    "DatasetSliceParams",
+    "DirectoryArchiveParams",
     "EntryListParams",
     "EntryLocateParams",
+    "UsageLocateParams",
 ]
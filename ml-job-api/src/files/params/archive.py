@@ -0,0 +1,16 @@
+from pydantic import Field
+
+from src.files.params.locate import EntryLocateParams
+from src.files.resources import archive_resources
+from src.files.types import ArchiveType
+
+
+class DirectoryArchiveParams(EntryLocateParams):
+    """
+    Query parameters for locating a directory within storage and choosing the format of its archive.
+    """
+
+    archive_type: ArchiveType = Field(
+        archive_resources["archive_type"]["DEFAULT_VALUE"],
+        description=archive_resources["archive_type"]["DESCRIPTION"],
+    )
@@ -0,0 +1,19 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.files.resources import upload_resources
+
+
+class ChunkLocateParams(BaseModel):
+    """
+    Query parameters for locating a chunk within the file of an upload session.
+    """
+
+    offset: int = Field(
+        ...,
+        ge=upload_resources["offset"]["MIN_VALUE"],
+        description=upload_resources["offset"]["DESCRIPTION"],
+        examples=upload_resources["offset"]["EXAMPLES"],
+    )
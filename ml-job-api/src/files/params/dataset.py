@@ -0,0 +1,71 @@
+from typing import Self
+
+from pydantic import (
+    Field,
+    model_validator,
+)
+
+from src.files.params.locate import EntryLocateParams
+from src.files.resources import dataset_resources
+
+
+class DatasetSliceParams(EntryLocateParams):
+    """
+    Query parameters for locating an HDF5 file within storage and selecting a slice of one of its datasets.
+    """
+
+    name: str = Field(
+        ...,
+        min_length=dataset_resources["name"]["MIN_LENGTH"],
+        max_length=dataset_resources["name"]["MAX_LENGTH"],
+        description=dataset_resources["name"]["DESCRIPTION"],
+        examples=dataset_resources["name"]["EXAMPLES"],
+    )
+
+    row_start: int = Field(
+        dataset_resources["row_start"]["DEFAULT_VALUE"],
+        ge=dataset_resources["row_start"]["MIN_VALUE"],
+        description=dataset_resources["row_start"]["DESCRIPTION"],
+        examples=dataset_resources["row_start"]["EXAMPLES"],
+    )
+
+    row_stop: int | None = Field(
+        None,
+        ge=dataset_resources["row_stop"]["MIN_VALUE"],
+        description=dataset_resources["row_stop"]["DESCRIPTION"],
+        examples=dataset_resources["row_stop"]["EXAMPLES"],
+    )
+
+    column_start: int | None = Field(
+        None,
+        ge=dataset_resources["column_start"]["MIN_VALUE"],
+        description=dataset_resources["column_start"]["DESCRIPTION"],
+        examples=dataset_resources["column_start"]["EXAMPLES"],
+    )
+
+    column_stop: int | None = Field(
+        None,
+        ge=dataset_resources["column_stop"]["MIN_VALUE"],
+        description=dataset_resources["column_stop"]["DESCRIPTION"],
+        examples=dataset_resources["column_stop"]["EXAMPLES"],
+    )
+
+    @model_validator(mode="after")
+    def check_bounds(self) -> Self:
+        """
+        Ensure the slice does not stop before it starts.
+
+        Returns:
+            Self: The validated parameters.
+
+        Raises:
+            ValueError: If a stop index precedes its start index.
+        """
+
+        if self.row_stop is not None and self.row_stop < self.row_start:
+            raise ValueError("Row stop must not precede row start.")
+
+        if self.column_stop is not None and self.column_stop < (self.column_start or 0):
+            raise ValueError("Column stop must not precede column start.")
+
+        return self
@@ -1,14 +1,19 @@
+from typing import Self
+
 from pydantic import (
     BaseModel,
     Field,
+    model_validator,
 )
 
+from src.common.utils import decode_cursor
 from src.files.resources import list_resources
+from src.files.types import EntrySortType
 
 
 class EntryListParams(BaseModel):
     """
-    Query parameters for listing directory contents.
+    Query parameters for listing, filtering, ordering and paginating directory contents.
     """
 
     parent_dir_path: str = Field(
@@ -18,3 +23,67 @@ class EntryListParams(BaseModel):
         description=list_resources["parent_dir_path"]["DESCRIPTION"],
         examples=list_resources["parent_dir_path"]["EXAMPLES"],
     )
+
+    offset: int = Field(
+        list_resources["offset"]["DEFAULT_VALUE"],
+        ge=list_resources["offset"]["MIN_VALUE"],
+        description=list_resources["offset"]["DESCRIPTION"],
+        examples=list_resources["offset"]["EXAMPLES"],
+    )
+
+    limit: int = Field(
+        list_resources["limit"]["DEFAULT_VALUE"],
+        ge=list_resources["limit"]["MIN_VALUE"],
+        le=list_resources["limit"]["MAX_VALUE"],
+        description=list_resources["limit"]["DESCRIPTION"],
+        examples=list_resources["limit"]["EXAMPLES"],
+    )
+
+    sort: EntrySortType = Field(
+        list_resources["sort"]["DEFAULT_VALUE"],
+        description=list_resources["sort"]["DESCRIPTION"],
+    )
+
+    descending: bool = Field(
+        list_resources["descending"]["DEFAULT_VALUE"],
+        description=list_resources["descending"]["DESCRIPTION"],
+        examples=list_resources["descending"]["EXAMPLES"],
+    )
+
+    prefix: str | None = Field(
+        None,
+        min_length=list_resources["prefix"]["MIN_LENGTH"],
+        max_length=list_resources["prefix"]["MAX_LENGTH"],
+        description=list_resources["prefix"]["DESCRIPTION"],
+        examples=list_resources["prefix"]["EXAMPLES"],
+    )
+
+    cursor: str | None = Field(
+        None,
+        min_length=list_resources["cursor"]["MIN_LENGTH"],
+        max_length=list_resources["cursor"]["MAX_LENGTH"],
+        description=list_resources["cursor"]["DESCRIPTION"],
+        examples=list_resources["cursor"]["EXAMPLES"],
+    )
+
+    @model_validator(mode="after")
+    def check_cursor(self) -> Self:
+        """
+        Ensure the cursor is well-formed and was created for the same ordering.
+
+        Returns:
+            Self: The validated parameters.
+
+        Raises:
+            ValueError: If the cursor is malformed or was created for a different ordering.
+        """
+
+        if self.cursor is None:
+            return self
+
+        position = decode_cursor(self.cursor)
+
+        if len(position) != 5 or position[:2] != [self.sort, self.descending]:
+            raise ValueError("'cursor' must come from a listing with the same 'sort' and 'descending'.")
+
+        return self
@@ -0,0 +1,29 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.files.resources import usage_resources
+
+
+class UsageLocateParams(BaseModel):
+    """
+    Query parameters for locating the directory whose disk usage is summarized.
+    """
+
+    dir_path: str = Field(
+        usage_resources["dir_path"]["DEFAULT_VALUE"],
+        min_length=usage_resources["dir_path"]["MIN_LENGTH"],
+        max_length=usage_resources["dir_path"]["MAX_LENGTH"],
+        pattern=usage_resources["dir_path"]["PATTERN"],
+        description=usage_resources["dir_path"]["DESCRIPTION"],
+        examples=usage_resources["dir_path"]["EXAMPLES"],
+    )
+
+    limit: int = Field(
+        usage_resources["limit"]["DEFAULT_VALUE"],
+        ge=usage_resources["limit"]["MIN_VALUE"],
+        le=usage_resources["limit"]["MAX_VALUE"],
+        description=usage_resources["limit"]["DESCRIPTION"],
+        examples=usage_resources["limit"]["EXAMPLES"],
+    )
@@ -0,0 +1,49 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+from src.files.entities import (
+    DatasetEntity,
+    DatasetSliceEntity,
+)
+from src.files.params import DatasetSliceParams
+
+
+class DatasetReader(ABC):
+    """
+    Reader interface for inspecting and slicing the datasets of stored files.
+    """
+
+    @abstractmethod
+    async def list_by_filename_and_parent_dir_path(self, filename: str, parent_dir_path: str) -> list[DatasetEntity]:
+        """
+        List the datasets of a stored file with their shapes and types.
+
+        Parameters:
+            filename (str): Name of the file to inspect.
+            parent_dir_path (str): Directory path where the file is stored.
+
+        Returns:
+            list[DatasetEntity]: Entity models of the datasets, ordered by path.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_slice_by_filename_and_params(
+        self, filename: str, params: DatasetSliceParams, packed: bool = False
+    ) -> DatasetSliceEntity:
+        """
+        Read a slice of rows and columns of a dataset of a stored file.
+
+        Parameters:
+            filename (str): Name of the file to read.
+            params (DatasetSliceParams): Location of the file, name of the dataset and bounds of the slice.
+            packed (bool): Whether the values are packed as little-endian bytes rather than kept as nested lists.
+
+        Returns:
+            DatasetSliceEntity: Entity model of the slice with its values.
+        """
+
+        raise NotImplementedError
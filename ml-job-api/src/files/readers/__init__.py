@@ -0,0 +1,6 @@
+from src.files.readers.hdf5 import DatasetHDF5Reader
+
+
+__all__ = [
+    "DatasetHDF5Reader",
+]
@@ -0,0 +1,266 @@
+import asyncio
+import math
+import os
+import stat
+from concurrent.futures import Executor
+from typing import Any
+
+import h5py
+
+from src.common.caches import HandleCache
+from src.common.utils import get_norm_path
+from src.files.entities import (
+    DatasetEntity,
+    DatasetSliceEntity,
+)
+from src.files.errors import (
+    DatasetInvalidSliceError,
+    DatasetNotExistError,
+    FileNotExistError,
+)
+from src.files.params import DatasetSliceParams
+from src.files.reader import DatasetReader
+
+
+class DatasetHDF5Reader(DatasetReader):
+    """
+    HDF5 implementation of DatasetReader reading the HDF5 files of the shared files directory.
+
+    Files stay open in a shared handle cache, validated against the modification time, inode and size
+    of the file, so a rewritten file is opened again. Only the selected hyperslab of a dataset is read,
+    and slices beyond `max_slice_values` values are refused before any data is read.
+    """
+
+    def __init__(
+        self,
+        lfs_files_dir_path: str,
+        handle_cache: HandleCache,
+        max_slice_values: int,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Initialize the reader with the base path to files storage.
+
+        Parameters:
+            lfs_files_dir_path (str): Absolute path to the root of the shared files directory.
+            handle_cache (HandleCache): Cache of open HDF5 files.
+            max_slice_values (int): Maximum number of values of a slice read at once.
+            executor (Executor | None):
+                Optional executor reading HDF5 files, the default executor of the event loop if omitted.
+        """
+
+        self.shared_dir_path = lfs_files_dir_path
+        self.handle_cache = handle_cache
+        self.max_slice_values = max_slice_values
+        self.executor = executor
+
+    @staticmethod
+    def _get_dtype_name(dataset: h5py.Dataset) -> str:
+        """
+        Get the name of the type of the values of a dataset.
+
+        Parameters:
+            dataset (h5py.Dataset): The dataset.
+
+        Returns:
+            str: The NumPy type name in little-endian byte order, or `string` for text datasets.
+        """
+
+        if h5py.check_string_dtype(dataset.dtype):
+            return "string"
+
+        # Types are reported in the byte order packed values are returned in, whatever the order in the file
+        return str(dataset.dtype.newbyteorder("<"))
+
+    def _list_datasets(self, abs_file_path: str, version: tuple[int, int, int]) -> list[dict[str, Any]]:
+        """
+        Collect the path, shape and type of every dataset of an HDF5 file.
+
+        Parameters:
+            abs_file_path (str): Absolute path of the HDF5 file.
+            version (tuple[int, int, int]): Modification time, inode and size of the file.
+
+        Returns:
+            list[dict[str, Any]]: Fields of the dataset entities, ordered by path.
+        """
+
+        datasets = []
+
+        def collect(name: str, node: h5py.HLObject) -> None:
+            if isinstance(node, h5py.Dataset):
+                datasets.append(dict(name=f"/{name}", shape=list(node.shape), dtype=self._get_dtype_name(node)))
+
+        with self.handle_cache.use(abs_file_path, version, lambda: h5py.File(abs_file_path, "r")) as h5f_reader:
+            h5f_reader.visititems(collect)
+
+        return sorted(datasets, key=lambda dataset: dataset["name"])
+
+    def _read_slice(
+        self, abs_file_path: str, version: tuple[int, int, int], params: DatasetSliceParams, packed: bool
+    ) -> dict[str, Any]:
+        """
+        Read a slice of rows and optionally columns of a dataset of an HDF5 file.
+
+        Bounds beyond the extent of the dataset are clipped to it, as in Python slicing.
+
+        Parameters:
+            abs_file_path (str): Absolute path of the HDF5 file.
+            version (tuple[int, int, int]): Modification time, inode and size of the file.
+            params (DatasetSliceParams): Name of the dataset and bounds of the slice.
+            packed (bool): Whether the values are packed as little-endian bytes rather than kept as nested lists.
+
+        Returns:
+            dict[str, Any]: Fields of the slice entity.
+
+        Raises:
+            DatasetNotExistError: If the file has no dataset of the name.
+            DatasetInvalidSliceError: If the slice cannot be selected, exceeds the size limit, or cannot be packed.
+        """
+
+        with self.handle_cache.use(abs_file_path, version, lambda: h5py.File(abs_file_path, "r")) as h5f_reader:
+            dataset = h5f_reader.get(params.name)
+
+            if not isinstance(dataset, h5py.Dataset):
+                raise DatasetNotExistError(f"Cannot get dataset with name='{params.name}'.")
+
+            if dataset.ndim == 0:
+                raise DatasetInvalidSliceError(f"Cannot slice scalar dataset with name='{params.name}'.")
+
+            is_string = h5py.check_string_dtype(dataset.dtype) is not None
+            slice_fields = dict(name=params.name, dtype=self._get_dtype_name(dataset))
+
+            row_stop = min(params.row_stop if params.row_stop is not None else dataset.shape[0], dataset.shape[0])
+            row_start = min(params.row_start, row_stop)
+            selection = [slice(row_start, row_stop)]
+            slice_fields.update(row_start=row_start, row_stop=row_stop)
+
+            if params.column_start is not None or params.column_stop is not None:
+                if dataset.ndim < 2:
+                    raise DatasetInvalidSliceError(
+                        f"Cannot select columns of one-dimensional dataset with name='{params.name}'."
+                    )
+
+                column_stop = min(
+                    params.column_stop if params.column_stop is not None else dataset.shape[1], dataset.shape[1]
+                )
+                column_start = min(params.column_start or 0, column_stop)
+                selection.append(slice(column_start, column_stop))
+                slice_fields.update(column_start=column_start, column_stop=column_stop)
+
+            shape = [part.stop - part.start for part in selection] + list(dataset.shape[len(selection) :])
+
+            if math.prod(shape) > self.max_slice_values:
+                raise DatasetInvalidSliceError(
+                    f"Cannot read slice of shape={shape} exceeding {self.max_slice_values} values."
+                )
+
+            if packed and (is_string or dataset.dtype.kind not in "biuf"):
+                raise DatasetInvalidSliceError(
+                    f"Cannot pack values of type='{slice_fields['dtype']}' of dataset with name='{params.name}'."
+                )
+
+            values = (dataset.asstr() if is_string else dataset)[tuple(selection)]
+
+        if packed:
+            return dict(
+                shape=shape, data=values.astype(values.dtype.newbyteorder("<"), copy=False).tobytes(), **slice_fields
+            )
+
+        return dict(shape=shape, values=values.tolist(), **slice_fields)
+
+    def _get_file_version(self, filename: str, parent_dir_path: str) -> tuple[str, tuple[int, int, int]]:
+        """
+        Locate a stored file and compute the version its cached handle is validated against.
+
+        Parameters:
+            filename (str): Name of the file.
+            parent_dir_path (str): Directory path where the file is stored.
+
+        Returns:
+            tuple[str, tuple[int, int, int]]: Absolute path of the file, and its modification time, inode and size.
+
+        Raises:
+            FileNotExistError: If the file does not exist or is not a regular file.
+        """
+
+        rel_file_path = get_norm_path(parent_dir_path, child_name=filename)
+        abs_file_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path, child_name=filename)
+
+        # Ensure file exists
+        try:
+            file_stat = os.stat(abs_file_path)
+
+        except OSError:
+            raise FileNotExistError(f"Cannot read datasets of file='{rel_file_path}'.")
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise FileNotExistError(f"Cannot read datasets of file='{rel_file_path}'.")
+
+        return abs_file_path, (file_stat.st_mtime_ns, file_stat.st_ino, file_stat.st_size)
+
+    async def list_by_filename_and_parent_dir_path(self, filename: str, parent_dir_path: str) -> list[DatasetEntity]:
+        """
+        List the datasets of a stored HDF5 file, offloading the reading to the configured executor.
+
+        Parameters:
+            filename (str): Name of the file to inspect.
+            parent_dir_path (str): Relative directory path where the file is stored.
+
+        Returns:
+            list[DatasetEntity]: Entity models of the datasets, ordered by path.
+
+        Raises:
+            FileNotExistError: If the file does not exist or is not a regular file.
+            DatasetNotExistError: If the file cannot be read as an HDF5 file.
+        """
+
+        abs_file_path, version = self._get_file_version(filename, parent_dir_path)
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            datasets = await loop.run_in_executor(self.executor, self._list_datasets, abs_file_path, version)
+
+        except OSError:
+            raise DatasetNotExistError(
+                f"Cannot read datasets of file='{get_norm_path(parent_dir_path, child_name=filename)}'."
+            )
+
+        return [DatasetEntity(**dataset) for dataset in datasets]
+
+    async def get_slice_by_filename_and_params(
+        self, filename: str, params: DatasetSliceParams, packed: bool = False
+    ) -> DatasetSliceEntity:
+        """
+        Read a slice of a dataset of a stored HDF5 file, offloading the reading to the configured executor.
+
+        Parameters:
+            filename (str): Name of the file to read.
+            params (DatasetSliceParams): Location of the file, name of the dataset and bounds of the slice.
+            packed (bool): Whether the values are packed as little-endian bytes rather than kept as nested lists.
+
+        Returns:
+            DatasetSliceEntity: Entity model of the slice with its values.
+
+        Raises:
+            FileNotExistError: If the file does not exist or is not a regular file.
+            DatasetNotExistError: If the file cannot be read as an HDF5 file or has no dataset of the name.
+            DatasetInvalidSliceError: If the slice cannot be selected, exceeds the size limit, or cannot be packed.
+        """
+
+        abs_file_path, version = self._get_file_version(filename, params.parent_dir_path)
+
+        loop = asyncio.get_running_loop()
+
+        try:
+            slice_fields = await loop.run_in_executor(
+                self.executor, self._read_slice, abs_file_path, version, params, packed
+            )
+
+        except OSError:
+            raise DatasetNotExistError(
+                f"Cannot read datasets of file='{get_norm_path(params.parent_dir_path, child_name=filename)}'."
+            )
+
+        # Values are read from a validated dataset, so the entity is constructed without validating them again
+        return DatasetSliceEntity.model_construct(**slice_fields)
@@ -0,0 +1,38 @@
+import asyncio
+import logging
+
+from src.files.api.dependencies import get_service_using_lfs_and_postgres
+from src.infrastructure.locks import deletion_reap_lock
+from src.infrastructure.storages import postgres_async_session_maker
+from src.settings.files import file_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+async def reap_deletions_periodically() -> None:
+    """
+    Periodically remove the contents of the directories moved to the trash.
+
+    Every `deletion_reap_interval` seconds the file service removes the pending deletions at most
+    `deletion_reap_rate` bytes per second, and forgets deletions completed more than `deletion_retention`
+    seconds ago. Only the API worker holding the reap advisory lock removes files, so the rate is not
+    multiplied by the number of workers. Failures of a single pass are logged and never stop the loop;
+    cancel the task to stop it.
+    """
+
+    while True:
+        await asyncio.sleep(file_settings.deletion_reap_interval)
+
+        try:
+            async with deletion_reap_lock.try_hold() as held:
+                if not held:
+                    continue
+
+                async with postgres_async_session_maker() as postgres_async_session:
+                    service = get_service_using_lfs_and_postgres(postgres_async_session)
+
+                    await service.reap_deletions(file_settings.deletion_reap_rate, file_settings.deletion_retention)
+
+        except Exception:
+            logger.exception("Cannot reap directories moved to the trash.")
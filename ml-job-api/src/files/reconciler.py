@@ -0,0 +1,32 @@
+import asyncio
+import logging
+
+from src.files.api.dependencies import get_service_using_lfs_and_postgres
+from src.infrastructure.storages import postgres_async_session_maker
+from src.settings.files import file_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_usages_periodically() -> None:
+    """
+    Periodically recompute the disk usage index from a scan of the shared files directory.
+
+    Every `usage_reconcile_check_interval` seconds a new database session is opened and the file service
+    rescans the whole storage if no API worker did so in the last `usage_reconcile_interval` seconds,
+    correcting any drift of the incrementally updated totals, e.g. from files written by workers directly.
+    Failures of a single pass are logged and never stop the loop; cancel the task to stop it.
+    """
+
+    while True:
+        await asyncio.sleep(file_settings.usage_reconcile_check_interval)
+
+        try:
+            async with postgres_async_session_maker() as postgres_async_session:
+                service = get_service_using_lfs_and_postgres(postgres_async_session)
+
+                await service.reconcile_usages(file_settings.usage_reconcile_interval)
+
+        except Exception:
+            logger.exception("Cannot reconcile disk usage of directories.")
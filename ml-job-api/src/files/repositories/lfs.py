@@ -1,5 +1,19 @@
+import asyncio
+import fcntl
+import heapq
+import json
+import math
 import os
-from typing import AsyncIterator
+import stat
+from collections.abc import (
+    AsyncIterator,
+    Iterator,
+)
+from datetime import (
+    datetime,
+    timedelta,
+)
+from uuid import UUID
 
 import aiofiles
 import aiofiles.os
@@ -7,32 +21,86 @@ import aioshutil
 from fastapi import UploadFile
 
 from src.common.utils import (
+    decode_cursor,
+    encode_cursor,
+    generate_uuid,
+    get_current_utc_datetime,
     get_datetime_from_timestamp,
     get_norm_path,
 )
+from src.files.dto import UploadCreateDTO
 from src.files.entities import (
+    DeletionEntity,
     DirectoryEntity,
     FileEntity,
+    UploadEntity,
 )
 from src.files.errors import (
+    DeletionNotExistError,
     DirectoryAlreadyExistError,
     DirectoryNotExistError,
+    EntryInvalidPathError,
     FileNotExistError,
+    UploadChecksumMismatchError,
+    UploadIncompleteError,
+    UploadInvalidChunkError,
+    UploadNotExistError,
 )
+from src.files.params import EntryListParams
 from src.files.repository import FileRepository
+from src.files.types import (
+    ArchiveType,
+    EntrySortType,
+)
 from src.files.utils import (
-    download_file,
+    get_file_sha256,
+    get_tree_size,
+    iterate_tree_removal,
+    merge_ranges,
+    remove_tree_entries,
+    scan_dir,
+    scan_tree_usages,
+    stream_tar_archive,
+    stream_zip_archive,
     upload_file,
+    write_file_chunk,
 )
 
 
 class FileLFSRepository(FileRepository):
     """
     Local filesystem implementation of FileRepository.
+
+    Upload sessions live in a hidden directory of the shared files directory, so they are visible
+    to every API worker and their files are moved to the target location with an atomic rename.
+    Each session directory holds the session metadata, the preallocated file chunks are written
+    into in place, and an empty marker file per received byte range.
+
+    Deleted directories are moved with an atomic rename into a hidden trash directory of the shared
+    files directory, so they disappear at once, and are removed later by a throttled background reaper.
+    Each deletion directory holds the deletion metadata with its progress, the moved directory, and
+    a lock file held by the API worker creating or reaping the deletion, so workers never reap it twice.
     """
 
     chunk_size = 1024 * 1024
 
+    archive_zstd_level = 3
+    archive_stored_zstd_level = -10
+    archive_stored_suffixes = (".h5", ".hdf5", ".keras", ".zip", ".gz", ".bz2", ".xz", ".zst", ".npz", ".png", ".jpg")
+
+    uploads_dirname = ".uploads"
+    upload_meta_filename = "meta.json"
+    upload_data_filename = "data.part"
+    upload_chunks_dirname = "chunks"
+
+    trash_dirname = ".trash"
+    deletion_meta_filename = "meta.json"
+    deletion_lock_filename = "lock"
+    deletion_data_dirname = "data"
+    deletion_batch_entries = 1000
+    deletion_batches_per_second = 10
+    deletion_progress_interval = 1.0
+
     def __init__(self, lfs_files_dir_path: str) -> None:
         """
         Initialize with the base directory path for file storage.
@@ -43,6 +111,25 @@ class FileLFSRepository(FileRepository):
 
         self.shared_dir_path = lfs_files_dir_path
 
+    def _is_internal_path(self, rel_path: str) -> bool:
+        """
+        Check whether a relative path is, or lies under, the upload sessions or the trash directory.
+
+        These directories are not part of the stored files, so they are never listed, and no file
+        or directory under them can be uploaded, created, downloaded, archived or deleted through
+        the files endpoints.
+
+        Parameters:
+            rel_path (str): Normalized relative path of a file or directory.
+
+        Returns:
+            bool: True if the path belongs to the upload sessions or the trash.
+        """
+
+        top_name = rel_path.lstrip("\\/").split(os.sep, 1)[0]
+
+        return top_name in (self.uploads_dirname, self.trash_dirname)
+
     async def upload_by_filename_and_parent_dir_path(
         self, filename: str, parent_dir_path: str, file: UploadFile
     ) -> FileEntity:
@@ -56,18 +143,30 @@ class FileLFSRepository(FileRepository):
 
         Returns:
             FileEntity: Metadata for the stored file, including size and modified timestamp.
+
+        Raises:
+            EntryInvalidPathError: If the file would be stored in the upload sessions or the trash.
+            DirectoryAlreadyExistError: If a directory already exists at the file location.
         """
 
         # Build relative and absolute paths
         rel_parent_dir_path = get_norm_path(parent_dir_path)
+        rel_file_path = get_norm_path(parent_dir_path, child_name=filename)
         abs_parent_dir_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path)
         abs_file_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path, child_name=filename)
 
+        if self._is_internal_path(rel_file_path):
+            raise EntryInvalidPathError(f"Cannot upload file='{rel_file_path}'.")
+
         # Ensure directory exists
         await aiofiles.os.makedirs(abs_parent_dir_path, exist_ok=True)
 
         # Write file in chunks
-        await upload_file(abs_file_path, file, self.chunk_size)
+        try:
+            await upload_file(abs_file_path, file, self.chunk_size)
+
+        except IsADirectoryError:
+            raise DirectoryAlreadyExistError(f"Cannot upload file='{rel_file_path}'.")
 
         return FileEntity(
             filename=filename,
@@ -78,30 +177,47 @@ class FileLFSRepository(FileRepository):
 
     async def download_by_filename_and_parent_dir_path(
         self, filename: str, parent_dir_path: str
-    ) -> AsyncIterator[bytes]:
+    ) -> tuple[str, FileEntity]:
         """
-        Stream a file's contents back to the caller.
+        Locate a file to be sent back to the caller.
 
         Parameters:
             filename (str): Name of the file to retrieve.
             parent_dir_path (str): Relative directory path where the file resides.
 
         Returns:
-            AsyncIterator[bytes]: An async iterator yielding chunks of the file.
+            tuple[str, FileEntity]: Absolute path of the file, and its metadata including size and modified timestamp.
 
         Raises:
             FileNotExistError: If the file does not exist or is not a regular file.
         """
 
         # Build relative and absolute paths
+        rel_parent_dir_path = get_norm_path(parent_dir_path)
         rel_file_path = get_norm_path(parent_dir_path, child_name=filename)
         abs_file_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path, child_name=filename)
 
-        # Ensure file exists
-        if not os.path.exists(abs_file_path) or not os.path.isfile(abs_file_path):
+        # Ensure file exists and is a stored file
+        if self._is_internal_path(rel_file_path):
+            raise FileNotExistError(f"Cannot download file='{rel_file_path}'.")
+
+        try:
+            file_stat = await aiofiles.os.stat(abs_file_path)
+
+        except OSError:
             raise FileNotExistError(f"Cannot download file='{rel_file_path}'.")
 
-        return download_file(abs_file_path, self.chunk_size)
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise FileNotExistError(f"Cannot download file='{rel_file_path}'.")
+
+        file_entity = FileEntity(
+            filename=filename,
+            parent_dir_path=rel_parent_dir_path,
+            size=file_stat.st_size,
+            modified_at=get_datetime_from_timestamp(file_stat.st_mtime),
+        )
+
+        return abs_file_path, file_entity
 
     async def delete_by_filename_and_parent_dir_path(self, filename: str, parent_dir_path: str) -> None:
         """
@@ -119,7 +235,10 @@ class FileLFSRepository(FileRepository):
         rel_file_path = get_norm_path(parent_dir_path, child_name=filename)
         abs_file_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path, child_name=filename)
 
-        # Ensure file exists
+        # Ensure file exists and is a stored file
+        if self._is_internal_path(rel_file_path):
+            raise FileNotExistError(f"Cannot delete file='{rel_file_path}'.")
+
         if not os.path.exists(abs_file_path) or not os.path.isfile(abs_file_path):
             raise FileNotExistError(f"Cannot delete file='{rel_file_path}'.")
 
@@ -137,6 +256,7 @@ class FileLFSRepository(FileRepository):
             DirectoryEntity: Entity model for the created directory.
 
         Raises:
+            EntryInvalidPathError: If the directory would be created in the upload sessions or the trash.
             DirectoryAlreadyExistError: If a directory with the same name already exists.
         """
 
@@ -145,6 +265,9 @@ class FileLFSRepository(FileRepository):
         rel_dir_path = get_norm_path(parent_dir_path, child_name=dirname)
         abs_dir_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path, child_name=dirname)
 
+        if self._is_internal_path(rel_dir_path):
+            raise EntryInvalidPathError(f"Cannot create directory='{rel_dir_path}'.")
+
         # Ensure directory does not exist
         if os.path.exists(abs_dir_path) and os.path.isdir(abs_dir_path):
             raise DirectoryAlreadyExistError(f"Cannot create directory='{rel_dir_path}'.")
@@ -156,14 +279,17 @@ class FileLFSRepository(FileRepository):
             parent_dir_path=rel_parent_dir_path,
         )
 
-    async def delete_by_dirname_and_parent_dir_path(self, dirname: str, parent_dir_path: str) -> None:
+    async def delete_by_dirname_and_parent_dir_path(self, dirname: str, parent_dir_path: str) -> DeletionEntity:
         """
-        Recursively remove a directory and its contents.
+        Atomically move a directory to the trash, its contents being removed by the background reaper.
 
         Parameters:
             dirname (str): Name of the directory to delete.
             parent_dir_path (str): Relative parent directory path.
 
+        Returns:
+            DeletionEntity: The scheduled deletion.
+
         Raises:
             DirectoryNotExistError: If the directory does not exist.
         """
@@ -172,57 +298,745 @@ class FileLFSRepository(FileRepository):
         rel_dir_path = get_norm_path(parent_dir_path, child_name=dirname)
         abs_dir_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path, child_name=dirname)
 
-        # Ensure directory exists
+        # Ensure directory exists and is a stored directory
+        if self._is_internal_path(rel_dir_path):
+            raise DirectoryNotExistError(f"Cannot delete directory='{rel_dir_path}'.")
+
         if not os.path.exists(abs_dir_path) or not os.path.isdir(abs_dir_path):
             raise DirectoryNotExistError(f"Cannot delete directory='{rel_dir_path}'.")
 
-        await aioshutil.rmtree(abs_dir_path, ignore_errors=True)
+        deletion_id = generate_uuid()
+        deletion_meta = dict(
+            deletion_id=str(deletion_id),
+            dir_path=rel_dir_path,
+            size=None,
+            removed=0,
+            requested_at=get_current_utc_datetime().isoformat(),
+            completed_at=None,
+        )
+
+        await aiofiles.os.makedirs(self._get_deletion_dir_path(deletion_id))
+
+        # The deletion stays locked until the directory is moved, so it is not reaped before
+        lock_fd = self._lock_deletion(deletion_id)
+
+        try:
+            await self._write_deletion_meta(deletion_id, deletion_meta)
+            await aiofiles.os.rename(abs_dir_path, self._get_deletion_dir_path(deletion_id, self.deletion_data_dirname))
+
+        except FileNotFoundError:
+            await aioshutil.rmtree(self._get_deletion_dir_path(deletion_id), ignore_errors=True)
+
+            raise DirectoryNotExistError(f"Cannot delete directory='{rel_dir_path}'.")
+
+        except OSError:
+            # Never leave a deletion without its directory behind
+            await aioshutil.rmtree(self._get_deletion_dir_path(deletion_id), ignore_errors=True)
+
+            raise
+
+        finally:
+            os.close(lock_fd)
+
+        return DeletionEntity(**deletion_meta)
+
+    async def archive_by_dirname_and_parent_dir_path(
+        self, dirname: str, parent_dir_path: str, archive_type: ArchiveType
+    ) -> Iterator[bytes]:
+        """
+        Archive a directory tree on the fly, without a temporary file and in constant memory.
+
+        The returned iterator is synchronous, as it reads files and compresses them while consumed,
+        so it is meant to be iterated in a thread pool. Already compressed files, e.g. HDF5 pools
+        and Keras models, are stored rather than recompressed.
+
+        Parameters:
+            dirname (str): Name of the directory to archive.
+            parent_dir_path (str): Relative parent directory path.
+            archive_type (ArchiveType): Format of the archive.
+
+        Returns:
+            Iterator[bytes]: Stream of the archive bytes.
+
+        Raises:
+            DirectoryNotExistError: If the directory does not exist.
+        """
+
+        # Build relative and absolute paths
+        rel_dir_path = get_norm_path(parent_dir_path, child_name=dirname)
+        abs_dir_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path, child_name=dirname)
+
+        # Ensure directory exists and is a stored directory
+        if self._is_internal_path(rel_dir_path) or not await aiofiles.os.path.isdir(abs_dir_path):
+            raise DirectoryNotExistError(f"Cannot archive directory='{rel_dir_path}'.")
+
+        if archive_type == ArchiveType.ZIP:
+            return stream_zip_archive(abs_dir_path, self.chunk_size, self.archive_stored_suffixes)
+
+        zstd_level = self.archive_zstd_level if archive_type == ArchiveType.TAR_ZST else None
+
+        return stream_tar_archive(
+            abs_dir_path, self.chunk_size, self.archive_stored_suffixes, zstd_level, self.archive_stored_zstd_level
+        )
+
+    @staticmethod
+    def _select_page(
+        dirnames: list[str], files: list[tuple[str, int, int]], params: EntryListParams
+    ) -> tuple[list[str], list[tuple[str, int, int]], str | None]:
+        """
+        Order scanned entries and select the requested page of them.
+
+        Directories precede files and are ordered by name, files are ordered by the requested key
+        with the name breaking ties. Only the entries up to the end of the page are ordered, with
+        a partial heap selection, so listing the first pages of a large directory stays cheap.
+
+        Parameters:
+            dirnames (list[str]): Names of the scanned subdirectories.
+            files (list[tuple[str, int, int]]): Names, sizes and modification times of the scanned files.
+            params (EntryListParams): Ordering and pagination parameters.
+
+        Returns:
+            tuple[list[str], list[tuple[str, int, int]], str | None]:
+                Subdirectory names and files of the page, and the cursor of the following page if there is one.
+        """
+
+        # Positions of the entries in the listing order within their group: directories first, then files
+        if params.sort == EntrySortType.SIZE:
+            file_positions = [(size, name, size, mtime_ns) for name, size, mtime_ns in files]
+
+        elif params.sort == EntrySortType.MODIFIED_AT:
+            file_positions = [(mtime_ns, name, size, mtime_ns) for name, size, mtime_ns in files]
+
+        else:
+            file_positions = [("", name, size, mtime_ns) for name, size, mtime_ns in files]
+
+        dir_positions = [(0 if params.sort != EntrySortType.NAME else "", name) for name in dirnames]
 
-    async def list_by_parent_dir_path(self, parent_dir_path: str) -> tuple[list[FileEntity], list[DirectoryEntity]]:
+        # Keep only the entries following the cursor
+        if params.cursor is not None:
+            _, _, group, key, name = decode_cursor(params.cursor)
+
+            def is_after(position: tuple) -> bool:
+                return position[:2] < (key, name) if params.descending else position[:2] > (key, name)
+
+            dir_positions = [position for position in dir_positions if group == 0 and is_after(position)]
+            file_positions = [position for position in file_positions if group == 0 or is_after(position)]
+
+        end = params.offset + params.limit
+        select = heapq.nlargest if params.descending else heapq.nsmallest
+
+        page_positions = [
+            *((0, position) for position in select(end, dir_positions)),
+            *((1, position) for position in select(max(end - len(dir_positions), 0), file_positions)),
+        ][params.offset : end]
+
+        next_cursor = None
+
+        if page_positions and end < len(dir_positions) + len(file_positions):
+            group, (key, name, *_) = page_positions[-1]
+            next_cursor = encode_cursor([params.sort, params.descending, group, key, name])
+
+        page_dirnames = [position[1] for group, position in page_positions if group == 0]
+        page_files = [position[1:] for group, position in page_positions if group == 1]
+
+        return page_dirnames, page_files, next_cursor
+
+    def _scan_page(
+        self, abs_parent_dir_path: str, params: EntryListParams
+    ) -> tuple[list[str], list[tuple[str, int, int]], int, int, str | None]:
+        """
+        Scan a directory and select the requested page of its entries.
+
+        Parameters:
+            abs_parent_dir_path (str): Absolute path of the directory to list.
+            params (EntryListParams): Filters, ordering and pagination parameters.
+
+        Returns:
+            tuple[list[str], list[tuple[str, int, int]], int, int, str | None]:
+                Subdirectory names and files of the page, the numbers of all matching files and subdirectories,
+                and the cursor of the following page if there is one.
         """
-        List files and subdirectories under the given directory.
+
+        dirnames, files = scan_dir(abs_parent_dir_path, params.prefix)
+
+        # Upload sessions and the trash are not part of the stored files
+        if get_norm_path(params.parent_dir_path) == "/":
+            dirnames = [dirname for dirname in dirnames if dirname not in (self.uploads_dirname, self.trash_dirname)]
+
+        page_dirnames, page_files, next_cursor = self._select_page(dirnames, files, params)
+
+        return page_dirnames, page_files, len(files), len(dirnames), next_cursor
+
+    async def list_by_params(
+        self, params: EntryListParams
+    ) -> tuple[list[FileEntity], list[DirectoryEntity], int, int, str | None]:
+        """
+        List a page of the files and subdirectories under the given directory.
+
+        The directory is scanned in a single `os.scandir` pass on a worker thread, and entities
+        are built only for the entries of the requested page.
 
         Parameters:
-            parent_dir_path (str): Relative path of the directory to list.
+            params (EntryListParams): Directory, filters, ordering and pagination parameters.
 
         Returns:
-            tuple[list[FileEntity], list[DirectoryEntity]]: Two lists: FileEntity list and DirectoryEntity list.
+            tuple[list[FileEntity], list[DirectoryEntity], int, int, str | None]:
+                FileEntity items and DirectoryEntity items of the page, the numbers of all matching files
+                and subdirectories, and the cursor of the following page if there is one.
 
         Raises:
             DirectoryNotExistError: If the target directory does not exist.
         """
 
         # Build relative and absolute paths
-        rel_parent_dir_path = get_norm_path(parent_dir_path)
-        abs_parent_dir_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path)
+        rel_parent_dir_path = get_norm_path(params.parent_dir_path)
+        abs_parent_dir_path = get_norm_path(params.parent_dir_path, prefix=self.shared_dir_path)
 
-        # Ensure directory exists
-        if not os.path.exists(abs_parent_dir_path) or not os.path.isdir(abs_parent_dir_path):
+        if self._is_internal_path(rel_parent_dir_path):
             raise DirectoryNotExistError(f"Cannot list directory='{rel_parent_dir_path}'.")
 
-        file_entities = []
-        directory_entities = []
-        entry_names = await aiofiles.os.listdir(abs_parent_dir_path)
+        # Scan directory and select page off the event loop
+        loop = asyncio.get_running_loop()
 
-        for entry_name in entry_names:
-            abs_entry_path = get_norm_path(parent_dir_path, prefix=self.shared_dir_path, child_name=entry_name)
+        try:
+            page_dirnames, page_files, file_count, directory_count, next_cursor = await loop.run_in_executor(
+                None, self._scan_page, abs_parent_dir_path, params
+            )
 
-            if os.path.isfile(abs_entry_path):
-                file_entity = FileEntity(
-                    filename=entry_name,
-                    parent_dir_path=rel_parent_dir_path,
-                    size=os.path.getsize(abs_entry_path),
-                    modified_at=get_datetime_from_timestamp(os.path.getmtime(abs_entry_path)),
-                )
+        except (FileNotFoundError, NotADirectoryError):
+            raise DirectoryNotExistError(f"Cannot list directory='{rel_parent_dir_path}'.")
+
+        file_entities = [
+            FileEntity(
+                filename=filename,
+                parent_dir_path=rel_parent_dir_path,
+                size=size,
+                modified_at=get_datetime_from_timestamp(mtime_ns / 1e9),
+            )
+            for filename, size, mtime_ns in page_files
+        ]
+        directory_entities = [
+            DirectoryEntity(
+                dirname=dirname,
+                parent_dir_path=rel_parent_dir_path,
+            )
+            for dirname in page_dirnames
+        ]
+
+        return file_entities, directory_entities, file_count, directory_count, next_cursor
+
+    def _get_upload_dir_path(self, upload_id: UUID, child_name: str | None = None) -> str:
+        """
+        Compute the absolute path of the directory of an upload session, or of an entry in it.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+            child_name (str | None): Optional name of an entry of the session directory.
+
+        Returns:
+            str: The absolute path.
+        """
+
+        return get_norm_path(f"/{self.uploads_dirname}/{upload_id}", prefix=self.shared_dir_path, child_name=child_name)
+
+    async def _read_upload_meta(self, upload_id: UUID) -> dict:
+        """
+        Read the metadata of an upload session.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+
+        Returns:
+            dict: The metadata of the session as created.
+
+        Raises:
+            UploadNotExistError: If the upload session does not exist.
+        """
+
+        try:
+            async with aiofiles.open(
+                self._get_upload_dir_path(upload_id, self.upload_meta_filename), "r", encoding="utf-8"
+            ) as file_reader:
+                return json.loads(await file_reader.read())
+
+        except (OSError, ValueError):
+            raise UploadNotExistError(f"Cannot get upload with ID={upload_id}.")
+
+    async def _list_upload_received(self, upload_id: UUID) -> list[tuple[int, int]]:
+        """
+        List the byte ranges of an upload session received so far, from its marker files.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+
+        Returns:
+            list[tuple[int, int]]: Sorted and disjoint half-open byte ranges.
+        """
 
-                file_entities.append(file_entity)
+        try:
+            marker_names = await aiofiles.os.listdir(self._get_upload_dir_path(upload_id, self.upload_chunks_dirname))
+
+        except OSError:
+            raise UploadNotExistError(f"Cannot get upload with ID={upload_id}.")
+
+        ranges = []
+
+        for marker_name in marker_names:
+            start, _, end = marker_name.partition("-")
+            ranges.append((int(start), int(end)))
+
+        return merge_ranges(ranges)
+
+    async def create_upload(self, dto: UploadCreateDTO) -> UploadEntity:
+        """
+        Create a resumable upload session, preallocating the file chunks are written into.
+
+        The file is created sparse with its declared size, so chunks can be written at any offset
+        and in parallel without growing it.
+
+        Parameters:
+            dto (UploadCreateDTO): Data transfer object containing the target location, size and checksum of the file.
+
+        Returns:
+            UploadEntity: The newly created upload session.
+
+        Raises:
+            EntryInvalidPathError: If the file would be stored in the upload sessions or the trash.
+            DirectoryAlreadyExistError: If a directory already exists at the file location.
+        """
+
+        rel_file_path = get_norm_path(dto.parent_dir_path, child_name=dto.filename)
+        abs_file_path = get_norm_path(dto.parent_dir_path, prefix=self.shared_dir_path, child_name=dto.filename)
+
+        if self._is_internal_path(rel_file_path):
+            raise EntryInvalidPathError(f"Cannot upload file='{rel_file_path}'.")
+
+        if await aiofiles.os.path.isdir(abs_file_path):
+            raise DirectoryAlreadyExistError(f"Cannot upload file='{rel_file_path}'.")
+
+        upload_id = generate_uuid()
+        upload_meta = dict(
+            upload_id=str(upload_id),
+            filename=dto.filename,
+            parent_dir_path=get_norm_path(dto.parent_dir_path),
+            size=dto.size,
+            sha256=dto.sha256,
+            created_at=get_current_utc_datetime().isoformat(),
+        )
+
+        await aiofiles.os.makedirs(self._get_upload_dir_path(upload_id, self.upload_chunks_dirname))
+
+        async with aiofiles.open(self._get_upload_dir_path(upload_id, self.upload_data_filename), "wb") as file_writer:
+            await file_writer.truncate(dto.size)
+
+        async with aiofiles.open(
+            self._get_upload_dir_path(upload_id, self.upload_meta_filename), "w", encoding="utf-8"
+        ) as file_writer:
+            await file_writer.write(json.dumps(upload_meta))
+
+        return UploadEntity(received=[], **upload_meta)
+
+    async def get_upload_by_upload_id(self, upload_id: UUID) -> UploadEntity:
+        """
+        Retrieve an upload session with the byte ranges received so far.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+
+        Returns:
+            UploadEntity: The upload session.
+
+        Raises:
+            UploadNotExistError: If the upload session does not exist.
+        """
 
-            else:
-                directory_entity = DirectoryEntity(
-                    dirname=entry_name,
-                    parent_dir_path=rel_parent_dir_path,
+        upload_meta = await self._read_upload_meta(upload_id)
+        received = await self._list_upload_received(upload_id)
+
+        return UploadEntity(received=received, **upload_meta)
+
+    async def write_chunk_by_upload_id_and_offset(
+        self, upload_id: UUID, offset: int, stream: AsyncIterator[bytes]
+    ) -> None:
+        """
+        Write a chunk straight into the preallocated file of an upload session and record its byte range.
+
+        A chunk is recorded only once it has been fully written, so an interrupted chunk is simply sent again.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+            offset (int): Byte offset in the uploaded file the chunk is written at.
+            stream (AsyncIterator[bytes]): Stream of the chunk bytes.
+
+        Raises:
+            UploadNotExistError: If the upload session does not exist.
+            UploadInvalidChunkError: If the chunk extends past the declared size of the file.
+        """
+
+        upload_meta = await self._read_upload_meta(upload_id)
+
+        try:
+            written = await write_file_chunk(
+                self._get_upload_dir_path(upload_id, self.upload_data_filename), offset, stream, upload_meta["size"]
+            )
+
+        except FileNotFoundError:
+            raise UploadNotExistError(f"Cannot write chunk of upload with ID={upload_id}.")
+
+        except ValueError:
+            raise UploadInvalidChunkError(
+                f"Cannot write chunk at offset={offset} past size={upload_meta['size']} of upload with ID={upload_id}."
+            )
+
+        if not written:
+            return
+
+        marker_path = self._get_upload_dir_path(upload_id, f"{self.upload_chunks_dirname}/{offset}-{offset + written}")
+
+        try:
+            async with aiofiles.open(marker_path, "wb"):
+                pass
+
+        except FileNotFoundError:
+            raise UploadNotExistError(f"Cannot write chunk of upload with ID={upload_id}.")
+
+    async def complete_upload_by_upload_id(self, upload_id: UUID) -> FileEntity:
+        """
+        Verify a fully received upload and atomically rename its file to the target location.
+
+        An existing file at the target location is replaced. The session is removed once completed.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+
+        Returns:
+            FileEntity: Metadata for the stored file, including size and modified timestamp.
+
+        Raises:
+            UploadNotExistError: If the upload session does not exist.
+            UploadIncompleteError: If some byte ranges of the file have not been received.
+            UploadChecksumMismatchError: If the received file does not match the declared checksum.
+            DirectoryAlreadyExistError: If a directory was created at the file location meanwhile.
+        """
+
+        upload = await self.get_upload_by_upload_id(upload_id)
+
+        if upload.size and upload.received != [(0, upload.size)]:
+            raise UploadIncompleteError(f"Cannot complete upload with ID={upload_id} missing received bytes.")
+
+        abs_data_file_path = self._get_upload_dir_path(upload_id, self.upload_data_filename)
+
+        if upload.sha256:
+            loop = asyncio.get_running_loop()
+            sha256 = await loop.run_in_executor(None, get_file_sha256, abs_data_file_path)
+
+            if sha256 != upload.sha256:
+                raise UploadChecksumMismatchError(f"Cannot complete upload with ID={upload_id} having sha256={sha256}.")
+
+        # Build relative and absolute paths
+        abs_parent_dir_path = get_norm_path(upload.parent_dir_path, prefix=self.shared_dir_path)
+        abs_file_path = get_norm_path(upload.parent_dir_path, prefix=self.shared_dir_path, child_name=upload.filename)
+
+        # Ensure directory exists, then move file into place at once
+        await aiofiles.os.makedirs(abs_parent_dir_path, exist_ok=True)
+
+        try:
+            await aiofiles.os.replace(abs_data_file_path, abs_file_path)
+
+        except FileNotFoundError:
+            raise UploadNotExistError(f"Cannot complete upload with ID={upload_id}.")
+
+        except IsADirectoryError:
+            raise DirectoryAlreadyExistError(f"Cannot complete upload with ID={upload_id} onto a directory.")
+
+        await aioshutil.rmtree(self._get_upload_dir_path(upload_id), ignore_errors=True)
+
+        file_stat = await aiofiles.os.stat(abs_file_path)
+
+        return FileEntity(
+            filename=upload.filename,
+            parent_dir_path=upload.parent_dir_path,
+            size=file_stat.st_size,
+            modified_at=get_datetime_from_timestamp(file_stat.st_mtime),
+        )
+
+    async def delete_upload_by_upload_id(self, upload_id: UUID) -> None:
+        """
+        Abort an upload session and remove the data received so far.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+
+        Raises:
+            UploadNotExistError: If the upload session does not exist.
+        """
+
+        abs_upload_dir_path = self._get_upload_dir_path(upload_id)
+
+        if not await aiofiles.os.path.isdir(abs_upload_dir_path):
+            raise UploadNotExistError(f"Cannot delete upload with ID={upload_id}.")
+
+        await aioshutil.rmtree(abs_upload_dir_path, ignore_errors=True)
+
+    def _get_deletion_dir_path(self, deletion_id: UUID, child_name: str | None = None) -> str:
+        """
+        Compute the absolute path of the trash directory of a deletion, or of an entry in it.
+
+        Parameters:
+            deletion_id (UUID): The UUID of the deletion.
+            child_name (str | None): Optional name of an entry of the deletion directory.
+
+        Returns:
+            str: The absolute path.
+        """
+
+        return get_norm_path(f"/{self.trash_dirname}/{deletion_id}", prefix=self.shared_dir_path, child_name=child_name)
+
+    def _lock_deletion(self, deletion_id: UUID) -> int | None:
+        """
+        Try to take the exclusive lock of a deletion, released by closing the returned descriptor
+        or by the exit of the process holding it.
+
+        Parameters:
+            deletion_id (UUID): The UUID of the deletion.
+
+        Returns:
+            int | None: Descriptor of the lock file, or None if another worker holds the lock.
+        """
+
+        lock_fd = os.open(self._get_deletion_dir_path(deletion_id, self.deletion_lock_filename), os.O_RDWR | os.O_CREAT)
+
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        except BlockingIOError:
+            os.close(lock_fd)
+
+            return None
+
+        return lock_fd
+
+    async def _read_deletion_meta(self, deletion_id: UUID) -> dict:
+        """
+        Read the metadata of a deletion.
+
+        Parameters:
+            deletion_id (UUID): The UUID of the deletion.
+
+        Returns:
+            dict: The metadata of the deletion with its progress.
+
+        Raises:
+            DeletionNotExistError: If the deletion does not exist.
+        """
+
+        try:
+            async with aiofiles.open(
+                self._get_deletion_dir_path(deletion_id, self.deletion_meta_filename), "r", encoding="utf-8"
+            ) as file_reader:
+                return json.loads(await file_reader.read())
+
+        except (OSError, ValueError):
+            raise DeletionNotExistError(f"Cannot get deletion with ID={deletion_id}.")
+
+    async def _write_deletion_meta(self, deletion_id: UUID, deletion_meta: dict) -> None:
+        """
+        Atomically write the metadata of a deletion, so it is never read half-written.
+
+        Parameters:
+            deletion_id (UUID): The UUID of the deletion.
+            deletion_meta (dict): The metadata of the deletion with its progress.
+        """
+
+        abs_meta_file_path = self._get_deletion_dir_path(deletion_id, self.deletion_meta_filename)
+
+        async with aiofiles.open(f"{abs_meta_file_path}.tmp", "w", encoding="utf-8") as file_writer:
+            await file_writer.write(json.dumps(deletion_meta))
+
+        await aiofiles.os.replace(f"{abs_meta_file_path}.tmp", abs_meta_file_path)
+
+    async def _list_deletion_ids(self) -> list[UUID]:
+        """
+        List the deletions of the trash directory.
+
+        Returns:
+            list[UUID]: The UUIDs of the deletions.
+        """
+
+        try:
+            names = await aiofiles.os.listdir(get_norm_path(f"/{self.trash_dirname}", prefix=self.shared_dir_path))
+
+        except FileNotFoundError:
+            return []
+
+        deletion_ids = []
+
+        for name in names:
+            try:
+                deletion_ids.append(UUID(name))
+
+            except ValueError:
+                continue
+
+        return deletion_ids
+
+    async def _reap_deletion(self, deletion_id: UUID, bytes_per_second: int) -> None:
+        """
+        Remove the contents of a deletion in bounded batches, throttled to a byte rate.
+
+        Batches are removed by the default executor, yielding to the event loop between them, and the progress
+        is written to the deletion metadata every `deletion_progress_interval` seconds. A deletion locked by
+        another worker is skipped, and an interrupted deletion resumes where it stopped.
+
+        Parameters:
+            deletion_id (UUID): The UUID of the deletion.
+            bytes_per_second (int): Maximum rate in bytes per second files are removed at, zero for no limit.
+        """
+
+        lock_fd = self._lock_deletion(deletion_id)
+
+        if lock_fd is None:
+            return
+
+        try:
+            deletion_meta = await self._read_deletion_meta(deletion_id)
+
+            if deletion_meta["completed_at"] is not None:
+                return
+
+            abs_data_dir_path = self._get_deletion_dir_path(deletion_id, self.deletion_data_dirname)
+            loop = asyncio.get_running_loop()
+
+            if deletion_meta["size"] is None:
+                deletion_meta["size"] = await loop.run_in_executor(None, get_tree_size, abs_data_dir_path)
+
+                await self._write_deletion_meta(deletion_id, deletion_meta)
+
+            removal = iterate_tree_removal(abs_data_dir_path)
+            max_batch_size = (
+                max(bytes_per_second // self.deletion_batches_per_second, 1) if bytes_per_second else math.inf
+            )
+            started_at = written_at = loop.time()
+            removed = 0
+
+            while True:
+                batch_size, is_removed = await loop.run_in_executor(
+                    None, remove_tree_entries, removal, max_batch_size, self.deletion_batch_entries
                 )
+                removed += batch_size
+                deletion_meta["removed"] += batch_size
+
+                if is_removed:
+                    break
+
+                if loop.time() - written_at >= self.deletion_progress_interval:
+                    await self._write_deletion_meta(deletion_id, deletion_meta)
+
+                    written_at = loop.time()
+
+                # Wait until the removed bytes fit into the rate since the start of the removal
+                delay = removed / bytes_per_second - (loop.time() - started_at) if bytes_per_second else 0
+
+                await asyncio.sleep(max(delay, 0))
+
+            deletion_meta["completed_at"] = get_current_utc_datetime().isoformat()
+
+            await self._write_deletion_meta(deletion_id, deletion_meta)
+
+        finally:
+            os.close(lock_fd)
+
+    async def get_deletion_by_deletion_id(self, deletion_id: UUID) -> DeletionEntity:
+        """
+        Retrieve the progress of a background deletion of a directory.
+
+        Parameters:
+            deletion_id (UUID): The UUID of the deletion.
+
+        Returns:
+            DeletionEntity: The deletion.
+
+        Raises:
+            DeletionNotExistError: If the deletion does not exist, or its record has expired.
+        """
+
+        deletion_meta = await self._read_deletion_meta(deletion_id)
+
+        return DeletionEntity(**deletion_meta)
+
+    async def list_deletions(self) -> list[DeletionEntity]:
+        """
+        List the pending and recently completed background deletions of directories.
+
+        Deletions whose metadata cannot be read, e.g. while being created, are skipped.
+
+        Returns:
+            list[DeletionEntity]: The deletions, ordered by request datetime.
+        """
+
+        entities = []
+
+        for deletion_id in await self._list_deletion_ids():
+            try:
+                entities.append(DeletionEntity(**await self._read_deletion_meta(deletion_id)))
+
+            except DeletionNotExistError:
+                continue
+
+        return sorted(entities, key=lambda entity: (entity.requested_at, entity.deletion_id))
+
+    async def reap_deletions(self, bytes_per_second: int, retention: int) -> None:
+        """
+        Remove the contents of the pending deletions one after another, oldest first,
+        and remove the records of deletions completed more than `retention` seconds ago.
+
+        Parameters:
+            bytes_per_second (int): Maximum rate in bytes per second files are removed at, zero for no limit.
+            retention (int): Seconds the record of a completed deletion is kept for.
+        """
+
+        deletion_metas = []
+
+        for deletion_id in await self._list_deletion_ids():
+            try:
+                deletion_metas.append(await self._read_deletion_meta(deletion_id))
+
+            except DeletionNotExistError:
+                continue
+
+        for deletion_meta in sorted(deletion_metas, key=lambda deletion_meta: deletion_meta["requested_at"]):
+            deletion_id = UUID(deletion_meta["deletion_id"])
+
+            if deletion_meta["completed_at"] is None:
+                await self._reap_deletion(deletion_id, bytes_per_second)
+
+            elif get_current_utc_datetime() - datetime.fromisoformat(deletion_meta["completed_at"]) > timedelta(
+                seconds=retention
+            ):
+                await aioshutil.rmtree(self._get_deletion_dir_path(deletion_id), ignore_errors=True)
+
+    async def scan_usages_by_dir_path(self, dir_path: str) -> dict[str, tuple[int, int]]:
+        """
+        Walk a directory tree once in the default executor, summing the sizes of its regular files bottom-up.
+
+        Upload sessions and the trash are not part of the stored files, so they are skipped when
+        the whole shared files directory is scanned.
+
+        Parameters:
+            dir_path (str): Relative path of the directory to scan.
+
+        Returns:
+            dict[str, tuple[int, int]]:
+                Total size in bytes and number of regular files by relative directory path,
+                empty if the directory does not exist.
+        """
+
+        # Build relative and absolute paths
+        rel_dir_path = get_norm_path(dir_path)
+        abs_dir_path = get_norm_path(dir_path, prefix=self.shared_dir_path)
+
+        excluded_dirnames = (self.uploads_dirname, self.trash_dirname) if rel_dir_path == os.sep else ()
 
-                directory_entities.append(directory_entity)
+        loop = asyncio.get_running_loop()
 
-        return file_entities, directory_entities
+        return await loop.run_in_executor(None, scan_tree_usages, abs_dir_path, rel_dir_path, excluded_dirnames)
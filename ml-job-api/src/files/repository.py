@@ -2,14 +2,23 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from typing import AsyncIterator
+from collections.abc import (
+    AsyncIterator,
+    Iterator,
+)
+from uuid import UUID
 
 from fastapi import UploadFile
 
+from src.files.dto import UploadCreateDTO
 from src.files.entities import (
+    DeletionEntity,
     DirectoryEntity,
     FileEntity,
+    UploadEntity,
 )
+from src.files.params import EntryListParams
+from src.files.types import ArchiveType
 
 
 class FileRepository(ABC):
@@ -38,16 +47,16 @@ class FileRepository(ABC):
     @abstractmethod
     async def download_by_filename_and_parent_dir_path(
         self, filename: str, parent_dir_path: str
-    ) -> AsyncIterator[bytes]:
+    ) -> tuple[str, FileEntity]:
         """
-        Stream the contents of a stored file back to the caller.
+        Locate a stored file to be sent back to the caller.
 
         Parameters:
             filename (str): Name of the file to retrieve.
             parent_dir_path (str): Directory path where the file is stored.
 
         Returns:
-            AsyncIterator[bytes]: An asynchronous iterator yielding chunks of the file's bytes.
+            tuple[str, FileEntity]: Local path the file's contents can be sent from, and metadata about the file.
         """
 
         raise NotImplementedError
@@ -80,29 +89,173 @@ class FileRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_by_dirname_and_parent_dir_path(self, dirname: str, parent_dir_path: str) -> None:
+    async def delete_by_dirname_and_parent_dir_path(self, dirname: str, parent_dir_path: str) -> DeletionEntity:
         """
-        Remove a directory and its contents from the storage.
+        Remove a directory from the storage at once, scheduling the removal of its contents in the background.
 
         Parameters:
             dirname (str): Name of the directory to delete.
             parent_dir_path (str): Parent directory path where the directory resides.
+
+        Returns:
+            DeletionEntity: Entity model representing the scheduled deletion.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def archive_by_dirname_and_parent_dir_path(
+        self, dirname: str, parent_dir_path: str, archive_type: ArchiveType
+    ) -> Iterator[bytes]:
+        """
+        Archive a directory tree to be streamed back to the caller.
+
+        Parameters:
+            dirname (str): Name of the directory to archive.
+            parent_dir_path (str): Directory path containing the directory.
+            archive_type (ArchiveType): Format of the archive.
+
+        Returns:
+            Iterator[bytes]: Stream of the archive bytes, generated while consumed.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_params(
+        self, params: EntryListParams
+    ) -> tuple[list[FileEntity], list[DirectoryEntity], int, int, str | None]:
+        """
+        List a page of the files and subdirectories under the given directory.
+
+        Parameters:
+            params (EntryListParams): Directory, filters, ordering and pagination parameters.
+
+        Returns:
+            tuple[list[FileEntity], list[DirectoryEntity], int, int, str | None]:
+                FileEntity items and DirectoryEntity items of the page, the numbers of all matching files
+                and subdirectories, and the cursor of the following page if there is one.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def create_upload(self, dto: UploadCreateDTO) -> UploadEntity:
+        """
+        Create a resumable upload session of a file.
+
+        Parameters:
+            dto (UploadCreateDTO): Data transfer object containing the target location, size and checksum of the file.
+
+        Returns:
+            UploadEntity: The newly created upload session.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_upload_by_upload_id(self, upload_id: UUID) -> UploadEntity:
+        """
+        Retrieve an upload session with the byte ranges received so far.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+
+        Returns:
+            UploadEntity: The upload session.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def write_chunk_by_upload_id_and_offset(
+        self, upload_id: UUID, offset: int, stream: AsyncIterator[bytes]
+    ) -> None:
+        """
+        Write a chunk of the uploaded file at the given offset.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+            offset (int): Byte offset in the uploaded file the chunk is written at.
+            stream (AsyncIterator[bytes]): Stream of the chunk bytes.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete_upload_by_upload_id(self, upload_id: UUID) -> FileEntity:
+        """
+        Verify a fully received upload and atomically move its file to the target location.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+
+        Returns:
+            FileEntity: Entity model containing metadata about the stored file.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_upload_by_upload_id(self, upload_id: UUID) -> None:
+        """
+        Abort an upload session and discard the data received so far.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_deletion_by_deletion_id(self, deletion_id: UUID) -> DeletionEntity:
+        """
+        Retrieve the progress of a background deletion of a directory.
+
+        Parameters:
+            deletion_id (UUID): The UUID of the deletion.
+
+        Returns:
+            DeletionEntity: Entity model representing the deletion.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_deletions(self) -> list[DeletionEntity]:
+        """
+        List the pending and recently completed background deletions of directories.
+
+        Returns:
+            list[DeletionEntity]: Entity models of the deletions, ordered by request datetime.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def reap_deletions(self, bytes_per_second: int, retention: int) -> None:
+        """
+        Remove the contents of the pending deletions, and forget deletions completed long ago.
+
+        Parameters:
+            bytes_per_second (int): Maximum rate in bytes per second files are removed at, zero for no limit.
+            retention (int): Seconds the record of a completed deletion is kept for.
         """
 
         raise NotImplementedError
 
     @abstractmethod
-    async def list_by_parent_dir_path(self, parent_dir_path: str) -> tuple[list[FileEntity], list[DirectoryEntity]]:
+    async def scan_usages_by_dir_path(self, dir_path: str) -> dict[str, tuple[int, int]]:
         """
-        List all files and subdirectories under the given directory.
+        Compute the recursive size and number of regular files of a directory and all its subdirectories.
 
         Parameters:
-            parent_dir_path (str): Directory path whose contents should be listed.
+            dir_path (str): Relative path of the directory to scan.
 
         Returns:
-            Tuple[List[FileEntity], List[DirectoryEntity]]:
-                Two lists: the first containing FileEntity items for each file,
-                the second containing DirectoryEntity items for each subdirectory.
+            dict[str, tuple[int, int]]:
+                Total size in bytes and number of regular files by relative directory path,
+                empty if the directory does not exist.
         """
 
         raise NotImplementedError
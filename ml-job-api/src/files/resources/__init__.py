@@ -1,14 +1,24 @@
 from src.files.resources.api import rest_resources
 from src.files.resources.entity import (
+    archive_resources,
+    dataset_resources,
+    deletion_resources,
     directory_resources,
     file_resources,
     list_resources,
+    upload_resources,
+    usage_resources,
 )
 
 
 __all__ = [
     "rest_resources",
+    "archive_resources",
+    "dataset_resources",
+    "deletion_resources",
     "directory_resources",
     "file_resources",
     "list_resources",
+    "upload_resources",
+    "usage_resources",
 ]
@@ -7,25 +7,64 @@ rest_resources = {
     "HTTP_500": "Internal Server Error — an unexpected error occurred during processing",
     "upload": {
         "HTTP_201": "File uploaded successfully",
+        "HTTP_400": "Requested file location is reserved by the storage",
+        "HTTP_409": "Requested file location is a directory",
         "SUMMARY": "Upload a new file",
         "DESCRIPTION": (
             "Accepts a multipart/form-data request and stores the file in the configured backend. "
             "Requires path parameter `filename` and location query parameters. "
-            "Returns metadata of the stored file. Possible errors: 422 for invalid inputs, "
-            "500 for storage failures."
+            "Returns metadata of the stored file. Possible errors: 400 if the location is reserved by the storage, "
+            "409 if a directory exists at the location, 422 for invalid inputs, 500 for storage failures."
         ),
     },
     "download": {
         "HTTP_200": "File download stream started",
+        "HTTP_206": "Requested byte ranges of the file download stream started",
+        "HTTP_304": "File held by the client is up to date",
         "HTTP_404": "Requested file not found",
+        "HTTP_416": "Requested byte ranges not satisfiable",
         "SUMMARY": "Download a file",
         "DESCRIPTION": (
             "Streams the contents of a stored file back to the client. "
             "Requires path parameter `filename` and location query parameters. "
-            "Possible errors: 404 if the file is missing, 422 for invalid inputs, "
+            "Responses carry `ETag` and `Last-Modified` headers, so a client holding the current file "
+            "gets 304 for `If-None-Match` or `If-Modified-Since`. Parts of the file are sent for the `Range` header, "
+            "e.g. to resume an interrupted download, unless `If-Range` no longer matches the file. "
+            "Possible errors: 404 if the file is missing, 416 for unsatisfiable ranges, 422 for invalid inputs, "
             "500 for backend errors."
         ),
     },
+    "list_datasets": {
+        "HTTP_200": "Datasets of the HDF5 file listed successfully",
+        "HTTP_404": "Requested file not found or not an HDF5 file",
+        "SUMMARY": "List the datasets of an HDF5 file",
+        "DESCRIPTION": (
+            "Lists the path, shape and type of every dataset of a stored HDF5 file, e.g. a `result.h5` of a job, "
+            "without downloading it. Requires path parameter `filename` and location query parameters. "
+            "Files are kept open until they change. "
+            "Possible errors: 404 if the file is missing or not an HDF5 file, 422 for invalid inputs, "
+            "500 for backend errors."
+        ),
+    },
+    "retrieve_dataset_slice": {
+        "HTTP_200": "Slice of the dataset retrieved successfully",
+        "HTTP_400": "Requested slice cannot be selected, is too large, or cannot be packed",
+        "HTTP_404": "Requested file or dataset not found",
+        "HTTP_406": "Requested slice representation not available",
+        "SUMMARY": "Retrieve a slice of a dataset of an HDF5 file",
+        "DESCRIPTION": (
+            "Reads the rows `row_start` to `row_stop` and optionally the columns `column_start` to `column_stop` "
+            "of the dataset `name` of a stored HDF5 file, e.g. `entropies` or `labels` of a `result.h5` of a job, "
+            "without reading the rest of the file. Bounds beyond the dataset are clipped to it. "
+            "Requires path parameter `filename` and location query parameters. Slices are limited in their number "
+            "of values. With `Accept: application/octet-stream`, values of numeric datasets are returned as "
+            "little-endian bytes in C order, of the type in header `X-Dataset-Dtype` and the comma-separated shape "
+            "in header `X-Dataset-Shape`. "
+            "Possible errors: 400 for slices of scalar datasets, columns of one-dimensional datasets, too large "
+            "slices or packing of non-numeric values, 404 if the file or dataset is missing, 406 for unsupported "
+            "`Accept` media types, 422 for invalid inputs, 500 for backend errors."
+        ),
+    },
     "remove": {
         "HTTP_204": "File removed successfully",
         "HTTP_404": "Requested file not found",
@@ -38,34 +77,144 @@ rest_resources = {
     },
     "initialize_directory": {
         "HTTP_201": "Directory initialized successfully",
+        "HTTP_400": "Requested directory location is reserved by the storage",
         "HTTP_409": "Requested directory already exists",
         "SUMMARY": "Initialize a new directory",
         "DESCRIPTION": (
             "Initializes a new directory in the storage backend. "
             "Requires path parameter `dirname` and location query parameters. "
-            "Possible errors: 409 if the directory already exists, "
+            "Possible errors: 400 if the location is reserved by the storage, 409 if the directory already exists, "
             "422 for invalid inputs, 500 for backend errors."
         ),
     },
     "remove_directory": {
-        "HTTP_204": "Directory removed successfully",
+        "HTTP_202": "Directory moved to the trash and scheduled for removal",
         "HTTP_404": "Requested directory not found",
         "SUMMARY": "Remove a directory",
         "DESCRIPTION": (
-            "Recursively removes a directory and its contents from storage. "
+            "Removes a directory and its contents from storage in the background. "
             "Requires path parameter `dirname` and location query parameters. "
+            "The directory is atomically moved to the trash, so it disappears at once, and its contents are removed "
+            "by a throttled background reaper; the returned `deletion_id` tracks the progress of the removal. "
             "Possible errors: 404 if the directory is missing, 422 for invalid inputs, "
             "500 for deletion failures."
         ),
     },
+    "list_deletions": {
+        "HTTP_200": "Deletions listed successfully",
+        "SUMMARY": "List directory deletions",
+        "DESCRIPTION": (
+            "Lists the background deletions of directories still being removed, and those completed "
+            "within the retention period, with the bytes removed so far. "
+            "Possible errors: 500 for listing failures."
+        ),
+    },
+    "retrieve_deletion": {
+        "HTTP_200": "Deletion retrieved successfully",
+        "HTTP_404": "Requested deletion not found",
+        "SUMMARY": "Retrieve the progress of a directory deletion",
+        "DESCRIPTION": (
+            "Retrieves the background deletion identified by path parameter `deletion_id`, with the total size "
+            "of the deleted directory once its removal started, the bytes removed so far, and the completion "
+            "datetime once fully removed. "
+            "Possible errors: 404 if the deletion is missing or its record expired, 422 for invalid inputs, "
+            "500 for retrieval failures."
+        ),
+    },
+    "download_directory": {
+        "HTTP_200": "Directory archive download stream started",
+        "HTTP_404": "Requested directory not found",
+        "SUMMARY": "Download a directory as an archive",
+        "DESCRIPTION": (
+            "Streams a directory and its contents back to the client as an archive generated on the fly, "
+            "e.g. to pull all results of a job at once. Requires path parameter `dirname` and location query "
+            "parameters. Query parameter `archive_type` selects a ZIP archive with deflated members, an uncompressed "
+            "TAR archive, or a TAR archive compressed with Zstandard. Already compressed files, e.g. HDF5 pools and "
+            "Keras models, are stored rather than recompressed. Symbolic links are skipped. "
+            "Possible errors: 404 if the directory is missing, 422 for invalid inputs, 500 for backend errors."
+        ),
+    },
     "list": {
         "HTTP_200": "File and directory list retrieved successfully",
         "HTTP_404": "Requested directory not found",
         "SUMMARY": "List directory contents",
         "DESCRIPTION": (
-            "Retrieves summaries of all files and subdirectories under a given storage location. "
-            "Requires location query parameters. Possible errors: 404 if the directory is missing, "
-            "422 for invalid inputs, 500 for listing failures."
+            "Retrieves summaries of the files and subdirectories under a given storage location, "
+            "optionally limited to names starting with query parameter `prefix`. Directories precede files "
+            "and are ordered by name, files are ordered by query parameter `sort`, reversed with `descending`. "
+            "Pages are selected by `offset` and `limit`, optionally after the `cursor` returned as `next_cursor` "
+            "by the previous page, with the counts of all matching entries. "
+            "Possible errors: 404 if the directory is missing, 422 for invalid inputs, 500 for listing failures."
+        ),
+    },
+    "retrieve_usage": {
+        "HTTP_200": "Directory disk usage retrieved successfully",
+        "HTTP_404": "Requested directory not indexed",
+        "SUMMARY": "Retrieve the disk usage of a directory",
+        "DESCRIPTION": (
+            "Retrieves the total `size` and `file_count` of the regular files under the directory of query parameter "
+            "`dir_path` and all its subdirectories, with its at most `limit` largest direct subdirectories. "
+            "Totals are read from an index updated by every upload and deletion, and by the end of every job, "
+            "so the usage of a job is the usage of its `dir_path`. The index is periodically recomputed from "
+            "a scan of the whole storage, correcting files written outside the API, at `reconciled_at`. "
+            "Possible errors: 404 if the directory is not indexed, 422 for invalid inputs, 500 for backend failures."
+        ),
+    },
+    "initialize_upload": {
+        "HTTP_201": "Upload session created successfully",
+        "HTTP_400": "Requested file location is reserved by the storage",
+        "HTTP_409": "Requested file location is a directory",
+        "SUMMARY": "Create a resumable upload",
+        "DESCRIPTION": (
+            "Creates a resumable upload session of a file of body field `size` bytes, to be stored as `filename` "
+            "in `parent_dir_path`, optionally verified against body field `sha256` on completion. "
+            "Possible errors: 400 if the location is reserved by the storage, 409 if a directory exists at "
+            "the location, 422 for invalid inputs, 500 for backend errors."
+        ),
+    },
+    "retrieve_upload": {
+        "HTTP_200": "Upload session retrieved successfully",
+        "HTTP_404": "Requested upload session not found",
+        "SUMMARY": "Retrieve a resumable upload",
+        "DESCRIPTION": (
+            "Retrieves the upload session identified by path parameter `upload_id` with the byte ranges "
+            "received so far, so an interrupted upload sends only the missing chunks. "
+            "Possible errors: 404 if the session is missing, 422 for invalid inputs, 500 for backend errors."
+        ),
+    },
+    "upload_chunk": {
+        "HTTP_204": "Upload chunk written successfully",
+        "HTTP_400": "Upload chunk extends past the size of the file",
+        "HTTP_404": "Requested upload session not found",
+        "SUMMARY": "Upload a chunk of a resumable upload",
+        "DESCRIPTION": (
+            "Writes the raw request body straight into the file of the upload session identified by path parameter "
+            "`upload_id`, at byte offset of query parameter `offset`. Chunks may be sent in any order, "
+            "in parallel, and again after a failure. "
+            "Possible errors: 400 if the chunk extends past the size of the file, 404 if the session is missing, "
+            "422 for invalid inputs, 500 for backend errors."
+        ),
+    },
+    "complete_upload": {
+        "HTTP_201": "Upload completed and file stored successfully",
+        "HTTP_404": "Requested upload session not found",
+        "HTTP_409": "Upload incomplete, not matching its checksum, or its file location is a directory",
+        "SUMMARY": "Complete a resumable upload",
+        "DESCRIPTION": (
+            "Verifies that every byte of the upload session identified by path parameter `upload_id` was received, "
+            "and its SHA-256 digest if declared, then atomically moves the file to its location, replacing "
+            "an existing file, and removes the session. "
+            "Possible errors: 404 if the session is missing, 409 if the file is incomplete, its checksum "
+            "does not match or a directory exists at its location, 422 for invalid inputs, 500 for backend errors."
+        ),
+    },
+    "remove_upload": {
+        "HTTP_204": "Upload session aborted successfully",
+        "HTTP_404": "Requested upload session not found",
+        "SUMMARY": "Abort a resumable upload",
+        "DESCRIPTION": (
+            "Aborts the upload session identified by path parameter `upload_id` and discards its received data. "
+            "Possible errors: 404 if the session is missing, 422 for invalid inputs, 500 for backend errors."
         ),
     },
 }
@@ -47,25 +47,247 @@ list_resources = {
         "DESCRIPTION": "Path to the parent directory whose contents will be listed",
         "EXAMPLES": ["/"],
     },
+    "offset": {
+        "MIN_VALUE": 0,
+        "DEFAULT_VALUE": 0,
+        "DESCRIPTION": "Number of entries to skip, after the entry of the cursor if given",
+        "EXAMPLES": [0],
+    },
+    "limit": {
+        "MIN_VALUE": 0,
+        "MAX_VALUE": 10000,
+        "DEFAULT_VALUE": 1000,
+        "DESCRIPTION": "Maximum number of files and directories returned",
+        "EXAMPLES": [100],
+    },
+    "sort": {
+        "DEFAULT_VALUE": "NAME",
+        "DESCRIPTION": "Key the files are ordered by, directories always precede files and are ordered by name",
+    },
+    "descending": {
+        "DEFAULT_VALUE": False,
+        "DESCRIPTION": "Whether the entries are ordered in descending order",
+        "EXAMPLES": [False],
+    },
+    "prefix": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 255,
+        "DESCRIPTION": "Prefix the names of the listed files and directories must start with",
+        "EXAMPLES": ["spec-56207"],
+    },
+    "cursor": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 1024,
+        "DESCRIPTION": (
+            "Opaque cursor of the previous page, the entries following it are listed, "
+            "only valid with the ordering of the previous page"
+        ),
+        "EXAMPLES": ["WyJOQU1FIixmYWxzZSwxLCIiLCJzcGVjLTU2MjA3LU0zMTAxMU40NEIyX3NwMDEtMDA2LmZpdHMiXQ=="],
+    },
+    "next_cursor": {
+        "DESCRIPTION": "Cursor listing the following page, omitted on the last page",
+        "EXAMPLES": ["WyJOQU1FIixmYWxzZSwxLCIiLCJzcGVjLTU2MjA3LU0zMTAxMU40NEIyX3NwMDEtMDA2LmZpdHMiXQ=="],
+    },
     "total": {
         "MIN_VALUE": 0,
-        "DESCRIPTION": "Total number of files and directories in the parent directory",
+        "DESCRIPTION": "Total number of files and directories in the parent directory matching the prefix",
         "EXAMPLES": [2],
     },
     "file_count": {
         "MIN_VALUE": 0,
-        "DESCRIPTION": "Number of files in the specified directory",
+        "DESCRIPTION": "Number of files in the specified directory matching the prefix",
         "EXAMPLES": [1],
     },
     "directory_count": {
         "MIN_VALUE": 0,
-        "DESCRIPTION": "Number of directories in the specified directory",
+        "DESCRIPTION": "Number of directories in the specified directory matching the prefix",
         "EXAMPLES": [1],
     },
     "files": {
-        "DESCRIPTION": "List of file summaries in the directory",
+        "DESCRIPTION": "List of file summaries of the page",
     },
     "directories": {
-        "DESCRIPTION": "List of directory summaries in the directory",
+        "DESCRIPTION": "List of directory summaries of the page",
+    },
+}
+
+upload_resources = {
+    "upload_id": {
+        "DESCRIPTION": "Unique identifier of the upload session",
+        "EXAMPLES": ["0b6d7c2e-5c1a-4d43-9a4e-2f0b1f6f9a51"],
+    },
+    "filename": {
+        "MIN_LENGTH": file_resources["filename"]["MIN_LENGTH"],
+        "MAX_LENGTH": 255,
+        "PATTERN": r"^(?!\.{1,2}$)[^\\/]+$",
+        "DESCRIPTION": "Name under which the uploaded file is stored, including its extension",
+        "EXAMPLES": ["training_data.h5"],
+    },
+    "parent_dir_path": {
+        "MIN_LENGTH": file_resources["parent_dir_path"]["MIN_LENGTH"],
+        "PATTERN": file_resources["parent_dir_path"]["PATTERN"],
+        "DESCRIPTION": "Path to the parent directory the uploaded file is stored in",
+        "EXAMPLES": ["/JOBS/job_lamost_2025_spectra_learning_3fa85f64-5717-4562-b3fc-2c963f66afa6"],
+    },
+    "size": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Size of the whole uploaded file in bytes",
+        "EXAMPLES": [5368709120],
+    },
+    "sha256": {
+        "PATTERN": r"^[0-9a-f]{64}$",
+        "DESCRIPTION": "Optional lowercase hex SHA-256 digest the uploaded file is verified against on completion",
+        "EXAMPLES": ["9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"],
+    },
+    "offset": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Byte offset in the uploaded file the chunk in the request body is written at",
+        "EXAMPLES": [0],
+    },
+    "received": {
+        "DESCRIPTION": "Sorted and disjoint half-open byte ranges of the uploaded file received so far",
+        "EXAMPLES": [[[0, 67108864], [134217728, 201326592]]],
+    },
+    "created_at": {
+        "DESCRIPTION": "UTC datetime when the upload session was created",
+        "EXAMPLES": ["2025-06-02T08:15:00Z"],
+    },
+}
+
+usage_resources = {
+    "dir_path": {
+        "MIN_LENGTH": file_resources["parent_dir_path"]["MIN_LENGTH"],
+        "MAX_LENGTH": 1024,
+        "PATTERN": file_resources["parent_dir_path"]["PATTERN"],
+        "DEFAULT_VALUE": "/",
+        "DESCRIPTION": "Path of the directory whose disk usage is summarized",
+        "EXAMPLES": ["/JOBS"],
+    },
+    "size": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Total size in bytes of the regular files of the directory and all its subdirectories",
+        "EXAMPLES": [42949672960],
+    },
+    "file_count": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Total number of regular files of the directory and all its subdirectories",
+        "EXAMPLES": [1280],
+    },
+    "updated_at": {
+        "DESCRIPTION": "UTC datetime when the usage of the directory last changed",
+        "EXAMPLES": ["2025-06-02T08:15:00Z"],
+    },
+    "reconciled_at": {
+        "DESCRIPTION": "UTC datetime when the usage of the directory was last recomputed by a scan of the storage",
+        "EXAMPLES": ["2025-06-02T06:00:00Z"],
+    },
+    "limit": {
+        "MIN_VALUE": 0,
+        "MAX_VALUE": 1000,
+        "DEFAULT_VALUE": 100,
+        "DESCRIPTION": "Maximum number of subdirectories returned, the largest ones first",
+        "EXAMPLES": [10],
+    },
+    "directories": {
+        "DESCRIPTION": "Usage of the largest direct subdirectories of the directory, ordered by size descending",
+    },
+}
+
+deletion_resources = {
+    "deletion_id": {
+        "DESCRIPTION": "Unique identifier of the background deletion of a directory",
+        "EXAMPLES": ["6a1f3c8e-2d4b-4f0a-9c7e-5b8d2e1f0a93"],
+    },
+    "dir_path": {
+        "DESCRIPTION": "Path the deleted directory was stored at before it was moved to the trash",
+        "EXAMPLES": ["/JOBS/job_lamost_2025_spectra_learning_3fa85f64-5717-4562-b3fc-2c963f66afa6"],
+    },
+    "size": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Total size in bytes of the files of the deleted directory, omitted until its removal starts",
+        "EXAMPLES": [42949672960],
+    },
+    "removed": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Size in bytes of the files of the deleted directory removed so far",
+        "EXAMPLES": [10737418240],
+    },
+    "requested_at": {
+        "DESCRIPTION": "UTC datetime when the directory was moved to the trash",
+        "EXAMPLES": ["2025-06-02T08:15:00Z"],
+    },
+    "completed_at": {
+        "DESCRIPTION": "UTC datetime when the deleted directory was fully removed, omitted while it is being removed",
+        "EXAMPLES": ["2025-06-02T08:21:40Z"],
+    },
+    "deletions": {
+        "DESCRIPTION": "List of the pending and recently completed deletions, ordered by request datetime",
+    },
+}
+
+archive_resources = {
+    "archive_type": {
+        "DEFAULT_VALUE": "ZIP",
+        "DESCRIPTION": (
+            "Format of the archive, ZIP with deflated members, uncompressed TAR, or TAR compressed with Zstandard"
+        ),
+    },
+    "extensions": {
+        "ZIP": ".zip",
+        "TAR": ".tar",
+        "TAR_ZST": ".tar.zst",
+    },
+    "media_types": {
+        "ZIP": "application/zip",
+        "TAR": "application/x-tar",
+        "TAR_ZST": "application/zstd",
+    },
+}
+
+dataset_resources = {
+    "name": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 1024,
+        "DESCRIPTION": "Path of the dataset within the HDF5 file",
+        "EXAMPLES": ["/entropies"],
+    },
+    "shape": {
+        "DESCRIPTION": "Shape of the dataset, or of the slice of it",
+        "EXAMPLES": [[1000, 3]],
+    },
+    "dtype": {
+        "DESCRIPTION": "NumPy type of the dataset values, or `string` for text",
+        "EXAMPLES": ["float32"],
+    },
+    "datasets": {
+        "DESCRIPTION": "List of dataset summaries of the HDF5 file, ordered by path",
+    },
+    "row_start": {
+        "MIN_VALUE": 0,
+        "DEFAULT_VALUE": 0,
+        "DESCRIPTION": "Index of the first row of the slice, along the first dimension of the dataset",
+        "EXAMPLES": [0],
+    },
+    "row_stop": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Index after the last row of the slice, the end of the dataset if omitted",
+        "EXAMPLES": [100],
+    },
+    "column_start": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Index of the first column of the slice, along the second dimension of the dataset",
+        "EXAMPLES": [0],
+    },
+    "column_stop": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Index after the last column of the slice, the end of the dataset if omitted",
+        "EXAMPLES": [3],
+    },
+    "values": {
+        "DESCRIPTION": "Values of the slice as nested lists of the slice shape",
+        "EXAMPLES": [[[0.12, 0.85, 0.03]]],
+    },
+    "data": {
+        "DESCRIPTION": "Values of the slice packed as little-endian bytes in C order",
     },
 }
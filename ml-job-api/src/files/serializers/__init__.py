@@ -1,3 +1,12 @@
+from src.files.serializers.dataset import (
+    DatasetListSerializer,
+    DatasetSliceSerializer,
+    DatasetSummarizeSerializer,
+)
+from src.files.serializers.deletion import (
+    DeletionListSerializer,
+    DeletionReadSerializer,
+)
 from src.files.serializers.list import EntryListSerializer
 from src.files.serializers.read import (
     DirectoryReadSerializer,
@@ -7,12 +16,25 @@ from src.files.serializers.summarize import (
     DirectorySummarizeSerializer,
     FileSummarizeSerializer,
 )
+from src.files.serializers.upload import UploadReadSerializer
+from src.files.serializers.usage import (
+    UsageReadSerializer,
+    UsageSummarizeSerializer,
+)
 
 
 __all__ = [
+    "DatasetListSerializer",
+    "DatasetSliceSerializer",
+    "DatasetSummarizeSerializer",
+    "DeletionListSerializer",
+    "DeletionReadSerializer",
     "EntryListSerializer",
     "DirectoryReadSerializer",
     "FileReadSerializer",
     "DirectorySummarizeSerializer",
     "FileSummarizeSerializer",
+    "UploadReadSerializer",
+    "UsageReadSerializer",
+    "UsageSummarizeSerializer",
 ]
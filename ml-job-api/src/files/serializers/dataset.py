@@ -0,0 +1,94 @@
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.files.resources import (
+    dataset_resources,
+    file_resources,
+)
+
+
+class DatasetSummarizeSerializer(BaseModel):
+    """
+    Serializer model for summary view for a dataset of an HDF5 file.
+    """
+
+    name: str = Field(
+        ...,
+        description=dataset_resources["name"]["DESCRIPTION"],
+        examples=dataset_resources["name"]["EXAMPLES"],
+    )
+
+    shape: list[int] = Field(
+        ...,
+        description=dataset_resources["shape"]["DESCRIPTION"],
+        examples=dataset_resources["shape"]["EXAMPLES"],
+    )
+
+    dtype: str = Field(
+        ...,
+        description=dataset_resources["dtype"]["DESCRIPTION"],
+        examples=dataset_resources["dtype"]["EXAMPLES"],
+    )
+
+
+class DatasetListSerializer(BaseModel):
+    """
+    Serializer model for listing the datasets of an HDF5 file.
+    """
+
+    filename: str = Field(
+        ...,
+        description=file_resources["filename"]["DESCRIPTION"],
+        examples=file_resources["filename"]["EXAMPLES"],
+    )
+
+    parent_dir_path: str = Field(
+        ...,
+        description=file_resources["parent_dir_path"]["DESCRIPTION"],
+        examples=file_resources["parent_dir_path"]["EXAMPLES"],
+    )
+
+    datasets: list[DatasetSummarizeSerializer] = Field(
+        ...,
+        description=dataset_resources["datasets"]["DESCRIPTION"],
+    )
+
+
+class DatasetSliceSerializer(DatasetSummarizeSerializer):
+    """
+    Serializer model for a slice of rows and columns of a dataset of an HDF5 file.
+    """
+
+    row_start: int = Field(
+        ...,
+        description=dataset_resources["row_start"]["DESCRIPTION"],
+        examples=dataset_resources["row_start"]["EXAMPLES"],
+    )
+
+    row_stop: int = Field(
+        ...,
+        description=dataset_resources["row_stop"]["DESCRIPTION"],
+        examples=dataset_resources["row_stop"]["EXAMPLES"],
+    )
+
+    column_start: int | None = Field(
+        None,
+        description=dataset_resources["column_start"]["DESCRIPTION"],
+        examples=dataset_resources["column_start"]["EXAMPLES"],
+    )
+
+    column_stop: int | None = Field(
+        None,
+        description=dataset_resources["column_stop"]["DESCRIPTION"],
+        examples=dataset_resources["column_stop"]["EXAMPLES"],
+    )
+
+    values: Any = Field(
+        ...,
+        description=dataset_resources["values"]["DESCRIPTION"],
+        examples=dataset_resources["values"]["EXAMPLES"],
+    )
@@ -0,0 +1,62 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.files.resources import deletion_resources
+
+
+class DeletionReadSerializer(BaseModel):
+    """
+    Serializer model for the progress of the background deletion of a directory.
+    """
+
+    deletion_id: UUID = Field(
+        ...,
+        description=deletion_resources["deletion_id"]["DESCRIPTION"],
+        examples=deletion_resources["deletion_id"]["EXAMPLES"],
+    )
+
+    dir_path: str = Field(
+        ...,
+        description=deletion_resources["dir_path"]["DESCRIPTION"],
+        examples=deletion_resources["dir_path"]["EXAMPLES"],
+    )
+
+    size: int | None = Field(
+        None,
+        description=deletion_resources["size"]["DESCRIPTION"],
+        examples=deletion_resources["size"]["EXAMPLES"],
+    )
+
+    removed: int = Field(
+        ...,
+        description=deletion_resources["removed"]["DESCRIPTION"],
+        examples=deletion_resources["removed"]["EXAMPLES"],
+    )
+
+    requested_at: datetime = Field(
+        ...,
+        description=deletion_resources["requested_at"]["DESCRIPTION"],
+        examples=deletion_resources["requested_at"]["EXAMPLES"],
+    )
+
+    completed_at: datetime | None = Field(
+        None,
+        description=deletion_resources["completed_at"]["DESCRIPTION"],
+        examples=deletion_resources["completed_at"]["EXAMPLES"],
+    )
+
+
+class DeletionListSerializer(BaseModel):
+    """
+    Serializer model for listing the background deletions of directories.
+    """
+
+    deletions: list[DeletionReadSerializer] = Field(
+        ...,
+        description=deletion_resources["deletions"]["DESCRIPTION"],
+    )
@@ -39,6 +39,24 @@ class EntryListSerializer(BaseModel):
         examples=list_resources["directory_count"]["EXAMPLES"],
     )
 
+    offset: int = Field(
+        ...,
+        description=list_resources["offset"]["DESCRIPTION"],
+        examples=list_resources["offset"]["EXAMPLES"],
+    )
+
+    limit: int = Field(
+        ...,
+        description=list_resources["limit"]["DESCRIPTION"],
+        examples=list_resources["limit"]["EXAMPLES"],
+    )
+
+    next_cursor: str | None = Field(
+        None,
+        description=list_resources["next_cursor"]["DESCRIPTION"],
+        examples=list_resources["next_cursor"]["EXAMPLES"],
+    )
+
     files: list[FileSummarizeSerializer] = Field(
         ...,
         description=list_resources["files"]["DESCRIPTION"],
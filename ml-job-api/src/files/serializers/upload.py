@@ -0,0 +1,57 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.files.resources import upload_resources
+
+
+class UploadReadSerializer(BaseModel):
+    """
+    Serializer model for the state of a resumable upload session.
+    """
+
+    upload_id: UUID = Field(
+        ...,
+        description=upload_resources["upload_id"]["DESCRIPTION"],
+        examples=upload_resources["upload_id"]["EXAMPLES"],
+    )
+
+    filename: str = Field(
+        ...,
+        description=upload_resources["filename"]["DESCRIPTION"],
+        examples=upload_resources["filename"]["EXAMPLES"],
+    )
+
+    parent_dir_path: str = Field(
+        ...,
+        description=upload_resources["parent_dir_path"]["DESCRIPTION"],
+        examples=upload_resources["parent_dir_path"]["EXAMPLES"],
+    )
+
+    size: int = Field(
+        ...,
+        description=upload_resources["size"]["DESCRIPTION"],
+        examples=upload_resources["size"]["EXAMPLES"],
+    )
+
+    sha256: str | None = Field(
+        None,
+        description=upload_resources["sha256"]["DESCRIPTION"],
+        examples=upload_resources["sha256"]["EXAMPLES"],
+    )
+
+    received: list[tuple[int, int]] = Field(
+        ...,
+        description=upload_resources["received"]["DESCRIPTION"],
+        examples=upload_resources["received"]["EXAMPLES"],
+    )
+
+    created_at: datetime = Field(
+        ...,
+        description=upload_resources["created_at"]["DESCRIPTION"],
+        examples=upload_resources["created_at"]["EXAMPLES"],
+    )
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.files.resources import usage_resources
+
+
+class UsageSummarizeSerializer(BaseModel):
+    """
+    Serializer model for summary view for the disk usage of a directory.
+    """
+
+    dir_path: str = Field(
+        ...,
+        description=usage_resources["dir_path"]["DESCRIPTION"],
+        examples=usage_resources["dir_path"]["EXAMPLES"],
+    )
+
+    size: int = Field(
+        ...,
+        description=usage_resources["size"]["DESCRIPTION"],
+        examples=usage_resources["size"]["EXAMPLES"],
+    )
+
+    file_count: int = Field(
+        ...,
+        description=usage_resources["file_count"]["DESCRIPTION"],
+        examples=usage_resources["file_count"]["EXAMPLES"],
+    )
+
+
+class UsageReadSerializer(UsageSummarizeSerializer):
+    """
+    Serializer model for detailed view for the disk usage of a directory with its largest subdirectories.
+    """
+
+    updated_at: datetime = Field(
+        ...,
+        description=usage_resources["updated_at"]["DESCRIPTION"],
+        examples=usage_resources["updated_at"]["EXAMPLES"],
+    )
+
+    reconciled_at: datetime | None = Field(
+        None,
+        description=usage_resources["reconciled_at"]["DESCRIPTION"],
+        examples=usage_resources["reconciled_at"]["EXAMPLES"],
+    )
+
+    directories: list[UsageSummarizeSerializer] = Field(
+        ...,
+        description=usage_resources["directories"]["DESCRIPTION"],
+    )
@@ -1,35 +1,115 @@
-from typing import AsyncIterator
+import logging
+from collections.abc import (
+    AsyncIterator,
+    Iterator,
+)
+from uuid import UUID
 
 from fastapi import UploadFile
 
+from src.common.utils import get_norm_path
+from src.files.dto import UploadCreateDTO
+from src.files.errors import FileNotExistError
+from src.files.index import UsageIndex
 from src.files.params import (
+    ChunkLocateParams,
+    DatasetSliceParams,
+    DirectoryArchiveParams,
     EntryListParams,
     EntryLocateParams,
+    UsageLocateParams,
 )
+from src.files.reader import DatasetReader
 from src.files.repository import FileRepository
 from src.files.serializers import (
+    DatasetListSerializer,
+    DatasetSliceSerializer,
+    DatasetSummarizeSerializer,
+    DeletionListSerializer,
+    DeletionReadSerializer,
     DirectoryReadSerializer,
     DirectorySummarizeSerializer,
     EntryListSerializer,
     FileReadSerializer,
     FileSummarizeSerializer,
+    UploadReadSerializer,
+    UsageReadSerializer,
+    UsageSummarizeSerializer,
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 class FileService:
     """
     Business logic layer for managing file and directory operations.
     """
 
-    def __init__(self, repository: FileRepository) -> None:
+    def __init__(
+        self,
+        repository: FileRepository,
+        dataset_reader: DatasetReader | None = None,
+        usage_index: UsageIndex | None = None,
+    ) -> None:
         """
         Initialize the file service with a repository implementation.
 
         Parameters:
             repository (FileRepository): Concrete repository for performing file and directory operations.
+            dataset_reader (DatasetReader | None): Optional reader for inspecting and slicing the datasets of files.
+            usage_index (UsageIndex | None):
+                Optional index of the disk usage of directories, kept up to date by every change of stored files.
         """
 
         self.repository = repository
+        self.dataset_reader = dataset_reader
+        self.usage_index = usage_index
+
+    async def _get_file_usage(self, filename: str, parent_dir_path: str) -> tuple[int, int]:
+        """
+        Get the size and number of a stored file before it is replaced or removed, to update the usage index.
+
+        Parameters:
+            filename (str): Name of the file.
+            parent_dir_path (str): Directory path where the file is stored.
+
+        Returns:
+            tuple[int, int]: Size in bytes and number of the file, zeros if it does not exist or nothing is indexed.
+        """
+
+        if self.usage_index is None:
+            return 0, 0
+
+        try:
+            _, entity = await self.repository.download_by_filename_and_parent_dir_path(filename, parent_dir_path)
+
+        except FileNotExistError:
+            return 0, 0
+
+        return entity.size, 1
+
+    async def _update_usage(self, dir_path: str, size: int, file_count: int) -> None:
+        """
+        Add a change of stored files to the usage of a directory and its ancestors.
+
+        The change has already happened in storage, so a failure is only logged, and the drift
+        is corrected by the next reconciliation.
+
+        Parameters:
+            dir_path (str): Directory path where the change happened.
+            size (int): Change of the size in bytes.
+            file_count (int): Change of the number of regular files.
+        """
+
+        if self.usage_index is None:
+            return
+
+        try:
+            await self.usage_index.update_by_dir_path(dir_path, size, file_count)
+
+        except Exception:
+            logger.exception("Cannot update usage of directory='%s'.", dir_path)
 
     async def upload_file_by_filename(
         self, filename: str, params: EntryLocateParams, file: UploadFile
@@ -46,23 +126,90 @@ class FileService:
             FileReadSerializer: Serializer containing metadata of the stored file.
         """
 
+        previous_size, previous_file_count = await self._get_file_usage(filename, params.parent_dir_path)
         entity = await self.repository.upload_by_filename_and_parent_dir_path(filename, params.parent_dir_path, file)
 
+        await self._update_usage(entity.parent_dir_path, entity.size - previous_size, 1 - previous_file_count)
+
         return FileReadSerializer(**entity.model_dump())
 
-    async def download_file_by_filename(self, filename: str, params: EntryLocateParams) -> AsyncIterator[bytes]:
+    async def download_file_by_filename(
+        self, filename: str, params: EntryLocateParams
+    ) -> tuple[str, FileReadSerializer]:
         """
-        Stream a stored file's contents back to the client.
+        Locate a stored file to be sent back to the client.
 
         Parameters:
             filename (str): Name of the file to retrieve.
             params (EntryLocateParams): Query parameters specifying the directory containing the file.
 
         Returns:
-            AsyncIterator[bytes]: An asynchronous iterator yielding chunks of the file's bytes.
+            tuple[str, FileReadSerializer]:
+                Local path the file's contents are sent from, and serializer containing metadata of the file.
+        """
+
+        file_path, entity = await self.repository.download_by_filename_and_parent_dir_path(
+            filename, params.parent_dir_path
+        )
+
+        return file_path, FileReadSerializer(**entity.model_dump())
+
+    async def list_datasets_by_filename(self, filename: str, params: EntryLocateParams) -> DatasetListSerializer:
+        """
+        List the datasets of a stored HDF5 file with their shapes and types.
+
+        Parameters:
+            filename (str): Name of the file to inspect.
+            params (EntryLocateParams): Query parameters specifying the directory containing the file.
+
+        Returns:
+            DatasetListSerializer: Serializer containing the summaries of the datasets of the file.
+        """
+
+        entities = await self.dataset_reader.list_by_filename_and_parent_dir_path(filename, params.parent_dir_path)
+        serializers = [DatasetSummarizeSerializer(**entity.model_dump()) for entity in entities]
+
+        return DatasetListSerializer(filename=filename, parent_dir_path=params.parent_dir_path, datasets=serializers)
+
+    async def retrieve_dataset_slice_by_filename(
+        self, filename: str, params: DatasetSliceParams
+    ) -> DatasetSliceSerializer:
+        """
+        Read a slice of a dataset of a stored HDF5 file as nested lists of values.
+
+        Parameters:
+            filename (str): Name of the file to read.
+            params (DatasetSliceParams): Query parameters locating the file and selecting the slice of the dataset.
+
+        Returns:
+            DatasetSliceSerializer: Serializer containing the bounds, shape and values of the slice.
+        """
+
+        entity = await self.dataset_reader.get_slice_by_filename_and_params(filename, params)
+
+        # Values are read from a validated dataset, so the serializer is constructed without validating them again
+        return DatasetSliceSerializer.model_construct(
+            values=entity.values, **entity.model_dump(exclude={"values", "data"})
+        )
+
+    async def retrieve_packed_dataset_slice_by_filename(
+        self, filename: str, params: DatasetSliceParams
+    ) -> tuple[bytes, DatasetSliceSerializer]:
+        """
+        Read a slice of a numeric dataset of a stored HDF5 file as packed little-endian bytes.
+
+        Parameters:
+            filename (str): Name of the file to read.
+            params (DatasetSliceParams): Query parameters locating the file and selecting the slice of the dataset.
+
+        Returns:
+            tuple[bytes, DatasetSliceSerializer]:
+                Values of the slice in C order, and serializer containing the bounds, shape and type of the slice.
         """
 
-        return await self.repository.download_by_filename_and_parent_dir_path(filename, params.parent_dir_path)
+        entity = await self.dataset_reader.get_slice_by_filename_and_params(filename, params, packed=True)
+
+        return entity.data, DatasetSliceSerializer.model_construct(**entity.model_dump(exclude={"values", "data"}))
 
     async def remove_file_by_filename(self, filename: str, params: EntryLocateParams) -> None:
         """
@@ -73,7 +220,10 @@ class FileService:
             params (EntryLocateParams): Query parameters specifying the directory containing the file.
         """
 
+        size, file_count = await self._get_file_usage(filename, params.parent_dir_path)
+
         await self.repository.delete_by_filename_and_parent_dir_path(filename, params.parent_dir_path)
+        await self._update_usage(params.parent_dir_path, -size, -file_count)
 
     async def initialize_directory_by_dirname(self, dirname: str, params: EntryLocateParams) -> DirectoryReadSerializer:
         """
@@ -89,41 +239,111 @@ class FileService:
 
         entity = await self.repository.create_by_dirname_and_parent_dir_path(dirname, params.parent_dir_path)
 
+        await self._update_usage(get_norm_path(entity.parent_dir_path, child_name=entity.dirname), 0, 0)
+
         return DirectoryReadSerializer(**entity.model_dump())
 
-    async def remove_directory_by_dirname(self, dirname: str, params: EntryLocateParams) -> None:
+    async def remove_directory_by_dirname(self, dirname: str, params: EntryLocateParams) -> DeletionReadSerializer:
         """
-        Recursively remove a directory and its contents from storage.
+        Move a directory to the trash, its contents being removed from storage in the background.
 
         Parameters:
             dirname (str): Name of the directory to delete.
             params (EntryLocateParams): Query parameters specifying the parent directory.
+
+        Returns:
+            DeletionReadSerializer: Serializer representing the scheduled deletion.
         """
 
-        await self.repository.delete_by_dirname_and_parent_dir_path(dirname, params.parent_dir_path)
+        entity = await self.repository.delete_by_dirname_and_parent_dir_path(dirname, params.parent_dir_path)
+
+        if self.usage_index is not None:
+            try:
+                await self.usage_index.delete_by_dir_path(entity.dir_path)
+
+            except Exception:
+                logger.exception("Cannot delete usage of directory='%s'.", entity.dir_path)
+
+        return DeletionReadSerializer(**entity.model_dump())
+
+    async def retrieve_deletion(self, deletion_id: UUID) -> DeletionReadSerializer:
+        """
+        Retrieve the progress of a background deletion of a directory.
+
+        Parameters:
+            deletion_id (UUID): The UUID of the deletion.
+
+        Returns:
+            DeletionReadSerializer: Serializer representing the deletion with the bytes removed so far.
+        """
+
+        entity = await self.repository.get_deletion_by_deletion_id(deletion_id)
+
+        return DeletionReadSerializer(**entity.model_dump())
+
+    async def list_deletions(self) -> DeletionListSerializer:
+        """
+        List the pending and recently completed background deletions of directories.
+
+        Returns:
+            DeletionListSerializer: Serializer containing the list of DeletionReadSerializer.
+        """
+
+        entities = await self.repository.list_deletions()
+        serializers = [DeletionReadSerializer(**entity.model_dump()) for entity in entities]
+
+        return DeletionListSerializer(deletions=serializers)
+
+    async def reap_deletions(self, bytes_per_second: int, retention: int) -> None:
+        """
+        Remove the contents of the directories moved to the trash, and forget deletions completed long ago.
+
+        Parameters:
+            bytes_per_second (int): Maximum rate in bytes per second files are removed at, zero for no limit.
+            retention (int): Seconds the record of a completed deletion is kept for.
+        """
+
+        await self.repository.reap_deletions(bytes_per_second, retention)
+
+    async def download_directory_by_dirname(self, dirname: str, params: DirectoryArchiveParams) -> Iterator[bytes]:
+        """
+        Archive a directory tree to be streamed back to the client.
+
+        Parameters:
+            dirname (str): Name of the directory to download.
+            params (DirectoryArchiveParams): Query parameters specifying the parent directory and archive format.
+
+        Returns:
+            Iterator[bytes]: Stream of the archive bytes, generated while consumed.
+        """
+
+        return await self.repository.archive_by_dirname_and_parent_dir_path(
+            dirname, params.parent_dir_path, params.archive_type
+        )
 
     async def list_entries(self, params: EntryListParams) -> EntryListSerializer:
         """
-        List all files and subdirectories under a given directory.
+        List a page of the files and subdirectories under a given directory.
 
-        This method retrieves raw FileEntity and DirectoryEntity lists from the repository,
-        converts them to FileSummarizeSerializer and DirectorySummarizeSerializer,
-        and returns an EntryListSerializer containing counts and summaries.
+        This method retrieves the FileEntity and DirectoryEntity lists of the requested page
+        with the counts of all matching entries from the repository, converts them to
+        FileSummarizeSerializer and DirectorySummarizeSerializer, and returns an
+        EntryListSerializer containing counts, pagination and summaries.
 
         Parameters:
-            params (EntryListParams): Query parameters specifying the directory to list.
+            params (EntryListParams): Query parameters specifying the directory, filters, ordering and page to list.
 
         Returns:
             EntryListSerializer: Serializer containing listing metadata of the directory contents.
         """
 
-        file_entities, directory_entities = await self.repository.list_by_parent_dir_path(params.parent_dir_path)
+        file_entities, directory_entities, file_count, directory_count, next_cursor = (
+            await self.repository.list_by_params(params)
+        )
         file_serializers = [FileSummarizeSerializer(**file_entity.model_dump()) for file_entity in file_entities]
         directory_serializers = [
             DirectorySummarizeSerializer(**directory_entity.model_dump()) for directory_entity in directory_entities
         ]
-        file_count = len(file_serializers)
-        directory_count = len(directory_serializers)
         total = file_count + directory_count
 
         return EntryListSerializer(
@@ -131,6 +351,114 @@ class FileService:
             total=total,
             file_count=file_count,
             directory_count=directory_count,
+            offset=params.offset,
+            limit=params.limit,
+            next_cursor=next_cursor,
             files=file_serializers,
             directories=directory_serializers,
         )
+
+    async def initialize_upload(self, dto: UploadCreateDTO) -> UploadReadSerializer:
+        """
+        Create a resumable upload session of a file.
+
+        Parameters:
+            dto (UploadCreateDTO): Data transfer object containing the target location, size and checksum of the file.
+
+        Returns:
+            UploadReadSerializer: Serializer representing the created upload session.
+        """
+
+        entity = await self.repository.create_upload(dto)
+
+        return UploadReadSerializer(**entity.model_dump())
+
+    async def retrieve_upload(self, upload_id: UUID) -> UploadReadSerializer:
+        """
+        Retrieve the state of an upload session, e.g. to resume it after an interruption.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+
+        Returns:
+            UploadReadSerializer: Serializer representing the upload session with the byte ranges received so far.
+        """
+
+        entity = await self.repository.get_upload_by_upload_id(upload_id)
+
+        return UploadReadSerializer(**entity.model_dump())
+
+    async def upload_chunk(self, upload_id: UUID, params: ChunkLocateParams, stream: AsyncIterator[bytes]) -> None:
+        """
+        Write a chunk of the file of an upload session.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+            params (ChunkLocateParams): Query parameters specifying the offset of the chunk.
+            stream (AsyncIterator[bytes]): Stream of the chunk bytes.
+        """
+
+        await self.repository.write_chunk_by_upload_id_and_offset(upload_id, params.offset, stream)
+
+    async def complete_upload(self, upload_id: UUID) -> FileReadSerializer:
+        """
+        Complete an upload session, storing its file at the target location.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+
+        Returns:
+            FileReadSerializer: Serializer containing metadata of the stored file.
+        """
+
+        upload = await self.repository.get_upload_by_upload_id(upload_id)
+        previous_size, previous_file_count = await self._get_file_usage(upload.filename, upload.parent_dir_path)
+        entity = await self.repository.complete_upload_by_upload_id(upload_id)
+
+        await self._update_usage(entity.parent_dir_path, entity.size - previous_size, 1 - previous_file_count)
+
+        return FileReadSerializer(**entity.model_dump())
+
+    async def remove_upload(self, upload_id: UUID) -> None:
+        """
+        Abort an upload session.
+
+        Parameters:
+            upload_id (UUID): The UUID of the upload session.
+        """
+
+        await self.repository.delete_upload_by_upload_id(upload_id)
+
+    async def retrieve_usage(self, params: UsageLocateParams) -> UsageReadSerializer:
+        """
+        Retrieve the recursive disk usage of a directory with its largest subdirectories from the usage index.
+
+        Parameters:
+            params (UsageLocateParams): Query parameters specifying the directory and the number of subdirectories.
+
+        Returns:
+            UsageReadSerializer: Serializer containing the totals of the directory and summaries of its subdirectories.
+        """
+
+        entity = await self.usage_index.get_by_dir_path(params.dir_path)
+        directory_entities = await self.usage_index.list_by_parent_dir_path(entity.dir_path, params.limit)
+        directory_serializers = [
+            UsageSummarizeSerializer(**directory_entity.model_dump()) for directory_entity in directory_entities
+        ]
+
+        return UsageReadSerializer(**entity.model_dump(), directories=directory_serializers)
+
+    async def reconcile_usages(self, interval: int) -> None:
+        """
+        Recompute the usage index from a scan of the whole storage, unless another API worker did so recently.
+
+        Parameters:
+            interval (int): Seconds after the latest reconciliation a new one is due.
+        """
+
+        if not await self.usage_index.claim_reconciliation(interval):
+            return
+
+        usages = await self.repository.scan_usages_by_dir_path("/")
+
+        await self.usage_index.replace_by_dir_path("/", usages)
@@ -0,0 +1,8 @@
+from src.files.types.archive import ArchiveType
+from src.files.types.sort import EntrySortType
+
+
+__all__ = [
+    "ArchiveType",
+    "EntrySortType",
+]
@@ -0,0 +1,11 @@
+from enum import StrEnum
+
+
+class ArchiveType(StrEnum):
+    """
+    Enumeration type of the archive formats directories can be downloaded as.
+    """
+
+    ZIP = "ZIP"
+    TAR = "TAR"
+    TAR_ZST = "TAR_ZST"
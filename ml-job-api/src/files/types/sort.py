@@ -0,0 +1,11 @@
+from enum import StrEnum
+
+
+class EntrySortType(StrEnum):
+    """
+    Enumeration type of the keys directory entries can be listed by.
+    """
+
+    NAME = "NAME"
+    SIZE = "SIZE"
+    MODIFIED_AT = "MODIFIED_AT"
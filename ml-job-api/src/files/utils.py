@@ -1,8 +1,20 @@
-from typing import AsyncIterator
+import hashlib
+import os
+import stat
+import tarfile
+import zipfile
+from collections.abc import (
+    AsyncIterator,
+    Iterator,
+)
+from datetime import datetime
 
 import aiofiles
+import zstandard
 from fastapi import UploadFile
 
+from src.common.utils import get_norm_path
+
 
 #
 
@@ -26,21 +38,569 @@ async def upload_file(file_path: str, file: UploadFile, chunk_size: int) -> None
             await file_writer.write(chunk)
 
 
-async def download_file(file_path: str, chunk_size: int) -> AsyncIterator[bytes]:
+async def write_file_chunk(file_path: str, offset: int, stream: AsyncIterator[bytes], max_size: int) -> int:
+    """
+    Write a stream of bytes into an existing file at the given offset, without spooling it anywhere else.
+
+    Writing stops with an error once the chunk would extend past `max_size`, so a chunk never grows
+    the file beyond its declared size. Chunks at different offsets can be written concurrently.
+
+    Parameters:
+        file_path (str): The absolute path of the file to write into.
+        offset (int): Byte offset the chunk is written at.
+        stream (AsyncIterator[bytes]): Stream of the chunk bytes, e.g. a request body.
+        max_size (int): Size in bytes the file must not be written beyond.
+
+    Returns:
+        int: Number of bytes written.
+
+    Raises:
+        ValueError: If the chunk extends past `max_size`.
+    """
+
+    written = 0
+
+    async with aiofiles.open(file_path, "r+b") as file_writer:
+        await file_writer.seek(offset)
+
+        async for data in stream:
+            if offset + written + len(data) > max_size:
+                raise ValueError("Chunk extends past the size of the file.")
+
+            await file_writer.write(data)
+            written += len(data)
+
+    return written
+
+
+def get_file_sha256(file_path: str) -> str:
+    """
+    Compute the SHA-256 digest of a file, reading it in blocks.
+
+    Parameters:
+        file_path (str): The absolute path of the file.
+
+    Returns:
+        str: The lowercase hex digest.
+    """
+
+    with open(file_path, "rb") as file_reader:
+        return hashlib.file_digest(file_reader, "sha256").hexdigest()
+
+
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Merge overlapping and adjacent half-open ranges.
+
+    Parameters:
+        ranges (list[tuple[int, int]]): Half-open ranges in any order.
+
+    Returns:
+        list[tuple[int, int]]: Sorted and disjoint half-open ranges covering the same values.
+    """
+
+    merged = []
+
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+#
+
+
+def get_file_etag(size: int, modified_at: datetime) -> str:
+    """
+    Compute a strong entity tag of a stored file from its size and modification time.
+
+    Parameters:
+        size (int): Size of the file in bytes.
+        modified_at (datetime): Datetime when the file was last modified.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+
+    return f'"{size:x}-{round(modified_at.timestamp() * 1_000_000):x}"'
+
+
+#
+
+
+def scan_dir(dir_path: str, prefix: str | None = None) -> tuple[list[str], list[tuple[str, int, int]]]:
+    """
+    Collect the entries of a directory in a single pass, without a system call per entry where possible.
+
+    Entry types come from the directory listing itself, and only files are stat'ed once through
+    the cached `DirEntry.stat()`. Entries vanishing during the scan are skipped. Every entry that
+    is not a file is reported as a directory.
+
+    Parameters:
+        dir_path (str): Absolute path of the directory to scan.
+        prefix (str | None): Optional prefix the names of the collected entries must start with.
+
+    Returns:
+        tuple[list[str], list[tuple[str, int, int]]]:
+            Names of the subdirectories, and names, sizes in bytes and modification times in nanoseconds of the files.
+    """
+
+    dirnames = []
+    files = []
+
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if prefix and not entry.name.startswith(prefix):
+                continue
+
+            try:
+                if entry.is_file():
+                    entry_stat = entry.stat()
+                    files.append((entry.name, entry_stat.st_size, entry_stat.st_mtime_ns))
+
+                else:
+                    dirnames.append(entry.name)
+
+            except OSError:
+                continue
+
+    return dirnames, files
+
+
+#
+
+
+def get_tree_size(dir_path: str) -> int:
+    """
+    Compute the total size of the regular files of a directory tree, without following symbolic links.
+
+    Parameters:
+        dir_path (str): Absolute path of the directory.
+
+    Returns:
+        int: Total size in bytes of the regular files of the tree.
+    """
+
+    size = 0
+
+    for parent_dir_path, _, filenames in os.walk(dir_path):
+        for filename in filenames:
+            try:
+                file_stat = os.lstat(os.path.join(parent_dir_path, filename))
+
+            except FileNotFoundError:
+                continue
+
+            if stat.S_ISREG(file_stat.st_mode):
+                size += file_stat.st_size
+
+    return size
+
+
+def iterate_tree_removal(dir_path: str) -> Iterator[int]:
+    """
+    Remove a directory tree bottom-up, one entry at a time, as the returned iterator is consumed.
+
+    Symbolic links are removed without following them. Entries already removed, e.g. by an interrupted
+    earlier removal, are skipped.
+
+    Parameters:
+        dir_path (str): Absolute path of the directory.
+
+    Returns:
+        Iterator[int]: Size in bytes of each removed entry, zero for entries other than regular files.
+    """
+
+    for parent_dir_path, dirnames, filenames in os.walk(dir_path, topdown=False):
+        for filename in filenames:
+            file_path = os.path.join(parent_dir_path, filename)
+
+            try:
+                file_stat = os.lstat(file_path)
+                os.unlink(file_path)
+
+            except FileNotFoundError:
+                continue
+
+            yield file_stat.st_size if stat.S_ISREG(file_stat.st_mode) else 0
+
+        # Symbolic links to directories are listed as directories, but never descended into
+        for dirname in dirnames:
+            child_dir_path = os.path.join(parent_dir_path, dirname)
+
+            try:
+                if os.path.islink(child_dir_path):
+                    os.unlink(child_dir_path)
+
+                else:
+                    os.rmdir(child_dir_path)
+
+            except FileNotFoundError:
+                continue
+
+            yield 0
+
+    try:
+        os.rmdir(dir_path)
+
+    except FileNotFoundError:
+        pass
+
+
+def remove_tree_entries(removal: Iterator[int], max_size: float, max_entries: int) -> tuple[int, bool]:
+    """
+    Advance a removal created by `iterate_tree_removal` by a bounded batch of entries.
+
+    Parameters:
+        removal (Iterator[int]): The removal in progress.
+        max_size (float): Size in bytes after which the batch stops, possibly infinite.
+        max_entries (int): Number of entries after which the batch stops.
+
+    Returns:
+        tuple[int, bool]: Size in bytes of the files removed by the batch, and whether the whole tree is removed.
+    """
+
+    size = 0
+
+    for entries, entry_size in enumerate(removal, start=1):
+        size += entry_size
+
+        if size >= max_size or entries >= max_entries:
+            return size, False
+
+    return size, True
+
+
+#
+
+
+def get_dir_path_ancestors(dir_path: str) -> list[str]:
     """
-    Stream a local file from disk back to the caller in configurable chunks.
+    List a normalized directory path with all its ancestors, starting from the root directory.
+
+    Parameters:
+        dir_path (str): Relative directory path, e.g. "/JOBS/job_1".
 
-    Opens the file at `file_path` for binary reading and yields `chunk_size` bytes
-    at a time. This iterator can be directly returned as a StreamingResponse in FastAPI.
+    Returns:
+        list[str]: The ancestors and the directory path itself, e.g. ["/", "/JOBS", "/JOBS/job_1"].
+    """
+
+    dir_path = get_norm_path(dir_path)
+    dir_paths = [dir_path]
+
+    while dir_path != os.path.dirname(dir_path):
+        dir_path = os.path.dirname(dir_path)
+        dir_paths.append(dir_path)
+
+    return dir_paths[::-1]
+
+
+def scan_tree_usages(
+    abs_dir_path: str, rel_dir_path: str, excluded_dirnames: tuple[str, ...] = ()
+) -> dict[str, tuple[int, int]]:
+    """
+    Compute the recursive size and number of regular files of every directory of a tree in a single walk.
+
+    Symbolic links are not followed, and the directories of `excluded_dirnames` directly under the root
+    of the tree are skipped, e.g. hidden directories of the storage itself.
 
     Parameters:
-        file_path (str): The absolute or relative path of the file to be streamed.
-        chunk_size (int): Number of bytes to read and yield per iteration.
+        abs_dir_path (str): Absolute path of the directory.
+        rel_dir_path (str): Relative path of the directory the returned paths are based on.
+        excluded_dirnames (tuple[str, ...]): Names of the subdirectories of the root of the tree to skip.
 
     Returns:
-        AsyncIterator[bytes]: An asynchronous iterator yielding byte chunks of the file.
+        dict[str, tuple[int, int]]:
+            Total size in bytes and number of regular files by relative directory path,
+            empty if the directory does not exist.
     """
 
-    async with aiofiles.open(file_path, "rb") as file_reader:
-        while chunk := await file_reader.read(chunk_size):
-            yield chunk
+    usages = {}
+    rel_dir_paths = []
+
+    for parent_dir_path, dirnames, filenames in os.walk(abs_dir_path):
+        if parent_dir_path == abs_dir_path:
+            dirnames[:] = [dirname for dirname in dirnames if dirname not in excluded_dirnames]
+
+        size = file_count = 0
+
+        for filename in filenames:
+            try:
+                file_stat = os.lstat(os.path.join(parent_dir_path, filename))
+
+            except FileNotFoundError:
+                continue
+
+            if stat.S_ISREG(file_stat.st_mode):
+                size += file_stat.st_size
+                file_count += 1
+
+        rel_parent_dir_path = get_norm_path(os.path.relpath(parent_dir_path, abs_dir_path), prefix=rel_dir_path)
+        usages[rel_parent_dir_path] = (size, file_count)
+        rel_dir_paths.append(rel_parent_dir_path)
+
+    # Directories are walked top-down, so in reverse every directory is summed up before its parent
+    for rel_parent_dir_path in reversed(rel_dir_paths[1:]):
+        size, file_count = usages[rel_parent_dir_path]
+        parent_size, parent_file_count = usages[os.path.dirname(rel_parent_dir_path)]
+        usages[os.path.dirname(rel_parent_dir_path)] = (parent_size + size, parent_file_count + file_count)
+
+    return usages
+
+
+#
+
+
+class _ArchiveBuffer:
+    """
+    Write-only, non-seekable file object collecting the bytes written by an archiver until they are taken.
+
+    Written bytes are optionally compressed with Zstandard. The compression level can be switched
+    between archive members by finishing the current frame, as concatenated frames form a valid stream.
+    """
+
+    def __init__(self, zstd_level: int | None = None) -> None:
+        """
+        Initialize an empty buffer.
+
+        Parameters:
+            zstd_level (int | None): Optional Zstandard compression level of the written bytes.
+        """
+
+        self.data = bytearray()
+        self.position = 0
+        self.zstd_level = zstd_level
+        self.compressor = zstandard.ZstdCompressor(level=zstd_level).compressobj() if zstd_level is not None else None
+
+    def write(self, data: bytes) -> int:
+        """
+        Collect bytes written by the archiver.
+
+        Parameters:
+            data (bytes): The written bytes.
+
+        Returns:
+            int: Number of bytes written.
+        """
+
+        self.position += len(data)
+        self.data += self.compressor.compress(data) if self.compressor else data
+
+        return len(data)
+
+    def tell(self) -> int:
+        """
+        Get the number of bytes written so far, before compression.
+
+        Returns:
+            int: The position in the archive.
+        """
+
+        return self.position
+
+    def flush(self) -> None:
+        """
+        Do nothing, as collected bytes are only released by `take`.
+        """
+
+    def switch_zstd_level(self, zstd_level: int) -> None:
+        """
+        Compress the following bytes with another Zstandard level, if the buffer compresses at all.
+
+        Parameters:
+            zstd_level (int): The Zstandard compression level.
+        """
+
+        if self.compressor is None or zstd_level == self.zstd_level:
+            return
+
+        self.data += self.compressor.flush()
+        self.zstd_level = zstd_level
+        self.compressor = zstandard.ZstdCompressor(level=zstd_level).compressobj()
+
+    def finish(self) -> None:
+        """
+        Finish the compressed stream, if the buffer compresses at all.
+        """
+
+        if self.compressor:
+            self.data += self.compressor.flush()
+
+    def take(self) -> bytes:
+        """
+        Take the bytes collected so far, emptying the buffer.
+
+        Returns:
+            bytes: The collected bytes.
+        """
+
+        data = bytes(self.data)
+        self.data.clear()
+
+        return data
+
+
+def _walk_archive_members(dir_path: str) -> Iterator[tuple[str, str, os.stat_result]]:
+    """
+    Walk a directory tree in name order, collecting the entries to archive.
+
+    Only directories and regular files are collected, symbolic links are neither archived nor followed.
+    Entries vanishing during the walk are skipped.
+
+    Parameters:
+        dir_path (str): Absolute path of the directory to walk.
+
+    Returns:
+        Iterator[tuple[str, str, os.stat_result]]:
+            Absolute paths, archive names prefixed with the name of the directory, and stats of the entries.
+    """
+
+    root_path = os.path.dirname(dir_path)
+
+    for walk_dir_path, dirnames, filenames in os.walk(dir_path):
+        dirnames.sort()
+
+        try:
+            yield walk_dir_path, os.path.relpath(walk_dir_path, root_path), os.lstat(walk_dir_path)
+
+        except OSError:
+            continue
+
+        for filename in sorted(filenames):
+            file_path = os.path.join(walk_dir_path, filename)
+
+            try:
+                file_stat = os.lstat(file_path)
+
+            except OSError:
+                continue
+
+            if stat.S_ISREG(file_stat.st_mode):
+                yield file_path, os.path.relpath(file_path, root_path), file_stat
+
+
+def stream_zip_archive(dir_path: str, chunk_size: int, stored_suffixes: tuple[str, ...]) -> Iterator[bytes]:
+    """
+    Generate a ZIP archive of a directory tree on the fly, without a temporary file.
+
+    Members are written with data descriptors, so the archive is produced in a single pass and only
+    about `chunk_size` bytes are held in memory. Files ending with one of `stored_suffixes` are
+    already compressed and stored as they are, the other ones are deflated.
+
+    Parameters:
+        dir_path (str): Absolute path of the directory to archive.
+        chunk_size (int): Number of bytes of a file read per iteration.
+        stored_suffixes (tuple[str, ...]): Lowercase filename suffixes of the members stored without compression.
+
+    Returns:
+        Iterator[bytes]: Stream of the archive bytes.
+    """
+
+    buffer = _ArchiveBuffer()
+
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for member_path, member_name, member_stat in _walk_archive_members(dir_path):
+            if stat.S_ISDIR(member_stat.st_mode):
+                archive.writestr(zipfile.ZipInfo.from_file(member_path, member_name), b"")
+
+                continue
+
+            try:
+                file_reader = open(member_path, "rb")
+
+            except OSError:
+                continue
+
+            member_info = zipfile.ZipInfo.from_file(member_path, member_name)
+            member_info.compress_type = (
+                zipfile.ZIP_STORED if member_name.lower().endswith(stored_suffixes) else zipfile.ZIP_DEFLATED
+            )
+
+            with file_reader, archive.open(member_info, "w") as member_writer:
+                while chunk := file_reader.read(chunk_size):
+                    member_writer.write(chunk)
+
+                    if data := buffer.take():
+                        yield data
+
+    yield buffer.take()
+
+
+def stream_tar_archive(
+    dir_path: str,
+    chunk_size: int,
+    stored_suffixes: tuple[str, ...],
+    zstd_level: int | None = None,
+    stored_zstd_level: int | None = None,
+) -> Iterator[bytes]:
+    """
+    Generate a POSIX TAR archive of a directory tree on the fly, optionally compressed with Zstandard.
+
+    Only about `chunk_size` bytes are held in memory. When compressed, files ending with one of
+    `stored_suffixes` are already compressed, so they are written in frames of `stored_zstd_level`,
+    a fast level leaving incompressible data in raw blocks, rather than recompressed.
+    A file changing its size while archived is truncated or padded with zeros to its size when walked.
+
+    Parameters:
+        dir_path (str): Absolute path of the directory to archive.
+        chunk_size (int): Number of bytes of a file read per iteration.
+        stored_suffixes (tuple[str, ...]): Lowercase filename suffixes of the already compressed members.
+        zstd_level (int | None): Optional Zstandard compression level of the archive.
+        stored_zstd_level (int | None): Zstandard compression level of the already compressed members.
+
+    Returns:
+        Iterator[bytes]: Stream of the archive bytes.
+    """
+
+    buffer = _ArchiveBuffer(zstd_level)
+
+    for member_path, member_name, member_stat in _walk_archive_members(dir_path):
+        member_info = tarfile.TarInfo(member_name)
+        member_info.mode = stat.S_IMODE(member_stat.st_mode)
+        member_info.mtime = int(member_stat.st_mtime)
+
+        if stat.S_ISDIR(member_stat.st_mode):
+            member_info.type = tarfile.DIRTYPE
+            buffer.write(member_info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape"))
+
+            continue
+
+        try:
+            file_reader = open(member_path, "rb")
+
+        except OSError:
+            continue
+
+        member_info.size = member_stat.st_size
+        is_stored = member_name.lower().endswith(stored_suffixes)
+        buffer.switch_zstd_level(stored_zstd_level if is_stored and stored_zstd_level is not None else zstd_level)
+        buffer.write(member_info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape"))
+
+        with file_reader:
+            remaining = member_info.size
+
+            while remaining:
+                chunk = file_reader.read(min(chunk_size, remaining)) or bytes(min(chunk_size, remaining))
+                buffer.write(chunk)
+                remaining -= len(chunk)
+
+                if data := buffer.take():
+                    yield data
+
+        # Member data is padded to whole blocks
+        if remainder := member_info.size % tarfile.BLOCKSIZE:
+            buffer.write(bytes(tarfile.BLOCKSIZE - remainder))
+
+    # Archive ends with two empty blocks, padded to a whole record
+    buffer.write(bytes(2 * tarfile.BLOCKSIZE))
+
+    if remainder := buffer.tell() % tarfile.RECORDSIZE:
+        buffer.write(bytes(tarfile.RECORDSIZE - remainder))
+
+    buffer.finish()
+
+    yield buffer.take()
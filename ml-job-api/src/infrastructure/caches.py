@@ -0,0 +1,30 @@
+import h5py
+
+from src.common.caches import (
+    HandleCache,
+    JSONDiskCache,
+    LRUCache,
+)
+from src.settings.caches import cache_settings
+from src.spectra.utils import close_pool_file
+
+
+#
+
+
+# In-process cache of parsed spectra, bounded by their approximate size in bytes
+spectrum_memory_cache = LRUCache(cache_settings.spectrum_cache_max_size)
+
+# Optional on-disk cache of parsed spectra, shared by all API workers mounting the same directory
+spectrum_disk_cache = (
+    JSONDiskCache(cache_settings.spectrum_cache_dir_path) if cache_settings.spectrum_cache_dir_path else None
+)
+
+# In-process cache of open HDF5 pool files of jobs with their filename indices
+pool_handle_cache = HandleCache(cache_settings.pool_handle_cache_max_entries, close_pool_file)
+
+# In-process cache of open HDF5 files of the files storage, read by dataset slices
+dataset_handle_cache = HandleCache(cache_settings.dataset_handle_cache_max_entries, h5py.File.close)
+
+# In-process cache of the counts of jobs matching list filters, bounded by their number
+job_count_cache = LRUCache(cache_settings.job_count_cache_max_entries)
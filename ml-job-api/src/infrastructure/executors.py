@@ -0,0 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from src.settings.spectra import spectrum_settings
+
+
+#
+
+
+# Bounded thread pool reading and parsing spectrum files off the event loop
+spectrum_read_executor = ThreadPoolExecutor(
+    max_workers=spectrum_settings.spectrum_read_workers,
+    thread_name_prefix="spectrum-read",
+)
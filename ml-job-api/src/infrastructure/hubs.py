@@ -0,0 +1,9 @@
+from src.common.hubs import BroadcastHub
+from src.settings.events import event_settings
+
+
+#
+
+
+# In-process fan-out of job and file change events to the streaming clients of the API worker
+event_hub = BroadcastHub(event_settings.event_queue_size)
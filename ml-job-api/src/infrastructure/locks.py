@@ -0,0 +1,15 @@
+from src.common.locks import PostgresAdvisoryLock
+from src.infrastructure.storages import postgres_async_engine
+
+
+#
+
+
+# Advisory lock electing the single API worker sweeping processing jobs with expired leases
+job_sweep_lock = PostgresAdvisoryLock(postgres_async_engine, "ml-job-api:job-sweep")
+
+# Advisory lock electing the single API worker removing the directories moved to the trash
+deletion_reap_lock = PostgresAdvisoryLock(postgres_async_engine, "ml-job-api:deletion-reap")
+
+# Advisory lock electing the single API worker watching the shared files directory for changes
+entry_watch_lock = PostgresAdvisoryLock(postgres_async_engine, "ml-job-api:entry-watch")
@@ -30,6 +30,8 @@ postgres_async_engine = create_async_engine(
     url=postgres_settings.db_url,
     echo=postgres_settings.debug,
     connect_args={"timeout": postgres_settings.engine_connection_timeout},
+    pool_size=postgres_settings.engine_pool_size,
+    max_overflow=postgres_settings.engine_max_overflow,
     future=True,
 )
 
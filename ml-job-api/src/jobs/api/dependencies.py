@@ -1,22 +1,35 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.events.api.dependencies import get_broker_using_postgres
+from src.files.indexes import UsagePostgresIndex
+from src.files.repositories import FileLFSRepository
+from src.infrastructure.caches import job_count_cache
 from src.infrastructure.clients import celery_client
-from src.infrastructure.storages import get_postgres_async_session
+from src.infrastructure.storages import (
+    get_postgres_async_session,
+    lfs_files_dir_path,
+)
 from src.jobs.clients import JobCeleryQueue
 from src.jobs.repositories import JobPostgresRepository
 from src.jobs.service import JobService
+from src.jobs.storages import JobLFSStorage
+from src.settings.caches import cache_settings
+from src.settings.jobs import job_settings
 
 
 def get_service_using_postgres_and_celery(
     postgres_async_session: AsyncSession = Depends(get_postgres_async_session),
 ) -> JobService:
     """
-    Construct a JobService backed by PostgreSQL persistence and Celery task queue.
+    Construct a JobService backed by PostgreSQL persistence, Celery task queue and local filesystem storage.
 
     This dependency factory builds a JobPostgresRepository using the injected
-    AsyncSession, and a JobCeleryQueue using the global Celery client, then
-    injects both into a JobService instance.
+    AsyncSession and the shared cache of job counts, a JobCeleryQueue using the global Celery client, a JobLFSStorage
+    using the shared files directory, a FileLFSRepository removing job directories
+    in the background, a UsagePostgresIndex keeping the disk usage of job directories,
+    and an EventPostgresBroker publishing job changes to streaming clients, then injects
+    them into a JobService instance.
 
     Parameters:
         postgres_async_session (AsyncSession): Asynchronous database session for PostgreSQL operations.
@@ -25,7 +38,22 @@ def get_service_using_postgres_and_celery(
         JobService: Service instance for managing job lifecycle and dispatching tasks to Celery for processing.
     """
 
-    postgres_repository = JobPostgresRepository(postgres_async_session)
-    celery_queue = JobCeleryQueue(celery_client)
-
-    return JobService(postgres_repository, celery_queue)
+    postgres_repository = JobPostgresRepository(
+        postgres_async_session,
+        job_count_cache,
+        cache_settings.job_count_cache_ttl,
+    )
+    celery_queue = JobCeleryQueue(celery_client, job_settings.job_inspect_timeout)
+    lfs_storage = JobLFSStorage(lfs_files_dir_path)
+    lfs_file_repository = FileLFSRepository(lfs_files_dir_path)
+    postgres_usage_index = UsagePostgresIndex(postgres_async_session)
+    postgres_event_broker = get_broker_using_postgres()
+
+    return JobService(
+        postgres_repository,
+        celery_queue,
+        lfs_storage,
+        lfs_file_repository,
+        postgres_usage_index,
+        postgres_event_broker,
+    )
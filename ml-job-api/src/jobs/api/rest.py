@@ -14,25 +14,34 @@ from fastapi_restful.cbv import cbv
 
 from src.jobs.api.dependencies import get_service_using_postgres_and_celery
 from src.jobs.dto import (
+    JobBatchDTO,
     JobEditDTO,
     JobEndDTO,
     JobInitializeDTO,
+    JobProgressDTO,
 )
 from src.jobs.errors import (
     JobNotExistError,
     JobPhaseConflictError,
 )
-from src.jobs.params import JobListParams
+from src.jobs.params import (
+    JobListParams,
+    JobRemoveParams,
+)
 from src.jobs.resources import rest_resources
 from src.jobs.serializers import (
+    JobBatchSerializer,
     JobListSerializer,
+    JobQueueListSerializer,
     JobReadSerializer,
 )
 from src.jobs.service import JobService
 from src.jobs.types import (
+    BatchActionType,
     EndActionType,
     ProcessActionType,
 )
+from src.settings.jobs import job_settings
 
 
 rest_router = APIRouter(
@@ -60,6 +69,7 @@ class JobRESTRouter:
         status_code=status.HTTP_201_CREATED,
         responses={
             status.HTTP_201_CREATED: {"description": rest_resources["initialize"]["HTTP_201"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["initialize"]["HTTP_404"]},
         },
         summary=rest_resources["initialize"]["SUMMARY"],
         description=rest_resources["initialize"]["DESCRIPTION"],
@@ -68,7 +78,48 @@ class JobRESTRouter:
         self,
         dto: JobInitializeDTO = Body(title="Job initialization payload"),
     ) -> JobReadSerializer:
-        return await self.service.initialize_job(dto)
+        try:
+            return await self.service.initialize_job(dto)
+
+        except JobNotExistError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    @rest_router.get(
+        path="/queues/",
+        tags=["Jobs: List"],
+        response_class=JSONResponse,
+        response_model=JobQueueListSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["queues"]["HTTP_200"]},
+        },
+        summary=rest_resources["queues"]["SUMMARY"],
+        description=rest_resources["queues"]["DESCRIPTION"],
+    )
+    async def list_job_queues(self) -> JobQueueListSerializer:
+        return await self.service.list_job_queues(job_settings.job_queue_wait_window)
+
+    @rest_router.post(
+        path="/batch/{batch_action}",
+        tags=["Jobs: Batch"],
+        response_class=JSONResponse,
+        response_model=JobBatchSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["batch"]["HTTP_200"]},
+        },
+        summary=rest_resources["batch"]["SUMMARY"],
+        description=rest_resources["batch"]["DESCRIPTION"],
+    )
+    async def manage_jobs_batch(
+        self,
+        batch_action: BatchActionType = Path(title="Batch action"),
+        dto: JobBatchDTO = Body(title="Job batch selection payload"),
+        params: JobRemoveParams = Query(title="Job removal parameters"),
+    ) -> JobBatchSerializer:
+        return await self.service.manage_jobs_batch_by_batch_action(batch_action, dto, params)
 
     @rest_router.get(
         path="/{job_id}",
@@ -136,9 +187,10 @@ class JobRESTRouter:
     async def remove_job(
         self,
         job_id: UUID = Path(title="Job ID"),
+        params: JobRemoveParams = Query(title="Job removal parameters"),
     ) -> None:
         try:
-            await self.service.remove_job_by_job_id(job_id)
+            await self.service.remove_job_by_job_id(job_id, params)
 
         except JobNotExistError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -205,6 +257,30 @@ class JobRESTRouter:
         except JobPhaseConflictError as e:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
+    @rest_router.post(
+        path="/{job_id}/progress",
+        tags=["Jobs: Action"],
+        response_class=JSONResponse,
+        response_model=None,
+        status_code=status.HTTP_204_NO_CONTENT,
+        responses={
+            status.HTTP_204_NO_CONTENT: {"description": rest_resources["progress"]["HTTP_204"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["progress"]["HTTP_404"]},
+        },
+        summary=rest_resources["progress"]["SUMMARY"],
+        description=rest_resources["progress"]["DESCRIPTION"],
+    )
+    async def report_job_progress(
+        self,
+        job_id: UUID = Path(title="Job ID"),
+        dto: JobProgressDTO = Body(title="Job progress payload"),
+    ) -> None:
+        try:
+            await self.service.report_job_progress_by_job_id(job_id, dto)
+
+        except JobNotExistError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
     @rest_router.get(
         path="/",
         tags=["Jobs: List"],
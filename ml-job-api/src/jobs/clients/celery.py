@@ -12,30 +12,49 @@ class JobCeleryQueue(JobQueue):
     Celery-backed implementation of JobQueue.
     """
 
-    def __init__(self, celery_client: Celery) -> None:
+    def __init__(self, celery_client: Celery, inspect_timeout: float = 1.0) -> None:
         """
         Initialize with a configured Celery client.
 
         Parameters:
             celery_client (Celery): The Celery application instance used to send and control jobs.
+            inspect_timeout (float): Seconds to wait for workers replies when inspecting them.
         """
 
         self.queue = celery_client
+        self.inspect_timeout = inspect_timeout
 
-    def run_by_job_id_and_job_type(self, job_id: UUID, job_type: JobType, dto: JobStartDTO) -> None:
+    def _get_queue_name_by_job_type(self, job_type: JobType) -> str:
+        """
+        Resolve the name of the queue Celery tasks of the given job type are routed to.
+
+        Parameters:
+            job_type (JobType): The registered Celery task name.
+
+        Returns:
+            str: The routed queue name, or the default queue name if the job type has no route.
+        """
+
+        route = self.queue.conf.task_routes.get(job_type, {})
+
+        return route.get("queue", self.queue.conf.task_default_queue)
+
+    def run_by_job_id_and_job_type(self, job_id: UUID, job_type: JobType, dto: JobStartDTO, priority: int) -> None:
         """
         Enqueue a new Celery task for the given job.
 
         This sends a Celery task whose `task_id` is set to the job_id string and whose
-        name matches the JobType enum. The DTO is serialized into kwargs.
+        name matches the JobType enum. The task is routed to the queue of its job type
+        by the `task_routes` setting. The DTO is serialized into kwargs.
 
         Parameters:
             job_id (UUID): The unique identifier for this job; becomes the Celery task ID.
             job_type (JobType): The registered Celery task name indicating which worker handler to invoke.
             dto (JobStartDTO): DTO containing job initialization parameters; will be passed as keyword arguments.
+            priority (int): Priority of the Celery task within its queue.
         """
 
-        self.queue.send_task(task_id=str(job_id), name=job_type, kwargs={"dto": dto.model_dump()})
+        self.queue.send_task(task_id=str(job_id), name=job_type, kwargs={"dto": dto.model_dump()}, priority=priority)
 
     def abort_by_job_id(self, job_id: UUID) -> None:
         """
@@ -49,3 +68,69 @@ class JobCeleryQueue(JobQueue):
         """
 
         self.queue.control.revoke(task_id=str(job_id), terminate=True)
+
+    def abort_batch_by_job_ids(self, job_ids: list[UUID]) -> None:
+        """
+        Revoke multiple running or queued Celery tasks with a single broadcast.
+
+        Every worker receives one revoke command listing all task IDs, instead of one command per task.
+
+        Parameters:
+            job_ids (list[UUID]): The unique identifiers of the jobs/Celery tasks to abort.
+        """
+
+        self.queue.control.revoke(task_id=[str(job_id) for job_id in job_ids], terminate=True)
+
+    def list_active_job_ids(self) -> set[UUID] | None:
+        """
+        List identifiers of Celery tasks currently executed or prefetched by workers.
+
+        This broadcasts `active` and `reserved` inspect commands and waits for the workers
+        replies at most `inspect_timeout` seconds per command.
+
+        Returns:
+            set[UUID] | None: Identifiers of active jobs, or None if no worker replied.
+        """
+
+        inspect = self.queue.control.inspect(timeout=self.inspect_timeout)
+        active_tasks = inspect.active()
+        reserved_tasks = inspect.reserved()
+
+        if active_tasks is None and reserved_tasks is None:
+            return None
+
+        job_ids = set()
+
+        for worker_tasks in [*(active_tasks or {}).values(), *(reserved_tasks or {}).values()]:
+            for worker_task in worker_tasks:
+                job_ids.add(UUID(worker_task["id"]))
+
+        return job_ids
+
+    def get_depth_by_job_type(self, job_type: JobType) -> tuple[str, int | None, int | None]:
+        """
+        Get the depth of the broker queue Celery tasks of the given job type are routed to.
+
+        This declares the queue passively, which reads its message and consumer counts
+        without creating or modifying it.
+
+        Parameters:
+            job_type (JobType): The registered Celery task name.
+
+        Returns:
+            tuple[str, int | None, int | None]:
+                The queue name, the number of ready messages in the queue and the number of its consumers,
+                both None if the broker is unreachable or the queue was not declared yet.
+        """
+
+        queue_name = self._get_queue_name_by_job_type(job_type)
+
+        with self.queue.connection_for_read() as connection:
+            try:
+                with connection.channel() as channel:
+                    _, messages, consumers = channel.queue_declare(queue=queue_name, passive=True)
+
+            except (*connection.connection_errors, *connection.channel_errors):
+                return queue_name, None, None
+
+        return queue_name, messages, consumers
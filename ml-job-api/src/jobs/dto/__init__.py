@@ -1,16 +1,22 @@
+from src.jobs.dto.advance import JobAdvanceDTO
+from src.jobs.dto.batch import JobBatchDTO
 from src.jobs.dto.create import JobCreateDTO
 from src.jobs.dto.edit import JobEditDTO
 from src.jobs.dto.end import JobEndDTO
 from src.jobs.dto.initialize import JobInitializeDTO
+from src.jobs.dto.progress import JobProgressDTO
 from src.jobs.dto.start import JobStartDTO
 from src.jobs.dto.update import JobUpdateDTO
 
 
 __all__ = [
+    "JobAdvanceDTO",
+    "JobBatchDTO",
     "JobCreateDTO",
     "JobEditDTO",
     "JobEndDTO",
     "JobInitializeDTO",
+    "JobProgressDTO",
     "JobStartDTO",
     "JobUpdateDTO",
 ]
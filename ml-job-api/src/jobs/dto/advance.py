@@ -0,0 +1,39 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.jobs.resources import advance_resources
+
+
+class JobAdvanceDTO(BaseModel):
+    """
+    Data Transfer Object model for continuing a chained Active ML Job with its labelled labelling set.
+    """
+
+    iteration: int = Field(
+        ...,
+        ge=advance_resources["iteration"]["MIN_VALUE"],
+        description=advance_resources["iteration"]["DESCRIPTION"],
+        examples=advance_resources["iteration"]["EXAMPLES"],
+    )
+
+    oracle_filenames: list[str] = Field(
+        ...,
+        description=advance_resources["oracle_filenames"]["DESCRIPTION"],
+        examples=advance_resources["oracle_filenames"]["EXAMPLES"],
+    )
+
+    oracle_labels: list[str] = Field(
+        ...,
+        description=advance_resources["oracle_labels"]["DESCRIPTION"],
+        examples=advance_resources["oracle_labels"]["EXAMPLES"],
+    )
+
+    performance: float | None = Field(
+        None,
+        ge=advance_resources["performance"]["MIN_VALUE"],
+        le=advance_resources["performance"]["MAX_VALUE"],
+        description=advance_resources["performance"]["DESCRIPTION"],
+        examples=advance_resources["performance"]["EXAMPLES"],
+    )
@@ -0,0 +1,75 @@
+from typing import Self
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    Field,
+    model_validator,
+)
+
+from src.jobs.resources import batch_resources
+from src.jobs.types import (
+    JobType,
+    PhaseType,
+)
+
+
+class JobBatchDTO(BaseModel):
+    """
+    Data Transfer Object model for selecting the jobs a batch action is applied to, by IDs or by filters.
+    """
+
+    job_ids: list[UUID] | None = Field(
+        None,
+        min_length=batch_resources["job_ids"]["MIN_LENGTH"],
+        max_length=batch_resources["job_ids"]["MAX_LENGTH"],
+        description=batch_resources["job_ids"]["DESCRIPTION"],
+        examples=batch_resources["job_ids"]["EXAMPLES"],
+    )
+
+    phase: PhaseType | None = Field(
+        None,
+        description=batch_resources["phase"]["DESCRIPTION"],
+        examples=batch_resources["phase"]["EXAMPLES"],
+    )
+
+    type: JobType | None = Field(
+        None,
+        description=batch_resources["type"]["DESCRIPTION"],
+        examples=batch_resources["type"]["EXAMPLES"],
+    )
+
+    label: str | None = Field(
+        None,
+        min_length=batch_resources["label"]["MIN_LENGTH"],
+        max_length=batch_resources["label"]["MAX_LENGTH"],
+        description=batch_resources["label"]["DESCRIPTION"],
+        examples=batch_resources["label"]["EXAMPLES"],
+    )
+
+    limit: int = Field(
+        batch_resources["limit"]["DEFAULT_VALUE"],
+        ge=batch_resources["limit"]["MIN_VALUE"],
+        le=batch_resources["limit"]["MAX_VALUE"],
+        description=batch_resources["limit"]["DESCRIPTION"],
+        examples=batch_resources["limit"]["EXAMPLES"],
+    )
+
+    @model_validator(mode="after")
+    def check_selection(self) -> Self:
+        """
+        Ensure the jobs are selected either by IDs or by at least one filter, so a batch never selects all jobs.
+
+        Returns:
+            Self: The validated selection.
+
+        Raises:
+            ValueError: If neither or both of the IDs and the filters are given.
+        """
+
+        has_filters = self.phase is not None or self.type is not None or self.label is not None
+
+        if (self.job_ids is not None) == has_filters:
+            raise ValueError("Jobs must be selected either by IDs or by filters.")
+
+        return self
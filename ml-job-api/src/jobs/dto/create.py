@@ -58,6 +58,26 @@ class JobCreateDTO(BaseModel):
         examples=job_resources["description"]["EXAMPLES"],
     )
 
+    parent_job_id: UUID | None = Field(
+        None,
+        description=job_resources["parent_job_id"]["DESCRIPTION"],
+        examples=job_resources["parent_job_id"]["EXAMPLES"],
+    )
+
+    chained: bool = Field(
+        False,
+        description=job_resources["chained"]["DESCRIPTION"],
+        examples=job_resources["chained"]["EXAMPLES"],
+    )
+
+    priority: int = Field(
+        job_resources["priority"]["DEFAULT_VALUE"],
+        ge=job_resources["priority"]["MIN_VALUE"],
+        le=job_resources["priority"]["MAX_VALUE"],
+        description=job_resources["priority"]["DESCRIPTION"],
+        examples=job_resources["priority"]["EXAMPLES"],
+    )
+
     created_at: datetime = Field(
         ...,
         description=job_resources["created_at"]["DESCRIPTION"],
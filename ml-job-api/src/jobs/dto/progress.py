@@ -0,0 +1,68 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.jobs.resources import progress_resources
+
+
+class JobProgressDTO(BaseModel):
+    """
+    Data Transfer Object model used by workers to report the execution progress of a running Job.
+    """
+
+    stage: str | None = Field(
+        None,
+        min_length=progress_resources["stage"]["MIN_LENGTH"],
+        max_length=progress_resources["stage"]["MAX_LENGTH"],
+        description=progress_resources["stage"]["DESCRIPTION"],
+        examples=progress_resources["stage"]["EXAMPLES"],
+    )
+
+    files_processed: int | None = Field(
+        None,
+        ge=progress_resources["files_processed"]["MIN_VALUE"],
+        description=progress_resources["files_processed"]["DESCRIPTION"],
+        examples=progress_resources["files_processed"]["EXAMPLES"],
+    )
+
+    files_total: int | None = Field(
+        None,
+        ge=progress_resources["files_total"]["MIN_VALUE"],
+        description=progress_resources["files_total"]["DESCRIPTION"],
+        examples=progress_resources["files_total"]["EXAMPLES"],
+    )
+
+    epoch: int | None = Field(
+        None,
+        ge=progress_resources["epoch"]["MIN_VALUE"],
+        description=progress_resources["epoch"]["DESCRIPTION"],
+        examples=progress_resources["epoch"]["EXAMPLES"],
+    )
+
+    epochs_total: int | None = Field(
+        None,
+        ge=progress_resources["epochs_total"]["MIN_VALUE"],
+        description=progress_resources["epochs_total"]["DESCRIPTION"],
+        examples=progress_resources["epochs_total"]["EXAMPLES"],
+    )
+
+    loss: float | None = Field(
+        None,
+        description=progress_resources["loss"]["DESCRIPTION"],
+        examples=progress_resources["loss"]["EXAMPLES"],
+    )
+
+    prediction_batch: int | None = Field(
+        None,
+        ge=progress_resources["prediction_batch"]["MIN_VALUE"],
+        description=progress_resources["prediction_batch"]["DESCRIPTION"],
+        examples=progress_resources["prediction_batch"]["EXAMPLES"],
+    )
+
+    prediction_batches_total: int | None = Field(
+        None,
+        ge=progress_resources["prediction_batches_total"]["MIN_VALUE"],
+        description=progress_resources["prediction_batches_total"]["DESCRIPTION"],
+        examples=progress_resources["prediction_batches_total"]["EXAMPLES"],
+    )
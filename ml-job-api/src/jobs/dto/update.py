@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 
 from pydantic import (
     BaseModel,
@@ -45,3 +46,33 @@ class JobUpdateDTO(BaseModel):
         description=job_resources["execution_duration"]["DESCRIPTION"],
         examples=job_resources["execution_duration"]["EXAMPLES"],
     )
+
+    progress: dict[str, Any] | None = Field(
+        None,
+        description=job_resources["progress"]["DESCRIPTION"],
+    )
+
+    heartbeat_at: datetime | None = Field(
+        None,
+        description=job_resources["heartbeat_at"]["DESCRIPTION"],
+        examples=job_resources["heartbeat_at"]["EXAMPLES"],
+    )
+
+    requeue_count: int | None = Field(
+        None,
+        ge=job_resources["requeue_count"]["MIN_VALUE"],
+        description=job_resources["requeue_count"]["DESCRIPTION"],
+        examples=job_resources["requeue_count"]["EXAMPLES"],
+    )
+
+    chained: bool | None = Field(
+        None,
+        description=job_resources["chained"]["DESCRIPTION"],
+        examples=job_resources["chained"]["EXAMPLES"],
+    )
+
+    queued_at: datetime | None = Field(
+        None,
+        description=job_resources["queued_at"]["DESCRIPTION"],
+        examples=job_resources["queued_at"]["EXAMPLES"],
+    )
@@ -1,8 +1,10 @@
 from src.jobs.errors.not_exist import JobNotExistError
 from src.jobs.errors.phase_conflict import JobPhaseConflictError
+from src.jobs.errors.pipeline import JobPipelineError
 
 
 __all__ = [
     "JobNotExistError",
     "JobPhaseConflictError",
+    "JobPipelineError",
 ]
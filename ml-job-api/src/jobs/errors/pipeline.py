@@ -0,0 +1,9 @@
+from src.common.errors import BaseError
+
+
+class JobPipelineError(BaseError):
+    """
+    Raised when the files of a chained job cannot be staged for the pipeline continuation.
+    """
+
+    message = "Job pipeline error."
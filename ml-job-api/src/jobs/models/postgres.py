@@ -1,12 +1,21 @@
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import (
+    Boolean,
     DateTime,
     Enum,
     Float,
+    ForeignKey,
+    Index,
+    Integer,
     String,
+    text,
+)
+from sqlalchemy.dialects.postgresql import (
+    JSONB,
+    UUID,
 )
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -27,6 +36,37 @@ class JobPostgresModel(BasePostgresModel):
 
     __tablename__ = "jobs"
 
+    __table_args__ = (
+        Index(
+            "ix__jobs__heartbeat_at__processing",
+            "heartbeat_at",
+            postgresql_where=text("phase = 'PROCESSING'"),
+        ),
+        Index(
+            "ix__jobs__created_at__job_id",
+            "created_at",
+            "job_id",
+        ),
+        Index(
+            "ix__jobs__phase__created_at__job_id",
+            "phase",
+            "created_at",
+            "job_id",
+        ),
+        Index(
+            "ix__jobs__type__created_at__job_id",
+            "type",
+            "created_at",
+            "job_id",
+        ),
+        Index(
+            "ix__jobs__label__trgm",
+            "label",
+            postgresql_using="gin",
+            postgresql_ops={"label": "gin_trgm_ops"},
+        ),
+    )
+
     repr_columns = (
         "job_id",
         "type",
@@ -73,7 +113,6 @@ class JobPostgresModel(BasePostgresModel):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
         comment="Job creation datetime",
     )
 
@@ -94,3 +133,53 @@ class JobPostgresModel(BasePostgresModel):
         nullable=True,
         comment="Job execution duration",
     )
+
+    progress: Mapped[dict[str, Any] | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        comment="Job execution progress",
+    )
+
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Job latest heartbeat datetime",
+    )
+
+    requeue_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Job requeue count",
+    )
+
+    parent_job_id: Mapped[UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("jobs.job_id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+        comment="Job preceding job ID",
+    )
+
+    chained: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+        comment="Job automatic pipeline continuation flag",
+    )
+
+    priority: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=job_resources["priority"]["DEFAULT_VALUE"],
+        server_default=str(job_resources["priority"]["DEFAULT_VALUE"]),
+        comment="Job queue priority",
+    )
+
+    queued_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Job latest dispatch datetime",
+    )
@@ -1,6 +1,8 @@
 from src.jobs.params.list import JobListParams
+from src.jobs.params.remove import JobRemoveParams
 
 
 __all__ = [
     "JobListParams",
+    "JobRemoveParams",
 ]
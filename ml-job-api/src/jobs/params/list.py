@@ -1,16 +1,60 @@
+from datetime import datetime
+from typing import Self
+from uuid import UUID
+
 from pydantic import (
     BaseModel,
     Field,
+    model_validator,
 )
 
+from src.common.utils import decode_cursor
 from src.jobs.resources import list_resources
+from src.jobs.types import (
+    JobType,
+    PhaseType,
+)
 
 
 class JobListParams(BaseModel):
     """
-    Query parameters for paginating job listings.
+    Query parameters for filtering and paginating job listings.
     """
 
+    phase: PhaseType | None = Field(
+        None,
+        description=list_resources["phase"]["DESCRIPTION"],
+        examples=list_resources["phase"]["EXAMPLES"],
+    )
+
+    type: JobType | None = Field(
+        None,
+        description=list_resources["type"]["DESCRIPTION"],
+        examples=list_resources["type"]["EXAMPLES"],
+    )
+
+    label: str | None = Field(
+        None,
+        min_length=list_resources["label"]["MIN_LENGTH"],
+        max_length=list_resources["label"]["MAX_LENGTH"],
+        description=list_resources["label"]["DESCRIPTION"],
+        examples=list_resources["label"]["EXAMPLES"],
+    )
+
+    count: bool = Field(
+        list_resources["count"]["DEFAULT_VALUE"],
+        description=list_resources["count"]["DESCRIPTION"],
+        examples=list_resources["count"]["EXAMPLES"],
+    )
+
+    cursor: str | None = Field(
+        None,
+        min_length=list_resources["cursor"]["MIN_LENGTH"],
+        max_length=list_resources["cursor"]["MAX_LENGTH"],
+        description=list_resources["cursor"]["DESCRIPTION"],
+        examples=list_resources["cursor"]["EXAMPLES"],
+    )
+
     offset: int = Field(
         list_resources["offset"]["DEFAULT_VALUE"],
         ge=list_resources["offset"]["MIN_VALUE"],
@@ -24,3 +68,32 @@ class JobListParams(BaseModel):
         description=list_resources["limit"]["DESCRIPTION"],
         examples=list_resources["limit"]["EXAMPLES"],
     )
+
+    @model_validator(mode="after")
+    def check_cursor(self) -> Self:
+        """
+        Ensure the cursor is well-formed.
+
+        Returns:
+            Self: The validated parameters.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+
+        if self.cursor is None:
+            return self
+
+        position = decode_cursor(self.cursor)
+
+        if len(position) != 2:
+            raise ValueError("Cursor is malformed.")
+
+        try:
+            datetime.fromisoformat(position[0])
+            UUID(position[1])
+
+        except (TypeError, ValueError) as e:
+            raise ValueError("Cursor is malformed.") from e
+
+        return self
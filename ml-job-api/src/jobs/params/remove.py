@@ -0,0 +1,18 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.jobs.resources import remove_resources
+
+
+class JobRemoveParams(BaseModel):
+    """
+    Query parameters for removing a job.
+    """
+
+    remove_dir: bool = Field(
+        remove_resources["remove_dir"]["DEFAULT_VALUE"],
+        description=remove_resources["remove_dir"]["DESCRIPTION"],
+        examples=remove_resources["remove_dir"]["EXAMPLES"],
+    )
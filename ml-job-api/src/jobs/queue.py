@@ -14,14 +14,15 @@ class JobQueue(ABC):
     """
 
     @abstractmethod
-    def run_by_job_id_and_job_type(self, job_id: UUID, job_type: JobType, dto: JobStartDTO) -> None:
+    def run_by_job_id_and_job_type(self, job_id: UUID, job_type: JobType, dto: JobStartDTO, priority: int) -> None:
         """
         Enqueue a new job for execution.
 
         Parameters:
             job_id (UUID): Unique identifier assigned to the job.
-            job_type (JobType): The category of the job, determining which worker job to invoke.
+            job_type (JobType): The category of the job, determining which worker job and queue to use.
             dto (JobStartDTO): Data transfer object containing initialization parameters for the job.
+            priority (int): Priority of the job within its queue, higher values are consumed first.
         """
 
         raise NotImplementedError
@@ -36,3 +37,41 @@ class JobQueue(ABC):
         """
 
         raise NotImplementedError
+
+    @abstractmethod
+    def abort_batch_by_job_ids(self, job_ids: list[UUID]) -> None:
+        """
+        Revoke multiple running jobs at once.
+
+        Parameters:
+            job_ids (list[UUID]): Unique identifiers of the jobs to abort.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_active_job_ids(self) -> set[UUID] | None:
+        """
+        List identifiers of jobs currently executed or reserved by workers.
+
+        Returns:
+            set[UUID] | None: Identifiers of active jobs, or None if no worker replied.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_depth_by_job_type(self, job_type: JobType) -> tuple[str, int | None, int | None]:
+        """
+        Get the depth of the queue jobs of the given type are routed to.
+
+        Parameters:
+            job_type (JobType): The category of the jobs.
+
+        Returns:
+            tuple[str, int | None, int | None]:
+                The queue name, the number of jobs waiting in the queue and the number of its consumers,
+                both None if the queue cannot be inspected.
+        """
+
+        raise NotImplementedError
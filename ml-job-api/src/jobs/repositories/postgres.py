@@ -1,37 +1,148 @@
+import time
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    delete,
+    extract,
     func,
+    or_,
     select,
+    tuple_,
+    update,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.caches import LRUCache
+from src.common.utils import (
+    decode_cursor,
+    encode_cursor,
+)
 from src.jobs.dto import (
+    JobBatchDTO,
     JobCreateDTO,
     JobUpdateDTO,
 )
 from src.jobs.entity import JobEntity
 from src.jobs.errors import JobNotExistError
 from src.jobs.models import JobPostgresModel
+from src.jobs.params import JobListParams
 from src.jobs.repository import JobRepository
+from src.jobs.types import (
+    JobType,
+    PhaseType,
+)
 
 
 class JobPostgresRepository(JobRepository):
     """
     PostgreSQL-backed implementation of JobRepository using SQLAlchemy AsyncSession.
+
+    Updates and deletes are single `UPDATE/DELETE … RETURNING` statements, so a write costs one
+    round-trip besides its commit, and conditional ones are atomic against concurrent writers.
+    Job listings are paginated by keyset on (`created_at`, `job_id`), so every page is a range scan
+    of a composite index whatever its depth. Counts of matching jobs are optionally cached for
+    a few seconds, so paging through a listing does not count the jobs again for every page.
     """
 
     model = JobPostgresModel
 
-    def __init__(self, postgres_async_session: AsyncSession) -> None:
+    def __init__(
+        self,
+        postgres_async_session: AsyncSession,
+        count_cache: LRUCache | None = None,
+        count_cache_ttl: float = 0.0,
+    ) -> None:
         """
         Initialize the repository with an async SQLAlchemy session.
 
         Parameters:
             postgres_async_session (AsyncSession): An SQLAlchemy AsyncSession bound to the PostgreSQL engine.
+            count_cache (LRUCache | None): Optional in-process cache of the counts of jobs matching filters.
+            count_cache_ttl (float): Seconds a cached count is served for, zero disables the cache.
         """
 
         self.session = postgres_async_session
+        self.count_cache = count_cache
+        self.count_cache_ttl = count_cache_ttl
+
+    def _leased_at(self) -> ColumnElement[datetime]:
+        """
+        Build the expression of the datetime the lease of a processing job was last renewed at.
+
+        A job renews its lease with every heartbeat. Until the first heartbeat of a dispatch,
+        the lease starts when the job was queued, so a job whose message is lost or whose
+        worker dies early expires as well.
+
+        Returns:
+            ColumnElement[datetime]: The latest heartbeat, or the queue datetime, or the creation datetime.
+        """
+
+        return func.coalesce(self.model.heartbeat_at, self.model.queued_at, self.model.created_at)
+
+    def _filter_by_params(self, query: Select, params: JobListParams | JobBatchDTO) -> Select:
+        """
+        Restrict a query to the job records matching the listing filters.
+
+        Phase and type filters map onto composite indexes ending with the listing order, and label
+        searches onto a trigram index, so the matching rows are found without a sequential scan.
+
+        Parameters:
+            query (Select): The query over job records.
+            params (JobListParams | JobBatchDTO): Listing or batch selection filters to apply.
+
+        Returns:
+            Select: The filtered query.
+        """
+
+        if params.phase is not None:
+            query = query.where(self.model.phase == params.phase)
+
+        if params.type is not None:
+            query = query.where(self.model.type == params.type)
+
+        if params.label is not None:
+            pattern = params.label.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query = query.where(self.model.label.ilike(f"%{pattern}%", escape="\\"))
+
+        return query
+
+    async def _select_batch_for_update(self, selection: JobBatchDTO) -> dict[UUID, PhaseType]:
+        """
+        Select the jobs of a batch and lock their records until the end of the transaction.
+
+        The records are locked in a deterministic order, so concurrent batches over the same jobs
+        wait for each other instead of deadlocking, and single job transitions wait for the batch.
+
+        Parameters:
+            selection (JobBatchDTO): Selection of the jobs by IDs or by filters.
+
+        Returns:
+            dict[UUID, PhaseType]: The current phases of the selected jobs, in the selection order.
+        """
+
+        query = select(self.model.job_id, self.model.phase)
+
+        if selection.job_ids is not None:
+            query = query.where(self.model.job_id.in_(selection.job_ids)).order_by(self.model.job_id)
+
+        else:
+            query = (
+                self._filter_by_params(query, selection)
+                .order_by(self.model.created_at.desc(), self.model.job_id.desc())
+                .limit(selection.limit)
+            )
+
+        result = await self.session.execute(query.with_for_update())
+        phases = dict(result.tuples().all())
+
+        if selection.job_ids is not None:
+            phases = {job_id: phases[job_id] for job_id in dict.fromkeys(selection.job_ids) if job_id in phases}
+
+        return phases
 
     async def create(self, dto: JobCreateDTO) -> JobEntity:
         """
@@ -75,7 +186,7 @@ class JobPostgresRepository(JobRepository):
 
     async def update_by_job_id(self, job_id: UUID, dto: JobUpdateDTO) -> JobEntity:
         """
-        Update existing fields of a job record.
+        Update existing fields of a job record in a single statement.
 
         Parameters:
             job_id (UUID): The unique identifier of the job to update.
@@ -88,70 +199,400 @@ class JobPostgresRepository(JobRepository):
             JobNotExistError: If no job with the specified ID exists.
         """
 
-        orm = await self.session.get(self.model, job_id)
+        values = dto.model_dump(exclude_unset=True)
+
+        if not values:
+            return await self.get_by_job_id(job_id)
+
+        query = update(self.model).where(self.model.job_id == job_id).values(**values).returning(self.model)
+        result = await self.session.execute(query)
+        orm = result.scalar_one_or_none()
 
         if not orm:
+            await self.session.rollback()
+
             raise JobNotExistError(f"Cannot update job with ID={job_id}.")
 
-        for key, value in dto.model_dump(exclude_none=True).items():
-            setattr(orm, key, value)
+        await self.session.commit()
+
+        return JobEntity.model_validate(orm)
+
+    async def update_by_job_id_and_phases(self, job_id: UUID, phases: set[PhaseType], dto: JobUpdateDTO) -> JobEntity:
+        """
+        Update existing fields of a job record in a single conditional statement.
+
+        The phase condition is evaluated by the database, so of concurrent callers moving a job
+        out of the given phases only the first one updates it, whichever API worker serves it.
+
+        Parameters:
+            job_id (UUID): The unique identifier of the job to update.
+            phases (set[PhaseType]): The phases the job may currently be in.
+            dto (JobUpdateDTO): DTO containing fields to update.
+
+        Returns:
+            JobEntity: The updated job entity reflecting persisted changes.
+
+        Raises:
+            JobNotExistError: If no job with the specified ID exists in any of the given phases.
+        """
+
+        query = (
+            update(self.model)
+            .where(self.model.job_id == job_id, self.model.phase.in_(phases))
+            .values(**dto.model_dump(exclude_unset=True))
+            .returning(self.model)
+        )
+        result = await self.session.execute(query)
+        orm = result.scalar_one_or_none()
+
+        if not orm:
+            await self.session.rollback()
+
+            raise JobNotExistError(f"Cannot update job with ID={job_id} in phases={', '.join(sorted(phases))}.")
 
         await self.session.commit()
-        await self.session.refresh(orm)
 
         return JobEntity.model_validate(orm)
 
-    async def delete_by_job_id(self, job_id: UUID) -> None:
+    async def update_by_job_id_and_heartbeat_before(
+        self, job_id: UUID, heartbeat_before: datetime, dto: JobUpdateDTO
+    ) -> JobEntity:
+        """
+        Update existing fields of a processing job record with an expired lease in a single conditional statement.
+
+        The lease condition is evaluated by the database, so a heartbeat received after
+        the lease was found expired prevents the update. A job without any heartbeat yet
+        is leased since it was queued.
+
+        Parameters:
+            job_id (UUID): The unique identifier of the job to update.
+            heartbeat_before (datetime): The datetime the lease of the job must have been renewed before.
+            dto (JobUpdateDTO): DTO containing fields to update.
+
+        Returns:
+            JobEntity: The updated job entity reflecting persisted changes.
+
+        Raises:
+            JobNotExistError: If no processing job with the specified ID and an expired lease exists.
+        """
+
+        query = (
+            update(self.model)
+            .where(
+                self.model.job_id == job_id,
+                self.model.phase == PhaseType.PROCESSING,
+                self._leased_at() < heartbeat_before,
+            )
+            .values(**dto.model_dump(exclude_unset=True))
+            .returning(self.model)
+        )
+        result = await self.session.execute(query)
+        orm = result.scalar_one_or_none()
+
+        if not orm:
+            await self.session.rollback()
+
+            raise JobNotExistError(f"Cannot update job with ID={job_id} and heartbeat before={heartbeat_before}.")
+
+        await self.session.commit()
+
+        return JobEntity.model_validate(orm)
+
+    async def update_by_job_id_and_chained(self, job_id: UUID, chained: bool, dto: JobUpdateDTO) -> JobEntity:
+        """
+        Update existing fields of a job record with the given continuation flag in a single conditional statement.
+
+        The flag condition is evaluated by the database, so only one of concurrent callers
+        can claim a job for the pipeline continuation by resetting its flag.
+
+        Parameters:
+            job_id (UUID): The unique identifier of the job to update.
+            chained (bool): The value the pipeline continuation flag of the job must currently have.
+            dto (JobUpdateDTO): DTO containing fields to update.
+
+        Returns:
+            JobEntity: The updated job entity reflecting persisted changes.
+
+        Raises:
+            JobNotExistError: If no job with the specified ID and flag value exists.
+        """
+
+        query = (
+            update(self.model)
+            .where(self.model.job_id == job_id, self.model.chained == chained)
+            .values(**dto.model_dump(exclude_unset=True))
+            .returning(self.model)
+        )
+        result = await self.session.execute(query)
+        orm = result.scalar_one_or_none()
+
+        if not orm:
+            await self.session.rollback()
+
+            raise JobNotExistError(f"Cannot update job with ID={job_id} and chained={chained}.")
+
+        await self.session.commit()
+
+        return JobEntity.model_validate(orm)
+
+    async def delete_by_job_id_and_phases(self, job_id: UUID, phases: set[PhaseType]) -> JobEntity:
         """
-        Delete a job record from the database.
+        Delete a job record in one of the given phases in a single conditional statement.
 
         Parameters:
             job_id (UUID): The unique identifier of the job to delete.
+            phases (set[PhaseType]): The phases the job may currently be in.
+
+        Returns:
+            JobEntity: The deleted job entity.
 
         Raises:
-            JobNotExistError: If no job with the specified ID exists.
+            JobNotExistError: If no job with the specified ID exists in any of the given phases.
         """
 
-        orm = await self.session.get(self.model, job_id)
+        query = (
+            delete(self.model).where(self.model.job_id == job_id, self.model.phase.in_(phases)).returning(self.model)
+        )
+        result = await self.session.execute(query)
+        orm = result.scalar_one_or_none()
 
         if not orm:
-            raise JobNotExistError(f"Cannot delete job with ID={job_id}.")
+            await self.session.rollback()
+
+            raise JobNotExistError(f"Cannot delete job with ID={job_id} in phases={', '.join(sorted(phases))}.")
+
+        await self.session.commit()
+
+        return JobEntity.model_validate(orm)
+
+    async def update_batch_by_selection_and_phases(
+        self, selection: JobBatchDTO, phases: set[PhaseType], dto: JobUpdateDTO
+    ) -> tuple[list[JobEntity], dict[UUID, PhaseType]]:
+        """
+        Update existing fields of the selected job records in one of the given phases.
+
+        The phases are checked on the locked records and all matching records updated by a single
+        statement, in one transaction.
+
+        Parameters:
+            selection (JobBatchDTO): Selection of the jobs by IDs or by filters.
+            phases (set[PhaseType]): The phases the jobs may currently be in to be updated.
+            dto (JobUpdateDTO): DTO containing fields to update.
+
+        Returns:
+            tuple[list[JobEntity], dict[UUID, PhaseType]]:
+                The updated job entities, and the phases of all selected jobs before the update,
+                in the selection order.
+        """
+
+        selected_phases = await self._select_batch_for_update(selection)
+        job_ids = [job_id for job_id, phase in selected_phases.items() if phase in phases]
+        orms = []
+
+        if job_ids:
+            query = (
+                update(self.model)
+                .where(self.model.job_id.in_(job_ids))
+                .values(**dto.model_dump(exclude_unset=True))
+                .returning(self.model)
+            )
+            result = await self.session.execute(query)
+            orms = result.scalars().all()
+
+        await self.session.commit()
+
+        return [JobEntity.model_validate(orm) for orm in orms], selected_phases
+
+    async def delete_batch_by_selection_and_phases(
+        self, selection: JobBatchDTO, phases: set[PhaseType]
+    ) -> tuple[list[JobEntity], dict[UUID, PhaseType]]:
+        """
+        Delete the selected job records in one of the given phases.
+
+        The phases are checked on the locked records and all matching records deleted by a single
+        statement, in one transaction.
+
+        Parameters:
+            selection (JobBatchDTO): Selection of the jobs by IDs or by filters.
+            phases (set[PhaseType]): The phases the jobs may currently be in to be deleted.
+
+        Returns:
+            tuple[list[JobEntity], dict[UUID, PhaseType]]:
+                The deleted job entities, and the phases of all selected jobs before the deletion,
+                in the selection order.
+        """
+
+        selected_phases = await self._select_batch_for_update(selection)
+        job_ids = [job_id for job_id, phase in selected_phases.items() if phase in phases]
+        orms = []
+
+        if job_ids:
+            query = delete(self.model).where(self.model.job_id.in_(job_ids)).returning(self.model)
+            result = await self.session.execute(query)
+            orms = result.scalars().all()
 
-        await self.session.delete(orm)
         await self.session.commit()
 
-    async def list_by_offset_and_limit(self, offset: int, limit: int) -> list[JobEntity]:
+        return [JobEntity.model_validate(orm) for orm in orms], selected_phases
+
+    async def list_by_params(self, params: JobListParams) -> tuple[list[JobEntity], str | None]:
+        """
+        Retrieve a page of job records matching the filters, ordered by creation time descending.
+
+        The page following a cursor starts right after its job in the index order, and one extra
+        record is read to know whether another page follows.
+
+        Parameters:
+            params (JobListParams): Filters and pagination parameters.
+
+        Returns:
+            tuple[list[JobEntity], str | None]:
+                A list of job entities for the requested page, and the cursor of the following page,
+                or None on the last page.
+        """
+
+        query = self._filter_by_params(select(self.model), params)
+
+        if params.cursor is not None:
+            created_at, job_id = decode_cursor(params.cursor)
+            query = query.where(
+                tuple_(self.model.created_at, self.model.job_id)
+                < tuple_(datetime.fromisoformat(created_at), UUID(job_id))
+            )
+
+        query = (
+            query.order_by(self.model.created_at.desc(), self.model.job_id.desc())
+            .offset(params.offset)
+            .limit(params.limit + 1)
+        )
+        result = await self.session.execute(query)
+        orms = result.scalars().all()
+        entities = [JobEntity.model_validate(orm) for orm in orms[: params.limit]]
+
+        if len(orms) <= params.limit or not entities:
+            return entities, None
+
+        return entities, encode_cursor([entities[-1].created_at.isoformat(), str(entities[-1].job_id)])
+
+    async def list_by_heartbeat_before(self, heartbeat_before: datetime) -> list[JobEntity]:
+        """
+        Retrieve processing job records whose lease was last renewed before the given datetime.
+
+        The lease is renewed by heartbeats, and starts when a job is queued if it has no heartbeat yet.
+
+        Parameters:
+            heartbeat_before (datetime): The datetime the lease of the jobs must have been renewed before.
+
+        Returns:
+            list[JobEntity]: A list of processing job entities with expired leases.
+        """
+
+        query = select(self.model).where(
+            self.model.phase == PhaseType.PROCESSING,
+            self._leased_at() < heartbeat_before,
+        )
+        result = await self.session.execute(query)
+        orms = result.scalars().all()
+
+        return [JobEntity.model_validate(orm) for orm in orms]
+
+    async def list_by_parent_job_id_and_phase(self, parent_job_id: UUID, phase: PhaseType) -> list[JobEntity]:
         """
-        Retrieve a page of job records ordered by creation time descending.
+        Retrieve job records following the given job in the pipeline and being in the given phase.
 
         Parameters:
-            offset (int): Number of records to skip.
-            limit (int): Maximum number of records to return.
+            parent_job_id (UUID): The unique identifier of the preceding job.
+            phase (PhaseType): The phase the jobs must currently be in.
 
         Returns:
-            list[JobEntity]: A list of job entities for the requested page.
+            list[JobEntity]: A list of following job entities ordered by creation time ascending.
         """
 
-        created_at_order = self.model.created_at.desc()
-        query = select(self.model).order_by(created_at_order).offset(offset).limit(limit)
+        created_at_order = self.model.created_at.asc()
+        query = (
+            select(self.model)
+            .where(self.model.parent_job_id == parent_job_id, self.model.phase == phase)
+            .order_by(created_at_order)
+        )
         result = await self.session.execute(query)
         orms = result.scalars().all()
 
         return [JobEntity.model_validate(orm) for orm in orms]
 
-    async def total(self) -> int:
+    async def list_waits_by_started_after(
+        self, started_after: datetime, now: datetime
+    ) -> dict[JobType, tuple[int, float | None, float | None]]:
         """
-        Count the total number of job records.
+        Aggregate the queue wait of job records per job type in a single grouped query.
+
+        A dispatched job is waiting while it is processing without any worker heartbeat yet.
+
+        Parameters:
+            started_after (datetime): The datetime recently started jobs must have started after.
+            now (datetime): The current datetime the waiting jobs are measured against.
 
         Returns:
-            int: Total count of jobs in the database.
+            dict[JobType, tuple[int, float | None, float | None]]:
+                Per job type with any matching job, the number of waiting jobs, the seconds the oldest
+                of them has been waiting, and the average seconds recently started jobs waited in the queue.
         """
 
-        query = select(func.count(self.model.job_id))
+        is_waiting = and_(
+            self.model.phase == PhaseType.PROCESSING,
+            self.model.heartbeat_at.is_(None),
+            self.model.queued_at.is_not(None),
+        )
+        is_recently_started = and_(
+            self.model.started_at > started_after,
+            self.model.queued_at.is_not(None),
+        )
+        query = (
+            select(
+                self.model.type,
+                func.count().filter(is_waiting),
+                extract("epoch", now - func.min(self.model.queued_at).filter(is_waiting)),
+                func.avg(extract("epoch", self.model.started_at - self.model.queued_at)).filter(is_recently_started),
+            )
+            .where(or_(is_waiting, is_recently_started))
+            .group_by(self.model.type)
+        )
+        result = await self.session.execute(query)
+        rows = result.all()
+
+        return {
+            job_type: (
+                waiting,
+                float(oldest_wait) if oldest_wait is not None else None,
+                max(float(average_wait), 0.0) if average_wait is not None else None,
+            )
+            for job_type, waiting, oldest_wait, average_wait in rows
+        }
+
+    async def total_by_params(self, params: JobListParams) -> int:
+        """
+        Count the job records matching the filters, serving a count cached less than `count_cache_ttl` seconds ago.
+
+        Parameters:
+            params (JobListParams): Filters, pagination parameters are ignored.
+
+        Returns:
+            int: Count of matching jobs in the database.
+        """
+
+        key = ("jobs", params.phase, params.type, params.label)
+
+        if self.count_cache is not None and self.count_cache_ttl > 0:
+            entry = self.count_cache.get(key, None)
+
+            if entry is not None and time.monotonic() - entry[0] < self.count_cache_ttl:
+                return entry[1]
+
+        query = self._filter_by_params(select(func.count(self.model.job_id)), params)
         result = await self.session.execute(query)
-        total = result.scalar()
+        total = result.scalar() or 0
 
-        if not total:
-            return 0
+        if self.count_cache is not None and self.count_cache_ttl > 0:
+            # Counts are small, so every cached count takes a single unit of the cache budget
+            self.count_cache.set(key, None, (time.monotonic(), total), 1)
 
         return total
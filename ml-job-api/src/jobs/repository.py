@@ -2,13 +2,20 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from datetime import datetime
 from uuid import UUID
 
 from src.jobs.dto import (
+    JobBatchDTO,
     JobCreateDTO,
     JobUpdateDTO,
 )
 from src.jobs.entity import JobEntity
+from src.jobs.params import JobListParams
+from src.jobs.types import (
+    JobType,
+    PhaseType,
+)
 
 
 class JobRepository(ABC):
@@ -60,38 +67,188 @@ class JobRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def delete_by_job_id(self, job_id: UUID) -> None:
+    async def update_by_job_id_and_phases(self, job_id: UUID, phases: set[PhaseType], dto: JobUpdateDTO) -> JobEntity:
         """
-        Delete a job record from the system.
+        Update fields of an existing job record only if it is in one of the given phases.
+
+        Parameters:
+            job_id (UUID): The UUID of the job to update.
+            phases (set[PhaseType]): The phases the job may currently be in.
+            dto (JobUpdateDTO): Data transfer object containing fields to modify.
+
+        Returns:
+            JobEntity: The updated job entity reflecting the applied changes.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_by_job_id_and_heartbeat_before(
+        self, job_id: UUID, heartbeat_before: datetime, dto: JobUpdateDTO
+    ) -> JobEntity:
+        """
+        Update fields of a processing job record only if its lease was last renewed before the given datetime.
+
+        The lease is renewed by heartbeats, and starts when the job is queued if it has no heartbeat yet.
+
+        Parameters:
+            job_id (UUID): The UUID of the job to update.
+            heartbeat_before (datetime): The datetime the lease of the job must have been renewed before.
+            dto (JobUpdateDTO): Data transfer object containing fields to modify.
+
+        Returns:
+            JobEntity: The updated job entity reflecting the applied changes.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_by_job_id_and_chained(self, job_id: UUID, chained: bool, dto: JobUpdateDTO) -> JobEntity:
+        """
+        Update fields of a job record only if its pipeline continuation flag has the given value.
+
+        Parameters:
+            job_id (UUID): The UUID of the job to update.
+            chained (bool): The value the pipeline continuation flag of the job must currently have.
+            dto (JobUpdateDTO): Data transfer object containing fields to modify.
+
+        Returns:
+            JobEntity: The updated job entity reflecting the applied changes.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_by_job_id_and_phases(self, job_id: UUID, phases: set[PhaseType]) -> JobEntity:
+        """
+        Delete a job record from the system only if it is in one of the given phases.
 
         Parameters:
             job_id (UUID): The UUID of the job to delete.
+            phases (set[PhaseType]): The phases the job may currently be in.
+
+        Returns:
+            JobEntity: The deleted job entity.
         """
 
         raise NotImplementedError
 
     @abstractmethod
-    async def list_by_offset_and_limit(self, offset: int, limit: int) -> list[JobEntity]:
+    async def update_batch_by_selection_and_phases(
+        self, selection: JobBatchDTO, phases: set[PhaseType], dto: JobUpdateDTO
+    ) -> tuple[list[JobEntity], dict[UUID, PhaseType]]:
         """
-        List job records in descending creation order, with pagination.
+        Update fields of the selected job records in one of the given phases, in a single transaction.
 
         Parameters:
-            offset (int): Number of records to skip before starting the list.
-            limit (int): Maximum number of records to return.
+            selection (JobBatchDTO): Selection of the jobs by IDs or by filters.
+            phases (set[PhaseType]): The phases the jobs may currently be in to be updated.
+            dto (JobUpdateDTO): Data transfer object containing fields to modify.
 
         Returns:
-            list[JobEntity]: A list of job entities ordered by `created_at` descending.
+            tuple[list[JobEntity], dict[UUID, PhaseType]]:
+                The updated job entities, and the phases of all selected jobs before the update,
+                in the selection order.
         """
 
         raise NotImplementedError
 
     @abstractmethod
-    async def total(self) -> int:
+    async def delete_batch_by_selection_and_phases(
+        self, selection: JobBatchDTO, phases: set[PhaseType]
+    ) -> tuple[list[JobEntity], dict[UUID, PhaseType]]:
+        """
+        Delete the selected job records in one of the given phases, in a single transaction.
+
+        Parameters:
+            selection (JobBatchDTO): Selection of the jobs by IDs or by filters.
+            phases (set[PhaseType]): The phases the jobs may currently be in to be deleted.
+
+        Returns:
+            tuple[list[JobEntity], dict[UUID, PhaseType]]:
+                The deleted job entities, and the phases of all selected jobs before the deletion,
+                in the selection order.
         """
-        Get the total count of job records in the system.
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_params(self, params: JobListParams) -> tuple[list[JobEntity], str | None]:
+        """
+        List job records matching the filters in descending creation order, with pagination.
+
+        Parameters:
+            params (JobListParams): Filters and pagination parameters.
+
+        Returns:
+            tuple[list[JobEntity], str | None]:
+                A list of job entities ordered by `created_at` and `job_id` descending,
+                and the cursor of the following page, or None on the last page.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_heartbeat_before(self, heartbeat_before: datetime) -> list[JobEntity]:
+        """
+        List processing job records whose lease was last renewed before the given datetime.
+
+        The lease is renewed by heartbeats, and starts when a job is queued if it has no heartbeat yet.
+
+        Parameters:
+            heartbeat_before (datetime): The datetime the lease of the jobs must have been renewed before.
+
+        Returns:
+            list[JobEntity]: A list of processing job entities with expired leases.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_parent_job_id_and_phase(self, parent_job_id: UUID, phase: PhaseType) -> list[JobEntity]:
+        """
+        List job records following the given job in the pipeline and being in the given phase.
+
+        Parameters:
+            parent_job_id (UUID): The UUID of the preceding job.
+            phase (PhaseType): The phase the jobs must currently be in.
+
+        Returns:
+            list[JobEntity]: A list of following job entities ordered by `created_at` ascending.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_waits_by_started_after(
+        self, started_after: datetime, now: datetime
+    ) -> dict[JobType, tuple[int, float | None, float | None]]:
+        """
+        Aggregate the queue wait of job records per job type.
+
+        Parameters:
+            started_after (datetime): The datetime recently started jobs must have started after.
+            now (datetime): The current datetime the waiting jobs are measured against.
+
+        Returns:
+            dict[JobType, tuple[int, float | None, float | None]]:
+                Per job type with any matching job, the number of dispatched jobs not yet picked up by a worker,
+                the seconds the oldest of them has been waiting, and the average seconds recently started jobs
+                waited in the queue.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def total_by_params(self, params: JobListParams) -> int:
+        """
+        Count the job records matching the filters.
+
+        Parameters:
+            params (JobListParams): Filters, pagination parameters are ignored.
 
         Returns:
-            int: The total number of jobs.
+            int: The number of matching jobs.
         """
 
         raise NotImplementedError
@@ -1,12 +1,22 @@
 from src.jobs.resources.api import rest_resources
 from src.jobs.resources.entity import (
+    advance_resources,
+    batch_resources,
     job_resources,
     list_resources,
+    progress_resources,
+    queue_resources,
+    remove_resources,
 )
 
 
 __all__ = [
+    "advance_resources",
+    "batch_resources",
     "job_resources",
     "list_resources",
+    "progress_resources",
+    "queue_resources",
+    "remove_resources",
     "rest_resources",
 ]
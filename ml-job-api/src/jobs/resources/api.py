@@ -7,11 +7,15 @@ rest_resources = {
     "HTTP_500": "Internal Server Error — an unexpected error occurred during processing",
     "initialize": {
         "HTTP_201": "Job initialized successfully",
+        "HTTP_404": "Preceding job not found",
         "SUMMARY": "Initialize a new job",
         "DESCRIPTION": (
             "Accepts a JSON payload with job type, label and optional description; "
             "initializes a new job record with a generated `job_id` and directory path. "
-            "Possible errors: 422 for invalid inputs, 500 for persistence failures."
+            "An optional `parent_job_id` places the job after another job in a pipeline, and `chained` "
+            "lets the pipeline continue the job automatically. "
+            "Possible errors: 404 if the preceding job is not found, 422 for invalid inputs, "
+            "500 for persistence failures."
         ),
     },
     "retrieve": {
@@ -41,7 +45,9 @@ rest_resources = {
         "DESCRIPTION": (
             "Removes the job identified by `job_id` if it is in a removable phase: "
             "PENDING, COMPLETED, ERROR or ABORTED. Also cascades removing of all associated "
-            "labelling records from the system. Possible errors: 404 if not found, "
+            "labelling records from the system. With query parameter `remove_dir`, the storage directory "
+            "of the job is moved to the trash and removed in the background, its progress listed by the "
+            "directory deletions of the files API. Possible errors: 404 if not found, "
             "409 if phase conflict, 422 for invalid `job_id`, 500 for removing failures."
         ),
     },
@@ -57,6 +63,22 @@ rest_resources = {
             "422 for invalid inputs, 500 for queueing failures."
         ),
     },
+    "batch": {
+        "HTTP_200": "Job batch action applied, see the outcome of each job",
+        "SUMMARY": "Run, abort or remove a batch of jobs",
+        "DESCRIPTION": (
+            "Runs, aborts or removes at once the jobs given by `job_ids`, or selected by the `phase`, `type` "
+            "and `label` filters, at most `limit` of them, the newest first. The phases of all selected jobs "
+            "are checked and the action applied in a single transaction, with the same allowed phases as the "
+            "single job actions: PENDING to run, PROCESSING to abort, PENDING, COMPLETED, ERROR or ABORTED "
+            "to remove. All aborted jobs are revoked by a single broadcast to the workers. With query "
+            "parameter `remove_dir`, the storage directories of removed jobs are moved to the trash. "
+            "The response reports the outcome for every job, missing jobs and phase conflicts included, and "
+            "FAILED for jobs that cannot be dispatched, revoked or have their directory moved to the trash. "
+            "Possible errors: 422 for invalid inputs, neither or both of IDs and filters included, "
+            "500 for persistence failures."
+        ),
+    },
     "end": {
         "HTTP_200": "Job end action applied",
         "HTTP_404": "Requested job not found",
@@ -65,16 +87,42 @@ rest_resources = {
         "DESCRIPTION": (
             "Marks the job as completed or errored based on `end_action` and provided processing metrics,"
             "if it is in appropriate phase: PROCESSING for complete action, PROCESSING for error action. "
+            "Repeating an already applied action with the same metrics returns the job unchanged. "
+            "Completing a chained job dispatches the pending jobs following it in the pipeline. "
             "Possible errors: 404 if not found, 409 if the job is in an invalid phase, "
             "422 for invalid inputs, 500 for update failures."
         ),
     },
+    "progress": {
+        "HTTP_204": "Job progress reported successfully",
+        "HTTP_404": "Requested job not found in PROCESSING phase",
+        "SUMMARY": "Report job progress",
+        "DESCRIPTION": (
+            "Accepts a JSON payload with the latest execution progress of the job identified by `job_id` "
+            "and stores it together with the heartbeat datetime, if the job is in PROCESSING phase. "
+            "Intended to be called periodically by workers. Possible errors: 404 if not found or not processing, "
+            "422 for invalid inputs, 500 for update failures."
+        ),
+    },
     "list": {
         "HTTP_200": "Jobs list retrieved successfully",
         "SUMMARY": "List jobs",
         "DESCRIPTION": (
-            "Retrieves a list of job summaries based on `offset` and `limit` query parameters. "
-            "Possible errors: 422 for invalid pagination parameters, 500 for retrieval failures."
+            "Retrieves a list of job summaries, newest first, optionally filtered by `phase`, `type` and a "
+            "case-insensitive `label` substring. Pages are followed by passing the returned `next_cursor` as "
+            "`cursor`, which stays fast at any depth, while `offset` skips jobs after the cursor. The count of "
+            "matching jobs in `total` may be a few seconds old and is skipped with `count=false`. "
+            "Possible errors: 422 for invalid pagination parameters or cursor, 500 for retrieval failures."
+        ),
+    },
+    "queues": {
+        "HTTP_200": "Job queues retrieved successfully",
+        "SUMMARY": "List job queues",
+        "DESCRIPTION": (
+            "Retrieves the queue of each job type with its broker depth and consumers, the number of "
+            "dispatched jobs not yet picked up by a worker, the wait of the oldest of them and the average "
+            "wait of recently started jobs. Broker counts are missing if the broker cannot be inspected. "
+            "Possible errors: 500 for retrieval failures."
         ),
     },
 }
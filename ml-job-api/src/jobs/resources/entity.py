@@ -48,18 +48,185 @@ job_resources = {
         "DESCRIPTION": "Total execution time of the job in seconds",
         "EXAMPLES": [180],
     },
+    "progress": {
+        "DESCRIPTION": "Latest execution progress snapshot reported by the worker",
+    },
+    "heartbeat_at": {
+        "DESCRIPTION": "UTC datetime of the latest worker heartbeat",
+        "EXAMPLES": ["2025-03-03T12:26:00Z"],
+    },
+    "requeue_count": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of times the job was requeued after its worker lease expired",
+        "EXAMPLES": [1],
+    },
+    "parent_job_id": {
+        "DESCRIPTION": "Unique identifier of the preceding job in the pipeline, after which the job is dispatched",
+        "EXAMPLES": ["3fa85f64-5717-4562-b3fc-2c963f66afa6"],
+    },
+    "chained": {
+        "DESCRIPTION": (
+            "Whether the pipeline continues the job automatically: pending follow-up jobs of a data "
+            "preprocessing job are dispatched once it completes, and the next iteration of an Active ML "
+            "job is staged and dispatched once its labelling set is fully labelled"
+        ),
+        "EXAMPLES": [True],
+    },
+    "priority": {
+        "MIN_VALUE": 0,
+        "MAX_VALUE": 9,
+        "DEFAULT_VALUE": 5,
+        "DESCRIPTION": "Priority of the job within the queue of its type, higher values are run first",
+        "EXAMPLES": [7],
+    },
+    "queued_at": {
+        "DESCRIPTION": "UTC datetime when the job was last dispatched to its queue",
+        "EXAMPLES": ["2025-03-03T12:20:00Z"],
+    },
+}
+
+queue_resources = {
+    "type": {
+        "DESCRIPTION": "Job type routed to the queue",
+    },
+    "queue": {
+        "DESCRIPTION": "Name of the broker queue consumed by the worker pool of the job type",
+        "EXAMPLES": ["active_ml"],
+    },
+    "messages": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of jobs waiting in the broker queue, missing if the broker cannot be inspected",
+        "EXAMPLES": [4],
+    },
+    "consumers": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of workers consuming the broker queue, missing if the broker cannot be inspected",
+        "EXAMPLES": [1],
+    },
+    "waiting": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of dispatched jobs not yet picked up by a worker",
+        "EXAMPLES": [4],
+    },
+    "oldest_wait": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Seconds the longest waiting dispatched job has been waiting for a worker",
+        "EXAMPLES": [1260.5],
+    },
+    "average_wait": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Average seconds recently started jobs waited in the queue before a worker picked them up",
+        "EXAMPLES": [312.4],
+    },
+    "queues": {
+        "DESCRIPTION": "List of job queues with their depth and wait time",
+    },
+}
+
+advance_resources = {
+    "iteration": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Iteration of the Active ML job whose labelling set was labelled",
+        "EXAMPLES": [1],
+    },
+    "oracle_filenames": {
+        "DESCRIPTION": "Spectrum filenames of the labelled oracle set",
+        "EXAMPLES": [["spec-55859-F5902_sp01-001.fits"]],
+    },
+    "oracle_labels": {
+        "DESCRIPTION": "User labels of the labelled oracle set, parallel to the spectrum filenames",
+        "EXAMPLES": [["single peak"]],
+    },
+    "performance": {
+        "MIN_VALUE": 0,
+        "MAX_VALUE": 1,
+        "DESCRIPTION": "Share of the labelled performance estimation set matching the model prediction",
+        "EXAMPLES": [0.8],
+    },
+}
+
+progress_resources = {
+    "stage": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 30,
+        "DESCRIPTION": "Name of the execution stage the worker is currently in",
+        "EXAMPLES": ["TRAINING"],
+    },
+    "files_processed": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of input files processed so far",
+        "EXAMPLES": [1200],
+    },
+    "files_total": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Total number of input files to process",
+        "EXAMPLES": [45000],
+    },
+    "epoch": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of model training epochs finished so far",
+        "EXAMPLES": [12],
+    },
+    "epochs_total": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Maximum number of model training epochs",
+        "EXAMPLES": [1000],
+    },
+    "loss": {
+        "DESCRIPTION": "Model training loss of the latest finished epoch",
+        "EXAMPLES": [0.4213],
+    },
+    "prediction_batch": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of model prediction batches finished so far",
+        "EXAMPLES": [3],
+    },
+    "prediction_batches_total": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Total number of model prediction batches",
+        "EXAMPLES": [8],
+    },
 }
 
 list_resources = {
     "total": {
         "MIN_VALUE": 0,
-        "DESCRIPTION": "Total number of jobs in the system",
+        "DESCRIPTION": "Number of jobs matching the filters, counted up to a few seconds ago, omitted if not counted",
         "EXAMPLES": [123],
     },
+    "phase": {
+        "DESCRIPTION": "Phase of the listed jobs, jobs in any phase if omitted",
+        "EXAMPLES": ["PROCESSING"],
+    },
+    "type": {
+        "DESCRIPTION": "Type of the listed jobs, jobs of any type if omitted",
+        "EXAMPLES": ["ACTIVE_ML"],
+    },
+    "label": {
+        "MIN_LENGTH": job_resources["label"]["MIN_LENGTH"],
+        "MAX_LENGTH": job_resources["label"]["MAX_LENGTH"],
+        "DESCRIPTION": "Case-insensitive text the labels of the listed jobs contain",
+        "EXAMPLES": ["orionis"],
+    },
+    "count": {
+        "DEFAULT_VALUE": True,
+        "DESCRIPTION": "Whether the total number of jobs matching the filters is counted",
+        "EXAMPLES": [False],
+    },
+    "cursor": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 1024,
+        "DESCRIPTION": "Opaque cursor of the previous page, the jobs created before its last job are listed",
+        "EXAMPLES": ["WyIyMDI1LTA0LTA0VDEyOjAwOjAwKzAwOjAwIiwiM2ZhODVmNjQtNTcxNy00NTYyLWIzZmMtMmM5NjNmNjZhZmE2Il0="],
+    },
+    "next_cursor": {
+        "DESCRIPTION": "Cursor listing the following page, omitted on the last page",
+        "EXAMPLES": ["WyIyMDI1LTA0LTA0VDEyOjAwOjAwKzAwOjAwIiwiM2ZhODVmNjQtNTcxNy00NTYyLWIzZmMtMmM5NjNmNjZhZmE2Il0="],
+    },
     "offset": {
         "MIN_VALUE": 0,
         "DEFAULT_VALUE": 0,
-        "DESCRIPTION": "Zero-based index of the first returned job",
+        "DESCRIPTION": "Number of jobs to skip, after the job of the cursor if given",
         "EXAMPLES": [10],
     },
     "limit": {
@@ -72,3 +239,63 @@ list_resources = {
         "DESCRIPTION": "List of summarized job records",
     },
 }
+
+remove_resources = {
+    "remove_dir": {
+        "DEFAULT_VALUE": False,
+        "DESCRIPTION": "Whether the storage directory of the job is also removed in the background",
+        "EXAMPLES": [True],
+    },
+}
+
+batch_resources = {
+    "job_ids": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 1000,
+        "DESCRIPTION": "Identifiers of the jobs the action is applied to, omitted to select the jobs by the filters",
+        "EXAMPLES": [["3fa85f64-5717-4562-b3fc-2c963f66afa6"]],
+    },
+    "phase": {
+        "DESCRIPTION": "Phase of the jobs selected by the filters, jobs in any phase if omitted",
+        "EXAMPLES": ["ERROR"],
+    },
+    "type": {
+        "DESCRIPTION": "Type of the jobs selected by the filters, jobs of any type if omitted",
+        "EXAMPLES": ["DATA_PREPROCESSING"],
+    },
+    "label": {
+        "MIN_LENGTH": job_resources["label"]["MIN_LENGTH"],
+        "MAX_LENGTH": job_resources["label"]["MAX_LENGTH"],
+        "DESCRIPTION": "Case-insensitive text the labels of the jobs selected by the filters contain",
+        "EXAMPLES": ["orionis"],
+    },
+    "limit": {
+        "MIN_VALUE": 1,
+        "MAX_VALUE": 1000,
+        "DEFAULT_VALUE": 1000,
+        "DESCRIPTION": "Maximum number of jobs selected by the filters, the newest first",
+        "EXAMPLES": [100],
+    },
+    "batch_action": {
+        "DESCRIPTION": "Action applied to the selected jobs",
+    },
+    "applied": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of jobs the action was applied to",
+        "EXAMPLES": [42],
+    },
+    "outcome": {
+        "DESCRIPTION": "Outcome of the action on the job",
+    },
+    "phase_after": {
+        "DESCRIPTION": "Phase of the job after the action, omitted if the job does not exist anymore",
+        "EXAMPLES": ["ABORTED"],
+    },
+    "detail": {
+        "DESCRIPTION": "Reason the action was not applied to the job as requested, omitted if it was",
+        "EXAMPLES": ["Cannot abort job in current phase=COMPLETED, allowed phases=PROCESSING."],
+    },
+    "results": {
+        "DESCRIPTION": "Outcomes of the action per selected job, in the order of the given IDs or the newest first",
+    },
+}
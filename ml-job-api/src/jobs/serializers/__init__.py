@@ -1,10 +1,24 @@
+from src.jobs.serializers.batch import (
+    JobBatchResultSerializer,
+    JobBatchSerializer,
+)
 from src.jobs.serializers.list import JobListSerializer
+from src.jobs.serializers.progress import JobProgressSerializer
+from src.jobs.serializers.queue import (
+    JobQueueListSerializer,
+    JobQueueSerializer,
+)
 from src.jobs.serializers.read import JobReadSerializer
 from src.jobs.serializers.summarize import JobSummarizeSerializer
 
 
 __all__ = [
+    "JobBatchResultSerializer",
+    "JobBatchSerializer",
     "JobListSerializer",
+    "JobProgressSerializer",
+    "JobQueueListSerializer",
+    "JobQueueSerializer",
     "JobReadSerializer",
     "JobSummarizeSerializer",
 ]
@@ -0,0 +1,67 @@
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.jobs.resources import (
+    batch_resources,
+    job_resources,
+)
+from src.jobs.types import (
+    BatchActionType,
+    BatchOutcomeType,
+    PhaseType,
+)
+
+
+class JobBatchResultSerializer(BaseModel):
+    """
+    Serializer model of the outcome of a batch action on a single job.
+    """
+
+    job_id: UUID = Field(
+        ...,
+        description=job_resources["job_id"]["DESCRIPTION"],
+    )
+
+    outcome: BatchOutcomeType = Field(
+        ...,
+        description=batch_resources["outcome"]["DESCRIPTION"],
+    )
+
+    phase: PhaseType | None = Field(
+        None,
+        description=batch_resources["phase_after"]["DESCRIPTION"],
+        examples=batch_resources["phase_after"]["EXAMPLES"],
+    )
+
+    detail: str | None = Field(
+        None,
+        description=batch_resources["detail"]["DESCRIPTION"],
+        examples=batch_resources["detail"]["EXAMPLES"],
+    )
+
+
+class JobBatchSerializer(BaseModel):
+    """
+    Serializer model of the report of a batch action.
+    """
+
+    batch_action: BatchActionType = Field(
+        ...,
+        description=batch_resources["batch_action"]["DESCRIPTION"],
+    )
+
+    applied: int = Field(
+        ...,
+        ge=batch_resources["applied"]["MIN_VALUE"],
+        description=batch_resources["applied"]["DESCRIPTION"],
+        examples=batch_resources["applied"]["EXAMPLES"],
+    )
+
+    results: list[JobBatchResultSerializer] = Field(
+        ...,
+        description=batch_resources["results"]["DESCRIPTION"],
+    )
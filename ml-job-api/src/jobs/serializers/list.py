@@ -12,8 +12,8 @@ class JobListSerializer(BaseModel):
     Serializer model for paginated listing of jobs.
     """
 
-    total: int = Field(
-        ...,
+    total: int | None = Field(
+        None,
         description=list_resources["total"]["DESCRIPTION"],
         examples=list_resources["total"]["EXAMPLES"],
     )
@@ -30,6 +30,12 @@ class JobListSerializer(BaseModel):
         examples=list_resources["limit"]["EXAMPLES"],
     )
 
+    next_cursor: str | None = Field(
+        None,
+        description=list_resources["next_cursor"]["DESCRIPTION"],
+        examples=list_resources["next_cursor"]["EXAMPLES"],
+    )
+
     jobs: list[JobSummarizeSerializer] = Field(
         ...,
         description=list_resources["jobs"]["DESCRIPTION"],
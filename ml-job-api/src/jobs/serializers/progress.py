@@ -0,0 +1,60 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.jobs.resources import progress_resources
+
+
+class JobProgressSerializer(BaseModel):
+    """
+    Serializer model of the latest execution progress snapshot of a job.
+    """
+
+    stage: str | None = Field(
+        None,
+        description=progress_resources["stage"]["DESCRIPTION"],
+        examples=progress_resources["stage"]["EXAMPLES"],
+    )
+
+    files_processed: int | None = Field(
+        None,
+        description=progress_resources["files_processed"]["DESCRIPTION"],
+        examples=progress_resources["files_processed"]["EXAMPLES"],
+    )
+
+    files_total: int | None = Field(
+        None,
+        description=progress_resources["files_total"]["DESCRIPTION"],
+        examples=progress_resources["files_total"]["EXAMPLES"],
+    )
+
+    epoch: int | None = Field(
+        None,
+        description=progress_resources["epoch"]["DESCRIPTION"],
+        examples=progress_resources["epoch"]["EXAMPLES"],
+    )
+
+    epochs_total: int | None = Field(
+        None,
+        description=progress_resources["epochs_total"]["DESCRIPTION"],
+        examples=progress_resources["epochs_total"]["EXAMPLES"],
+    )
+
+    loss: float | None = Field(
+        None,
+        description=progress_resources["loss"]["DESCRIPTION"],
+        examples=progress_resources["loss"]["EXAMPLES"],
+    )
+
+    prediction_batch: int | None = Field(
+        None,
+        description=progress_resources["prediction_batch"]["DESCRIPTION"],
+        examples=progress_resources["prediction_batch"]["EXAMPLES"],
+    )
+
+    prediction_batches_total: int | None = Field(
+        None,
+        description=progress_resources["prediction_batches_total"]["DESCRIPTION"],
+        examples=progress_resources["prediction_batches_total"]["EXAMPLES"],
+    )
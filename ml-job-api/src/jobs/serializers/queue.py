@@ -0,0 +1,65 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.jobs.resources import queue_resources
+from src.jobs.types import JobType
+
+
+class JobQueueSerializer(BaseModel):
+    """
+    Serializer model of the depth and wait time of the queue of a job type.
+    """
+
+    type: JobType = Field(
+        ...,
+        description=queue_resources["type"]["DESCRIPTION"],
+    )
+
+    queue: str = Field(
+        ...,
+        description=queue_resources["queue"]["DESCRIPTION"],
+        examples=queue_resources["queue"]["EXAMPLES"],
+    )
+
+    messages: int | None = Field(
+        None,
+        description=queue_resources["messages"]["DESCRIPTION"],
+        examples=queue_resources["messages"]["EXAMPLES"],
+    )
+
+    consumers: int | None = Field(
+        None,
+        description=queue_resources["consumers"]["DESCRIPTION"],
+        examples=queue_resources["consumers"]["EXAMPLES"],
+    )
+
+    waiting: int = Field(
+        ...,
+        description=queue_resources["waiting"]["DESCRIPTION"],
+        examples=queue_resources["waiting"]["EXAMPLES"],
+    )
+
+    oldest_wait: float | None = Field(
+        None,
+        description=queue_resources["oldest_wait"]["DESCRIPTION"],
+        examples=queue_resources["oldest_wait"]["EXAMPLES"],
+    )
+
+    average_wait: float | None = Field(
+        None,
+        description=queue_resources["average_wait"]["DESCRIPTION"],
+        examples=queue_resources["average_wait"]["EXAMPLES"],
+    )
+
+
+class JobQueueListSerializer(BaseModel):
+    """
+    Serializer model for listing of job queues.
+    """
+
+    queues: list[JobQueueSerializer] = Field(
+        ...,
+        description=queue_resources["queues"]["DESCRIPTION"],
+    )
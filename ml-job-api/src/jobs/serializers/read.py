@@ -7,6 +7,7 @@ from pydantic import (
 )
 
 from src.jobs.resources import job_resources
+from src.jobs.serializers.progress import JobProgressSerializer
 from src.jobs.types import (
     JobType,
     PhaseType,
@@ -74,3 +75,46 @@ class JobReadSerializer(BaseModel):
         description=job_resources["execution_duration"]["DESCRIPTION"],
         examples=job_resources["execution_duration"]["EXAMPLES"],
     )
+
+    progress: JobProgressSerializer | None = Field(
+        None,
+        description=job_resources["progress"]["DESCRIPTION"],
+    )
+
+    heartbeat_at: datetime | None = Field(
+        None,
+        description=job_resources["heartbeat_at"]["DESCRIPTION"],
+        examples=job_resources["heartbeat_at"]["EXAMPLES"],
+    )
+
+    requeue_count: int = Field(
+        0,
+        description=job_resources["requeue_count"]["DESCRIPTION"],
+        examples=job_resources["requeue_count"]["EXAMPLES"],
+    )
+
+    parent_job_id: UUID | None = Field(
+        None,
+        description=job_resources["parent_job_id"]["DESCRIPTION"],
+        examples=job_resources["parent_job_id"]["EXAMPLES"],
+    )
+
+    chained: bool = Field(
+        False,
+        description=job_resources["chained"]["DESCRIPTION"],
+        examples=job_resources["chained"]["EXAMPLES"],
+    )
+
+    priority: int = Field(
+        job_resources["priority"]["DEFAULT_VALUE"],
+        ge=job_resources["priority"]["MIN_VALUE"],
+        le=job_resources["priority"]["MAX_VALUE"],
+        description=job_resources["priority"]["DESCRIPTION"],
+        examples=job_resources["priority"]["EXAMPLES"],
+    )
+
+    queued_at: datetime | None = Field(
+        None,
+        description=job_resources["queued_at"]["DESCRIPTION"],
+        examples=job_resources["queued_at"]["EXAMPLES"],
+    )
@@ -7,6 +7,7 @@ from pydantic import (
 )
 
 from src.jobs.resources import job_resources
+from src.jobs.serializers.progress import JobProgressSerializer
 from src.jobs.types import (
     JobType,
     PhaseType,
@@ -62,3 +63,20 @@ class JobSummarizeSerializer(BaseModel):
         description=job_resources["execution_duration"]["DESCRIPTION"],
         examples=job_resources["execution_duration"]["EXAMPLES"],
     )
+
+    progress: JobProgressSerializer | None = Field(
+        None,
+        description=job_resources["progress"]["DESCRIPTION"],
+    )
+
+    heartbeat_at: datetime | None = Field(
+        None,
+        description=job_resources["heartbeat_at"]["DESCRIPTION"],
+        examples=job_resources["heartbeat_at"]["EXAMPLES"],
+    )
+
+    priority: int = Field(
+        ...,
+        description=job_resources["priority"]["DESCRIPTION"],
+        examples=job_resources["priority"]["EXAMPLES"],
+    )
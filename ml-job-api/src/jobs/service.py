@@ -1,3 +1,7 @@
+import asyncio
+import logging
+import os
+from datetime import timedelta
 from uuid import UUID
 
 from src.common.utils import (
@@ -5,46 +9,93 @@ from src.common.utils import (
     get_current_utc_datetime,
     get_duration_in_seconds,
 )
+from src.events.broker import EventBroker
+from src.events.entity import EventEntity
+from src.events.types import EventType
+from src.files.errors import DirectoryNotExistError
+from src.files.index import UsageIndex
+from src.files.repository import FileRepository
 from src.jobs.dto import (
+    JobAdvanceDTO,
+    JobBatchDTO,
     JobCreateDTO,
     JobEditDTO,
     JobEndDTO,
     JobInitializeDTO,
+    JobProgressDTO,
     JobStartDTO,
     JobUpdateDTO,
 )
-from src.jobs.errors import JobPhaseConflictError
-from src.jobs.params import JobListParams
+from src.jobs.entity import JobEntity
+from src.jobs.errors import (
+    JobNotExistError,
+    JobPhaseConflictError,
+    JobPipelineError,
+)
+from src.jobs.params import (
+    JobListParams,
+    JobRemoveParams,
+)
 from src.jobs.queue import JobQueue
 from src.jobs.repository import JobRepository
 from src.jobs.serializers import (
+    JobBatchResultSerializer,
+    JobBatchSerializer,
     JobListSerializer,
+    JobQueueListSerializer,
+    JobQueueSerializer,
     JobReadSerializer,
     JobSummarizeSerializer,
 )
+from src.jobs.storage import JobStorage
 from src.jobs.types import (
+    BatchActionType,
+    BatchOutcomeType,
     EndActionType,
+    JobType,
     PhaseType,
     ProcessActionType,
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 class JobService:
     """
     Business logic layer for managing ML job lifecycle and orchestration.
     """
 
-    def __init__(self, repository: JobRepository, queue: JobQueue) -> None:
+    def __init__(
+        self,
+        repository: JobRepository,
+        queue: JobQueue,
+        storage: JobStorage,
+        file_repository: FileRepository | None = None,
+        usage_index: UsageIndex | None = None,
+        event_broker: EventBroker | None = None,
+    ) -> None:
         """
-        Initialize the job service with repository and queue implementations.
+        Initialize the job service with repository, queue and storage implementations.
 
         Parameters:
             repository (JobRepository): Concrete repository for persisting job records.
             queue (JobQueue): Concrete queue for dispatching and aborting asynchronous jobs.
+            storage (JobStorage): Concrete storage for staging the input files of chained jobs.
+            file_repository (FileRepository | None):
+                Optional repository of stored files, removing the storage directories of jobs in the background.
+            usage_index (UsageIndex | None):
+                Optional index of the disk usage of directories, updated with the storage directories of ended jobs.
+            event_broker (EventBroker | None):
+                Optional broker publishing the phase transitions and progress of jobs to streaming clients.
         """
 
         self.repository = repository
         self.queue = queue
+        self.storage = storage
+        self.file_repository = file_repository
+        self.usage_index = usage_index
+        self.event_broker = event_broker
 
     @staticmethod
     def _generate_job_id_and_dir_path(label: str) -> tuple[UUID, str]:
@@ -64,17 +115,173 @@ class JobService:
 
         return job_id, dir_path
 
+    async def _publish_event(self, entity: JobEntity, event_type: EventType) -> None:
+        """
+        Publish a phase transition or progress report of a job to streaming clients.
+
+        The job has already been updated, so a failure is only logged, and clients see
+        the change on their next reload.
+
+        Parameters:
+            entity (JobEntity): The updated job.
+            event_type (EventType): JOB_PHASE or JOB_PROGRESS.
+        """
+
+        if self.event_broker is None:
+            return
+
+        try:
+            await self.event_broker.publish(
+                EventEntity(
+                    event_type=event_type,
+                    occurred_at=get_current_utc_datetime(),
+                    job_id=entity.job_id,
+                    phase=entity.phase,
+                    progress=entity.progress if event_type == EventType.JOB_PROGRESS else None,
+                )
+            )
+
+        except Exception:
+            logger.exception("Cannot publish event=%s of job with ID=%s.", event_type, entity.job_id)
+
+    async def _refresh_usage(self, entity: JobEntity) -> None:
+        """
+        Rescan the storage directory of a job and replace its usage in the usage index.
+
+        The job has already been updated, so a failure is only logged, and the drift
+        is corrected by the next reconciliation.
+
+        Parameters:
+            entity (JobEntity): The job whose directory changed.
+        """
+
+        if self.usage_index is None or self.file_repository is None:
+            return
+
+        try:
+            usages = await self.file_repository.scan_usages_by_dir_path(entity.dir_path)
+
+            await self.usage_index.replace_by_dir_path(entity.dir_path, usages)
+
+        except Exception:
+            logger.exception("Cannot refresh usage of directory of job with ID=%s.", entity.job_id)
+
+    async def _remove_dir(self, job_id: UUID, dir_path: str) -> None:
+        """
+        Move the storage directory of a removed job to the trash and forget its disk usage.
+
+        A job whose directory was never created is skipped, and the directory is kept if the service
+        has no file repository.
+
+        Parameters:
+            job_id (UUID): Unique identifier of the removed job.
+            dir_path (str): Storage directory path of the removed job.
+        """
+
+        if self.file_repository is None:
+            logger.warning("Cannot remove directory of job with ID=%s without file repository.", job_id)
+            return
+
+        parent_dir_path, dirname = os.path.split(dir_path)
+
+        try:
+            await self.file_repository.delete_by_dirname_and_parent_dir_path(dirname, parent_dir_path)
+
+        except DirectoryNotExistError:
+            logger.info("Job with ID=%s has no directory='%s' to remove.", job_id, dir_path)
+
+        if self.usage_index is not None:
+            try:
+                await self.usage_index.delete_by_dir_path(dir_path)
+
+            except Exception:
+                logger.exception("Cannot delete usage of directory of job with ID=%s.", job_id)
+
+    async def _run_job(self, job_id: UUID) -> JobEntity:
+        """
+        Move a pending job to the PROCESSING phase and dispatch it to the queue of its type.
+
+        The transition is a single conditional statement returning the job to dispatch, so concurrent
+        callers cannot dispatch the same job twice. It is reverted if the job cannot be dispatched.
+
+        Parameters:
+            job_id (UUID): Unique identifier of the pending job to run.
+
+        Returns:
+            JobEntity: Updated job record.
+
+        Raises:
+            JobNotExistError: If no pending job with the specified ID exists.
+        """
+
+        queued_at = get_current_utc_datetime()
+
+        entity = await self.repository.update_by_job_id_and_phases(
+            job_id, {PhaseType.PENDING}, JobUpdateDTO(phase=PhaseType.PROCESSING, queued_at=queued_at)
+        )
+
+        try:
+            self.queue.run_by_job_id_and_job_type(
+                entity.job_id, entity.type, JobStartDTO(dir_path=entity.dir_path), entity.priority
+            )
+
+        except Exception:
+            await self.repository.update_by_job_id_and_phases(
+                entity.job_id, {PhaseType.PROCESSING}, JobUpdateDTO(phase=PhaseType.PENDING, queued_at=None)
+            )
+
+            raise
+
+        await self._publish_event(entity, EventType.JOB_PHASE)
+
+        return entity
+
+    async def _run_following_jobs(self, entity: JobEntity) -> None:
+        """
+        Dispatch the pending jobs following a completed chained job in the pipeline.
+
+        Active ML jobs following a data preprocessing job get its result as their pool data,
+        unless their configuration already points to another pool. Jobs whose files cannot be
+        staged stay pending, so they can be fixed and run manually.
+
+        Parameters:
+            entity (JobEntity): The completed job.
+        """
+
+        following_entities = await self.repository.list_by_parent_job_id_and_phase(entity.job_id, PhaseType.PENDING)
+
+        for following_entity in following_entities:
+            try:
+                if entity.type == JobType.DATA_PREPROCESSING and following_entity.type == JobType.ACTIVE_ML:
+                    await self.storage.stage_pool_data_by_dir_path_and_parent_dir_path(
+                        following_entity.dir_path, entity.dir_path
+                    )
+
+                await self._run_job(following_entity.job_id)
+
+            except JobNotExistError:
+                logger.info("Job with ID=%s following its chain is no longer pending.", following_entity.job_id)
+
+            except JobPipelineError:
+                logger.warning("Cannot run job with ID=%s following its chain.", following_entity.job_id, exc_info=True)
+
     async def initialize_job(self, dto: JobInitializeDTO) -> JobReadSerializer:
         """
         Create and persist a new job record in the PENDING phase.
 
         Parameters:
-            dto (JobInitializeDTO): Payload containing job type, label, and optional description.
+            dto (JobInitializeDTO): Payload containing job type, label, and optional description and pipeline settings.
 
         Returns:
             JobReadSerializer: Full job record.
+
+        Raises:
+            JobNotExistError: If the preceding job does not exist.
         """
 
+        if dto.parent_job_id:
+            await self.repository.get_by_job_id(dto.parent_job_id)
+
         job_id, dir_path = self._generate_job_id_and_dir_path(dto.label)
         created_at = get_current_utc_datetime()
         entity = await self.repository.create(
@@ -87,6 +294,8 @@ class JobService:
             )
         )
 
+        await self._publish_event(entity, EventType.JOB_PHASE)
+
         return JobReadSerializer(**entity.model_dump())
 
     async def retrieve_job_by_job_id(self, job_id: UUID) -> JobReadSerializer:
@@ -120,20 +329,24 @@ class JobService:
 
         return JobReadSerializer(**entity.model_dump())
 
-    async def remove_job_by_job_id(self, job_id: UUID) -> None:
+    async def remove_job_by_job_id(self, job_id: UUID, params: JobRemoveParams | None = None) -> None:
         """
-        Delete a job record if it is in a removable phase.
+        Delete a job record if it is in a removable phase, optionally with its storage directory.
 
         Allowed phases: PENDING, COMPLETED, ERROR, ABORTED.
+        The record is deleted by a single conditional statement, the job is read again only to tell
+        a missing job from a phase conflict.
+        The directory is moved to the trash once the record is deleted and removed in the background,
+        a job whose directory was never created is removed all the same.
 
         Parameters:
             job_id (UUID): Unique identifier of the job to delete.
+            params (JobRemoveParams | None): Optional query parameters selecting whether to remove the directory.
 
         Raises:
             JobPhaseConflictError: Conflict if current phase disallows deletion.
         """
 
-        entity = await self.repository.get_by_job_id(job_id)
         allowed_operation_phases = {
             PhaseType.PENDING,
             PhaseType.COMPLETED,
@@ -141,10 +354,19 @@ class JobService:
             PhaseType.ABORTED,
         }
 
-        if not (entity.phase in allowed_operation_phases):
-            raise JobPhaseConflictError(f"Cannot remove job with ID={entity.job_id} in current phase={entity.phase}.")
+        try:
+            entity = await self.repository.delete_by_job_id_and_phases(job_id, allowed_operation_phases)
+
+        except JobNotExistError:
+            entity = await self.repository.get_by_job_id(job_id)
+
+            raise JobPhaseConflictError(
+                f"Cannot remove job with ID={entity.job_id} in current phase={entity.phase}, "
+                f"allowed phases={', '.join(sorted(allowed_operation_phases))}."
+            )
 
-        await self.repository.delete_by_job_id(entity.job_id)
+        if params and params.remove_dir:
+            await self._remove_dir(entity.job_id, entity.dir_path)
 
     async def manage_job_by_job_id_and_process_action(
         self, job_id: UUID, process_action: ProcessActionType
@@ -154,6 +376,8 @@ class JobService:
 
         RUN action allowed only in PENDING phase.
         ABORT action allowed only in PROCESSING phase.
+        The phase transition is a single conditional statement, the job is read again only to tell
+        a missing job from a phase conflict.
 
         Parameters:
             job_id (UUID): Unique identifier of the job.
@@ -166,7 +390,6 @@ class JobService:
             JobPhaseConflictError: Conflict if action invalid for current phase.
         """
 
-        entity = await self.repository.get_by_job_id(job_id)
         allowed_operation_phases = {
             ProcessActionType.RUN: {
                 PhaseType.PENDING,
@@ -176,25 +399,178 @@ class JobService:
             },
         }
 
-        for allowed_operation_action in allowed_operation_phases.keys():
-            if process_action == allowed_operation_action and not (
-                entity.phase in allowed_operation_phases[allowed_operation_action]
-            ):
-                raise JobPhaseConflictError(
-                    f"Cannot process process action={process_action} on job with ID={entity.job_id} "
-                    f"in current phase={entity.phase}."
+        try:
+            if process_action == ProcessActionType.RUN:
+                entity = await self._run_job(job_id)
+
+            elif process_action == ProcessActionType.ABORT:
+                entity = await self.repository.update_by_job_id_and_phases(
+                    job_id, allowed_operation_phases[process_action], JobUpdateDTO(phase=PhaseType.ABORTED)
                 )
 
-        if process_action == ProcessActionType.RUN:
-            self.queue.run_by_job_id_and_job_type(entity.job_id, entity.type, JobStartDTO(dir_path=entity.dir_path))
-            entity = await self.repository.update_by_job_id(entity.job_id, JobUpdateDTO(phase=PhaseType.PROCESSING))
+        except JobNotExistError:
+            entity = await self.repository.get_by_job_id(job_id)
+
+            raise JobPhaseConflictError(
+                f"Cannot process process action={process_action} on job with ID={entity.job_id} "
+                f"in current phase={entity.phase}, "
+                f"allowed phases={', '.join(sorted(allowed_operation_phases[process_action]))}."
+            )
 
-        elif process_action == ProcessActionType.ABORT:
+        if process_action == ProcessActionType.ABORT:
             self.queue.abort_by_job_id(entity.job_id)
-            entity = await self.repository.update_by_job_id(entity.job_id, JobUpdateDTO(phase=PhaseType.ABORTED))
+
+            await self._publish_event(entity, EventType.JOB_PHASE)
 
         return JobReadSerializer(**entity.model_dump())
 
+    async def manage_jobs_batch_by_batch_action(
+        self, batch_action: BatchActionType, dto: JobBatchDTO, params: JobRemoveParams | None = None
+    ) -> JobBatchSerializer:
+        """
+        Run, abort or remove a batch of jobs selected by IDs or by filters.
+
+        The allowed phases are the same as for single jobs: PENDING to run, PROCESSING to abort, and
+        PENDING, COMPLETED, ERROR or ABORTED to remove. The phases of all selected jobs are checked and
+        the batch updated or deleted in a single transaction. Run jobs are then dispatched one by one,
+        and moved back to PENDING if they cannot be dispatched; aborted jobs are revoked by a single
+        broadcast, and stay ABORTED if it fails. Failures of single jobs or of the broadcast never fail
+        the batch, they are reported in its outcomes.
+
+        Parameters:
+            batch_action (BatchActionType): RUN, ABORT or REMOVE.
+            dto (JobBatchDTO): Selection of the jobs by IDs or by filters.
+            params (JobRemoveParams | None): Optional query parameters selecting whether to remove the directories.
+
+        Returns:
+            JobBatchSerializer: Number of jobs the action was applied to, and the outcome for every job.
+        """
+
+        allowed_operation_phases = {
+            BatchActionType.RUN: {
+                PhaseType.PENDING,
+            },
+            BatchActionType.ABORT: {
+                PhaseType.PROCESSING,
+            },
+            BatchActionType.REMOVE: {
+                PhaseType.PENDING,
+                PhaseType.COMPLETED,
+                PhaseType.ERROR,
+                PhaseType.ABORTED,
+            },
+        }
+        failures = {}
+
+        if batch_action == BatchActionType.RUN:
+            queued_at = get_current_utc_datetime()
+
+            entities, selected_phases = await self.repository.update_batch_by_selection_and_phases(
+                dto,
+                allowed_operation_phases[batch_action],
+                JobUpdateDTO(phase=PhaseType.PROCESSING, queued_at=queued_at),
+            )
+
+            for entity in entities:
+                try:
+                    self.queue.run_by_job_id_and_job_type(
+                        entity.job_id, entity.type, JobStartDTO(dir_path=entity.dir_path), entity.priority
+                    )
+
+                except Exception:
+                    logger.exception("Cannot dispatch job with ID=%s of batch.", entity.job_id)
+
+                    failures[entity.job_id] = "Cannot dispatch job, it was moved back to phase=PENDING."
+
+            if failures:
+                await self.repository.update_batch_by_selection_and_phases(
+                    JobBatchDTO(job_ids=list(failures)),
+                    {PhaseType.PROCESSING},
+                    JobUpdateDTO(phase=PhaseType.PENDING, queued_at=None),
+                )
+
+        elif batch_action == BatchActionType.ABORT:
+            entities, selected_phases = await self.repository.update_batch_by_selection_and_phases(
+                dto,
+                allowed_operation_phases[batch_action],
+                JobUpdateDTO(phase=PhaseType.ABORTED),
+            )
+
+            if entities:
+                try:
+                    self.queue.abort_batch_by_job_ids([entity.job_id for entity in entities])
+
+                except Exception:
+                    logger.exception("Cannot revoke jobs of batch.")
+
+                    for entity in entities:
+                        failures[entity.job_id] = "Job aborted, but its task cannot be revoked and may keep running."
+
+        else:
+            entities, selected_phases = await self.repository.delete_batch_by_selection_and_phases(
+                dto, allowed_operation_phases[batch_action]
+            )
+
+            if params and params.remove_dir:
+                for entity in entities:
+                    try:
+                        await self._remove_dir(entity.job_id, entity.dir_path)
+
+                    except Exception:
+                        logger.exception("Cannot remove directory of job with ID=%s of batch.", entity.job_id)
+
+                        failures[entity.job_id] = "Job removed, but its directory cannot be moved to the trash."
+
+        # Phases failed jobs are left in: reverted to PENDING when not dispatched, ABORTED when not revoked
+        failure_phases = {
+            BatchActionType.RUN: PhaseType.PENDING,
+            BatchActionType.ABORT: PhaseType.ABORTED,
+        }
+        applied_entities = {entity.job_id: entity for entity in entities}
+        results = []
+
+        for job_id in dict.fromkeys(dto.job_ids if dto.job_ids is not None else selected_phases):
+            entity = applied_entities.get(job_id)
+
+            if job_id in failures:
+                phase = failure_phases.get(batch_action)
+                result = JobBatchResultSerializer(
+                    job_id=job_id, outcome=BatchOutcomeType.FAILED, phase=phase, detail=failures[job_id]
+                )
+
+                if batch_action == BatchActionType.ABORT:
+                    await self._publish_event(entity, EventType.JOB_PHASE)
+
+            elif entity is not None:
+                phase = entity.phase if batch_action != BatchActionType.REMOVE else None
+                result = JobBatchResultSerializer(job_id=job_id, outcome=BatchOutcomeType.APPLIED, phase=phase)
+
+                if batch_action != BatchActionType.REMOVE:
+                    await self._publish_event(entity, EventType.JOB_PHASE)
+
+            elif job_id in selected_phases:
+                result = JobBatchResultSerializer(
+                    job_id=job_id,
+                    outcome=BatchOutcomeType.PHASE_CONFLICT,
+                    phase=selected_phases[job_id],
+                    detail=(
+                        f"Cannot process batch action={batch_action} on job "
+                        f"in current phase={selected_phases[job_id]}, "
+                        f"allowed phases={', '.join(sorted(allowed_operation_phases[batch_action]))}."
+                    ),
+                )
+
+            else:
+                result = JobBatchResultSerializer(
+                    job_id=job_id, outcome=BatchOutcomeType.NOT_EXIST, detail="Cannot get job."
+                )
+
+            results.append(result)
+
+        applied = sum(result.outcome == BatchOutcomeType.APPLIED for result in results)
+
+        return JobBatchSerializer(batch_action=batch_action, applied=applied, results=results)
+
     async def manage_job_by_job_id_and_end_action(
         self, job_id: UUID, end_action: EndActionType, dto: JobEndDTO
     ) -> JobReadSerializer:
@@ -202,6 +578,12 @@ class JobService:
         Finalize a processing job as completed or errored.
 
         COMPLETE and ERROR actions allowed only in PROCESSING phase.
+        Repeating an already applied action with the same execution metrics is a no-op,
+        so workers may safely retry their end requests.
+        Completing a chained job dispatches the pending jobs following it in the pipeline.
+        The phase transition is a single conditional statement, the job is read again only when it
+        is not processing, to tell a retry or a missing job from a phase conflict.
+        The disk usage of the directory of the ended job is recomputed, as workers write it directly.
 
         Parameters:
             job_id (UUID): Unique identifier of the job.
@@ -215,7 +597,10 @@ class JobService:
             JobPhaseConflictError: 409 Conflict if action invalid for current phase
         """
 
-        entity = await self.repository.get_by_job_id(job_id)
+        ended_phases = {
+            EndActionType.COMPLETE: PhaseType.COMPLETED,
+            EndActionType.ERROR: PhaseType.ERROR,
+        }
         allowed_operation_phases = {
             EndActionType.COMPLETE: {
                 PhaseType.PROCESSING,
@@ -224,55 +609,284 @@ class JobService:
                 PhaseType.PROCESSING,
             },
         }
-
-        for allowed_operation_action in allowed_operation_phases.keys():
-            if end_action == allowed_operation_action and not (
-                entity.phase in allowed_operation_phases[allowed_operation_action]
-            ):
-                raise JobPhaseConflictError(
-                    f"Cannot process end action={end_action} on job with ID={entity.job_id} "
-                    f"in current phase={entity.phase}."
-                )
-
         execution_duration = get_duration_in_seconds(dto.started_at, dto.ended_at)
 
-        if end_action == EndActionType.COMPLETE:
-            entity = await self.repository.update_by_job_id(
-                entity.job_id,
+        try:
+            entity = await self.repository.update_by_job_id_and_phases(
+                job_id,
+                allowed_operation_phases[end_action],
                 JobUpdateDTO(
-                    phase=PhaseType.COMPLETED,
+                    phase=ended_phases[end_action],
                     started_at=dto.started_at,
                     ended_at=dto.ended_at,
                     execution_duration=execution_duration,
                 ),
             )
 
-        elif end_action == EndActionType.ERROR:
-            entity = await self.repository.update_by_job_id(
-                entity.job_id,
-                JobUpdateDTO(
-                    phase=PhaseType.ERROR,
-                    started_at=dto.started_at,
-                    ended_at=dto.ended_at,
-                    execution_duration=execution_duration,
-                ),
+        except JobNotExistError:
+            entity = await self.repository.get_by_job_id(job_id)
+
+            if (
+                entity.phase == ended_phases[end_action]
+                and entity.started_at == dto.started_at
+                and entity.ended_at == dto.ended_at
+            ):
+                return JobReadSerializer(**entity.model_dump())
+
+            raise JobPhaseConflictError(
+                f"Cannot process end action={end_action} on job with ID={entity.job_id} "
+                f"in current phase={entity.phase}, "
+                f"allowed phases={', '.join(sorted(allowed_operation_phases[end_action]))}."
             )
 
+        if end_action == EndActionType.COMPLETE and entity.chained:
+            await self._run_following_jobs(entity)
+
+        await self._publish_event(entity, EventType.JOB_PHASE)
+        await self._refresh_usage(entity)
+
         return JobReadSerializer(**entity.model_dump())
 
+    async def advance_job_by_job_id(self, job_id: UUID, dto: JobAdvanceDTO) -> JobReadSerializer | None:
+        """
+        Continue a chained Active ML job whose labelling set is fully labelled with its next iteration.
+
+        The labelled data and the generated configuration are staged for a new chained job
+        following the given one, which is then dispatched at once. The pipeline flag of the given
+        job is reset in a single conditional statement first, so each iteration is continued once.
+        It is restored and the staged directory removed if the next iteration job cannot be staged
+        or created, so the labelling can be submitted again. A created job that cannot be dispatched
+        stays pending, so it can be run manually.
+
+        Parameters:
+            job_id (UUID): Unique identifier of the labelled job.
+            dto (JobAdvanceDTO): Payload with the labelled data.
+
+        Returns:
+            JobReadSerializer | None: The next iteration job, or None if not awaiting continuation.
+
+        Raises:
+            JobPipelineError: If the files of the next iteration cannot be staged.
+        """
+
+        entity = await self.repository.get_by_job_id(job_id)
+
+        if not (entity.chained and entity.type == JobType.ACTIVE_ML and entity.phase == PhaseType.COMPLETED):
+            return None
+
+        try:
+            entity = await self.repository.update_by_job_id_and_chained(
+                entity.job_id, True, JobUpdateDTO(chained=False)
+            )
+
+        except JobNotExistError:
+            return None
+
+        following_job_id, following_dir_path = self._generate_job_id_and_dir_path(entity.label)
+
+        try:
+            await self.storage.stage_next_iteration_by_dir_path_and_parent_dir_path(
+                following_dir_path, entity.dir_path, dto
+            )
+
+            created_at = get_current_utc_datetime()
+            following_entity = await self.repository.create(
+                JobCreateDTO(
+                    job_id=following_job_id,
+                    dir_path=following_dir_path,
+                    type=entity.type,
+                    phase=PhaseType.PENDING,
+                    label=entity.label,
+                    description=entity.description,
+                    parent_job_id=entity.job_id,
+                    chained=True,
+                    priority=entity.priority,
+                    created_at=created_at,
+                )
+            )
+
+        except Exception:
+            await self.repository.update_by_job_id(entity.job_id, JobUpdateDTO(chained=True))
+
+            try:
+                await self._remove_dir(following_job_id, following_dir_path)
+
+            except Exception:
+                logger.exception("Cannot remove staged directory of job with ID=%s.", following_job_id)
+
+            raise
+
+        try:
+            following_entity = await self._run_job(following_entity.job_id)
+
+        except Exception:
+            logger.exception("Cannot run job with ID=%s continuing its chain, it stays pending.", following_job_id)
+
+        return JobReadSerializer(**following_entity.model_dump())
+
+    async def report_job_progress_by_job_id(self, job_id: UUID, dto: JobProgressDTO) -> None:
+        """
+        Store the latest execution progress snapshot and heartbeat of a processing job.
+
+        Only the latest snapshot is kept, so the update is a single conditional statement
+        and the job read/list operations expose it without any extra query.
+
+        Parameters:
+            job_id (UUID): Unique identifier of the job.
+            dto (JobProgressDTO): Payload with the execution progress reported by the worker.
+        """
+
+        heartbeat_at = get_current_utc_datetime()
+
+        entity = await self.repository.update_by_job_id_and_phases(
+            job_id,
+            {PhaseType.PROCESSING},
+            JobUpdateDTO(progress=dto.model_dump(exclude_none=True), heartbeat_at=heartbeat_at),
+        )
+
+        await self._publish_event(entity, EventType.JOB_PROGRESS)
+
+    async def sweep_stale_jobs(self, lease_timeout: int, max_requeues: int, redelivery_timeout: int) -> None:
+        """
+        Reclaim processing jobs whose worker lease expired.
+
+        A lease expires when no heartbeat was received for `lease_timeout` seconds, counted from
+        the dispatch of a job without any heartbeat yet. Jobs still reported as active by the queue
+        keep running with a renewed lease. Workers acknowledge late and reject messages on worker
+        loss, so the message of a job whose worker died goes back to the broker queue, unreported
+        as active until taken again; while its queue holds messages, a job waits for that delivery
+        with its lease left expired, for at most `redelivery_timeout` more seconds. A job whose
+        queue is empty or whose wait ran out is considered to have lost its message, it is sent
+        again up to `max_requeues` times and then marked as errored. The sweep is skipped if no
+        worker replies, and a job if the depth of its queue cannot be read, because the queue state
+        is unknown then.
+
+        Parameters:
+            lease_timeout (int): Seconds without a heartbeat after which a lease expires.
+            max_requeues (int): Maximum number of requeues of a single job.
+            redelivery_timeout (int): Seconds after the lease expiry to wait for a queued message.
+        """
+
+        swept_at = get_current_utc_datetime()
+        heartbeat_before = swept_at - timedelta(seconds=lease_timeout)
+        redelivery_before = heartbeat_before - timedelta(seconds=redelivery_timeout)
+        entities = await self.repository.list_by_heartbeat_before(heartbeat_before)
+
+        if not entities:
+            return
+
+        # Read the depths first, so a message taken by a worker meanwhile is reported as active
+        queue_messages = {}
+
+        for job_type in {entity.type for entity in entities}:
+            _, queue_messages[job_type], _ = await asyncio.to_thread(self.queue.get_depth_by_job_type, job_type)
+
+        active_job_ids = await asyncio.to_thread(self.queue.list_active_job_ids)
+
+        if active_job_ids is None:
+            return
+
+        for entity in entities:
+            messages = queue_messages[entity.type]
+            # Waits count from the last sign of life, which is not renewed while a job waits
+            leased_at = entity.heartbeat_at or entity.queued_at or entity.created_at
+
+            try:
+                if entity.job_id in active_job_ids:
+                    await self.repository.update_by_job_id_and_heartbeat_before(
+                        entity.job_id, heartbeat_before, JobUpdateDTO(heartbeat_at=swept_at)
+                    )
+
+                elif messages is None:
+                    logger.warning("Cannot read queue of job with ID=%s, its lease is left expired.", entity.job_id)
+
+                elif messages and leased_at >= redelivery_before:
+                    continue
+
+                elif entity.requeue_count < max_requeues:
+                    await self.repository.update_by_job_id_and_heartbeat_before(
+                        entity.job_id,
+                        heartbeat_before,
+                        JobUpdateDTO(
+                            progress=None,
+                            heartbeat_at=swept_at,
+                            queued_at=swept_at,
+                            requeue_count=entity.requeue_count + 1,
+                        ),
+                    )
+                    self.queue.run_by_job_id_and_job_type(
+                        entity.job_id, entity.type, JobStartDTO(dir_path=entity.dir_path), entity.priority
+                    )
+
+                else:
+                    entity = await self.repository.update_by_job_id_and_heartbeat_before(
+                        entity.job_id,
+                        heartbeat_before,
+                        JobUpdateDTO(phase=PhaseType.ERROR, ended_at=swept_at),
+                    )
+                    self.queue.abort_by_job_id(entity.job_id)
+
+                    await self._publish_event(entity, EventType.JOB_PHASE)
+
+            except JobNotExistError:
+                continue
+
     async def list_jobs(self, params: JobListParams) -> JobListSerializer:
         """
-        Retrieve a paginated list of job summaries.
+        Retrieve a paginated list of summaries of the jobs matching the filters.
 
         Parameters:
-            params (JobListParams): Pagination parameters.
+            params (JobListParams): Filters and pagination parameters.
 
         Returns:
-            JobListSerializer: Total count, offset, limit, and list of JobSummarizeSerializer.
+            JobListSerializer:
+                Count of matching jobs if requested, offset, limit, cursor of the following page,
+                and list of JobSummarizeSerializer.
         """
 
-        total = await self.repository.total()
-        entities = await self.repository.list_by_offset_and_limit(params.offset, params.limit)
+        total = await self.repository.total_by_params(params) if params.count else None
+        entities, next_cursor = await self.repository.list_by_params(params)
         serializers = [JobSummarizeSerializer(**entity.model_dump()) for entity in entities]
 
-        return JobListSerializer(total=total, offset=params.offset, limit=params.limit, jobs=serializers)
+        return JobListSerializer(
+            total=total,
+            offset=params.offset,
+            limit=params.limit,
+            next_cursor=next_cursor,
+            jobs=serializers,
+        )
+
+    async def list_job_queues(self, wait_window: int) -> JobQueueListSerializer:
+        """
+        Retrieve the depth and wait time of the queue of each job type.
+
+        The depth is read from the broker, while the wait times are derived from the dispatch
+        and start datetimes of the job records.
+
+        Parameters:
+            wait_window (int): Seconds back from now in which started jobs count into the average wait.
+
+        Returns:
+            JobQueueListSerializer: List of JobQueueSerializer, one per job type.
+        """
+
+        now = get_current_utc_datetime()
+        waits = await self.repository.list_waits_by_started_after(now - timedelta(seconds=wait_window), now)
+        serializers = []
+
+        for job_type in JobType:
+            queue, messages, consumers = await asyncio.to_thread(self.queue.get_depth_by_job_type, job_type)
+            waiting, oldest_wait, average_wait = waits.get(job_type, (0, None, None))
+            serializers.append(
+                JobQueueSerializer(
+                    type=job_type,
+                    queue=queue,
+                    messages=messages,
+                    consumers=consumers,
+                    waiting=waiting,
+                    oldest_wait=oldest_wait,
+                    average_wait=average_wait,
+                )
+            )
+
+        return JobQueueListSerializer(queues=serializers)
@@ -0,0 +1,39 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+from src.jobs.dto import JobAdvanceDTO
+
+
+class JobStorage(ABC):
+    """
+    Storage interface for staging the input files of chained jobs.
+    """
+
+    @abstractmethod
+    async def stage_pool_data_by_dir_path_and_parent_dir_path(self, dir_path: str, parent_dir_path: str) -> None:
+        """
+        Point the configuration of a job to the pool data produced by its preceding job.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job to stage.
+            parent_dir_path (str): Storage directory path of the preceding data preprocessing job.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def stage_next_iteration_by_dir_path_and_parent_dir_path(
+        self, dir_path: str, parent_dir_path: str, dto: JobAdvanceDTO
+    ) -> None:
+        """
+        Store the labelled data of an Active ML job and the configuration of its next iteration.
+
+        Parameters:
+            dir_path (str): Storage directory path of the next iteration job to stage.
+            parent_dir_path (str): Storage directory path of the labelled Active ML job.
+            dto (JobAdvanceDTO): Data transfer object containing the labelled data.
+        """
+
+        raise NotImplementedError
@@ -0,0 +1,6 @@
+from src.jobs.storages.lfs import JobLFSStorage
+
+
+__all__ = [
+    "JobLFSStorage",
+]
@@ -0,0 +1,158 @@
+import json
+from typing import Any
+
+import aiofiles
+import aiofiles.os
+
+from src.common.utils import get_norm_path
+from src.jobs.dto import JobAdvanceDTO
+from src.jobs.errors import JobPipelineError
+from src.jobs.storage import JobStorage
+
+
+class JobLFSStorage(JobStorage):
+    """
+    Local filesystem implementation of JobStorage.
+
+    File names and formats follow the contract of the ML Job Worker microservice.
+    """
+
+    config_filename = "config.json"
+    new_config_filename = "new_config.json"
+    result_filename = "result.h5"
+    oracle_data_filename = "oracle_data.json"
+    perf_est_list_filename = "perf_est_list.json"
+
+    def __init__(self, lfs_files_dir_path: str) -> None:
+        """
+        Initialize with the base directory path for file storage.
+
+        Parameters:
+            lfs_files_dir_path (str): Absolute path to the root of the shared files directory.
+        """
+
+        self.shared_dir_path = lfs_files_dir_path
+
+    async def _read_json_file(self, dir_path: str, filename: str) -> Any:
+        """
+        Read and parse a JSON file of a job directory.
+
+        Parameters:
+            dir_path (str): Relative storage directory path of the job.
+            filename (str): Name of the file to read.
+
+        Returns:
+            Any: The parsed file content.
+
+        Raises:
+            JobPipelineError: If the file does not exist or is not valid JSON.
+        """
+
+        abs_file_path = get_norm_path(dir_path, prefix=self.shared_dir_path, child_name=filename)
+
+        try:
+            async with aiofiles.open(abs_file_path, "r", encoding="utf-8") as file_reader:
+                return json.loads(await file_reader.read())
+
+        except (OSError, ValueError) as e:
+            raise JobPipelineError(f"Cannot read file={filename} in job directory={dir_path}.") from e
+
+    async def _write_json_file(self, dir_path: str, filename: str, data: Any) -> None:
+        """
+        Atomically write a JSON file into a job directory, creating the directory if needed.
+
+        Parameters:
+            dir_path (str): Relative storage directory path of the job.
+            filename (str): Name of the file to write.
+            data (Any): JSON-serializable file content.
+        """
+
+        abs_dir_path = get_norm_path(dir_path, prefix=self.shared_dir_path)
+        abs_file_path = get_norm_path(dir_path, prefix=self.shared_dir_path, child_name=filename)
+        abs_tmp_file_path = f"{abs_file_path}.tmp"
+
+        await aiofiles.os.makedirs(abs_dir_path, exist_ok=True)
+
+        async with aiofiles.open(abs_tmp_file_path, "w", encoding="utf-8") as file_writer:
+            await file_writer.write(json.dumps(data, indent=4))
+
+        await aiofiles.os.replace(abs_tmp_file_path, abs_file_path)
+
+    async def stage_pool_data_by_dir_path_and_parent_dir_path(self, dir_path: str, parent_dir_path: str) -> None:
+        """
+        Set the pool data path of the job configuration to the result of the preceding job, unless already set.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job to stage.
+            parent_dir_path (str): Storage directory path of the preceding data preprocessing job.
+
+        Raises:
+            JobPipelineError: If the job configuration does not exist or is not valid JSON.
+        """
+
+        config = await self._read_json_file(dir_path, self.config_filename)
+
+        if not isinstance(config, dict):
+            raise JobPipelineError(f"Cannot stage pool data for invalid config in job directory={dir_path}.")
+
+        if config.get("pool_data_path"):
+            return
+
+        config["pool_data_path"] = get_norm_path(parent_dir_path, child_name=self.result_filename)
+
+        await self._write_json_file(dir_path, self.config_filename, config)
+
+    async def stage_next_iteration_by_dir_path_and_parent_dir_path(
+        self, dir_path: str, parent_dir_path: str, dto: JobAdvanceDTO
+    ) -> None:
+        """
+        Write the oracle data and performance estimations into the labelled job directory,
+        and the configuration generated by the labelled job into the next iteration job directory.
+
+        Oracle labels are stored as indexes of the configured classes. The performance estimation
+        of a repeated labelling of the same iteration replaces the previously stored one.
+
+        Parameters:
+            dir_path (str): Storage directory path of the next iteration job to stage.
+            parent_dir_path (str): Storage directory path of the labelled Active ML job.
+            dto (JobAdvanceDTO): Data transfer object containing the labelled data.
+
+        Raises:
+            JobPipelineError:
+                If the generated configuration or the stored performance estimations are missing or invalid,
+                or a label is not a configured class.
+        """
+
+        new_config = await self._read_json_file(parent_dir_path, self.new_config_filename)
+
+        try:
+            class_indexes = {class_name: index for index, class_name in enumerate(new_config["classes"])}
+            oracle_labels = [class_indexes[label] for label in dto.oracle_labels]
+
+        except (KeyError, TypeError) as e:
+            raise JobPipelineError(f"Cannot map oracle labels to classes of job directory={parent_dir_path}.") from e
+
+        oracle_data = {
+            "filenames": dto.oracle_filenames,
+            "labels": oracle_labels,
+        }
+
+        await self._write_json_file(parent_dir_path, self.oracle_data_filename, oracle_data)
+
+        if dto.performance is not None:
+            perf_est_list = await self._read_json_file(parent_dir_path, self.perf_est_list_filename)
+
+            if not isinstance(perf_est_list, list):
+                raise JobPipelineError(
+                    f"Cannot store performance estimation for invalid list in job directory={parent_dir_path}."
+                )
+
+            if len(perf_est_list) == dto.iteration:
+                perf_est_list[-1] = dto.performance
+
+            else:
+                perf_est_list.append(dto.performance)
+
+            await self._write_json_file(parent_dir_path, self.perf_est_list_filename, perf_est_list)
+
+        await self._write_json_file(dir_path, self.config_filename, new_config)
@@ -0,0 +1,41 @@
+import asyncio
+import logging
+
+from src.infrastructure.locks import job_sweep_lock
+from src.infrastructure.storages import postgres_async_session_maker
+from src.jobs.api.dependencies import get_service_using_postgres_and_celery
+from src.settings.jobs import job_settings
+
+
+logger = logging.getLogger(__name__)
+
+
+async def sweep_stale_jobs_periodically() -> None:
+    """
+    Periodically reclaim processing jobs whose worker lease expired.
+
+    Every `job_sweep_interval` seconds a new database session is opened and the job service
+    sweeps the processing jobs without a heartbeat for `job_lease_timeout` seconds. Only the API
+    worker holding the sweep advisory lock sweeps, the others skip the round. Failures of a single
+    sweep are logged and never stop the loop; cancel the task to stop it.
+    """
+
+    while True:
+        await asyncio.sleep(job_settings.job_sweep_interval)
+
+        try:
+            async with job_sweep_lock.try_hold() as held:
+                if not held:
+                    continue
+
+                async with postgres_async_session_maker() as postgres_async_session:
+                    service = get_service_using_postgres_and_celery(postgres_async_session)
+
+                    await service.sweep_stale_jobs(
+                        job_settings.job_lease_timeout,
+                        job_settings.job_sweep_max_requeues,
+                        job_settings.job_redelivery_timeout,
+                    )
+
+        except Exception:
+            logger.exception("Cannot sweep processing jobs with expired leases.")
@@ -1,3 +1,5 @@
+from src.jobs.types.batch_action import BatchActionType
+from src.jobs.types.batch_outcome import BatchOutcomeType
 from src.jobs.types.end_action import EndActionType
 from src.jobs.types.job import JobType
 from src.jobs.types.phase import PhaseType
@@ -5,6 +7,8 @@ from src.jobs.types.process_action import ProcessActionType
 
 
 __all__ = [
+    "BatchActionType",
+    "BatchOutcomeType",
     "EndActionType",
     "JobType",
     "PhaseType",
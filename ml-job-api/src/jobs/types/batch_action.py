@@ -0,0 +1,11 @@
+from enum import StrEnum
+
+
+class BatchActionType(StrEnum):
+    """
+    Enumeration type of actions that can be applied to a batch of jobs.
+    """
+
+    RUN = "RUN"
+    ABORT = "ABORT"
+    REMOVE = "REMOVE"
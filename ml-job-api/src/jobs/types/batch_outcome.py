@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+
+class BatchOutcomeType(StrEnum):
+    """
+    Enumeration type of outcomes of a batch action on a single job.
+    """
+
+    APPLIED = "APPLIED"
+    NOT_EXIST = "NOT_EXIST"
+    PHASE_CONFLICT = "PHASE_CONFLICT"
+    FAILED = "FAILED"
@@ -2,21 +2,26 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.infrastructure.storages import get_postgres_async_session
+from src.jobs.api.dependencies import get_service_using_postgres_and_celery
+from src.jobs.service import JobService
 from src.labellings.repositories import LabellingPostgresRepository
 from src.labellings.service import LabellingService
 
 
 def get_service_using_postgres(
     postgres_async_session: AsyncSession = Depends(get_postgres_async_session),
+    job_service: JobService = Depends(get_service_using_postgres_and_celery),
 ) -> LabellingService:
     """
     Construct a LabellingService backed by PostgreSQL persistence.
 
     This dependency factory builds a LabellingPostgresRepository using the injected
-    AsyncSession, and injects it into a LabellingService instance.
+    AsyncSession, and injects it together with the JobService continuing chained jobs
+    into a LabellingService instance.
 
     Parameters:
         postgres_async_session (AsyncSession): Asynchronous database session for PostgreSQL operations.
+        job_service (JobService): Service instance for continuing chained jobs once fully labelled.
 
     Returns:
         LabellingService: Service instance for labelling records using the PostgreSQL backend.
@@ -24,4 +29,4 @@ def get_service_using_postgres(
 
     postgres_repository = LabellingPostgresRepository(postgres_async_session)
 
-    return LabellingService(postgres_repository)
+    return LabellingService(postgres_repository, job_service)
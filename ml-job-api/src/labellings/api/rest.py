@@ -4,9 +4,11 @@ from fastapi import (
     APIRouter,
     Body,
     Depends,
+    Header,
     HTTPException,
     Path,
     Query,
+    Request,
     status,
 )
 from fastapi.responses import JSONResponse
@@ -22,7 +24,10 @@ from src.labellings.errors import (
     LabellingInvalidBatchError,
     LabellingNotExistError,
 )
-from src.labellings.resources import rest_resources
+from src.labellings.resources import (
+    batch_resources,
+    rest_resources,
+)
 from src.labellings.serializers import (
     LabellingListSerializer,
     LabellingReadSerializer,
@@ -135,9 +140,52 @@ class LabellingRESTRouter:
     async def initialize_labellings_batch(
         self,
         batch: list[LabellingInitializeDTO] = Body(title="Labelling initialization batch payload"),
+        idempotency_key: str | None = Header(
+            None,
+            alias="Idempotency-Key",
+            min_length=batch_resources["idempotency_key"]["MIN_LENGTH"],
+            max_length=batch_resources["idempotency_key"]["MAX_LENGTH"],
+            description=batch_resources["idempotency_key"]["DESCRIPTION"],
+            examples=batch_resources["idempotency_key"]["EXAMPLES"],
+        ),
     ) -> None:
         try:
-            await self.service.initialize_labellings_batch(batch)
+            await self.service.initialize_labellings_batch(batch, idempotency_key)
+
+        except LabellingAbsentJobError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    @rest_router.post(
+        path="/batch/stream",
+        tags=["Labellings: Batch"],
+        response_class=JSONResponse,
+        response_model=None,
+        status_code=status.HTTP_204_NO_CONTENT,
+        responses={
+            status.HTTP_204_NO_CONTENT: {"description": rest_resources["initialize_batch_stream"]["HTTP_204"]},
+            status.HTTP_400_BAD_REQUEST: {"description": rest_resources["initialize_batch_stream"]["HTTP_400"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["initialize_batch_stream"]["HTTP_404"]},
+        },
+        summary=rest_resources["initialize_batch_stream"]["SUMMARY"],
+        description=rest_resources["initialize_batch_stream"]["DESCRIPTION"],
+    )
+    async def initialize_labellings_batch_stream(
+        self,
+        request: Request,
+        idempotency_key: str | None = Header(
+            None,
+            alias="Idempotency-Key",
+            min_length=batch_resources["idempotency_key"]["MIN_LENGTH"],
+            max_length=batch_resources["idempotency_key"]["MAX_LENGTH"],
+            description=batch_resources["idempotency_key"]["DESCRIPTION"],
+            examples=batch_resources["idempotency_key"]["EXAMPLES"],
+        ),
+    ) -> None:
+        try:
+            await self.service.initialize_labellings_batch_stream(request.stream(), idempotency_key)
+
+        except LabellingInvalidBatchError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
         except LabellingAbsentJobError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
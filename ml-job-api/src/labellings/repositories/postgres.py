@@ -1,11 +1,13 @@
 from uuid import UUID
 
 from sqlalchemy import (
+    and_,
     case,
-    insert,
+    func,
     select,
     update,
 )
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,6 +28,8 @@ from src.labellings.types import SpectrumSetType
 class LabellingPostgresRepository(LabellingRepository):
     """
     PostgreSQL-backed implementation of LabellingRepository using SQLAlchemy AsyncSession.
+
+    Single labelling updates are `UPDATE … RETURNING` statements, costing one round-trip besides their commit.
     """
 
     model = LabellingPostgresModel
@@ -73,6 +77,11 @@ class LabellingPostgresRepository(LabellingRepository):
         """
         Bulk-insert multiple labelling records in one operation.
 
+        Records whose ID already exists are replaced by the new ones, so a retried idempotent batch
+        creates no duplicates, and a batch of a job run again, e.g. after a requeue or a broker
+        redelivery, replaces the labellings of its previous run to match the new result. User labels
+        and comments are kept only if the spectrum and its set did not change.
+
         Parameters:
             batch (list[LabellingCreateDTO]): List of DTOs containing all fields for the new labellings.
 
@@ -83,6 +92,21 @@ class LabellingPostgresRepository(LabellingRepository):
         # Prepare and execute bulk creation
         batch_creation_data = [dto.model_dump(exclude_none=True) for dto in batch]
         query = insert(self.model)
+        is_spectrum_kept = and_(
+            self.model.spectrum_filename == query.excluded.spectrum_filename,
+            self.model.spectrum_set == query.excluded.spectrum_set,
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[self.model.labelling_id],
+            set_={
+                "spectrum_filename": query.excluded.spectrum_filename,
+                "spectrum_set": query.excluded.spectrum_set,
+                "sequence_iteration": query.excluded.sequence_iteration,
+                "model_prediction": query.excluded.model_prediction,
+                "user_label": case((is_spectrum_kept, self.model.user_label), else_=query.excluded.user_label),
+                "user_comment": case((is_spectrum_kept, self.model.user_comment), else_=query.excluded.user_comment),
+            },
+        )
 
         try:
             await self.session.execute(query, batch_creation_data)
@@ -115,7 +139,7 @@ class LabellingPostgresRepository(LabellingRepository):
 
     async def update_by_labelling_id(self, labelling_id: UUID, dto: LabellingUpdateDTO) -> LabellingEntity:
         """
-        Update user-given metadata for an existing labelling.
+        Update user-given metadata for an existing labelling in a single statement.
 
         Parameters:
             labelling_id (UUID): The unique identifier of the labelling to update.
@@ -128,20 +152,27 @@ class LabellingPostgresRepository(LabellingRepository):
             LabellingNotExistError: If no labelling with the specified ID exists.
         """
 
-        orm = await self.session.get(self.model, labelling_id)
+        values = dto.model_dump(exclude_none=True)
+
+        if not values:
+            return await self.get_by_labelling_id(labelling_id)
+
+        query = update(self.model).where(self.model.labelling_id == labelling_id).values(**values).returning(self.model)
+        result = await self.session.execute(query)
+        orm = result.scalar_one_or_none()
 
         if not orm:
-            raise LabellingNotExistError(f"Cannot update labelling with ID={labelling_id}.")
+            await self.session.rollback()
 
-        for key, value in dto.model_dump(exclude_none=True).items():
-            setattr(orm, key, value)
+            raise LabellingNotExistError(f"Cannot update labelling with ID={labelling_id}.")
 
         await self.session.commit()
-        await self.session.refresh(orm)
 
         return LabellingEntity.model_validate(orm)
 
-    async def update_batch_by_labelling_ids(self, labelling_ids: list[UUID], batch: list[LabellingUpdateDTO]) -> None:
+    async def update_batch_by_labelling_ids(
+        self, labelling_ids: list[UUID], batch: list[LabellingUpdateDTO]
+    ) -> set[UUID]:
         """
         Apply bulk updates to multiple labelling records in one operation.
 
@@ -149,16 +180,19 @@ class LabellingPostgresRepository(LabellingRepository):
             labelling_ids (list[UUID]): List of UUIDs identifying the labellings to update.
             batch (list[LabellingUpdateDTO]): Parallel list of DTOs with updated fields.
 
+        Returns:
+            set[UUID]: Set of UUIDs of the jobs the updated labellings belong to.
+
         Raises:
             LabellingNotExistError: If any labelling ID in the list does not exist.
         """
 
-        # Verify all IDs exist
-        query = select(self.model.labelling_id).where(self.model.labelling_id.in_(labelling_ids))
+        # Verify all IDs exist and collect their jobs
+        query = select(self.model.labelling_id, self.model.job_id).where(self.model.labelling_id.in_(labelling_ids))
         result = await self.session.execute(query)
-        existing_ids = result.scalars().all()
+        existing_rows = result.all()
 
-        if len(labelling_ids) != len(existing_ids):
+        if len(labelling_ids) != len(existing_rows):
             raise LabellingNotExistError("Cannot update some labelling of the batch.")
 
         # Prepare and execute bulk update
@@ -171,6 +205,60 @@ class LabellingPostgresRepository(LabellingRepository):
         await self.session.execute(query, batch_update_data)
         await self.session.commit()
 
+        return {job_id for _, job_id in existing_rows}
+
+    async def summarize_by_job_id(self, job_id: UUID) -> tuple[int, int, int, int]:
+        """
+        Aggregate the labelling progress of the oracle and performance estimation labellings of a given job.
+
+        The counts are computed by the database in a single aggregate query, without loading the labellings.
+
+        Parameters:
+            job_id (UUID): The UUID of the job whose labellings to aggregate.
+
+        Returns:
+            tuple[int, int, int, int]:
+                The number of oracle labellings, the number of oracle and performance estimation labellings
+                without a user label, the number of performance estimation labellings, and the number of them
+                whose user label matches the model prediction.
+        """
+
+        is_oracle = self.model.spectrum_set == SpectrumSetType.ORACLE
+        is_perf_est = self.model.spectrum_set == SpectrumSetType.PERFORMANCE_ESTIMATION
+        query = select(
+            func.count().filter(is_oracle),
+            func.count().filter(func.coalesce(self.model.user_label, "") == ""),
+            func.count().filter(is_perf_est),
+            func.count().filter(is_perf_est, self.model.user_label == self.model.model_prediction),
+        ).where(
+            self.model.job_id == job_id,
+            self.model.spectrum_set.in_([SpectrumSetType.ORACLE, SpectrumSetType.PERFORMANCE_ESTIMATION]),
+        )
+        result = await self.session.execute(query)
+        oracles, unlabelled, perf_ests, perf_est_matches = result.one()
+
+        return oracles, unlabelled, perf_ests, perf_est_matches
+
+    async def list_by_job_id_and_spectrum_set(
+        self, job_id: UUID, spectrum_set: SpectrumSetType
+    ) -> list[LabellingEntity]:
+        """
+        Retrieve the labelling records of a given spectrum set for a given job.
+
+        Parameters:
+            job_id (UUID): The UUID of the job whose labellings to list.
+            spectrum_set (SpectrumSetType): The spectrum set of the labellings.
+
+        Returns:
+            list[LabellingEntity]: Labelling entities of the spectrum set tied to the job.
+        """
+
+        query = select(self.model).where(self.model.job_id == job_id, self.model.spectrum_set == spectrum_set)
+        result = await self.session.execute(query)
+        orms = result.scalars().all()
+
+        return [LabellingEntity.model_validate(orm) for orm in orms]
+
     async def list_by_job_id(self, job_id: UUID) -> list[LabellingEntity]:
         """
         Retrieve all labelling records for a given job, ordered by spectrum_set priority.
@@ -9,6 +9,7 @@ from src.labellings.dto import (
     LabellingUpdateDTO,
 )
 from src.labellings.entity import LabellingEntity
+from src.labellings.types import SpectrumSetType
 
 
 class LabellingRepository(ABC):
@@ -33,7 +34,7 @@ class LabellingRepository(ABC):
     @abstractmethod
     async def create_batch(self, batch: list[LabellingCreateDTO]) -> None:
         """
-        Create multiple labelling records in a single bulk operation.
+        Create multiple labelling records in a single bulk operation, skipping already existing IDs.
 
         Parameters:
             batch (list[LabellingCreateDTO]): List of DTOs for each labelling to initialize.
@@ -71,13 +72,52 @@ class LabellingRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_batch_by_labelling_ids(self, labelling_ids: list[UUID], batch: list[LabellingUpdateDTO]) -> None:
+    async def update_batch_by_labelling_ids(
+        self, labelling_ids: list[UUID], batch: list[LabellingUpdateDTO]
+    ) -> set[UUID]:
         """
         Apply bulk updates to multiple labelling records in one operation.
 
         Parameters:
             labelling_ids (list[UUID]): List of labelling UUIDs to update.
             batch (list[LabellingUpdateDTO]): Parallel list of DTOs with updated metadata for each corresponding ID.
+
+        Returns:
+            set[UUID]: Set of UUIDs of the jobs the updated labellings belong to.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def summarize_by_job_id(self, job_id: UUID) -> tuple[int, int, int, int]:
+        """
+        Aggregate the labelling progress of the oracle and performance estimation labellings of a given job.
+
+        Parameters:
+            job_id (UUID): The UUID of the job whose labellings to aggregate.
+
+        Returns:
+            tuple[int, int, int, int]:
+                The number of oracle labellings, the number of oracle and performance estimation labellings
+                without a user label, the number of performance estimation labellings, and the number of them
+                whose user label matches the model prediction.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_job_id_and_spectrum_set(
+        self, job_id: UUID, spectrum_set: SpectrumSetType
+    ) -> list[LabellingEntity]:
+        """
+        List the labelling records of a given spectrum set associated with a given job.
+
+        Parameters:
+            job_id (UUID): The UUID of the job whose labellings to retrieve.
+            spectrum_set (SpectrumSetType): The spectrum set of the labellings.
+
+        Returns:
+            list[LabellingEntity]: A list of the labelling entities of the spectrum set tied to the job.
         """
 
         raise NotImplementedError
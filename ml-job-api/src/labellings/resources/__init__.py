@@ -1,5 +1,6 @@
 from src.labellings.resources.api import rest_resources
 from src.labellings.resources.entity import (
+    batch_resources,
     labelling_resources,
     list_resources,
 )
@@ -7,6 +8,7 @@ from src.labellings.resources.entity import (
 
 __all__ = [
     "rest_resources",
+    "batch_resources",
     "labelling_resources",
     "list_resources",
 ]
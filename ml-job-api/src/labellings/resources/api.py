@@ -39,7 +39,22 @@ rest_resources = {
         "SUMMARY": "Initialize a new batch of labellings",
         "DESCRIPTION": (
             "Accepts an array of labelling payloads; generates IDs and persists multiple records in one request. "
-            "Possible errors: 404 if any associated job ID is missing, 422 for invalid inputs, "
+            "With the optional `Idempotency-Key` header the IDs are derived from the key, so a retried request "
+            "never creates duplicate records, it replaces the records created before. Possible errors: 404 if "
+            "any associated job ID is missing, 422 for invalid inputs, 500 for persistence failures."
+        ),
+    },
+    "initialize_batch_stream": {
+        "HTTP_204": "Streamed batch of labellings initialized successfully",
+        "HTTP_400": "Streamed batch contains an invalid labelling line",
+        "HTTP_404": "One or more associated jobs in the batch do not exist",
+        "SUMMARY": "Initialize a new streamed batch of labellings",
+        "DESCRIPTION": (
+            "Accepts a newline-delimited JSON (NDJSON) stream of labelling payloads, optionally gzip-encoded, "
+            "and persists all records in one request without buffering a JSON array. "
+            "With the optional `Idempotency-Key` header the IDs are derived from the key and the line index, "
+            "so a retried chunk never creates duplicate records, it replaces the records created before. "
+            "Possible errors: 400 for an invalid line, 404 if any associated job ID is missing, "
             "500 for persistence failures."
         ),
     },
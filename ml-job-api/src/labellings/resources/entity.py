@@ -56,3 +56,15 @@ list_resources = {
         "DESCRIPTION": "List of associated labelling records",
     },
 }
+
+batch_resources = {
+    "idempotency_key": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 255,
+        "DESCRIPTION": (
+            "Client-generated key of the batch request; retries with the same key replace the labellings created "
+            "before instead of duplicating them"
+        ),
+        "EXAMPLES": ["3fa85f64-5717-4562-b3fc-2c963f66afa6:0"],
+    },
+}
@@ -1,6 +1,24 @@
+import logging
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from src.common.utils import generate_uuid
+from pydantic import ValidationError
+
+from src.common.utils import (
+    generate_deterministic_uuid,
+    generate_uuid,
+    iterate_lines,
+)
+from src.jobs.dto import JobAdvanceDTO
+from src.jobs.errors import (
+    JobNotExistError,
+    JobPipelineError,
+)
+from src.jobs.service import JobService
+from src.jobs.types import (
+    JobType,
+    PhaseType,
+)
 from src.labellings.dto import (
     LabellingCreateDTO,
     LabellingEditDTO,
@@ -13,6 +31,10 @@ from src.labellings.serializers import (
     LabellingListSerializer,
     LabellingReadSerializer,
 )
+from src.labellings.types import SpectrumSetType
+
+
+logger = logging.getLogger(__name__)
 
 
 class LabellingService:
@@ -20,29 +42,90 @@ class LabellingService:
     Business logic layer for managing labelling operations on spectra for Active ML Job.
     """
 
-    def __init__(self, repository: LabellingRepository) -> None:
+    def __init__(self, repository: LabellingRepository, job_service: JobService | None = None) -> None:
         """
         Initialize the labelling service with a repository implementation.
 
         Parameters:
             repository (LabellingRepository): Concrete repository for persisting and retrieving labelling entities.
+            job_service (JobService | None): Optional job service continuing chained jobs once fully labelled.
         """
 
         self.repository = repository
+        self.job_service = job_service
 
     @staticmethod
-    def _generate_labelling_id() -> UUID:
+    def _generate_labelling_id(idempotency_key: str | None = None, index: int | None = None) -> UUID:
         """
         Generate a new UUID for a labelling record.
 
+        If an idempotency key is given, the UUID is derived from the key and the index of the labelling
+        in its batch, so retrying the same batch yields the same identifiers.
+
+        Parameters:
+            idempotency_key (str | None): Optional client-generated key of the batch request.
+            index (int | None): Index of the labelling in its batch, used with the idempotency key.
+
         Returns:
             UUID: A newly generated labelling identifier.
         """
 
-        labelling_id = generate_uuid()
+        if idempotency_key:
+            labelling_id = generate_deterministic_uuid(f"{idempotency_key}:{index}")
+
+        else:
+            labelling_id = generate_uuid()
 
         return labelling_id
 
+    async def _advance_job_by_job_id(self, job_id: UUID) -> None:
+        """
+        Continue a chained job with its next iteration if its labelling set is fully labelled.
+
+        The labelling set is fully labelled when every oracle and performance estimation labelling
+        has a user label. The performance is the share of performance estimation labellings whose
+        user label matches the model prediction. Jobs not awaiting continuation return before any
+        labelling is read, and the labelling progress is aggregated by the database, so only the
+        oracle labellings of a fully labelled set are loaded. Staging failures are logged, not
+        raised, so they never fail the labelling edits already persisted.
+
+        Parameters:
+            job_id (UUID): The UUID of the job whose labellings were edited.
+        """
+
+        if not self.job_service:
+            return
+
+        try:
+            job = await self.job_service.retrieve_job_by_job_id(job_id)
+
+        except JobNotExistError:
+            return
+
+        if not (job.chained and job.type == JobType.ACTIVE_ML and job.phase == PhaseType.COMPLETED):
+            return
+
+        oracles, unlabelled, perf_ests, perf_est_matches = await self.repository.summarize_by_job_id(job_id)
+
+        if not oracles or unlabelled:
+            return
+
+        performance = perf_est_matches / perf_ests if perf_ests else None
+        oracle_entities = await self.repository.list_by_job_id_and_spectrum_set(job_id, SpectrumSetType.ORACLE)
+
+        dto = JobAdvanceDTO(
+            iteration=oracle_entities[0].sequence_iteration,
+            oracle_filenames=[entity.spectrum_filename for entity in oracle_entities],
+            oracle_labels=[entity.user_label for entity in oracle_entities],
+            performance=performance,
+        )
+
+        try:
+            await self.job_service.advance_job_by_job_id(job_id, dto)
+
+        except JobPipelineError:
+            logger.warning("Cannot advance job with ID=%s after its labelling.", job_id, exc_info=True)
+
     async def initialize_labelling(self, dto: LabellingInitializeDTO) -> LabellingReadSerializer:
         """
         Create and persist a single new labelling record.
@@ -59,15 +142,22 @@ class LabellingService:
 
         return LabellingReadSerializer(**entity.model_dump())
 
-    async def initialize_labellings_batch(self, batch: list[LabellingInitializeDTO]) -> None:
+    async def initialize_labellings_batch(
+        self, batch: list[LabellingInitializeDTO], idempotency_key: str | None = None
+    ) -> None:
         """
         Bulk create and persist multiple labelling records in one operation.
 
+        Already existing labellings are replaced, so a batch retried with the same idempotency key
+        never creates duplicate records, and a job run again replaces the labellings of its previous
+        run instead of keeping labellings that no longer match its result.
+
         Parameters:
             batch (list[LabellingInitializeDTO]): List of DTOs for each new labelling.
+            idempotency_key (str | None): Optional client-generated key of the batch request.
         """
 
-        labelling_ids = [self._generate_labelling_id() for _ in batch]
+        labelling_ids = [self._generate_labelling_id(idempotency_key, index) for index in range(len(batch))]
         batch = [
             LabellingCreateDTO(labelling_id=labelling_id, **dto.model_dump())
             for labelling_id, dto in zip(labelling_ids, batch)
@@ -75,6 +165,36 @@ class LabellingService:
 
         await self.repository.create_batch(batch)
 
+    async def initialize_labellings_batch_stream(
+        self, stream: AsyncIterator[bytes], idempotency_key: str | None = None
+    ) -> None:
+        """
+        Bulk create and persist multiple labelling records from a newline-delimited JSON stream.
+
+        Parameters:
+            stream (AsyncIterator[bytes]): Stream of NDJSON chunks, one labelling payload per line.
+            idempotency_key (str | None): Optional client-generated key of the batch request.
+
+        Raises:
+            LabellingInvalidBatchError: If any line of the stream is not a valid labelling payload.
+        """
+
+        batch = []
+        line_number = 0
+
+        async for line in iterate_lines(stream):
+            line_number += 1
+
+            try:
+                batch.append(LabellingInitializeDTO.model_validate_json(line))
+
+            except ValidationError as e:
+                raise LabellingInvalidBatchError(
+                    f"Cannot initialize labellings batch with invalid labelling at line={line_number}."
+                ) from e
+
+        await self.initialize_labellings_batch(batch, idempotency_key)
+
     async def retrieve_labelling_by_labelling_id(self, labelling_id: UUID) -> LabellingReadSerializer:
         """
         Retrieve a single labelling record by its unique identifier.
@@ -96,6 +216,8 @@ class LabellingService:
         """
         Apply user edits to an existing labelling record.
 
+        Completing the labelling set of a chained job continues the job with its next iteration.
+
         Parameters:
             labelling_id (UUID): The UUID of the labelling to update.
             dto (LabellingEditDTO): DTO containing the new metadata.
@@ -106,6 +228,8 @@ class LabellingService:
 
         entity = await self.repository.update_by_labelling_id(labelling_id, LabellingUpdateDTO(**dto.model_dump()))
 
+        await self._advance_job_by_job_id(entity.job_id)
+
         return LabellingReadSerializer(**entity.model_dump())
 
     async def edit_labellings_batch_by_labelling_ids(
@@ -114,6 +238,8 @@ class LabellingService:
         """
         Apply user edits to multiple existing labellings in a bulk operation.
 
+        Completing the labelling set of a chained job continues the job with its next iteration.
+
         Parameters:
             labelling_ids (list[UUID]): List of labelling UUIDs to update.
             batch (list[LabellingEditDTO]): Parallel list of DTOs containing edits.
@@ -127,7 +253,10 @@ class LabellingService:
 
         batch = [LabellingUpdateDTO(**dto.model_dump()) for dto in batch]
 
-        await self.repository.update_batch_by_labelling_ids(labelling_ids, batch)
+        job_ids = await self.repository.update_batch_by_labelling_ids(labelling_ids, batch)
+
+        for job_id in job_ids:
+            await self._advance_job_by_job_id(job_id)
 
     async def list_labellings_by_job_id(self, job_id: UUID) -> LabellingListSerializer:
         """
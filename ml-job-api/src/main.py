@@ -1,22 +1,66 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
 from fastapi import (
     APIRouter,
     FastAPI,
 )
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.common.middlewares import GZipRequestMiddleware
+from src.events.api import events_api_router
+from src.events.listener import forward_published_events
+from src.events.watcher import watch_entries
 from src.files.api import files_api_router
+from src.files.reaper import reap_deletions_periodically
+from src.files.reconciler import reconcile_usages_periodically
+from src.infrastructure.caches import (
+    dataset_handle_cache,
+    pool_handle_cache,
+)
+from src.infrastructure.executors import spectrum_read_executor
 from src.jobs.api import jobs_api_router
+from src.jobs.sweeper import sweep_stale_jobs_periodically
 from src.labellings.api import labellings_api_router
 from src.settings.app import app_settings
 from src.spectra.api import spectra_api_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """
+    Run background tasks of the application for its whole lifetime.
+
+    Parameters:
+        app (FastAPI): The FastAPI application instance.
+    """
+
+    job_sweeper_task = asyncio.create_task(sweep_stale_jobs_periodically())
+    deletion_reaper_task = asyncio.create_task(reap_deletions_periodically())
+    usage_reconciler_task = asyncio.create_task(reconcile_usages_periodically())
+    event_listener_task = asyncio.create_task(forward_published_events())
+    entry_watcher_task = asyncio.create_task(watch_entries())
+
+    yield
+
+    job_sweeper_task.cancel()
+    deletion_reaper_task.cancel()
+    usage_reconciler_task.cancel()
+    event_listener_task.cancel()
+    entry_watcher_task.cancel()
+    spectrum_read_executor.shutdown(wait=False, cancel_futures=True)
+    pool_handle_cache.clear()
+    dataset_handle_cache.clear()
+
+
 # Create the main FastAPI application instance, using settings from app_settings
 app = FastAPI(
     title=app_settings.title,
     description=app_settings.description,
     version=app_settings.version,
     debug=app_settings.debug,
+    lifespan=lifespan,
 )
 
 # Enable CORS for all origins, methods, headers, and credentials
@@ -28,9 +72,13 @@ app.add_middleware(
     allow_credentials=True,
 )
 
+# Decompress gzip-encoded request bodies, e.g. large batches sent by workers
+app.add_middleware(GZipRequestMiddleware, max_size=app_settings.gzip_request_max_size)
+
 # Mount all sub-routers under the '/api' prefix
 api_router = APIRouter(prefix="/api")
 
+api_router.include_router(events_api_router)
 api_router.include_router(files_api_router)
 api_router.include_router(jobs_api_router)
 api_router.include_router(labellings_api_router)
@@ -7,9 +7,11 @@ from sqlalchemy import (
 )
 
 from src.common.models import BasePostgresModel
+from src.files.models import DirectoryUsagePostgresModel
 from src.jobs.models import JobPostgresModel
 from src.labellings.models import LabellingPostgresModel
 from src.settings.storages import postgres_settings
+from src.spectra.models import SpectrumPostgresModel
 
 
 # this is the Alembic Config object, which provides
@@ -28,5 +28,11 @@ class AppSettings(BaseSettings):
         description="The current version of the API",
     )
 
+    gzip_request_max_size: int = Field(
+        256 * 1024 * 1024,
+        ge=1,
+        description="Maximum number of bytes a gzip-encoded request body may decompress to",
+    )
+
 
 app_settings = AppSettings()
@@ -0,0 +1,46 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class CacheSettings(BaseSettings):
+    """
+    Configuration settings for the caches of parsed data.
+    All values can be loaded from environment variables.
+    """
+
+    spectrum_cache_max_size: int = Field(
+        256 * 1024 * 1024,
+        description="Maximum size in bytes of the in-process cache of parsed spectra, zero disables it",
+    )
+
+    spectrum_cache_dir_path: str | None = Field(
+        None,
+        description="Absolute path to the directory of the on-disk cache of parsed spectra shared by API workers",
+    )
+
+    pool_handle_cache_max_entries: int = Field(
+        16,
+        ge=0,
+        description="Maximum number of HDF5 pool files of jobs kept open by the API, zero disables the cache",
+    )
+
+    dataset_handle_cache_max_entries: int = Field(
+        8,
+        ge=0,
+        description="Maximum number of stored HDF5 files kept open for dataset reads, zero disables the cache",
+    )
+
+    job_count_cache_max_entries: int = Field(
+        256,
+        ge=0,
+        description="Maximum number of counts of jobs matching list filters cached by the API, zero disables it",
+    )
+
+    job_count_cache_ttl: float = Field(
+        5.0,
+        ge=0.0,
+        description="Seconds a cached count of jobs matching list filters is served for, zero disables the cache",
+    )
+
+
+cache_settings = CacheSettings()
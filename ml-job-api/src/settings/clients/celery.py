@@ -27,6 +27,25 @@ class CelerySettings(BaseSettings):
         description="Whether to automatically retry publishing jobs on broker failure",
     )
 
+    task_routes: dict[str, dict[str, str]] = Field(
+        {
+            "DATA_PREPROCESSING": {"queue": "data_preprocessing"},
+            "ACTIVE_ML": {"queue": "active_ml"},
+            "CATALOG_INGESTION": {"queue": "catalog_ingestion"},
+        },
+        description="Routing of jobs to queues by job type, so each type is consumed by its own worker pool",
+    )
+
+    task_queue_max_priority: int = Field(
+        9,
+        description="Maximum job priority supported by the queues declared by the publisher",
+    )
+
+    task_default_priority: int = Field(
+        5,
+        description="Priority of jobs published without an explicit priority",
+    )
+
     @field_validator("broker_url")
     def build_broker_url(cls, broker_url: str) -> str:
         broker_dsn = AmqpDsn(broker_url)
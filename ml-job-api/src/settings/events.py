@@ -0,0 +1,49 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class EventSettings(BaseSettings):
+    """
+    Configuration settings for the publishing and streaming of job and file change events.
+    All values can be loaded from environment variables.
+    """
+
+    event_channel: str = Field(
+        "ml_job_events",
+        description="Name of the PostgreSQL notification channel change events are published to all API workers on",
+    )
+
+    event_queue_size: int = Field(
+        1000,
+        ge=1,
+        description="Maximum number of events queued for a single streaming client before it is disconnected",
+    )
+
+    event_heartbeat_interval: float = Field(
+        15.0,
+        gt=0,
+        description="Seconds without events after which a comment is streamed to keep the connection open",
+    )
+
+    event_watch_dir_path: str = Field(
+        "/JOBS",
+        description="Path to the directory of the shared files directory whose entries are watched for changes",
+    )
+
+    event_watch_debounce: int = Field(
+        500,
+        ge=1,
+        description="Milliseconds file changes are grouped for, so a file written in many steps yields one event",
+    )
+
+    event_retry_interval: int = Field(
+        5,
+        ge=1,
+        description=(
+            "Seconds to wait before listening for notifications or watching files again after a failure, "
+            "and between two attempts of an API worker to take over the watch of files"
+        ),
+    )
+
+
+event_settings = EventSettings()
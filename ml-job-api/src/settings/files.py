@@ -0,0 +1,48 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class FileSettings(BaseSettings):
+    """
+    Configuration settings for the reading, background deletion and disk usage index of stored files.
+    All values can be loaded from environment variables.
+    """
+
+    dataset_slice_max_values: int = Field(
+        1_000_000,
+        ge=1,
+        description="Maximum number of values of a slice of an HDF5 dataset read by a single request",
+    )
+
+    deletion_reap_interval: int = Field(
+        5,
+        ge=1,
+        description="Seconds between two scans of the trash for directories to remove in the background",
+    )
+
+    deletion_reap_rate: int = Field(
+        256 * 1024 * 1024,
+        ge=0,
+        description="Maximum number of bytes per second removed from the trash, zero for no limit",
+    )
+
+    deletion_retention: int = Field(
+        86400,
+        ge=0,
+        description="Seconds the progress of a completed background deletion stays queryable",
+    )
+
+    usage_reconcile_interval: int = Field(
+        3600,
+        ge=1,
+        description="Seconds between two scans of the whole shared files directory recomputing the disk usage index",
+    )
+
+    usage_reconcile_check_interval: int = Field(
+        60,
+        ge=1,
+        description="Seconds between two checks by an API worker whether the disk usage index is due to be recomputed",
+    )
+
+
+file_settings = FileSettings()
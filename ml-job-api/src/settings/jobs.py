@@ -0,0 +1,45 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class JobSettings(BaseSettings):
+    """
+    Configuration settings for the supervision of running jobs and their queues.
+    All values can be loaded from environment variables.
+    """
+
+    job_lease_timeout: int = Field(
+        300,
+        description="Seconds without a worker heartbeat after which a processing job lease is considered expired",
+    )
+
+    job_sweep_interval: int = Field(
+        60,
+        description="Seconds between two sweeps of processing jobs with expired leases",
+    )
+
+    job_sweep_max_requeues: int = Field(
+        0,
+        description="Maximum number of times a job with an expired lease is requeued before it is marked as errored",
+    )
+
+    job_redelivery_timeout: int = Field(
+        1800,
+        description=(
+            "Seconds after a lease expiry during which a job not taken by any worker waits for the delivery of its "
+            "message from a non-empty queue, before the message is considered lost"
+        ),
+    )
+
+    job_inspect_timeout: float = Field(
+        2.0,
+        description="Seconds to wait for Celery workers replies when inspecting their active and reserved jobs",
+    )
+
+    job_queue_wait_window: int = Field(
+        3600,
+        description="Seconds back from now in which started jobs count into the average queue wait",
+    )
+
+
+job_settings = JobSettings()
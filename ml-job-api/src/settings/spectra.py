@@ -0,0 +1,18 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class SpectrumSettings(BaseSettings):
+    """
+    Configuration settings for the reading of spectrum files.
+    All values can be loaded from environment variables.
+    """
+
+    spectrum_read_workers: int = Field(
+        8,
+        ge=1,
+        description="Number of threads reading and parsing spectrum files, bounding the concurrency of batch retrievals",
+    )
+
+
+spectrum_settings = SpectrumSettings()
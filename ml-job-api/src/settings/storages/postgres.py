@@ -27,6 +27,18 @@ class PostgresSettings(BaseSettings):
         description="Maximum seconds to wait when establishing a new DB connection",
     )
 
+    engine_pool_size: int = Field(
+        5,
+        ge=1,
+        description="Number of DB connections kept open by each API worker",
+    )
+
+    engine_max_overflow: int = Field(
+        10,
+        ge=0,
+        description="Number of DB connections each API worker may open beyond the pool size under load",
+    )
+
     session_autocommit: bool = Field(
         False,
         description="Automatically commit the transaction after each flush",
@@ -1,20 +1,64 @@
-from src.infrastructure.storages import lfs_spectra_dir_path
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.caches import (
+    pool_handle_cache,
+    spectrum_disk_cache,
+    spectrum_memory_cache,
+)
+from src.infrastructure.executors import spectrum_read_executor
+from src.infrastructure.storages import (
+    get_postgres_async_session,
+    lfs_files_dir_path,
+    lfs_spectra_dir_path,
+)
+from src.jobs.repositories import JobPostgresRepository
+from src.labellings.repositories import LabellingPostgresRepository
+from src.settings.spectra import spectrum_settings
+from src.spectra.catalogs import SpectrumPostgresCatalog
+from src.spectra.pools import SpectrumHDF5Pool
 from src.spectra.repositories import SpectrumLFSRepository
 from src.spectra.service import SpectrumService
 
 
-def get_service_using_lfs() -> SpectrumService:
+def get_service_using_lfs_and_postgres(
+    postgres_async_session: AsyncSession = Depends(get_postgres_async_session),
+) -> SpectrumService:
     """
     Build and return a SpectrumService backed by a local filesystem repository.
 
     This function constructs a SpectrumLFSRepository using the configured
-    shared spectra directory path, then injects it into a SpectrumService.
+    shared spectra directory path, the process-wide spectrum caches and the
+    bounded executor reading spectrum files, a LabellingPostgresRepository
+    resolving the spectra of a job, a SpectrumPostgresCatalog searching
+    the header metadata of spectra, a JobPostgresRepository resolving the
+    directory of a job, and a SpectrumHDF5Pool reading the preprocessed spectra
+    of jobs through the shared handle cache, then injects them into a SpectrumService.
+
+    Parameters:
+        postgres_async_session (AsyncSession): Asynchronous database session for PostgreSQL operations.
 
     Returns:
         SpectrumService:
             Service instance for handling spectral data operations from the local filesystem.
     """
 
-    lfs_repository = SpectrumLFSRepository(lfs_spectra_dir_path)
+    lfs_repository = SpectrumLFSRepository(
+        lfs_spectra_dir_path,
+        spectrum_memory_cache,
+        spectrum_disk_cache,
+        spectrum_read_executor,
+    )
+    labelling_postgres_repository = LabellingPostgresRepository(postgres_async_session)
+    postgres_catalog = SpectrumPostgresCatalog(postgres_async_session)
+    job_postgres_repository = JobPostgresRepository(postgres_async_session)
+    hdf5_pool = SpectrumHDF5Pool(lfs_files_dir_path, pool_handle_cache, spectrum_read_executor)
 
-    return SpectrumService(lfs_repository)
+    return SpectrumService(
+        lfs_repository,
+        labelling_postgres_repository,
+        spectrum_settings.spectrum_read_workers,
+        postgres_catalog,
+        job_postgres_repository,
+        hdf5_pool,
+    )
@@ -1,21 +1,52 @@
+from uuid import UUID
+
 from fastapi import (
     APIRouter,
+    Body,
     Depends,
+    Header,
     HTTPException,
     Path,
+    Query,
+    Request,
     status,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import (
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi_restful.cbv import cbv
 
-from src.spectra.api.dependencies import get_service_using_lfs
-from src.spectra.errors import SpectrumNotExistError
+from src.common.utils import negotiate_media_type
+from src.jobs.errors import JobNotExistError
+from src.spectra.api.dependencies import get_service_using_lfs_and_postgres
+from src.spectra.dto import SpectrumBatchDTO
+from src.spectra.errors import (
+    SpectrumInvalidBatchError,
+    SpectrumNotExistError,
+)
+from src.spectra.params import (
+    SpectrumConeParams,
+    SpectrumPoolParams,
+    SpectrumPredictionParams,
+    SpectrumSampleParams,
+    SpectrumSearchParams,
+)
 from src.spectra.resources import (
     rest_resources,
     spectrum_resources,
 )
-from src.spectra.serializers import SpectrumReadSerializer
+from src.spectra.serializers import (
+    SpectrumCacheSerializer,
+    SpectrumListSerializer,
+    SpectrumPoolSerializer,
+    SpectrumPredictionListSerializer,
+    SpectrumReadSerializer,
+)
 from src.spectra.service import SpectrumService
+from src.spectra.utils import pack_spectrum_arrays
 
 
 rest_router = APIRouter(
@@ -32,18 +63,170 @@ class SpectrumRESTRouter:
     RESTful API router for spectral data operations.
     """
 
-    service: SpectrumService = Depends(get_service_using_lfs)
+    service: SpectrumService = Depends(get_service_using_lfs_and_postgres)
+
+    @rest_router.get(
+        path="/cache/",
+        tags=["Spectra: Cache"],
+        response_class=JSONResponse,
+        response_model=SpectrumCacheSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["cache"]["HTTP_200"]},
+        },
+        summary=rest_resources["cache"]["SUMMARY"],
+        description=rest_resources["cache"]["DESCRIPTION"],
+    )
+    async def retrieve_cache_stats(self) -> SpectrumCacheSerializer:
+        return await self.service.retrieve_cache_stats()
+
+    @rest_router.post(
+        path="/catalog/stream",
+        tags=["Spectra: Catalog"],
+        response_class=JSONResponse,
+        response_model=None,
+        status_code=status.HTTP_204_NO_CONTENT,
+        responses={
+            status.HTTP_204_NO_CONTENT: {"description": rest_resources["ingest_batch_stream"]["HTTP_204"]},
+            status.HTTP_400_BAD_REQUEST: {"description": rest_resources["ingest_batch_stream"]["HTTP_400"]},
+        },
+        summary=rest_resources["ingest_batch_stream"]["SUMMARY"],
+        description=rest_resources["ingest_batch_stream"]["DESCRIPTION"],
+    )
+    async def ingest_spectra_batch_stream(self, request: Request) -> None:
+        try:
+            await self.service.ingest_spectra_batch_stream(request.stream())
+
+        except SpectrumInvalidBatchError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    @rest_router.get(
+        path="/catalog/",
+        tags=["Spectra: Catalog"],
+        response_class=JSONResponse,
+        response_model=SpectrumListSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["search"]["HTTP_200"]},
+        },
+        summary=rest_resources["search"]["SUMMARY"],
+        description=rest_resources["search"]["DESCRIPTION"],
+    )
+    async def search_spectra(
+        self,
+        params: SpectrumSearchParams = Query(title="Spectra search parameters"),
+    ) -> SpectrumListSerializer:
+        return await self.service.search_spectra(params)
+
+    @rest_router.get(
+        path="/catalog/cone/",
+        tags=["Spectra: Catalog"],
+        response_class=JSONResponse,
+        response_model=SpectrumListSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["search_cone"]["HTTP_200"]},
+        },
+        summary=rest_resources["search_cone"]["SUMMARY"],
+        description=rest_resources["search_cone"]["DESCRIPTION"],
+    )
+    async def search_spectra_by_cone(
+        self,
+        params: SpectrumConeParams = Query(title="Spectra cone search parameters"),
+    ) -> SpectrumListSerializer:
+        return await self.service.search_spectra_by_cone(params)
+
+    @rest_router.post(
+        path="/batch/",
+        tags=["Spectra: Batch"],
+        response_class=StreamingResponse,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {
+                "description": rest_resources["retrieve_batch"]["HTTP_200"],
+                "content": {"application/x-ndjson": {}},
+            },
+        },
+        summary=rest_resources["retrieve_batch"]["SUMMARY"],
+        description=rest_resources["retrieve_batch"]["DESCRIPTION"],
+    )
+    async def retrieve_spectra_batch(
+        self,
+        dto: SpectrumBatchDTO = Body(title="Spectra batch selection payload"),
+    ) -> StreamingResponse:
+        return StreamingResponse(
+            await self.service.retrieve_spectra_batch(dto),
+            media_type="application/x-ndjson",
+        )
+
+    @rest_router.get(
+        path="/pools/{job_id}",
+        tags=["Spectra: Pool"],
+        response_class=ORJSONResponse,
+        response_model=SpectrumPoolSerializer,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["retrieve_pool"]["HTTP_200"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["retrieve_pool"]["HTTP_404"]},
+        },
+        summary=rest_resources["retrieve_pool"]["SUMMARY"],
+        description=rest_resources["retrieve_pool"]["DESCRIPTION"],
+    )
+    async def retrieve_pool_spectrum(
+        self,
+        job_id: UUID = Path(title="ID of the job that produced the pool"),
+        params: SpectrumPoolParams = Query(title="Selection of the preprocessed spectrum"),
+    ) -> Response:
+        try:
+            spectrum = await self.service.retrieve_pool_spectrum(job_id, params)
+
+        except (JobNotExistError, SpectrumNotExistError) as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+        # Responses are rendered directly, so the already constructed serializer is not validated again
+        return ORJSONResponse(dict(spectrum))
+
+    @rest_router.get(
+        path="/pools/{job_id}/predictions",
+        tags=["Spectra: Pool"],
+        response_class=JSONResponse,
+        response_model=SpectrumPredictionListSerializer,
+        response_model_exclude_none=True,
+        status_code=status.HTTP_200_OK,
+        responses={
+            status.HTTP_200_OK: {"description": rest_resources["retrieve_predictions"]["HTTP_200"]},
+            status.HTTP_404_NOT_FOUND: {"description": rest_resources["retrieve_predictions"]["HTTP_404"]},
+        },
+        summary=rest_resources["retrieve_predictions"]["SUMMARY"],
+        description=rest_resources["retrieve_predictions"]["DESCRIPTION"],
+    )
+    async def retrieve_pool_predictions(
+        self,
+        job_id: UUID = Path(title="ID of the active learning job that produced the predictions"),
+        params: SpectrumPredictionParams = Query(title="Prediction filter, ordering and pagination parameters"),
+    ) -> SpectrumPredictionListSerializer:
+        try:
+            return await self.service.retrieve_pool_predictions(job_id, params)
+
+        except (JobNotExistError, SpectrumNotExistError) as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
     @rest_router.get(
         path="/{filename}",
         tags=["Spectra: CRUD"],
-        response_class=JSONResponse,
+        response_class=ORJSONResponse,
         response_model=SpectrumReadSerializer,
-        response_model_exclude_none=True,
         status_code=status.HTTP_200_OK,
         responses={
-            status.HTTP_200_OK: {"description": rest_resources["retrieve"]["HTTP_200"]},
+            status.HTTP_200_OK: {
+                "description": rest_resources["retrieve"]["HTTP_200"],
+                "content": {"application/octet-stream": {}},
+            },
             status.HTTP_404_NOT_FOUND: {"description": rest_resources["retrieve"]["HTTP_404"]},
+            status.HTTP_406_NOT_ACCEPTABLE: {"description": rest_resources["retrieve"]["HTTP_406"]},
         },
         summary=rest_resources["retrieve"]["SUMMARY"],
         description=rest_resources["retrieve"]["DESCRIPTION"],
@@ -56,9 +239,29 @@ class SpectrumRESTRouter:
             max_length=spectrum_resources["filename"]["MAX_LENGTH"],
             pattern=spectrum_resources["filename"]["PATTERN"],
         ),
-    ) -> SpectrumReadSerializer:
+        params: SpectrumSampleParams = Query(title="Sampling parameters of the spectrum data arrays"),
+        accept: str | None = Header(None, title="Media types acceptable for the response"),
+    ) -> Response:
+        media_type = negotiate_media_type(accept, ["application/json", "application/octet-stream"])
+
+        if media_type is None:
+            raise HTTPException(
+                status_code=status.HTTP_406_NOT_ACCEPTABLE,
+                detail="Spectrum can only be returned as 'application/json' or 'application/octet-stream'.",
+            )
+
         try:
-            return await self.service.retrieve_spectrum_by_filename(filename)
+            spectrum = await self.service.retrieve_spectrum_by_filename(filename, params)
 
         except SpectrumNotExistError as e:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+        # Responses are rendered directly, so the already constructed serializer is not validated again
+        if media_type == "application/octet-stream":
+            return Response(
+                pack_spectrum_arrays(spectrum.wave, spectrum.flux),
+                headers={"X-Spectrum-Points": str(len(spectrum.wave))},
+                media_type=media_type,
+            )
+
+        return ORJSONResponse(dict(spectrum))
@@ -0,0 +1,84 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from uuid import UUID
+
+from src.spectra.dto import SpectrumCreateDTO
+from src.spectra.entity import SpectrumCatalogEntity
+from src.spectra.params import SpectrumSearchParams
+
+
+class SpectrumCatalog(ABC):
+    """
+    Catalog interface for searching the header metadata of spectra.
+    """
+
+    @abstractmethod
+    async def upsert_batch(self, batch: list[SpectrumCreateDTO]) -> None:
+        """
+        Create or replace multiple spectrum records of the catalog, matched by their filenames.
+
+        Parameters:
+            batch (list[SpectrumCreateDTO]): List of DTOs containing all fields of the spectra.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_params(self, params: SpectrumSearchParams) -> list[SpectrumCatalogEntity]:
+        """
+        List spectrum records matching the search filters, with pagination.
+
+        Parameters:
+            params (SpectrumSearchParams): Search filters and pagination parameters.
+
+        Returns:
+            list[SpectrumCatalogEntity]: A list of spectrum entities ordered by `observed_at` and `filename`.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def total_by_params(self, params: SpectrumSearchParams) -> int:
+        """
+        Count the spectrum records matching the search filters.
+
+        Parameters:
+            params (SpectrumSearchParams): Search filters, pagination parameters are ignored.
+
+        Returns:
+            int: The number of matching spectra.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_positions_by_healpix_ranges(
+        self, ranges: list[tuple[int, int]]
+    ) -> list[tuple[UUID, str, float, float]]:
+        """
+        List the sky positions of spectrum records whose HEALPix index falls into any of the given ranges.
+
+        Parameters:
+            ranges (list[tuple[int, int]]): Half-open ranges of nested HEALPix indices.
+
+        Returns:
+            list[tuple[UUID, str, float, float]]: The ID, filename, right ascension and declination of each spectrum.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_by_spectrum_ids(self, spectrum_ids: list[UUID]) -> list[SpectrumCatalogEntity]:
+        """
+        List spectrum records by their IDs.
+
+        Parameters:
+            spectrum_ids (list[UUID]): The IDs of the spectra.
+
+        Returns:
+            list[SpectrumCatalogEntity]: A list of the existing spectrum entities, in the order of the IDs.
+        """
+
+        raise NotImplementedError
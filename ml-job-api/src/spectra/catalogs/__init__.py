@@ -0,0 +1,6 @@
+from src.spectra.catalogs.postgres import SpectrumPostgresCatalog
+
+
+__all__ = [
+    "SpectrumPostgresCatalog",
+]
@@ -0,0 +1,191 @@
+from uuid import UUID
+
+from sqlalchemy import (
+    Select,
+    func,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.spectra.catalog import SpectrumCatalog
+from src.spectra.dto import SpectrumCreateDTO
+from src.spectra.entity import SpectrumCatalogEntity
+from src.spectra.models import SpectrumPostgresModel
+from src.spectra.params import SpectrumSearchParams
+
+
+class SpectrumPostgresCatalog(SpectrumCatalog):
+    """
+    PostgreSQL-backed implementation of SpectrumCatalog using SQLAlchemy AsyncSession.
+    """
+
+    model = SpectrumPostgresModel
+
+    def __init__(self, postgres_async_session: AsyncSession) -> None:
+        """
+        Initialize the catalog with an async SQLAlchemy session.
+
+        Parameters:
+            postgres_async_session (AsyncSession): An AsyncSession bound to the PostgreSQL engine.
+        """
+
+        self.session = postgres_async_session
+
+    def _filter_by_params(self, query: Select, params: SpectrumSearchParams) -> Select:
+        """
+        Restrict a query to the spectrum records matching the search filters.
+
+        Every filter maps onto an indexed column, so the matching rows are found by index scans.
+
+        Parameters:
+            query (Select): The query over spectrum records.
+            params (SpectrumSearchParams): Search filters to apply.
+
+        Returns:
+            Select: The filtered query.
+        """
+
+        if params.type is not None:
+            query = query.where(params.type == self.model.type)
+
+        if params.subtype is not None:
+            query = query.where(params.subtype == self.model.subtype)
+
+        if params.dir_path is not None:
+            query = query.where(params.dir_path == self.model.dir_path)
+
+        if params.observed_after is not None:
+            query = query.where(self.model.observed_at >= params.observed_after)
+
+        if params.observed_before is not None:
+            query = query.where(self.model.observed_at < params.observed_before)
+
+        if params.sn_g_min is not None:
+            query = query.where(self.model.sn_g >= params.sn_g_min)
+
+        if params.sn_r_min is not None:
+            query = query.where(self.model.sn_r >= params.sn_r_min)
+
+        if params.sn_i_min is not None:
+            query = query.where(self.model.sn_i >= params.sn_i_min)
+
+        return query
+
+    async def upsert_batch(self, batch: list[SpectrumCreateDTO]) -> None:
+        """
+        Bulk-insert multiple spectrum records in one operation, replacing the records of known filenames.
+
+        Replaced records keep their ID, so re-ingesting a directory updates the catalog in place.
+
+        Parameters:
+            batch (list[SpectrumCreateDTO]): List of DTOs containing all fields of the spectra.
+        """
+
+        if not batch:
+            return
+
+        # Prepare and execute bulk upsert
+        batch_upsert_data = [dto.model_dump() for dto in batch]
+        query = insert(self.model)
+        query = query.on_conflict_do_update(
+            index_elements=[self.model.filename],
+            set_={
+                column.name: query.excluded[column.name]
+                for column in self.model.__table__.columns
+                if column.name not in ("spectrum_id", "filename")
+            },
+        )
+
+        await self.session.execute(query, batch_upsert_data)
+        await self.session.commit()
+
+    async def list_by_params(self, params: SpectrumSearchParams) -> list[SpectrumCatalogEntity]:
+        """
+        Retrieve a page of spectrum records matching the search filters.
+
+        Parameters:
+            params (SpectrumSearchParams): Search filters and pagination parameters.
+
+        Returns:
+            list[SpectrumCatalogEntity]: A list of spectrum entities for the requested page.
+        """
+
+        query = self._filter_by_params(select(self.model), params)
+        query = query.order_by(self.model.observed_at, self.model.filename).offset(params.offset).limit(params.limit)
+        result = await self.session.execute(query)
+        orms = result.scalars().all()
+
+        return [SpectrumCatalogEntity.model_validate(orm) for orm in orms]
+
+    async def total_by_params(self, params: SpectrumSearchParams) -> int:
+        """
+        Count the spectrum records matching the search filters.
+
+        Parameters:
+            params (SpectrumSearchParams): Search filters, pagination parameters are ignored.
+
+        Returns:
+            int: Count of matching spectra in the database.
+        """
+
+        query = self._filter_by_params(select(func.count(self.model.spectrum_id)), params)
+        result = await self.session.execute(query)
+        total = result.scalar()
+
+        if not total:
+            return 0
+
+        return total
+
+    async def list_positions_by_healpix_ranges(
+        self, ranges: list[tuple[int, int]]
+    ) -> list[tuple[UUID, str, float, float]]:
+        """
+        Retrieve the sky positions of spectrum records whose HEALPix index falls into any of the given ranges.
+
+        Every range maps onto a scan of the HEALPix index, so only the spectra near the searched
+        sky position are read, and only the columns needed to filter and order them are loaded,
+        without building any ORM object.
+
+        Parameters:
+            ranges (list[tuple[int, int]]): Half-open ranges of nested HEALPix indices.
+
+        Returns:
+            list[tuple[UUID, str, float, float]]: The ID, filename, right ascension and declination of each spectrum.
+        """
+
+        if not ranges:
+            return []
+
+        query = select(self.model.spectrum_id, self.model.filename, self.model.ra, self.model.dec).where(
+            or_(*(self.model.healpix.between(start, end - 1) for start, end in ranges))
+        )
+        result = await self.session.execute(query)
+
+        return list(result.tuples().all())
+
+    async def list_by_spectrum_ids(self, spectrum_ids: list[UUID]) -> list[SpectrumCatalogEntity]:
+        """
+        Retrieve spectrum records by their IDs in a single query.
+
+        Parameters:
+            spectrum_ids (list[UUID]): The IDs of the spectra.
+
+        Returns:
+            list[SpectrumCatalogEntity]: A list of the existing spectrum entities, in the order of the IDs.
+        """
+
+        if not spectrum_ids:
+            return []
+
+        query = select(self.model).where(self.model.spectrum_id.in_(spectrum_ids))
+        result = await self.session.execute(query)
+        orms = {orm.spectrum_id: orm for orm in result.scalars().all()}
+
+        return [
+            SpectrumCatalogEntity.model_validate(orms[spectrum_id])
+            for spectrum_id in spectrum_ids
+            if spectrum_id in orms
+        ]
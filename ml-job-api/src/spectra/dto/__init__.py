@@ -0,0 +1,10 @@
+from src.spectra.dto.batch import SpectrumBatchDTO
+from src.spectra.dto.create import SpectrumCreateDTO
+from src.spectra.dto.ingest import SpectrumIngestDTO
+
+
+__all__ = [
+    "SpectrumBatchDTO",
+    "SpectrumCreateDTO",
+    "SpectrumIngestDTO",
+]
@@ -0,0 +1,73 @@
+from typing import (
+    Annotated,
+    Self,
+)
+from uuid import UUID
+
+from pydantic import (
+    BaseModel,
+    Field,
+    StringConstraints,
+    model_validator,
+)
+
+from src.labellings.types import SpectrumSetType
+from src.spectra.resources import (
+    batch_resources,
+    spectrum_resources,
+)
+
+
+SpectrumFilename = Annotated[
+    str,
+    StringConstraints(
+        min_length=spectrum_resources["filename"]["MIN_LENGTH"],
+        max_length=spectrum_resources["filename"]["MAX_LENGTH"],
+        pattern=spectrum_resources["filename"]["PATTERN"],
+    ),
+]
+
+
+class SpectrumBatchDTO(BaseModel):
+    """
+    Data Transfer Object model for retrieving a batch of spectra,
+    either by their filenames or by the labellings of a job.
+    """
+
+    filenames: list[SpectrumFilename] | None = Field(
+        None,
+        min_length=batch_resources["filenames"]["MIN_LENGTH"],
+        max_length=batch_resources["filenames"]["MAX_LENGTH"],
+        description=batch_resources["filenames"]["DESCRIPTION"],
+        examples=batch_resources["filenames"]["EXAMPLES"],
+    )
+
+    job_id: UUID | None = Field(
+        None,
+        description=batch_resources["job_id"]["DESCRIPTION"],
+    )
+
+    spectrum_set: SpectrumSetType | None = Field(
+        None,
+        description=batch_resources["spectrum_set"]["DESCRIPTION"],
+    )
+
+    @model_validator(mode="after")
+    def check_source(self) -> Self:
+        """
+        Ensure the spectra are selected either by filenames or by a job, but not both.
+
+        Returns:
+            Self: The validated DTO.
+
+        Raises:
+            ValueError: If both or neither of `filenames` and `job_id` are given, or `spectrum_set` lacks `job_id`.
+        """
+
+        if (self.filenames is None) == (self.job_id is None):
+            raise ValueError("Exactly one of 'filenames' and 'job_id' must be given.")
+
+        if self.spectrum_set is not None and self.job_id is None:
+            raise ValueError("'spectrum_set' can only be given together with 'job_id'.")
+
+        return self
@@ -1,6 +1,8 @@
+from src.spectra.errors.invalid_batch import SpectrumInvalidBatchError
 from src.spectra.errors.not_exist import SpectrumNotExistError
 
 
 __all__ = [
+    "SpectrumInvalidBatchError",
     "SpectrumNotExistError",
 ]
@@ -0,0 +1,9 @@
+from src.common.errors import BaseError
+
+
+class SpectrumInvalidBatchError(BaseError):
+    """
+    Raised when a batch of spectra to ingest into the catalog contains an invalid spectrum payload.
+    """
+
+    message = "Spectrum invalid batch."
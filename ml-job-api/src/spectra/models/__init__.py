@@ -1,6 +1,6 @@
-# from src.spectra.models.postgres import SpectrumPostgresModel
-#
-#
-# __all__ = [
-#     "SpectrumPostgresModel",
-# ]
+from src.spectra.models.postgres import SpectrumPostgresModel
+
+
+__all__ = [
+    "SpectrumPostgresModel",
+]
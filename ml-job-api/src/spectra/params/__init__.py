@@ -0,0 +1,14 @@
+from src.spectra.params.cone import SpectrumConeParams
+from src.spectra.params.pool import SpectrumPoolParams
+from src.spectra.params.prediction import SpectrumPredictionParams
+from src.spectra.params.sample import SpectrumSampleParams
+from src.spectra.params.search import SpectrumSearchParams
+
+
+__all__ = [
+    "SpectrumConeParams",
+    "SpectrumPoolParams",
+    "SpectrumPredictionParams",
+    "SpectrumSampleParams",
+    "SpectrumSearchParams",
+]
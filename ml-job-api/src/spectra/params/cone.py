@@ -0,0 +1,54 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.spectra.resources import (
+    cone_resources,
+    list_resources,
+)
+
+
+class SpectrumConeParams(BaseModel):
+    """
+    Query parameters for searching catalogued spectra within a cone around a sky position.
+    """
+
+    ra: float = Field(
+        ...,
+        ge=cone_resources["ra"]["MIN_VALUE"],
+        le=cone_resources["ra"]["MAX_VALUE"],
+        description=cone_resources["ra"]["DESCRIPTION"],
+        examples=cone_resources["ra"]["EXAMPLES"],
+    )
+
+    dec: float = Field(
+        ...,
+        ge=cone_resources["dec"]["MIN_VALUE"],
+        le=cone_resources["dec"]["MAX_VALUE"],
+        description=cone_resources["dec"]["DESCRIPTION"],
+        examples=cone_resources["dec"]["EXAMPLES"],
+    )
+
+    radius: float = Field(
+        ...,
+        gt=cone_resources["radius"]["MIN_VALUE"],
+        le=cone_resources["radius"]["MAX_VALUE"],
+        description=cone_resources["radius"]["DESCRIPTION"],
+        examples=cone_resources["radius"]["EXAMPLES"],
+    )
+
+    offset: int = Field(
+        list_resources["offset"]["DEFAULT_VALUE"],
+        ge=list_resources["offset"]["MIN_VALUE"],
+        description=list_resources["offset"]["DESCRIPTION"],
+        examples=list_resources["offset"]["EXAMPLES"],
+    )
+
+    limit: int = Field(
+        list_resources["limit"]["DEFAULT_VALUE"],
+        ge=list_resources["limit"]["MIN_VALUE"],
+        le=list_resources["limit"]["MAX_VALUE"],
+        description=list_resources["limit"]["DESCRIPTION"],
+        examples=list_resources["limit"]["EXAMPLES"],
+    )
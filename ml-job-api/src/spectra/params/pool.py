@@ -0,0 +1,52 @@
+from typing import Self
+
+from pydantic import (
+    BaseModel,
+    Field,
+    model_validator,
+)
+
+from src.spectra.resources import (
+    pool_resources,
+    spectrum_resources,
+)
+
+
+class SpectrumPoolParams(BaseModel):
+    """
+    Query parameters for selecting a preprocessed spectrum of the HDF5 pool of a job,
+    either by its filename or by its row index.
+    """
+
+    filename: str | None = Field(
+        None,
+        min_length=spectrum_resources["filename"]["MIN_LENGTH"],
+        max_length=spectrum_resources["filename"]["MAX_LENGTH"],
+        pattern=spectrum_resources["filename"]["PATTERN"],
+        description=pool_resources["filename"]["DESCRIPTION"],
+        examples=pool_resources["filename"]["EXAMPLES"],
+    )
+
+    index: int | None = Field(
+        None,
+        ge=pool_resources["index"]["MIN_VALUE"],
+        description=pool_resources["index"]["DESCRIPTION"],
+        examples=pool_resources["index"]["EXAMPLES"],
+    )
+
+    @model_validator(mode="after")
+    def check_source(self) -> Self:
+        """
+        Ensure the spectrum is selected either by filename or by row index, but not both.
+
+        Returns:
+            Self: The validated parameters.
+
+        Raises:
+            ValueError: If both or neither of `filename` and `index` are given.
+        """
+
+        if (self.filename is None) == (self.index is None):
+            raise ValueError("Exactly one of 'filename' and 'index' must be given.")
+
+        return self
@@ -0,0 +1,92 @@
+from typing import Self
+
+from pydantic import (
+    BaseModel,
+    Field,
+    model_validator,
+)
+
+from src.common.utils import decode_cursor
+from src.spectra.resources import prediction_resources
+
+
+class SpectrumPredictionParams(BaseModel):
+    """
+    Query parameters for filtering, ordering and paginating the predictions of an active learning job.
+    """
+
+    label: str | None = Field(
+        None,
+        min_length=prediction_resources["label"]["MIN_LENGTH"],
+        max_length=prediction_resources["label"]["MAX_LENGTH"],
+        description=prediction_resources["label"]["DESCRIPTION"],
+        examples=prediction_resources["label"]["EXAMPLES"],
+    )
+
+    entropy_min: float | None = Field(
+        None,
+        ge=prediction_resources["entropy_min"]["MIN_VALUE"],
+        description=prediction_resources["entropy_min"]["DESCRIPTION"],
+        examples=prediction_resources["entropy_min"]["EXAMPLES"],
+    )
+
+    entropy_max: float | None = Field(
+        None,
+        ge=prediction_resources["entropy_max"]["MIN_VALUE"],
+        description=prediction_resources["entropy_max"]["DESCRIPTION"],
+        examples=prediction_resources["entropy_max"]["EXAMPLES"],
+    )
+
+    descending: bool = Field(
+        prediction_resources["descending"]["DEFAULT_VALUE"],
+        description=prediction_resources["descending"]["DESCRIPTION"],
+        examples=prediction_resources["descending"]["EXAMPLES"],
+    )
+
+    limit: int = Field(
+        prediction_resources["limit"]["DEFAULT_VALUE"],
+        ge=prediction_resources["limit"]["MIN_VALUE"],
+        le=prediction_resources["limit"]["MAX_VALUE"],
+        description=prediction_resources["limit"]["DESCRIPTION"],
+        examples=prediction_resources["limit"]["EXAMPLES"],
+    )
+
+    cursor: str | None = Field(
+        None,
+        min_length=prediction_resources["cursor"]["MIN_LENGTH"],
+        max_length=prediction_resources["cursor"]["MAX_LENGTH"],
+        description=prediction_resources["cursor"]["DESCRIPTION"],
+        examples=prediction_resources["cursor"]["EXAMPLES"],
+    )
+
+    @model_validator(mode="after")
+    def check_bounds_and_cursor(self) -> Self:
+        """
+        Ensure the entropy range is not empty, and the cursor is well-formed and was created for the same ordering.
+
+        Returns:
+            Self: The validated parameters.
+
+        Raises:
+            ValueError:
+                If `entropy_min` exceeds `entropy_max`, or the cursor is malformed
+                or was created for a different ordering.
+        """
+
+        if self.entropy_min is not None and self.entropy_max is not None and self.entropy_min > self.entropy_max:
+            raise ValueError("'entropy_min' must not exceed 'entropy_max'.")
+
+        if self.cursor is None:
+            return self
+
+        position = decode_cursor(self.cursor)
+
+        if (
+            len(position) != 3
+            or position[0] != self.descending
+            or not isinstance(position[1], (int, float))
+            or not isinstance(position[2], int)
+        ):
+            raise ValueError("'cursor' must come from a listing with the same 'descending'.")
+
+        return self
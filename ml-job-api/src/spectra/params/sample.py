@@ -0,0 +1,60 @@
+from typing import Self
+
+from pydantic import (
+    BaseModel,
+    Field,
+    model_validator,
+)
+
+from src.spectra.resources import sample_resources
+from src.spectra.types import DownsamplingType
+
+
+class SpectrumSampleParams(BaseModel):
+    """
+    Query parameters for windowing and downsampling the data arrays of a spectrum.
+    """
+
+    max_points: int | None = Field(
+        None,
+        ge=sample_resources["max_points"]["MIN_VALUE"],
+        le=sample_resources["max_points"]["MAX_VALUE"],
+        description=sample_resources["max_points"]["DESCRIPTION"],
+        examples=sample_resources["max_points"]["EXAMPLES"],
+    )
+
+    wave_min: float | None = Field(
+        None,
+        ge=sample_resources["wave_min"]["MIN_VALUE"],
+        description=sample_resources["wave_min"]["DESCRIPTION"],
+        examples=sample_resources["wave_min"]["EXAMPLES"],
+    )
+
+    wave_max: float | None = Field(
+        None,
+        ge=sample_resources["wave_max"]["MIN_VALUE"],
+        description=sample_resources["wave_max"]["DESCRIPTION"],
+        examples=sample_resources["wave_max"]["EXAMPLES"],
+    )
+
+    downsampling: DownsamplingType = Field(
+        DownsamplingType.LTTB,
+        description=sample_resources["downsampling"]["DESCRIPTION"],
+    )
+
+    @model_validator(mode="after")
+    def check_wave_window(self) -> Self:
+        """
+        Ensure the wavelength window is not inverted.
+
+        Returns:
+            Self: The validated parameters.
+
+        Raises:
+            ValueError: If `wave_min` is greater than `wave_max`.
+        """
+
+        if self.wave_min is not None and self.wave_max is not None and self.wave_min > self.wave_max:
+            raise ValueError("'wave_min' must not be greater than 'wave_max'.")
+
+        return self
@@ -0,0 +1,81 @@
+from datetime import datetime
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.spectra.resources import list_resources
+from src.spectra.types import SpectrumType
+
+
+class SpectrumSearchParams(BaseModel):
+    """
+    Query parameters for filtering and paginating catalogued spectra.
+    """
+
+    offset: int = Field(
+        list_resources["offset"]["DEFAULT_VALUE"],
+        ge=list_resources["offset"]["MIN_VALUE"],
+        description=list_resources["offset"]["DESCRIPTION"],
+        examples=list_resources["offset"]["EXAMPLES"],
+    )
+
+    limit: int = Field(
+        list_resources["limit"]["DEFAULT_VALUE"],
+        ge=list_resources["limit"]["MIN_VALUE"],
+        le=list_resources["limit"]["MAX_VALUE"],
+        description=list_resources["limit"]["DESCRIPTION"],
+        examples=list_resources["limit"]["EXAMPLES"],
+    )
+
+    type: SpectrumType | None = Field(
+        None,
+        description=list_resources["type"]["DESCRIPTION"],
+    )
+
+    subtype: str | None = Field(
+        None,
+        min_length=list_resources["subtype"]["MIN_LENGTH"],
+        max_length=list_resources["subtype"]["MAX_LENGTH"],
+        description=list_resources["subtype"]["DESCRIPTION"],
+        examples=list_resources["subtype"]["EXAMPLES"],
+    )
+
+    dir_path: str | None = Field(
+        None,
+        min_length=list_resources["dir_path"]["MIN_LENGTH"],
+        max_length=list_resources["dir_path"]["MAX_LENGTH"],
+        description=list_resources["dir_path"]["DESCRIPTION"],
+        examples=list_resources["dir_path"]["EXAMPLES"],
+    )
+
+    observed_after: datetime | None = Field(
+        None,
+        description=list_resources["observed_after"]["DESCRIPTION"],
+        examples=list_resources["observed_after"]["EXAMPLES"],
+    )
+
+    observed_before: datetime | None = Field(
+        None,
+        description=list_resources["observed_before"]["DESCRIPTION"],
+        examples=list_resources["observed_before"]["EXAMPLES"],
+    )
+
+    sn_g_min: float | None = Field(
+        None,
+        description=list_resources["sn_g_min"]["DESCRIPTION"],
+        examples=list_resources["sn_g_min"]["EXAMPLES"],
+    )
+
+    sn_r_min: float | None = Field(
+        None,
+        description=list_resources["sn_r_min"]["DESCRIPTION"],
+        examples=list_resources["sn_r_min"]["EXAMPLES"],
+    )
+
+    sn_i_min: float | None = Field(
+        None,
+        description=list_resources["sn_i_min"]["DESCRIPTION"],
+        examples=list_resources["sn_i_min"]["EXAMPLES"],
+    )
@@ -0,0 +1,65 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+from src.spectra.entity import (
+    SpectrumPoolEntity,
+    SpectrumPredictionEntity,
+)
+from src.spectra.params import SpectrumPredictionParams
+
+
+class SpectrumPool(ABC):
+    """
+    Pool interface for reading preprocessed spectra produced by jobs.
+    """
+
+    @abstractmethod
+    async def get_by_dir_path_and_filename(self, dir_path: str, filename: str) -> SpectrumPoolEntity:
+        """
+        Retrieve a preprocessed spectrum of the pool of a job by its FITS filename.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job.
+            filename (str): The FITS filename of the spectrum to retrieve.
+
+        Returns:
+            SpectrumPoolEntity: The preprocessed spectrum with its row index in the pool.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_dir_path_and_index(self, dir_path: str, index: int) -> SpectrumPoolEntity:
+        """
+        Retrieve a preprocessed spectrum of the pool of a job by its row index.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job.
+            index (int): The row index of the spectrum to retrieve.
+
+        Returns:
+            SpectrumPoolEntity: The preprocessed spectrum with its FITS filename.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_predictions_by_dir_path_and_params(
+        self, dir_path: str, params: SpectrumPredictionParams
+    ) -> tuple[list[SpectrumPredictionEntity], int, str | None]:
+        """
+        List a page of the predictions of an active learning job, filtered and ordered by entropy.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job.
+            params (SpectrumPredictionParams): Filters, ordering and cursor of the page.
+
+        Returns:
+            tuple[list[SpectrumPredictionEntity], int, str | None]:
+                Predictions of the page, total number of predictions matching the filters,
+                and the cursor of the following page if there is one.
+        """
+
+        raise NotImplementedError
@@ -0,0 +1,6 @@
+from src.spectra.pools.hdf5 import SpectrumHDF5Pool
+
+
+__all__ = [
+    "SpectrumHDF5Pool",
+]
@@ -0,0 +1,364 @@
+import asyncio
+import bisect
+import heapq
+import itertools
+import os
+import stat
+from concurrent.futures import Executor
+from typing import Any
+
+import h5py
+
+from src.common.caches import HandleCache
+from src.common.utils import (
+    decode_cursor,
+    encode_cursor,
+    get_norm_path,
+)
+from src.spectra.entity import (
+    SpectrumPoolEntity,
+    SpectrumPredictionEntity,
+)
+from src.spectra.errors import SpectrumNotExistError
+from src.spectra.params import SpectrumPredictionParams
+from src.spectra.pool import SpectrumPool
+from src.spectra.utils import (
+    open_pool_file,
+    open_predictions_file,
+)
+
+
+class SpectrumHDF5Pool(SpectrumPool):
+    """
+    HDF5 implementation of SpectrumPool reading the `result.h5` files of job directories.
+
+    Pool files stay open in a shared handle cache together with the row index of every filename
+    and the common wavelength grid, so retrieving a spectrum reads a single row of the flux dataset.
+    Open files are validated against the modification time, inode and size of the file, so a
+    rewritten pool is opened again.
+
+    Predictions are read from the `predictions.h5` sidecar, whose rows are sorted by predicted class,
+    then by entropy and pool row index. Filters and cursors are resolved by binary searches within
+    the segments of the classes, so a page reads only the rows it may return.
+    """
+
+    result_filename = "result.h5"
+    predictions_filename = "predictions.h5"
+
+    def __init__(
+        self,
+        lfs_files_dir_path: str,
+        handle_cache: HandleCache,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Initialize the pool with the base path to files storage.
+
+        Parameters:
+            lfs_files_dir_path (str): Absolute path to the root of the shared files directory.
+            handle_cache (HandleCache): Cache of open pool files.
+            executor (Executor | None):
+                Optional executor reading pool files, the default executor of the event loop if omitted.
+        """
+
+        self.shared_dir_path = lfs_files_dir_path
+        self.handle_cache = handle_cache
+        self.executor = executor
+
+    def _read_row(
+        self, abs_file_path: str, version: tuple[int, int, int], filename: str | None, index: int | None
+    ) -> tuple[str, int, list[float], list[float]] | None:
+        """
+        Read a row of a pool file, selected either by its filename or by its index.
+
+        Parameters:
+            abs_file_path (str): Absolute path of the pool file.
+            version (tuple[int, int, int]): Modification time, inode and size of the file.
+            filename (str | None): The FITS filename of the row, if selected by filename.
+            index (int | None): The index of the row, if selected by index.
+
+        Returns:
+            tuple[str, int, list[float], list[float]] | None:
+                The filename, index, wavelength grid and flux array of the row, or None if there is no such row.
+        """
+
+        with self.handle_cache.use(abs_file_path, version, lambda: open_pool_file(abs_file_path)) as pool_file:
+            h5f_reader, filename_index, wave = pool_file
+            fluxes = h5f_reader["fluxes"]
+
+            if filename is not None:
+                index = filename_index.get(filename)
+
+                if index is None:
+                    return None
+
+            elif index < len(fluxes):
+                filename = h5f_reader["filenames"].asstr()[index]
+
+            else:
+                return None
+
+            return filename, index, wave, fluxes[index].tolist()
+
+    def _get_file_version(self, dir_path: str, filename: str) -> tuple[str, tuple[int, int, int]]:
+        """
+        Locate a file of a job directory and compute the version its cached handle is validated against.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job.
+            filename (str): Name of the file in the job directory.
+
+        Returns:
+            tuple[str, tuple[int, int, int]]: Absolute path of the file, and its modification time, inode and size.
+
+        Raises:
+            SpectrumNotExistError: If the file does not exist or is not a regular file.
+        """
+
+        rel_file_path = get_norm_path(dir_path, child_name=filename)
+        abs_file_path = get_norm_path(dir_path, prefix=self.shared_dir_path, child_name=filename)
+
+        # Ensure pool file exists
+        try:
+            file_stat = os.stat(abs_file_path)
+
+        except OSError:
+            raise SpectrumNotExistError(f"Cannot get spectra pool from file='{rel_file_path}'.")
+
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise SpectrumNotExistError(f"Cannot get spectra pool from file='{rel_file_path}'.")
+
+        return abs_file_path, (file_stat.st_mtime_ns, file_stat.st_ino, file_stat.st_size)
+
+    @staticmethod
+    def _bound_segment(
+        entropies: h5py.Dataset,
+        indexes: h5py.Dataset,
+        start: int,
+        stop: int,
+        params: SpectrumPredictionParams,
+        position: list[Any] | None,
+    ) -> tuple[int, int, int]:
+        """
+        Narrow the rows of a class segment to the entropy range of the filters and to the rows following a cursor.
+
+        Rows of a segment are sorted by entropy and pool row index, so the bounds are found by binary searches
+        reading a few values of the datasets.
+
+        Parameters:
+            entropies (h5py.Dataset): Entropies of the predictions file.
+            indexes (h5py.Dataset): Pool row indices of the predictions file.
+            start (int): First row of the segment.
+            stop (int): Row following the last row of the segment.
+            params (SpectrumPredictionParams): Filters and ordering of the page.
+            position (list[Any] | None): Ordering, entropy and pool row index of the cursor row, if any.
+
+        Returns:
+            tuple[int, int, int]:
+                Number of rows matching the filters, and the first row and the row following the last one
+                matching them after the cursor.
+        """
+
+        if params.entropy_min is not None:
+            start = bisect.bisect_left(entropies, params.entropy_min, start, stop)
+
+        if params.entropy_max is not None:
+            stop = bisect.bisect_right(entropies, params.entropy_max, start, stop)
+
+        count = stop - start
+
+        if position is not None:
+            _, entropy, index = position
+
+            # Rows of the entropy of the cursor row are ordered by their pool row index
+            equal_start = bisect.bisect_left(entropies, entropy, start, stop)
+            equal_stop = bisect.bisect_right(entropies, entropy, equal_start, stop)
+
+            if params.descending:
+                stop = bisect.bisect_left(indexes, index, equal_start, equal_stop)
+
+            else:
+                start = bisect.bisect_right(indexes, index, equal_start, equal_stop)
+
+        return count, start, max(start, stop)
+
+    def _read_predictions(
+        self, abs_file_path: str, version: tuple[int, int, int], params: SpectrumPredictionParams
+    ) -> tuple[list[tuple[float, int, str, str, bool | None]], int, bool]:
+        """
+        Read a page of predictions of a predictions file.
+
+        At most `limit` rows are read from each selected class segment, from the end matching the ordering,
+        and merged by entropy and pool row index.
+
+        Parameters:
+            abs_file_path (str): Absolute path of the predictions file.
+            version (tuple[int, int, int]): Modification time, inode and size of the file.
+            params (SpectrumPredictionParams): Filters, ordering and cursor of the page.
+
+        Returns:
+            tuple[list[tuple[float, int, str, str, bool | None]], int, bool]:
+                The entropy, pool row index, filename, label and candidate flag of the rows of the page,
+                the number of rows matching the filters, and whether rows follow the page.
+        """
+
+        position = decode_cursor(params.cursor) if params.cursor is not None else None
+
+        with self.handle_cache.use(abs_file_path, version, lambda: open_predictions_file(abs_file_path)) as pool_file:
+            h5f_reader, classes, label_offsets = pool_file
+            entropies, indexes = h5f_reader["entropies"], h5f_reader["indexes"]
+            candidates = h5f_reader.get("candidates")
+
+            labels = [params.label] if params.label is not None else classes
+            total, remaining, segments = 0, 0, []
+
+            for label in labels:
+                if label not in classes:
+                    continue
+
+                label_index = classes.index(label)
+                count, start, stop = self._bound_segment(
+                    entropies,
+                    indexes,
+                    label_offsets[label_index],
+                    label_offsets[label_index + 1],
+                    params,
+                    position,
+                )
+                total += count
+                remaining += stop - start
+
+                if params.descending:
+                    start = max(start, stop - params.limit)
+
+                else:
+                    stop = min(stop, start + params.limit)
+
+                if start == stop:
+                    continue
+
+                rows = list(
+                    zip(
+                        entropies[start:stop].tolist(),
+                        indexes[start:stop].tolist(),
+                        h5f_reader["filenames"].asstr()[start:stop].tolist(),
+                        [label] * (stop - start),
+                        candidates[start:stop].tolist() if candidates is not None else [None] * (stop - start),
+                    )
+                )
+                segments.append(rows[::-1] if params.descending else rows)
+
+        # Segments are already ordered, so merging them compares only the rows read
+        merged_rows = heapq.merge(*segments, key=lambda row: row[:2], reverse=params.descending)
+        page_rows = list(itertools.islice(merged_rows, params.limit))
+
+        return page_rows, total, remaining > len(page_rows)
+
+    async def _get_by_dir_path(
+        self, dir_path: str, filename: str | None = None, index: int | None = None
+    ) -> SpectrumPoolEntity:
+        """
+        Retrieve a preprocessed spectrum of the pool of a job, offloading the reading to the configured executor.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job.
+            filename (str | None): The FITS filename of the spectrum, if selected by filename.
+            index (int | None): The row index of the spectrum, if selected by index.
+
+        Returns:
+            SpectrumPoolEntity: The preprocessed spectrum.
+
+        Raises:
+            SpectrumNotExistError: If the pool file or the selected row does not exist.
+        """
+
+        abs_file_path, version = self._get_file_version(dir_path, self.result_filename)
+
+        loop = asyncio.get_running_loop()
+        row = await loop.run_in_executor(self.executor, self._read_row, abs_file_path, version, filename, index)
+
+        if row is None:
+            selector = f"filename='{filename}'" if filename is not None else f"index={index}"
+
+            raise SpectrumNotExistError(
+                f"Cannot get spectrum with {selector} from pool file="
+                f"'{get_norm_path(dir_path, child_name=self.result_filename)}'."
+            )
+
+        filename, index, wave, flux = row
+
+        return SpectrumPoolEntity(filename=filename, index=index, wave=wave, flux=flux)
+
+    async def get_by_dir_path_and_filename(self, dir_path: str, filename: str) -> SpectrumPoolEntity:
+        """
+        Retrieve a preprocessed spectrum of the pool of a job by its FITS filename, through the filename index.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job.
+            filename (str): The FITS filename of the spectrum to retrieve.
+
+        Returns:
+            SpectrumPoolEntity: The preprocessed spectrum with its row index in the pool.
+
+        Raises:
+            SpectrumNotExistError: If the pool file does not exist or does not contain the spectrum.
+        """
+
+        return await self._get_by_dir_path(dir_path, filename=filename)
+
+    async def get_by_dir_path_and_index(self, dir_path: str, index: int) -> SpectrumPoolEntity:
+        """
+        Retrieve a preprocessed spectrum of the pool of a job by its row index.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job.
+            index (int): The row index of the spectrum to retrieve.
+
+        Returns:
+            SpectrumPoolEntity: The preprocessed spectrum with its FITS filename.
+
+        Raises:
+            SpectrumNotExistError: If the pool file does not exist or the index is out of its range.
+        """
+
+        return await self._get_by_dir_path(dir_path, index=index)
+
+    async def list_predictions_by_dir_path_and_params(
+        self, dir_path: str, params: SpectrumPredictionParams
+    ) -> tuple[list[SpectrumPredictionEntity], int, str | None]:
+        """
+        List a page of the predictions of an active learning job from its predictions file,
+        offloading the reading to the configured executor.
+
+        Parameters:
+            dir_path (str): Storage directory path of the job.
+            params (SpectrumPredictionParams): Filters, ordering and cursor of the page.
+
+        Returns:
+            tuple[list[SpectrumPredictionEntity], int, str | None]:
+                Predictions of the page, total number of predictions matching the filters,
+                and the cursor of the following page if there is one.
+
+        Raises:
+            SpectrumNotExistError: If the predictions file does not exist.
+        """
+
+        abs_file_path, version = self._get_file_version(dir_path, self.predictions_filename)
+
+        loop = asyncio.get_running_loop()
+        page_rows, total, has_next = await loop.run_in_executor(
+            self.executor, self._read_predictions, abs_file_path, version, params
+        )
+
+        entities = [
+            SpectrumPredictionEntity(filename=filename, index=index, label=label, entropy=entropy, candidate=candidate)
+            for entropy, index, filename, label, candidate in page_rows
+        ]
+
+        next_cursor = None
+
+        if has_next:
+            last_entity = entities[-1]
+            next_cursor = encode_cursor([params.descending, last_entity.entropy, last_entity.index])
+
+        return entities, total, next_cursor
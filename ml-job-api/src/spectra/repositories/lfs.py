@@ -1,6 +1,13 @@
 import asyncio
 import os
-
+import stat
+from concurrent.futures import Executor
+from typing import Any
+
+from src.common.caches import (
+    JSONDiskCache,
+    LRUCache,
+)
 from src.common.utils import get_norm_path
 from src.spectra.entity import SpectrumEntity
 from src.spectra.errors import SpectrumNotExistError
@@ -11,17 +18,40 @@ from src.spectra.utils import read_file
 class SpectrumLFSRepository(SpectrumRepository):
     """
     Local filesystem implementation of SpectrumRepository.
+
+    Parsed spectra are optionally cached in memory and on disk. Cached spectra are keyed by
+    their file path and validated against the modification time, inode and size of the file,
+    so a replaced or modified file is parsed again.
     """
 
-    def __init__(self, lfs_spectra_dir_path: str) -> None:
+    # Approximate size in bytes of a float stored in a list: the float object and the list slot
+    float_size = 32
+
+    # Approximate size in bytes of the header metadata of a spectrum
+    header_size = 2048
+
+    def __init__(
+        self,
+        lfs_spectra_dir_path: str,
+        memory_cache: LRUCache | None = None,
+        disk_cache: JSONDiskCache | None = None,
+        executor: Executor | None = None,
+    ) -> None:
         """
         Initialize the repository with the base path to spectra storage.
 
         Parameters:
             lfs_spectra_dir_path (str): Absolute path to the root of the shared spectra directory.
+            memory_cache (LRUCache | None): Optional in-process cache of parsed spectrum entities.
+            disk_cache (JSONDiskCache | None): Optional on-disk cache of parsed spectrum data.
+            executor (Executor | None):
+                Optional executor reading and parsing spectrum files, the default executor of the event loop if omitted.
         """
 
         self.shared_dir_path = lfs_spectra_dir_path
+        self.memory_cache = memory_cache
+        self.disk_cache = disk_cache
+        self.executor = executor
 
     @staticmethod
     def _get_dir_path(filename: str) -> str:
@@ -45,13 +75,39 @@ class SpectrumLFSRepository(SpectrumRepository):
 
         return dir_path
 
+    def _read_file(self, file_path: str, version: list[int]) -> dict[str, Any]:
+        """
+        Read and parse a spectrum file, using the on-disk cache if configured.
+
+        Parameters:
+            file_path (str): Absolute path of the FITS file.
+            version (list[int]): Modification time, inode and size of the file.
+
+        Returns:
+            dict[str, Any]: A dictionary mapping metadata and data arrays extracted from the file.
+        """
+
+        if self.disk_cache:
+            spectrum_file_data = self.disk_cache.get(file_path, version)
+
+            if spectrum_file_data is not None:
+                return spectrum_file_data
+
+        spectrum_file_data = read_file(file_path)
+
+        if self.disk_cache:
+            self.disk_cache.set(file_path, version, spectrum_file_data)
+
+        return spectrum_file_data
+
     async def get_by_filename(self, filename: str) -> SpectrumEntity:
         """
         Retrieve and parse a spectrum entity by its FITS filename from the LFS.
 
         Builds the absolute file path under the shared directory, checks
-        for existence and file-type, then offloads the FITS reading and
-        parsing to a background thread.
+        for existence and file-type, then returns the cached entity if it
+        is still valid, or offloads the FITS reading and parsing to the
+        configured executor and caches the result.
 
         Parameters:
             filename (str): The FITS filename to retrieve, following the LAMOST naming convention.
@@ -69,9 +125,42 @@ class SpectrumLFSRepository(SpectrumRepository):
         abs_file_path = get_norm_path(rel_parent_dir_path, prefix=self.shared_dir_path, child_name=filename)
 
         # Ensure file exists
-        if not os.path.exists(abs_file_path) or not os.path.isfile(abs_file_path):
+        try:
+            file_stat = os.stat(abs_file_path)
+
+        except OSError:
+            raise SpectrumNotExistError(f"Cannot get spectrum from file='{rel_file_path}'.")
+
+        if not stat.S_ISREG(file_stat.st_mode):
             raise SpectrumNotExistError(f"Cannot get spectrum from file='{rel_file_path}'.")
 
-        spectrum_file_data = await asyncio.to_thread(read_file, abs_file_path)
+        version = [file_stat.st_mtime_ns, file_stat.st_ino, file_stat.st_size]
+
+        if self.memory_cache:
+            entity = self.memory_cache.get(abs_file_path, tuple(version))
+
+            if entity is not None:
+                return entity
+
+        loop = asyncio.get_running_loop()
+        spectrum_file_data = await loop.run_in_executor(self.executor, self._read_file, abs_file_path, version)
+        entity = SpectrumEntity.model_validate(spectrum_file_data)
+
+        if self.memory_cache:
+            size = self.header_size + self.float_size * (len(entity.wave) + len(entity.flux))
+            self.memory_cache.set(abs_file_path, tuple(version), entity, size)
+
+        return entity
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        Get the usage statistics of the in-process cache of parsed spectra.
+
+        Returns:
+            dict[str, int]: Cache statistics, all zero if the cache is not configured.
+        """
+
+        if not self.memory_cache:
+            return dict(hits=0, misses=0, evictions=0, entries=0, size=0, max_size=0)
 
-        return SpectrumEntity.model_validate(spectrum_file_data)
+        return self.memory_cache.stats()
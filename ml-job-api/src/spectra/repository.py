@@ -26,3 +26,15 @@ class SpectrumRepository(ABC):
         """
 
         raise NotImplementedError
+
+    @abstractmethod
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        Get the usage statistics of the cache of parsed spectra.
+
+        Returns:
+            dict[str, int]:
+                Numbers of hits, misses, evictions and entries, and current and maximum size in bytes of the cache.
+        """
+
+        raise NotImplementedError
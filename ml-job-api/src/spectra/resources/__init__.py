@@ -1,8 +1,24 @@
 from src.spectra.resources.api import rest_resources
-from src.spectra.resources.entity import spectrum_resources
+from src.spectra.resources.entity import (
+    batch_resources,
+    cache_resources,
+    cone_resources,
+    list_resources,
+    pool_resources,
+    prediction_resources,
+    sample_resources,
+    spectrum_resources,
+)
 
 
 __all__ = [
+    "batch_resources",
+    "cache_resources",
+    "cone_resources",
+    "list_resources",
+    "pool_resources",
+    "prediction_resources",
     "rest_resources",
+    "sample_resources",
     "spectrum_resources",
 ]
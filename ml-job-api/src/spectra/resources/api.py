@@ -8,12 +8,99 @@ rest_resources = {
     "retrieve": {
         "HTTP_200": "Spectrum retrieved successfully",
         "HTTP_404": "Requested spectrum not found",
+        "HTTP_406": "Requested spectrum representation not available",
         "SUMMARY": "Retrieve a spectrum",
         "DESCRIPTION": (
             "Retrieves and parses the FITS spectrum identified by path parameter `filename`, "
-            "and returns its header metadata and data arrays. "
-            "Possible errors: 404 if the spectrum is missing, 422 for invalid inputs, "
-            "500 for backend or parsing failures."
+            "and returns its header metadata and data arrays. Parsed spectra are cached until their file changes. "
+            "The data arrays can be limited to the wavelength window of query parameters `wave_min` and `wave_max`, "
+            "and reduced to at most query parameter `max_points` points with the shape-preserving "
+            "`downsampling` algorithm, LTTB by default. "
+            "With `Accept: application/octet-stream`, only the data arrays are returned as little-endian float32 "
+            "values, the wavelength array followed by the flux array of the length in header `X-Spectrum-Points`. "
+            "Possible errors: 404 if the spectrum is missing, 406 for unsupported `Accept` media types, "
+            "422 for invalid inputs, 500 for backend or parsing failures."
+        ),
+    },
+    "cache": {
+        "HTTP_200": "Spectrum cache statistics retrieved successfully",
+        "SUMMARY": "Retrieve spectrum cache statistics",
+        "DESCRIPTION": (
+            "Retrieves the hit, miss and eviction counts and the current size of the in-process cache "
+            "of parsed spectra of the serving API worker. "
+            "Possible errors: 500 for retrieval failures."
+        ),
+    },
+    "retrieve_batch": {
+        "HTTP_200": "Spectra batch streamed as newline-delimited JSON",
+        "SUMMARY": "Retrieve a batch of spectra",
+        "DESCRIPTION": (
+            "Retrieves the FITS spectra listed in body field `filenames`, or the labelled spectra of the job "
+            "identified by body field `job_id`, optionally limited to body field `spectrum_set`. "
+            "Spectra are read concurrently and streamed as newline-delimited JSON in completion order, "
+            "one line per spectrum with its `filename` and either the `spectrum` or the `error` it failed with, "
+            "so missing or corrupt files do not fail the whole batch. "
+            "Possible errors: 422 for invalid inputs, 500 for backend failures."
+        ),
+    },
+    "ingest_batch_stream": {
+        "HTTP_204": "Spectra batch ingested into the catalog successfully",
+        "HTTP_400": "Some spectrum of the batch is invalid",
+        "SUMMARY": "Ingest a batch of spectra into the catalog",
+        "DESCRIPTION": (
+            "Creates or replaces the catalog records of the spectra streamed in the request body "
+            "as newline-delimited JSON, one spectrum header payload per line, matched by their `filename`, "
+            "in one bulk operation. Used by the Catalog Ingestion job to publish scanned FITS headers. "
+            "Possible errors: 400 for invalid lines, 422 for invalid inputs, 500 for backend failures."
+        ),
+    },
+    "search": {
+        "HTTP_200": "Catalogued spectra listed successfully",
+        "SUMMARY": "Search the spectra catalog",
+        "DESCRIPTION": (
+            "Lists the header metadata of the catalogued spectra matching the query filters: "
+            "`type`, `subtype`, `dir_path`, the `observed_after` and `observed_before` observation window, "
+            "and the minimum signal-to-noise ratios `sn_g_min`, `sn_r_min` and `sn_i_min`, "
+            "ordered by observation datetime and paginated by `offset` and `limit`, with the total match count. "
+            "Possible errors: 422 for invalid inputs, 500 for backend failures."
+        ),
+    },
+    "search_cone": {
+        "HTTP_200": "Catalogued spectra within the cone listed successfully",
+        "SUMMARY": "Search the spectra catalog by sky position",
+        "DESCRIPTION": (
+            "Lists the header metadata of the catalogued spectra within `radius` arcminutes of the sky position "
+            "`ra`, `dec` in decimal degrees, with the angular `distance` of every spectrum, ordered from the nearest "
+            "one and paginated by `offset` and `limit`, with the total match count. "
+            "Possible errors: 422 for invalid inputs, 500 for backend failures."
+        ),
+    },
+    "retrieve_pool": {
+        "HTTP_200": "Preprocessed spectrum retrieved successfully",
+        "HTTP_404": "Requested job, pool or preprocessed spectrum not found",
+        "SUMMARY": "Retrieve a preprocessed spectrum of a job",
+        "DESCRIPTION": (
+            "Retrieves a single interpolated and scaled spectrum from the HDF5 pool `result.h5` produced by the job "
+            "identified by path parameter `job_id`, selected either by query parameter `filename` through the "
+            "filename index of the pool or by its row `index`, without parsing FITS files. "
+            "Pool files are kept open with their filename index until they change. "
+            "Possible errors: 404 if the job, its pool or the spectrum is missing, 422 for invalid inputs, "
+            "500 for backend or reading failures."
+        ),
+    },
+    "retrieve_predictions": {
+        "HTTP_200": "Predictions of the job listed successfully",
+        "HTTP_404": "Requested job or its predictions not found",
+        "SUMMARY": "List the predictions of an active learning job",
+        "DESCRIPTION": (
+            "Lists the predicted `label` and `entropy` of the spectra of the pool of the active learning job "
+            "identified by path parameter `job_id`, with their pool row `index` and `candidate` flag, "
+            "read from the `predictions.h5` file sorted by the job. Predictions can be filtered by query parameters "
+            "`label`, `entropy_min` and `entropy_max`, and are ordered by entropy, the most uncertain first "
+            "unless `descending` is false. Pages of at most `limit` predictions are followed with the returned "
+            "`next_cursor` passed as query parameter `cursor`, and only the rows of the page are read from the file. "
+            "Possible errors: 404 if the job or its predictions are missing, 422 for invalid inputs, "
+            "500 for backend or reading failures."
         ),
     },
 }
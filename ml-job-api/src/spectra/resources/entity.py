@@ -3,6 +3,9 @@ Centralized entity metadata definitions.
 """
 
 spectrum_resources = {
+    "spectrum_id": {
+        "DESCRIPTION": "Unique identifier of the spectrum in the catalog",
+    },
     "filename": {
         "MIN_LENGTH": 1,
         "MAX_LENGTH": 70,
@@ -10,6 +13,13 @@ spectrum_resources = {
         "DESCRIPTION": "Name of the FITS file containing the spectrum, following the LAMOST naming convention",
         "EXAMPLES": ["spec-56207-M31011N44B2_sp01-006.fits"],
     },
+    "dir_path": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 255,
+        "PATTERN": r"^(?:[\\/](?:[^\\/]+(?:[\\/][^\\/]+)*)?)$",
+        "DESCRIPTION": "Path of the directory containing the spectrum file, relative to the shared spectra directory",
+        "EXAMPLES": ["/M31011N44B2"],
+    },
     "targetname": {
         "MIN_LENGTH": 1,
         "MAX_LENGTH": 70,
@@ -123,4 +133,269 @@ spectrum_resources = {
         "DESCRIPTION": "Flux array in 10⁻¹⁷ erg s⁻¹ cm⁻² Å⁻¹ from the FITS data",
         "EXAMPLES": [[1.23, 1.19, 1.15]],
     },
+    "ingested_at": {
+        "DESCRIPTION": "UTC datetime the header metadata of the spectrum was last ingested into the catalog",
+        "EXAMPLES": ["2025-05-28T09:30:00Z"],
+    },
+    "healpix": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Nested HEALPix index of order 12 of the sky position of the spectrum",
+        "EXAMPLES": [74346788],
+    },
+}
+
+cache_resources = {
+    "hits": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of spectra served from the in-process cache",
+        "EXAMPLES": [950],
+    },
+    "misses": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of spectra missing in the in-process cache or invalidated by a file change",
+        "EXAMPLES": [50],
+    },
+    "evictions": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of spectra evicted from the in-process cache to stay within its size limit",
+        "EXAMPLES": [0],
+    },
+    "entries": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Number of spectra currently cached in process",
+        "EXAMPLES": [100],
+    },
+    "size": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Approximate size in bytes of the spectra currently cached in process",
+        "EXAMPLES": [25804800],
+    },
+    "max_size": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Maximum size in bytes of the in-process cache",
+        "EXAMPLES": [268435456],
+    },
+    "hit_ratio": {
+        "MIN_VALUE": 0,
+        "MAX_VALUE": 1,
+        "DESCRIPTION": "Share of spectrum retrievals served from the in-process cache",
+        "EXAMPLES": [0.95],
+    },
+}
+
+batch_resources = {
+    "filenames": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 1000,
+        "DESCRIPTION": "Names of the FITS files of the spectra to retrieve, following the LAMOST naming convention",
+        "EXAMPLES": [["spec-56207-M31011N44B2_sp01-006.fits", "spec-56207-M31011N44B2_sp01-007.fits"]],
+    },
+    "job_id": {
+        "DESCRIPTION": "Unique identifier of the job whose labelled spectra to retrieve",
+    },
+    "spectrum_set": {
+        "DESCRIPTION": "Dataset partition of the labelled spectra of the job to retrieve, all partitions if omitted",
+    },
+    "filename": {
+        "DESCRIPTION": "Name of the FITS file of the spectrum the batch item refers to",
+        "EXAMPLES": ["spec-56207-M31011N44B2_sp01-006.fits"],
+    },
+    "spectrum": {
+        "DESCRIPTION": "Retrieved spectrum, omitted if it could not be retrieved",
+    },
+    "error": {
+        "DESCRIPTION": "Reason the spectrum could not be retrieved, omitted on success",
+        "EXAMPLES": ["Cannot get spectrum from file='/M31011N44B2/spec-56207-M31011N44B2_sp01-006.fits'."],
+    },
+}
+
+sample_resources = {
+    "max_points": {
+        "MIN_VALUE": 3,
+        "MAX_VALUE": 100000,
+        "DESCRIPTION": "Maximum number of points of the returned data arrays, full resolution if omitted",
+        "EXAMPLES": [800],
+    },
+    "wave_min": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Lower bound in angstroms of the wavelength window of the returned data arrays",
+        "EXAMPLES": [4000.0],
+    },
+    "wave_max": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Upper bound in angstroms of the wavelength window of the returned data arrays",
+        "EXAMPLES": [7000.0],
+    },
+    "downsampling": {
+        "DESCRIPTION": (
+            "Algorithm reducing the data arrays to `max_points`: LTTB keeps the visually significant points, "
+            "MINMAX keeps the minimum and maximum flux of each wavelength bucket"
+        ),
+    },
+}
+
+list_resources = {
+    "total": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Total number of catalogued spectra matching the search filters",
+        "EXAMPLES": [1234],
+    },
+    "offset": {
+        "MIN_VALUE": 0,
+        "DEFAULT_VALUE": 0,
+        "DESCRIPTION": "Zero-based index of the first returned spectrum",
+        "EXAMPLES": [100],
+    },
+    "limit": {
+        "MIN_VALUE": 0,
+        "MAX_VALUE": 10000,
+        "DEFAULT_VALUE": 100,
+        "DESCRIPTION": "Maximum number of spectra returned",
+        "EXAMPLES": [100],
+    },
+    "type": {
+        "DESCRIPTION": "Broad spectral class the spectra must have",
+    },
+    "subtype": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 30,
+        "DESCRIPTION": "Detailed spectral subtype the spectra must have",
+        "EXAMPLES": ["G2V"],
+    },
+    "dir_path": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 255,
+        "DESCRIPTION": "Path of the directory the spectrum files must be in, relative to the shared spectra directory",
+        "EXAMPLES": ["/M31011N44B2"],
+    },
+    "observed_after": {
+        "DESCRIPTION": "Inclusive lower bound of the UTC observation datetime of the spectra",
+        "EXAMPLES": ["2012-10-01T00:00:00Z"],
+    },
+    "observed_before": {
+        "DESCRIPTION": "Exclusive upper bound of the UTC observation datetime of the spectra",
+        "EXAMPLES": ["2013-10-01T00:00:00Z"],
+    },
+    "sn_g_min": {
+        "DESCRIPTION": "Minimum signal-to-noise ratio in the g band of the spectra",
+        "EXAMPLES": [10.0],
+    },
+    "sn_r_min": {
+        "DESCRIPTION": "Minimum signal-to-noise ratio in the r band of the spectra",
+        "EXAMPLES": [10.0],
+    },
+    "sn_i_min": {
+        "DESCRIPTION": "Minimum signal-to-noise ratio in the i band of the spectra",
+        "EXAMPLES": [10.0],
+    },
+    "spectra": {
+        "DESCRIPTION": "List of summarized catalogued spectra ordered by observation datetime and filename",
+    },
+}
+
+cone_resources = {
+    "ra": {
+        "MIN_VALUE": 0,
+        "MAX_VALUE": 360,
+        "DESCRIPTION": "Right ascension in decimal degrees of the cone center",
+        "EXAMPLES": [291.161958],
+    },
+    "dec": {
+        "MIN_VALUE": -90,
+        "MAX_VALUE": 90,
+        "DESCRIPTION": "Declination in decimal degrees of the cone center",
+        "EXAMPLES": [36.941333],
+    },
+    "radius": {
+        "MIN_VALUE": 0,
+        "MAX_VALUE": 600,
+        "DESCRIPTION": "Radius in arcminutes of the cone",
+        "EXAMPLES": [5.0],
+    },
+    "distance": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Angular distance in arcminutes of the spectrum from the cone center",
+        "EXAMPLES": [1.27],
+    },
+}
+
+pool_resources = {
+    "filename": {
+        "DESCRIPTION": "Name of the FITS file of the preprocessed spectrum to retrieve from the pool of the job",
+        "EXAMPLES": ["spec-56207-M31011N44B2_sp01-006.fits"],
+    },
+    "index": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Row index of the preprocessed spectrum in the pool of the job",
+        "EXAMPLES": [42],
+    },
+    "wave": {
+        "DESCRIPTION": "Common wavelength grid in angstroms of all spectra of the pool",
+        "EXAMPLES": [[3800.0, 3801.0, 3802.0]],
+    },
+    "flux": {
+        "DESCRIPTION": "Flux array interpolated onto the wavelength grid and min-max scaled",
+        "EXAMPLES": [[0.42, 0.41, 0.43]],
+    },
+}
+
+prediction_resources = {
+    "label": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 255,
+        "DESCRIPTION": "Class predicted for the spectrum by the model of the job",
+        "EXAMPLES": ["double peak"],
+    },
+    "entropy": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Entropy of the predicted class probabilities, higher for more uncertain predictions",
+        "EXAMPLES": [0.6931],
+    },
+    "entropy_min": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Inclusive lower bound of the entropy of the predictions",
+        "EXAMPLES": [0.5],
+    },
+    "entropy_max": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Inclusive upper bound of the entropy of the predictions",
+        "EXAMPLES": [1.0],
+    },
+    "descending": {
+        "DEFAULT_VALUE": True,
+        "DESCRIPTION": "Whether the predictions are ordered from the most uncertain one",
+        "EXAMPLES": [True],
+    },
+    "limit": {
+        "MIN_VALUE": 1,
+        "MAX_VALUE": 1000,
+        "DEFAULT_VALUE": 100,
+        "DESCRIPTION": "Maximum number of predictions returned",
+        "EXAMPLES": [100],
+    },
+    "cursor": {
+        "MIN_LENGTH": 1,
+        "MAX_LENGTH": 1024,
+        "DESCRIPTION": (
+            "Opaque cursor of the previous page, the predictions following it are listed, "
+            "only valid with the ordering of the previous page"
+        ),
+        "EXAMPLES": ["W3RydWUsMC42OTMxLDQyXQ=="],
+    },
+    "next_cursor": {
+        "DESCRIPTION": "Cursor listing the following page, omitted on the last page",
+        "EXAMPLES": ["W3RydWUsMC42OTMxLDQyXQ=="],
+    },
+    "total": {
+        "MIN_VALUE": 0,
+        "DESCRIPTION": "Total number of predictions matching the filters",
+        "EXAMPLES": [1234],
+    },
+    "candidate": {
+        "DESCRIPTION": "Whether the spectrum was predicted as a candidate, omitted if the job looked for no candidates",
+        "EXAMPLES": [False],
+    },
+    "predictions": {
+        "DESCRIPTION": "List of predictions of the page, ordered by entropy and pool row index",
+    },
 }
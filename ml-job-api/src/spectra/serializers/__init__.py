@@ -1,6 +1,22 @@
+from src.spectra.serializers.batch import SpectrumBatchItemSerializer
+from src.spectra.serializers.cache import SpectrumCacheSerializer
+from src.spectra.serializers.list import SpectrumListSerializer
+from src.spectra.serializers.pool import SpectrumPoolSerializer
+from src.spectra.serializers.prediction import (
+    SpectrumPredictionListSerializer,
+    SpectrumPredictionSerializer,
+)
 from src.spectra.serializers.read import SpectrumReadSerializer
+from src.spectra.serializers.summarize import SpectrumSummarizeSerializer
 
 
 __all__ = [
+    "SpectrumBatchItemSerializer",
+    "SpectrumCacheSerializer",
+    "SpectrumListSerializer",
+    "SpectrumPoolSerializer",
+    "SpectrumPredictionListSerializer",
+    "SpectrumPredictionSerializer",
     "SpectrumReadSerializer",
+    "SpectrumSummarizeSerializer",
 ]
@@ -0,0 +1,30 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.spectra.resources import batch_resources
+from src.spectra.serializers.read import SpectrumReadSerializer
+
+
+class SpectrumBatchItemSerializer(BaseModel):
+    """
+    Serializer model for a single item of a streamed batch of spectra.
+    """
+
+    filename: str = Field(
+        ...,
+        description=batch_resources["filename"]["DESCRIPTION"],
+        examples=batch_resources["filename"]["EXAMPLES"],
+    )
+
+    spectrum: SpectrumReadSerializer | None = Field(
+        None,
+        description=batch_resources["spectrum"]["DESCRIPTION"],
+    )
+
+    error: str | None = Field(
+        None,
+        description=batch_resources["error"]["DESCRIPTION"],
+        examples=batch_resources["error"]["EXAMPLES"],
+    )
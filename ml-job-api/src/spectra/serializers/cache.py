@@ -0,0 +1,54 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.spectra.resources import cache_resources
+
+
+class SpectrumCacheSerializer(BaseModel):
+    """
+    Serializer model for the usage statistics of the cache of parsed spectra.
+    """
+
+    hits: int = Field(
+        ...,
+        description=cache_resources["hits"]["DESCRIPTION"],
+        examples=cache_resources["hits"]["EXAMPLES"],
+    )
+
+    misses: int = Field(
+        ...,
+        description=cache_resources["misses"]["DESCRIPTION"],
+        examples=cache_resources["misses"]["EXAMPLES"],
+    )
+
+    evictions: int = Field(
+        ...,
+        description=cache_resources["evictions"]["DESCRIPTION"],
+        examples=cache_resources["evictions"]["EXAMPLES"],
+    )
+
+    entries: int = Field(
+        ...,
+        description=cache_resources["entries"]["DESCRIPTION"],
+        examples=cache_resources["entries"]["EXAMPLES"],
+    )
+
+    size: int = Field(
+        ...,
+        description=cache_resources["size"]["DESCRIPTION"],
+        examples=cache_resources["size"]["EXAMPLES"],
+    )
+
+    max_size: int = Field(
+        ...,
+        description=cache_resources["max_size"]["DESCRIPTION"],
+        examples=cache_resources["max_size"]["EXAMPLES"],
+    )
+
+    hit_ratio: float | None = Field(
+        None,
+        description=cache_resources["hit_ratio"]["DESCRIPTION"],
+        examples=cache_resources["hit_ratio"]["EXAMPLES"],
+    )
@@ -0,0 +1,36 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.spectra.resources import list_resources
+from src.spectra.serializers.summarize import SpectrumSummarizeSerializer
+
+
+class SpectrumListSerializer(BaseModel):
+    """
+    Serializer model for paginated listing of catalogued spectra.
+    """
+
+    total: int = Field(
+        ...,
+        description=list_resources["total"]["DESCRIPTION"],
+        examples=list_resources["total"]["EXAMPLES"],
+    )
+
+    offset: int = Field(
+        ...,
+        description=list_resources["offset"]["DESCRIPTION"],
+        examples=list_resources["offset"]["EXAMPLES"],
+    )
+
+    limit: int = Field(
+        ...,
+        description=list_resources["limit"]["DESCRIPTION"],
+        examples=list_resources["limit"]["EXAMPLES"],
+    )
+
+    spectra: list[SpectrumSummarizeSerializer] = Field(
+        ...,
+        description=list_resources["spectra"]["DESCRIPTION"],
+    )
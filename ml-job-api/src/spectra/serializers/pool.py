@@ -0,0 +1,39 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.spectra.resources import (
+    pool_resources,
+    spectrum_resources,
+)
+
+
+class SpectrumPoolSerializer(BaseModel):
+    """
+    Serializer model for a preprocessed spectrum retrieved from the HDF5 pool of a job.
+    """
+
+    filename: str = Field(
+        ...,
+        description=spectrum_resources["filename"]["DESCRIPTION"],
+        examples=spectrum_resources["filename"]["EXAMPLES"],
+    )
+
+    index: int = Field(
+        ...,
+        description=pool_resources["index"]["DESCRIPTION"],
+        examples=pool_resources["index"]["EXAMPLES"],
+    )
+
+    wave: list[float] = Field(
+        ...,
+        description=pool_resources["wave"]["DESCRIPTION"],
+        examples=pool_resources["wave"]["EXAMPLES"],
+    )
+
+    flux: list[float] = Field(
+        ...,
+        description=pool_resources["flux"]["DESCRIPTION"],
+        examples=pool_resources["flux"]["EXAMPLES"],
+    )
@@ -0,0 +1,75 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.spectra.resources import (
+    pool_resources,
+    prediction_resources,
+    spectrum_resources,
+)
+
+
+class SpectrumPredictionSerializer(BaseModel):
+    """
+    Serializer model for a prediction of the model of an active learning job for a spectrum of its pool.
+    """
+
+    filename: str = Field(
+        ...,
+        description=spectrum_resources["filename"]["DESCRIPTION"],
+        examples=spectrum_resources["filename"]["EXAMPLES"],
+    )
+
+    index: int = Field(
+        ...,
+        description=pool_resources["index"]["DESCRIPTION"],
+        examples=pool_resources["index"]["EXAMPLES"],
+    )
+
+    label: str = Field(
+        ...,
+        description=prediction_resources["label"]["DESCRIPTION"],
+        examples=prediction_resources["label"]["EXAMPLES"],
+    )
+
+    entropy: float = Field(
+        ...,
+        description=prediction_resources["entropy"]["DESCRIPTION"],
+        examples=prediction_resources["entropy"]["EXAMPLES"],
+    )
+
+    candidate: bool | None = Field(
+        None,
+        description=prediction_resources["candidate"]["DESCRIPTION"],
+        examples=prediction_resources["candidate"]["EXAMPLES"],
+    )
+
+
+class SpectrumPredictionListSerializer(BaseModel):
+    """
+    Serializer model for cursor-paginated listing of the predictions of an active learning job.
+    """
+
+    total: int = Field(
+        ...,
+        description=prediction_resources["total"]["DESCRIPTION"],
+        examples=prediction_resources["total"]["EXAMPLES"],
+    )
+
+    limit: int = Field(
+        ...,
+        description=prediction_resources["limit"]["DESCRIPTION"],
+        examples=prediction_resources["limit"]["EXAMPLES"],
+    )
+
+    next_cursor: str | None = Field(
+        None,
+        description=prediction_resources["next_cursor"]["DESCRIPTION"],
+        examples=prediction_resources["next_cursor"]["EXAMPLES"],
+    )
+
+    predictions: list[SpectrumPredictionSerializer] = Field(
+        ...,
+        description=prediction_resources["predictions"]["DESCRIPTION"],
+    )
@@ -1,5 +1,56 @@
+import asyncio
+import heapq
+import logging
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from src.common.utils import (
+    generate_uuid,
+    get_current_utc_datetime,
+    iterate_lines,
+)
+from src.jobs.repository import JobRepository
+from src.labellings.repository import LabellingRepository
+from src.spectra.catalog import SpectrumCatalog
+from src.spectra.dto import (
+    SpectrumBatchDTO,
+    SpectrumCreateDTO,
+    SpectrumIngestDTO,
+)
+from src.spectra.errors import (
+    SpectrumInvalidBatchError,
+    SpectrumNotExistError,
+)
+from src.spectra.params import (
+    SpectrumConeParams,
+    SpectrumPoolParams,
+    SpectrumPredictionParams,
+    SpectrumSampleParams,
+    SpectrumSearchParams,
+)
+from src.spectra.pool import SpectrumPool
 from src.spectra.repository import SpectrumRepository
-from src.spectra.serializers import SpectrumReadSerializer
+from src.spectra.serializers import (
+    SpectrumBatchItemSerializer,
+    SpectrumCacheSerializer,
+    SpectrumListSerializer,
+    SpectrumPoolSerializer,
+    SpectrumPredictionListSerializer,
+    SpectrumPredictionSerializer,
+    SpectrumReadSerializer,
+    SpectrumSummarizeSerializer,
+)
+from src.spectra.utils import (
+    get_angular_distances,
+    get_healpix_indices,
+    get_healpix_ranges,
+    sample_spectrum,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 class SpectrumService:
@@ -7,25 +58,117 @@ class SpectrumService:
     Business logic layer for working with spectral data.
     """
 
-    def __init__(self, repository: SpectrumRepository) -> None:
+    def __init__(
+        self,
+        repository: SpectrumRepository,
+        labelling_repository: LabellingRepository | None = None,
+        batch_concurrency: int = 1,
+        catalog: SpectrumCatalog | None = None,
+        job_repository: JobRepository | None = None,
+        pool: SpectrumPool | None = None,
+    ) -> None:
         """
         Initialize the spectrum service with a repository implementation.
 
         Parameters:
             repository (SpectrumRepository): Concrete repository for accessing spectral data.
+            labelling_repository (LabellingRepository | None):
+                Optional repository of labellings, resolving the spectra of a job in batch retrievals.
+            batch_concurrency (int): Maximum number of spectra of a batch retrieved at the same time.
+            catalog (SpectrumCatalog | None): Optional catalog for searching the header metadata of spectra.
+            job_repository (JobRepository | None): Optional repository of jobs, resolving the directory of a job.
+            pool (SpectrumPool | None): Optional pool for reading the preprocessed spectra of jobs.
         """
 
         self.repository = repository
+        self.labelling_repository = labelling_repository
+        self.batch_concurrency = batch_concurrency
+        self.catalog = catalog
+        self.job_repository = job_repository
+        self.pool = pool
+
+    async def _retrieve_batch_item_by_filename(self, filename: str) -> SpectrumBatchItemSerializer:
+        """
+        Retrieve a single spectrum of a batch, reporting a failure as an error of the item.
+
+        Parameters:
+            filename (str): The FITS filename to retrieve.
+
+        Returns:
+            SpectrumBatchItemSerializer: The batch item with either the spectrum or the error.
+        """
+
+        try:
+            spectrum = await self.retrieve_spectrum_by_filename(filename)
+
+        except SpectrumNotExistError as e:
+            return SpectrumBatchItemSerializer(filename=filename, error=str(e))
+
+        except (OSError, KeyError, ValueError):
+            logger.exception("Cannot parse spectrum from file '%s'.", filename)
 
-    async def retrieve_spectrum_by_filename(self, filename: str) -> SpectrumReadSerializer:
+            error = f"Cannot parse spectrum from file='{filename}'."
+
+            return SpectrumBatchItemSerializer(filename=filename, error=error)
+
+        return SpectrumBatchItemSerializer(filename=filename, spectrum=spectrum)
+
+    async def _stream_batch_by_filenames(self, filenames: list[str]) -> AsyncIterator[bytes]:
+        """
+        Retrieve spectra concurrently and stream them as newline-delimited JSON in completion order.
+
+        At most `batch_concurrency` spectra are in flight at the same time, retrieved or waiting to be
+        sent, and a new retrieval starts only once a finished one was yielded. A large batch thus
+        neither floods the executor reading the files nor holds all parsed spectra in memory while
+        the client reads slowly.
+
+        Parameters:
+            filenames (list[str]): The FITS filenames to retrieve.
+
+        Returns:
+            AsyncIterator[bytes]: Stream of serialized batch items, one per line.
+        """
+
+        pending_filenames = iter(filenames)
+        tasks = set()
+
+        try:
+            while True:
+                # Refill the window of in-flight retrievals
+                for filename in pending_filenames:
+                    tasks.add(asyncio.create_task(self._retrieve_batch_item_by_filename(filename)))
+
+                    if len(tasks) >= self.batch_concurrency:
+                        break
+
+                if not tasks:
+                    break
+
+                done_tasks, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done_tasks:
+                    item = task.result()
+
+                    yield item.model_dump_json(exclude_none=True).encode() + b"\n"
+
+        finally:
+            # Stop pending retrievals if the client disconnects
+            for task in tasks:
+                task.cancel()
+
+    async def retrieve_spectrum_by_filename(
+        self, filename: str, params: SpectrumSampleParams | None = None
+    ) -> SpectrumReadSerializer:
         """
         Retrieve and serialize a spectrum by its FITS filename.
 
-        This method fetches the raw SpectrumEntity from the repository,
-        then constructs a SpectrumReadSerializer for API responses.
+        This method fetches the raw SpectrumEntity from the repository, optionally
+        windows and downsamples its data arrays, then constructs a SpectrumReadSerializer
+        for API responses without validating the already validated data again.
 
         Parameters:
             filename (str): The FITS filename to retrieve, following the LAMOST naming convention.
+            params (SpectrumSampleParams | None): Optional wavelength window and downsampling of the data arrays.
 
         Returns:
             SpectrumReadSerializer: The serialized spectrum data ready for API output.
@@ -33,4 +176,199 @@ class SpectrumService:
 
         entity = await self.repository.get_by_filename(filename)
 
-        return SpectrumReadSerializer(**entity.model_dump())
+        # Entities are validated once when parsed, so the serializer is constructed without copying or re-validating
+        spectrum_data = dict(entity)
+
+        if params and (params.max_points is not None or params.wave_min is not None or params.wave_max is not None):
+            spectrum_data["wave"], spectrum_data["flux"] = sample_spectrum(
+                entity.wave,
+                entity.flux,
+                params.max_points,
+                params.wave_min,
+                params.wave_max,
+                params.downsampling,
+            )
+
+        return SpectrumReadSerializer.model_construct(**spectrum_data)
+
+    async def retrieve_pool_spectrum(self, job_id: UUID, params: SpectrumPoolParams) -> SpectrumPoolSerializer:
+        """
+        Retrieve a preprocessed spectrum from the HDF5 pool produced by a job.
+
+        Parameters:
+            job_id (UUID): The UUID of the job whose pool to read.
+            params (SpectrumPoolParams): Selection of the spectrum by its filename or row index.
+
+        Returns:
+            SpectrumPoolSerializer: The interpolated and scaled spectrum ready for API output.
+        """
+
+        job_entity = await self.job_repository.get_by_job_id(job_id)
+
+        if params.filename is not None:
+            entity = await self.pool.get_by_dir_path_and_filename(job_entity.dir_path, params.filename)
+
+        else:
+            entity = await self.pool.get_by_dir_path_and_index(job_entity.dir_path, params.index)
+
+        return SpectrumPoolSerializer.model_construct(**dict(entity))
+
+    async def retrieve_pool_predictions(
+        self, job_id: UUID, params: SpectrumPredictionParams
+    ) -> SpectrumPredictionListSerializer:
+        """
+        Retrieve a cursor-paginated list of the predictions of an active learning job.
+
+        Parameters:
+            job_id (UUID): The UUID of the job whose predictions to read.
+            params (SpectrumPredictionParams): Filters by label and entropy range, ordering and cursor of the page.
+
+        Returns:
+            SpectrumPredictionListSerializer: Total count, limit, next cursor, and list of SpectrumPredictionSerializer.
+        """
+
+        job_entity = await self.job_repository.get_by_job_id(job_id)
+        entities, total, next_cursor = await self.pool.list_predictions_by_dir_path_and_params(
+            job_entity.dir_path, params
+        )
+        serializers = [SpectrumPredictionSerializer(**entity.model_dump()) for entity in entities]
+
+        return SpectrumPredictionListSerializer(
+            total=total, limit=params.limit, next_cursor=next_cursor, predictions=serializers
+        )
+
+    async def retrieve_spectra_batch(self, dto: SpectrumBatchDTO) -> AsyncIterator[bytes]:
+        """
+        Retrieve a batch of spectra, selected by their filenames or by the labellings of a job.
+
+        Duplicate filenames are retrieved once. A spectrum that cannot be retrieved is reported
+        as an error of its item rather than failing the whole batch.
+
+        Parameters:
+            dto (SpectrumBatchDTO): Data transfer object selecting the spectra to retrieve.
+
+        Returns:
+            AsyncIterator[bytes]: Stream of serialized batch items as newline-delimited JSON.
+        """
+
+        if dto.filenames is not None:
+            filenames = dto.filenames
+
+        else:
+            labelling_entities = await self.labelling_repository.list_by_job_id(dto.job_id)
+            filenames = [
+                labelling_entity.spectrum_filename
+                for labelling_entity in labelling_entities
+                if dto.spectrum_set is None or labelling_entity.spectrum_set == dto.spectrum_set
+            ]
+
+        return self._stream_batch_by_filenames(list(dict.fromkeys(filenames)))
+
+    async def retrieve_cache_stats(self) -> SpectrumCacheSerializer:
+        """
+        Retrieve the usage statistics of the cache of parsed spectra.
+
+        Returns:
+            SpectrumCacheSerializer: The cache statistics with the share of cache hits.
+        """
+
+        stats = self.repository.get_cache_stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_ratio = stats["hits"] / lookups if lookups else None
+
+        return SpectrumCacheSerializer(hit_ratio=hit_ratio, **stats)
+
+    async def ingest_spectra_batch_stream(self, stream: AsyncIterator[bytes]) -> None:
+        """
+        Create or replace multiple spectrum records of the catalog from a newline-delimited JSON stream.
+
+        The sky position of each spectrum is indexed by its nested HEALPix pixel for cone searches.
+
+        Parameters:
+            stream (AsyncIterator[bytes]): Stream of NDJSON chunks, one spectrum header payload per line.
+
+        Raises:
+            SpectrumInvalidBatchError: If any line of the stream is not a valid spectrum header payload.
+        """
+
+        dtos = []
+        line_number = 0
+        ingested_at = get_current_utc_datetime()
+
+        async for line in iterate_lines(stream):
+            line_number += 1
+
+            try:
+                dtos.append(SpectrumIngestDTO.model_validate_json(line))
+
+            except ValidationError as e:
+                raise SpectrumInvalidBatchError(
+                    f"Cannot ingest spectra batch with invalid spectrum at line={line_number}."
+                ) from e
+
+        # Sky positions of the whole batch are indexed at once
+        healpix_indices = get_healpix_indices([dto.ra for dto in dtos], [dto.dec for dto in dtos]) if dtos else []
+
+        batch = [
+            SpectrumCreateDTO(spectrum_id=generate_uuid(), ingested_at=ingested_at, healpix=healpix, **dto.model_dump())
+            for dto, healpix in zip(dtos, healpix_indices)
+        ]
+
+        await self.catalog.upsert_batch(batch)
+
+    async def search_spectra(self, params: SpectrumSearchParams) -> SpectrumListSerializer:
+        """
+        Retrieve a paginated list of catalogued spectra matching the search filters.
+
+        Parameters:
+            params (SpectrumSearchParams): Search filters and pagination parameters.
+
+        Returns:
+            SpectrumListSerializer: Total count, offset, limit, and list of SpectrumSummarizeSerializer.
+        """
+
+        total = await self.catalog.total_by_params(params)
+        entities = await self.catalog.list_by_params(params)
+        serializers = [SpectrumSummarizeSerializer(**entity.model_dump()) for entity in entities]
+
+        return SpectrumListSerializer(total=total, offset=params.offset, limit=params.limit, spectra=serializers)
+
+    async def search_spectra_by_cone(self, params: SpectrumConeParams) -> SpectrumListSerializer:
+        """
+        Retrieve a paginated list of catalogued spectra within a cone around a sky position.
+
+        Only the positions of the candidates are prefetched, by the ranges of HEALPix pixels covering
+        the cone, then filtered by their exact angular distance, ordered from the nearest one and
+        paginated. The full records are loaded for the requested page only.
+
+        Parameters:
+            params (SpectrumConeParams): Cone center, radius and pagination parameters.
+
+        Returns:
+            SpectrumListSerializer: Total count, offset, limit, and list of SpectrumSummarizeSerializer with distances.
+        """
+
+        ranges = get_healpix_ranges(params.ra, params.dec, params.radius)
+        positions = await self.catalog.list_positions_by_healpix_ranges(ranges)
+
+        distances = get_angular_distances(
+            params.ra, params.dec, [position[2] for position in positions], [position[3] for position in positions]
+        )
+
+        matches = [
+            (float(distance), filename, spectrum_id)
+            for distance, (spectrum_id, filename, *_) in zip(distances, positions)
+            if distance <= params.radius
+        ]
+
+        # Only the matches up to the end of the page are ordered
+        page_matches = heapq.nsmallest(params.offset + params.limit, matches)[params.offset :]
+        page_distances = {spectrum_id: distance for distance, _, spectrum_id in page_matches}
+
+        entities = await self.catalog.list_by_spectrum_ids([spectrum_id for _, _, spectrum_id in page_matches])
+        serializers = [
+            SpectrumSummarizeSerializer(distance=page_distances[entity.spectrum_id], **entity.model_dump())
+            for entity in entities
+        ]
+
+        return SpectrumListSerializer(total=len(matches), offset=params.offset, limit=params.limit, spectra=serializers)
@@ -1,6 +1,8 @@
+from src.spectra.types.downsampling import DownsamplingType
 from src.spectra.types.spectrum import SpectrumType
 
 
 __all__ = [
+    "DownsamplingType",
     "SpectrumType",
 ]
@@ -0,0 +1,10 @@
+from enum import StrEnum
+
+
+class DownsamplingType(StrEnum):
+    """
+    Enumeration type of the shape-preserving algorithms downsampling the data arrays of a spectrum.
+    """
+
+    LTTB = "LTTB"
+    MINMAX = "MINMAX"
@@ -1,6 +1,16 @@
 from typing import Any
 
+import astropy.units as u
+import h5py
+import numpy as np
 from astropy.io import fits
+from astropy_healpix import HEALPix
+
+from src.spectra.types import DownsamplingType
+
+
+# HEALPix order of the nested sky pixels indexing the catalog, about 0.86 arcmin wide
+healpix_order = 12
 
 
 #
@@ -65,3 +75,343 @@ def read_file(file_path: str) -> dict[str, Any]:
         )
 
     return raw_spectrum
+
+
+def open_pool_file(file_path: str) -> tuple[h5py.File, dict[str, int], list[float]]:
+    """
+    Open an HDF5 pool file of preprocessed spectra and index its rows by filename.
+
+    The pool file contains the datasets written by the ML Job Worker microservice:
+      - filenames: FITS filename of each row
+      - wave: common wavelength grid of all rows
+      - fluxes: interpolated and scaled flux array of each row
+
+    Parameters:
+        file_path (str): Path to the HDF5 file to open.
+
+    Returns:
+        tuple[h5py.File, dict[str, int], list[float]]:
+            The open file, the row index of each filename, and the common wavelength grid.
+    """
+
+    h5f_reader = h5py.File(file_path, "r")
+
+    try:
+        filename_index = {filename: index for index, filename in enumerate(h5f_reader["filenames"].asstr()[:])}
+        wave = h5f_reader["wave"][:].tolist()
+
+    except Exception:
+        h5f_reader.close()
+
+        raise
+
+    return h5f_reader, filename_index, wave
+
+
+def open_predictions_file(file_path: str) -> tuple[h5py.File, list[str], list[int]]:
+    """
+    Open an HDF5 predictions file of an active learning job and read its class segments.
+
+    The predictions file contains the datasets written by the ML Job Worker microservice,
+    with rows sorted by predicted class, then by entropy and pool row index:
+      - classes: name of each class
+      - label_offsets: first row of each class, followed by the number of rows
+      - indexes: row index of each prediction in the pool file
+      - entropies: entropy of each prediction
+      - filenames: FITS filename of each prediction
+      - candidates: optional candidate flag of each prediction
+
+    Parameters:
+        file_path (str): Path to the HDF5 file to open.
+
+    Returns:
+        tuple[h5py.File, list[str], list[int]]: The open file, the class names, and the row offsets of the classes.
+    """
+
+    h5f_reader = h5py.File(file_path, "r")
+
+    try:
+        classes = h5f_reader["classes"].asstr()[:].tolist()
+        label_offsets = h5f_reader["label_offsets"][:].tolist()
+
+    except Exception:
+        h5f_reader.close()
+
+        raise
+
+    return h5f_reader, classes, label_offsets
+
+
+def close_pool_file(pool_file: tuple[h5py.File, ...]) -> None:
+    """
+    Close an HDF5 file opened by `open_pool_file` or `open_predictions_file`.
+
+    Parameters:
+        pool_file (tuple[h5py.File, ...]): The open file with its indices.
+    """
+
+    pool_file[0].close()
+
+
+#
+
+
+def select_wave_window(
+    wave: np.ndarray, flux: np.ndarray, wave_min: float | None = None, wave_max: float | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Select the points of a spectrum within a wavelength window.
+
+    Parameters:
+        wave (np.ndarray): Wavelength array in ascending order.
+        flux (np.ndarray): Flux array of the same length as `wave`.
+        wave_min (float | None): Optional inclusive lower bound of the window.
+        wave_max (float | None): Optional inclusive upper bound of the window.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Views of the wavelength and flux arrays within the window.
+    """
+
+    start = np.searchsorted(wave, wave_min, side="left") if wave_min is not None else 0
+    end = np.searchsorted(wave, wave_max, side="right") if wave_max is not None else len(wave)
+
+    return wave[start:end], flux[start:end]
+
+
+def downsample_lttb(wave: np.ndarray, flux: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a spectrum with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are kept, and the remaining points are split into `max_points - 2`
+    buckets. From each bucket, the point forming the largest triangle with the point kept from the
+    preceding bucket and the average point of the following bucket is kept. Triangle areas are
+    computed over whole buckets at once, so only the chain of kept points is iterated in Python.
+
+    Parameters:
+        wave (np.ndarray): Wavelength array in ascending order.
+        flux (np.ndarray): Flux array of the same length as `wave`.
+        max_points (int): Maximum number of points to keep, at least 3.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The downsampled wavelength and flux arrays.
+    """
+
+    n_points = len(wave)
+
+    if max_points >= n_points:
+        return wave, flux
+
+    # Bucket bounds over the inner points, each bucket holding at least one point
+    edges = np.linspace(1, n_points - 1, max_points - 1).astype(np.intp)
+    starts, ends = edges[:-1], edges[1:]
+
+    # Average points of the buckets, the last bucket being followed by the last point
+    wave_sums = np.concatenate(([0.0], np.cumsum(wave)))
+    flux_sums = np.concatenate(([0.0], np.cumsum(flux)))
+    counts = ends - starts
+    next_waves = np.append(((wave_sums[ends] - wave_sums[starts]) / counts)[1:], wave[-1])
+    next_fluxes = np.append(((flux_sums[ends] - flux_sums[starts]) / counts)[1:], flux[-1])
+
+    indices = np.empty(max_points, dtype=np.intp)
+    indices[0], indices[-1] = 0, n_points - 1
+
+    kept = 0
+
+    for bucket, (start, end) in enumerate(zip(starts, ends)):
+        bucket_waves, bucket_fluxes = wave[start:end], flux[start:end]
+        areas = np.abs(
+            (wave[kept] - next_waves[bucket]) * (bucket_fluxes - flux[kept])
+            - (wave[kept] - bucket_waves) * (next_fluxes[bucket] - flux[kept])
+        )
+        kept = start + int(np.argmax(areas))
+        indices[bucket + 1] = kept
+
+    return wave[indices], flux[indices]
+
+
+def downsample_minmax(wave: np.ndarray, flux: np.ndarray, max_points: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a spectrum to the envelope of the minimum and maximum flux of wavelength buckets.
+
+    The points are split into `max_points // 2` buckets, and the points with the minimum and the
+    maximum flux of each bucket are kept in wavelength order, so narrow emission and absorption
+    lines survive. The buckets are padded into a single matrix and reduced at once.
+
+    Parameters:
+        wave (np.ndarray): Wavelength array in ascending order.
+        flux (np.ndarray): Flux array of the same length as `wave`.
+        max_points (int): Maximum number of points to keep, at least 2.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The downsampled wavelength and flux arrays.
+    """
+
+    n_points = len(wave)
+
+    if max_points >= n_points:
+        return wave, flux
+
+    edges = np.linspace(0, n_points, max_points // 2 + 1).astype(np.intp)
+    starts, ends = edges[:-1], edges[1:]
+
+    # Matrix of point indices with a row per bucket, padded where a bucket is shorter than the longest one
+    indices = starts[:, None] + np.arange(np.max(ends - starts))[None, :]
+    is_padding = indices >= ends[:, None]
+    indices = np.minimum(indices, n_points - 1)
+
+    bucket_fluxes = flux[indices]
+    min_indices = np.take_along_axis(
+        indices, np.argmin(np.where(is_padding, np.inf, bucket_fluxes), axis=1)[:, None], axis=1
+    )
+    max_indices = np.take_along_axis(
+        indices, np.argmax(np.where(is_padding, -np.inf, bucket_fluxes), axis=1)[:, None], axis=1
+    )
+
+    # Keep both extremes of each bucket in wavelength order, once if they coincide
+    kept_indices = np.unique(np.concatenate((min_indices, max_indices), axis=1))
+
+    return wave[kept_indices], flux[kept_indices]
+
+
+def sample_spectrum(
+    wave: list[float],
+    flux: list[float],
+    max_points: int | None = None,
+    wave_min: float | None = None,
+    wave_max: float | None = None,
+    downsampling: DownsamplingType = DownsamplingType.LTTB,
+) -> tuple[list[float], list[float]]:
+    """
+    Window and downsample the data arrays of a spectrum for plotting.
+
+    Parameters:
+        wave (list[float]): Wavelength array in ascending order.
+        flux (list[float]): Flux array of the same length as `wave`.
+        max_points (int | None): Optional maximum number of points to keep.
+        wave_min (float | None): Optional inclusive lower bound of the wavelength window.
+        wave_max (float | None): Optional inclusive upper bound of the wavelength window.
+        downsampling (DownsamplingType): Algorithm reducing the arrays to `max_points`.
+
+    Returns:
+        tuple[list[float], list[float]]: The sampled wavelength and flux arrays.
+    """
+
+    wave_array, flux_array = select_wave_window(
+        np.asarray(wave, dtype=np.float64), np.asarray(flux, dtype=np.float64), wave_min, wave_max
+    )
+
+    if max_points is not None and downsampling == DownsamplingType.LTTB:
+        wave_array, flux_array = downsample_lttb(wave_array, flux_array, max_points)
+
+    elif max_points is not None and downsampling == DownsamplingType.MINMAX:
+        wave_array, flux_array = downsample_minmax(wave_array, flux_array, max_points)
+
+    return wave_array.tolist(), flux_array.tolist()
+
+
+#
+
+
+def pack_spectrum_arrays(wave: list[float], flux: list[float]) -> bytes:
+    """
+    Pack the data arrays of a spectrum into a compact binary representation.
+
+    The wavelength array is followed by the flux array of the same length, both as
+    little-endian 32-bit floats, so a client reads them back with a single typed-array view.
+
+    Parameters:
+        wave (list[float]): Wavelength array.
+        flux (list[float]): Flux array of the same length as `wave`.
+
+    Returns:
+        bytes: The packed data arrays.
+    """
+
+    return np.asarray([wave, flux], dtype="<f4").tobytes()
+
+
+#
+
+
+def get_healpix_indices(ra: list[float], dec: list[float]) -> list[int]:
+    """
+    Compute the nested HEALPix indices of sky positions at the order indexing the catalog.
+
+    Parameters:
+        ra (list[float]): Right ascensions in decimal degrees.
+        dec (list[float]): Declinations in decimal degrees, of the same length as `ra`.
+
+    Returns:
+        list[int]: The HEALPix index of each position.
+    """
+
+    healpix = HEALPix(nside=2**healpix_order, order="nested")
+    indices = healpix.lonlat_to_healpix(
+        np.asarray(ra, dtype=np.float64) * u.deg, np.asarray(dec, dtype=np.float64) * u.deg
+    )
+
+    return indices.tolist()
+
+
+def get_healpix_ranges(ra: float, dec: float, radius: float) -> list[tuple[int, int]]:
+    """
+    Compute the ranges of HEALPix indices of the catalog order covering a cone on the sky.
+
+    The cone is covered by the pixels of the coarsest order at least four times finer than the cone,
+    which bounds both the number of pixels overlapping it and the area they cover outside of it.
+    In the nested scheme, every coarse pixel spans a contiguous range of fine pixels, so each coarse
+    pixel maps to one range, and adjacent ranges are merged. The cone is widened by half the coarse
+    pixel size, so partially overlapping pixels are never missed.
+
+    Parameters:
+        ra (float): Right ascension of the cone center in decimal degrees.
+        dec (float): Declination of the cone center in decimal degrees.
+        radius (float): Radius of the cone in arcminutes.
+
+    Returns:
+        list[tuple[int, int]]: Sorted and disjoint half-open ranges of HEALPix indices of the catalog order.
+    """
+
+    order = healpix_order
+
+    while order > 0 and HEALPix(nside=2**order).pixel_resolution < radius * u.arcmin / 4:
+        order -= 1
+
+    healpix = HEALPix(nside=2**order, order="nested")
+    pixels = np.unique(
+        healpix.cone_search_lonlat(ra * u.deg, dec * u.deg, radius * u.arcmin + healpix.pixel_resolution / 2)
+    )
+
+    shift = 2 * (healpix_order - order)
+    starts, ends = pixels << shift, (pixels + 1) << shift
+
+    # Merge ranges of adjacent pixels
+    breaks = np.flatnonzero(starts[1:] != ends[:-1])
+    range_starts = starts[np.concatenate(([0], breaks + 1))]
+    range_ends = ends[np.concatenate((breaks, [len(ends) - 1]))]
+
+    return list(zip(range_starts.tolist(), range_ends.tolist()))
+
+
+def get_angular_distances(ra: float, dec: float, ras: list[float], decs: list[float]) -> np.ndarray:
+    """
+    Compute the angular distances of sky positions from a given position with the haversine formula.
+
+    Parameters:
+        ra (float): Right ascension of the reference position in decimal degrees.
+        dec (float): Declination of the reference position in decimal degrees.
+        ras (list[float]): Right ascensions of the positions in decimal degrees.
+        decs (list[float]): Declinations of the positions in decimal degrees, of the same length as `ras`.
+
+    Returns:
+        np.ndarray: The angular distance of each position in arcminutes.
+    """
+
+    ra_rad, dec_rad = np.radians(ra), np.radians(dec)
+    ras_rad, decs_rad = np.radians(np.asarray(ras, dtype=np.float64)), np.radians(np.asarray(decs, dtype=np.float64))
+
+    haversines = (
+        np.sin((decs_rad - dec_rad) / 2) ** 2 + np.cos(dec_rad) * np.cos(decs_rad) * np.sin((ras_rad - ra_rad) / 2) ** 2
+    )
+
+    return np.degrees(2 * np.arcsin(np.sqrt(np.clip(haversines, 0, 1)))) * 60
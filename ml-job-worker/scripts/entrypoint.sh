@@ -5,8 +5,10 @@ set -e
 
 # Launch the Celery worker:
 #   -A: module:attribute pointing to the Celery app instance
-#   --concurrency=2: number of worker processes
+#   --queues: comma-separated queues the worker pool consumes (one per job type)
+#   --concurrency: number of worker processes of the pool
 #   --loglevel=info: set logging verbosity
 exec celery -A "src.main:app" worker \
-    --concurrency=2 \
+    --queues="${worker_queues:-data_preprocessing,active_ml,catalog_ingestion}" \
+    --concurrency="${worker_concurrency:-2}" \
     --loglevel=info
@@ -8,28 +8,41 @@ class LabellingHttpxAPI:
     HTTP client for interacting with the Labellings API of the ML Job service.
     """
 
-    def __init__(self, api_client: Client) -> None:
+    def __init__(self, api_client: Client, chunk_size: int) -> None:
         """
         Initialize the LabellingHttpxAPI with a configured HTTP client.
 
         Parameters:
             api_client (Client): An `httpx.Client` instance with base_url and other settings.
+            chunk_size (int): Maximum number of labellings sent in one request.
         """
 
         self.api = api_client
+        self.chunk_size = chunk_size
 
-    def initialize_labellings_batch(self, batch: list[LabellingInitializeSerializer]) -> None:
+    def initialize_labellings_batch(self, batch: list[LabellingInitializeSerializer], idempotency_key: str) -> None:
         """
-        Send a batch initialization request for multiple labellings.
+        Send batch initialization requests for multiple labellings.
 
-        Serializes each `LabellingInitializeSerializer` to JSON and posts to the `/labellings/batch/` endpoint
-        in a single array payload.
+        Serializes each `LabellingInitializeSerializer` to a JSON line and posts the batch in chunks
+        of NDJSON to the `/labellings/batch/stream` endpoint. Each chunk carries its own
+        `Idempotency-Key` header derived from the given key, so a retried chunk creates no duplicates.
 
         Parameters:
             batch (list[LabellingInitializeSerializer]):
                 List of serializers for initializing new labellings after Active ML Job workflow.
+            idempotency_key (str): Key identifying the batch, e.g. the ID of the job producing it.
+
+        Raises:
+            HTTPError: If a chunk request fails after all retries.
         """
 
-        response = [serializer.model_dump(mode="json") for serializer in batch]
+        for chunk_index, chunk_start in enumerate(range(0, len(batch), self.chunk_size)):
+            chunk = batch[chunk_start : chunk_start + self.chunk_size]
+            content = "".join(f"{serializer.model_dump_json()}\n" for serializer in chunk)
+            headers = {
+                "Content-Type": "application/x-ndjson",
+                "Idempotency-Key": f"{idempotency_key}:{chunk_index}",
+            }
 
-        self.api.post(f"/labellings/batch/", json=response)
+            self.api.post("/labellings/batch/stream", content=content, headers=headers).raise_for_status()
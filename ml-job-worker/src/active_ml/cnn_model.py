@@ -1,3 +1,6 @@
+import math
+
+from tensorflow.keras.callbacks import Callback
 from tensorflow.keras.callbacks import EarlyStopping
 from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import Conv1D
@@ -10,6 +13,36 @@ from imblearn.over_sampling import SMOTE
 from numpy.typing import NDArray
 
 from src.active_ml.config import ActiveLearningConfig
+from src.common.reporters import JobProgressReporter
+
+
+class ProgressCallback(Callback):
+    """
+    Keras callback forwarding training epochs and prediction batches to the job progress reporter.
+    """
+
+    def __init__(self, reporter: JobProgressReporter, 
+                 epochs_total: int | None = None, prediction_batches_total: int | None = None) -> None:
+        """
+        Parameters:
+            reporter (JobProgressReporter): rate-limited reporter of the job progress.
+            epochs_total (int | None): maximum number of training epochs.
+            prediction_batches_total (int | None): number of prediction batches.
+        """
+        super().__init__()
+        self.reporter = reporter
+        self.epochs_total = epochs_total
+        self.prediction_batches_total = prediction_batches_total
+
+    def on_epoch_end(self, epoch: int, logs: dict | None = None) -> None:
+        loss = (logs or {}).get("loss")
+        self.reporter.update(
+            epoch=epoch + 1, epochs_total=self.epochs_total, loss=float(loss) if loss is not None else None
+            )
+
+    def on_predict_batch_end(self, batch: int, logs: dict | None = None) -> None:
+        self.reporter.update(prediction_batch=batch + 1, prediction_batches_total=self.prediction_batches_total)
+
 
 def get_model(points: int, num_classes: int) -> Sequential:
     """
@@ -45,7 +78,7 @@ def get_model(points: int, num_classes: int) -> Sequential:
 
 def train(model: Sequential, fluxes: NDArray[float], 
           labels: NDArray[int], points: int, num_classes: int, 
-          config: ActiveLearningConfig) -> None:
+          config: ActiveLearningConfig, reporter: JobProgressReporter | None = None) -> None:
     """
     Trains the given model
     
@@ -60,6 +93,7 @@ def train(model: Sequential, fluxes: NDArray[float],
         points (int): number of uniform points.
         num_classes (int): number of spectrum classification classes.
         config (ActiveLearningConfig): configuration for model training, loaded from configuration file.
+        reporter (JobProgressReporter | None): optional reporter of finished epochs and loss.
     """
 
     one_hot_y = to_categorical(labels, num_classes=num_classes)
@@ -67,14 +101,18 @@ def train(model: Sequential, fluxes: NDArray[float],
             monitor='loss', min_delta=config.min_delta_train, patience=config.patience_train,
             restore_best_weights=True
             )
+    callbacks = [callback]
+    if reporter:
+        callbacks.append(ProgressCallback(reporter, epochs_total=config.epochs_train))
     model.fit(
             fluxes.reshape(-1, points, 1), one_hot_y, batch_size=config.batch_size_train, epochs=config.epochs_train,
-            callbacks=[callback], verbose=0
+            callbacks=callbacks, verbose=0
             )
 
 
 def predict(model: Sequential, fluxes: NDArray[float], 
-            points: int, config: ActiveLearningConfig) -> NDArray[NDArray[float]]:
+            points: int, config: ActiveLearningConfig, 
+            reporter: JobProgressReporter | None = None) -> NDArray[NDArray[float]]:
     """
     Runs model prediction
 
@@ -83,12 +121,17 @@ def predict(model: Sequential, fluxes: NDArray[float],
         fluxes (NDArray[float]): 1D array of fluxes to predict on.
         points (int): number of uniform points.
         config (ActiveLearningConfig): configuration for model prediction, loaded from configuration file.
+        reporter (JobProgressReporter | None): optional reporter of finished prediction batches.
     
     Returns (NDArray[NDArray[float]]): 
         2D array of predicted probabilities
     """
     fluxes = fluxes[...].reshape(-1, points, 1)
-    return model.predict(fluxes, verbose=0, batch_size=config.batch_size_predict)
+    callbacks = []
+    if reporter:
+        prediction_batches_total = math.ceil(fluxes.shape[0] / config.batch_size_predict)
+        callbacks.append(ProgressCallback(reporter, prediction_batches_total=prediction_batches_total))
+    return model.predict(fluxes, verbose=0, batch_size=config.batch_size_predict, callbacks=callbacks)
 
 def balance(fluxes: NDArray[float], 
             labels: NDArray[int]
@@ -1,4 +1,6 @@
+import os
 import h5py
+import numpy as np
 from numpy.typing import NDArray 
 from typing import Any
 
@@ -84,6 +86,40 @@ def write_active_learning_result(file_path: str, config: ActiveLearningConfig,
         if config.save_model:
             result["model"].save(f"{config.result_dir_path}/model.keras")
 
+def write_predictions(file_path: str, config: ActiveLearningConfig, result: dict[str, Any]) -> None:
+    """
+    Writes the predictions of active learning job's regular iteration to HDF5 sidecar file,
+    ordered for the prediction queries of the ML Job API.
+
+    Rows are sorted by predicted label, then by entropy and pool index, so the rows of every class
+    form a contiguous segment sorted by entropy, starting at its offset in `label_offsets`.
+    The file is written next to its final path and renamed at once, so it is never read half-written.
+
+    Parameters:
+        file_path (str): path to HDF5, where predictions will be written.
+        config (ActiveLearningConfig): job's configuration, loaded from configuration file.
+        result (dict): contains the result of a job, has keys:
+            filenames (NDArray[str]): 1D array containing spectrum filenames.
+            labels_pred (NDArray[int]): 1D array containing labels with the most high probability.
+            entropies (NDArray[float]): 1D array containing entropies to each spectrum.
+            candidate_indexes (NDArray[int]): 1D array containing spectrum indexes, which were predicted as candidate.
+    """
+    labels, entropies = result["labels_pred"], result["entropies"]
+    indexes = np.lexsort((np.arange(labels.shape[0]), entropies, labels))
+    label_offsets = np.searchsorted(labels[indexes], np.arange(len(config.classes) + 1))
+
+    tmp_file_path = f"{file_path}.tmp"
+    with h5py.File(tmp_file_path, "w") as h5f:
+        h5f.create_dataset("classes", data=config.classes, dtype=h5py.string_dtype("utf-8"))
+        h5f.create_dataset("label_offsets", data=label_offsets)
+        h5f.create_dataset("indexes", data=indexes)
+        h5f.create_dataset("entropies", data=entropies[indexes])
+        h5f.create_dataset("filenames", data=result["filenames"][indexes].tolist(), dtype=h5py.string_dtype("utf-8"))
+
+        if config.show_candidates:
+            h5f.create_dataset("candidates", data=np.isin(indexes, result["candidate_indexes"]))
+    os.replace(tmp_file_path, file_path)
+
 def write_active_learning_0_iter(file_path: str, result: dict[str, Any]) -> None:
     """
     Writes the result of active learning job's zero iteration to HDF5 file.
@@ -9,6 +9,7 @@ from src.active_ml.types import LabellingSpectrumSetType
 from src.active_ml.config import ActiveLearningConfig
 from src.active_ml import file_utils
 from src.active_ml import cnn_model
+from src.common.reporters import JobProgressReporter
 
 def get_tr_data(config: ActiveLearningConfig
                 ) -> tuple[NDArray[str], NDArray[float], NDArray[NDArray[float]], NDArray[int]]:
@@ -237,18 +238,21 @@ def create_new_config(config: ActiveLearningConfig):
     with open(f"{config.result_dir_path}/new_config.json", 'w', encoding='utf-8') as f:
         json.dump(new_config, f, indent=4)
 
-def run(config: ActiveLearningConfig):
+def run(config: ActiveLearningConfig, reporter: JobProgressReporter | None = None):
     """
     Runs regular iteration of active learning job.
     
     1. Loads training and pool data.
     2. Trains model and predicts on it.
     3. Gets corresponding indexes.
-    4. Saves results to file and creates severel files.
+    4. Saves results to file, with sorted predictions sidecar, and creates severel files.
 
     Parameters:
         config (ActiveLearningConfig): job's configuration, loaded from configuration file.
+        reporter (JobProgressReporter | None): optional reporter of the job execution progress.
     """
+    if reporter:
+        reporter.update(stage="LOADING")
     perf_est_list = get_perf_est_list(config)
     filenames_tr, wave_tr, fluxes_tr, labels_tr = get_tr_data(config)
     filenames, wave, fluxes = get_pool_data(config)
@@ -266,8 +270,12 @@ def run(config: ActiveLearningConfig):
     points, num_classes = wave.shape[0], len(config.classes)
     fluxes_tr_bal, labels_tr_bal = cnn_model.balance(fluxes_tr, labels_tr)
     model = cnn_model.get_model(points, num_classes)
-    cnn_model.train(model, fluxes_tr_bal, labels_tr_bal, points, num_classes, config)
-    label_list_pred = cnn_model.predict(model, fluxes, points, config)
+    if reporter:
+        reporter.update(stage="TRAINING")
+    cnn_model.train(model, fluxes_tr_bal, labels_tr_bal, points, num_classes, config, reporter)
+    if reporter:
+        reporter.update(stage="PREDICTING")
+    label_list_pred = cnn_model.predict(model, fluxes, points, config, reporter)
     labels_pred = np.argmax(label_list_pred, axis=1)
     entropies = entropy(label_list_pred.T)
 
@@ -285,8 +293,11 @@ def run(config: ActiveLearningConfig):
         "model": model,
     }
 
+    if reporter:
+        reporter.update(stage="WRITING")
     write_prep_data_plot(config, result)
     file_utils.write_active_learning_result(f"{config.result_dir_path}/result.h5", config, result)
+    file_utils.write_predictions(f"{config.result_dir_path}/predictions.h5", config, result)
     file_utils.write_training_data(f"{config.result_dir_path}/training_data.h5", 
                                    filenames_tr, wave_tr, fluxes_tr, labels_tr)
     write_dim_reduc_data(config, fluxes_tr, labels_tr)
@@ -7,6 +7,10 @@ from src.active_ml.serializers import LabellingInitializeSerializer
 from src.active_ml.types import LabellingSpectrumSetType
 from src.common.clients import JobHttpxAPI
 from src.common.dto import JobStartDTO
+from src.common.reporters import (
+    JobProgressReporter,
+    report_job_end,
+)
 from src.common.serializers import JobEndSerializer
 from src.common.types import (
     JobEndActionType,
@@ -19,7 +23,11 @@ from src.common.utils import (
     read_config_file,
     write_log_file,
 )
-from src.infrastructure.clients import api_client
+from src.infrastructure.clients import (
+    api_batch_chunk_size,
+    api_client,
+    api_progress_interval,
+)
 from src.infrastructure.storages import (
     lfs_files_dir_path,
 )
@@ -33,7 +41,8 @@ from src.active_ml.iterations import (
 def active_ml_job(self, dto: JobStartDTO) -> None:
     job_id = self.request.id
     job_api = JobHttpxAPI(api_client)
-    labelling_api = LabellingHttpxAPI(api_client)
+    labelling_api = LabellingHttpxAPI(api_client, api_batch_chunk_size)
+    job_progress_reporter = JobProgressReporter(job_api, job_id, api_progress_interval)
 
     #
 
@@ -47,6 +56,7 @@ def active_ml_job(self, dto: JobStartDTO) -> None:
     #
 
     try:
+        job_progress_reporter.start()
         config_file_data = read_config_file(config_file_path)
         config = ActiveLearningConfig.model_validate(config_file_data)
         config.result_dir_path = result_dir_path
@@ -71,7 +81,7 @@ def active_ml_job(self, dto: JobStartDTO) -> None:
         if config.iteration == 0:
             oracle_indexes, filenames = zero_iteration.run(config)
         else:
-            oracle_indexes, perf_est_indexes, candidate_indexes, filenames, labels_pred = regular_iteration.run(config)
+            oracle_indexes, perf_est_indexes, candidate_indexes, filenames, labels_pred = regular_iteration.run(config, job_progress_reporter)
         
 
         log = "Job was successfully processed!"
@@ -106,10 +116,10 @@ def active_ml_job(self, dto: JobStartDTO) -> None:
                         sequence_iteration=config.iteration,
                         model_prediction=config.classes[labels_pred[i]]
                     ))
-        labelling_api.initialize_labellings_batch(labellings)
+        labelling_api.initialize_labellings_batch(labellings, str(job_id))
 
-        job_api.end_job_by_job_id_and_job_end_action(
-            job_id, JobEndActionType.COMPLETE, JobEndSerializer(started_at=started_at, ended_at=ended_at)
+        report_job_end(
+            job_api, job_id, JobEndActionType.COMPLETE, JobEndSerializer(started_at=started_at, ended_at=ended_at)
         )
     except SystemExit:
         log = "Job was manually aborted!"
@@ -118,10 +128,11 @@ def active_ml_job(self, dto: JobStartDTO) -> None:
         log = get_error_log()
         ended_at = get_current_utc_datetime()
 
-        job_api.end_job_by_job_id_and_job_end_action(
-            job_id, JobEndActionType.ERROR, JobEndSerializer(started_at=started_at, ended_at=ended_at)
+        report_job_end(
+            job_api, job_id, JobEndActionType.ERROR, JobEndSerializer(started_at=started_at, ended_at=ended_at)
         )
 
     finally:
+        job_progress_reporter.stop()
         write_log_file(log_file_path, log)
 
@@ -0,0 +1,6 @@
+from src.catalog_ingestion.job import catalog_ingestion_job
+
+
+__all__ = [
+    "catalog_ingestion_job",
+]
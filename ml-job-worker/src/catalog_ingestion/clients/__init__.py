@@ -0,0 +1,6 @@
+from src.catalog_ingestion.clients.spectrum_api import SpectrumHttpxAPI
+
+
+__all__ = [
+    "SpectrumHttpxAPI",
+]
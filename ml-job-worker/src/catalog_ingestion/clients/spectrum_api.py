@@ -0,0 +1,43 @@
+from httpx import Client
+
+from src.catalog_ingestion.serializers import SpectrumIngestSerializer
+
+
+class SpectrumHttpxAPI:
+    """
+    HTTP client for interacting with the Spectra API of the ML Job service.
+    """
+
+    def __init__(self, api_client: Client) -> None:
+        """
+        Initialize the SpectrumHttpxAPI with a configured HTTP client.
+
+        Parameters:
+            api_client (Client): An `httpx.Client` instance with base_url and other settings.
+        """
+
+        self.api = api_client
+
+    def ingest_spectra_batch(self, batch: list[SpectrumIngestSerializer], idempotency_key: str) -> None:
+        """
+        Send a batch of spectrum headers to be created or replaced in the catalog.
+
+        Serializes each `SpectrumIngestSerializer` to a JSON line and posts the batch as NDJSON
+        to the `/spectra/catalog/stream` endpoint. Spectra are upserted by filename, so the request
+        is idempotent and carries an `Idempotency-Key` header allowing it to be retried.
+
+        Parameters:
+            batch (list[SpectrumIngestSerializer]): List of serializers of scanned spectrum headers.
+            idempotency_key (str): Key identifying the batch, e.g. the ID of the job with the batch index.
+
+        Raises:
+            HTTPError: If the request fails after all retries.
+        """
+
+        content = "".join(f"{serializer.model_dump_json()}\n" for serializer in batch)
+        headers = {
+            "Content-Type": "application/x-ndjson",
+            "Idempotency-Key": idempotency_key,
+        }
+
+        self.api.post("/spectra/catalog/stream", content=content, headers=headers).raise_for_status()
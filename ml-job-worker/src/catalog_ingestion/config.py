@@ -0,0 +1,23 @@
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+)
+
+
+class CatalogIngestionConfig(BaseModel):
+    """
+    Configuration settings for the catalog ingestion pipeline.
+
+    This model defines the input parameters for scanning a directory tree of raw FITS spectra
+    and publishing their header metadata to the spectra catalog of the ML Job API.
+    All values may be loaded from a JSON configuration file.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    data_dir_path: str = Field(
+        "/",
+        description="Path to the directory containing raw FITS spectrum files, scanned recursively",
+        examples=["/B6001"],
+    )
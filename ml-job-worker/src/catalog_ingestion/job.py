@@ -0,0 +1,114 @@
+from celery import shared_task
+
+from src.catalog_ingestion.clients import SpectrumHttpxAPI
+from src.catalog_ingestion.config import CatalogIngestionConfig
+from src.catalog_ingestion.utils import run
+from src.common.clients import JobHttpxAPI
+from src.common.dto import JobStartDTO
+from src.common.reporters import (
+    JobProgressReporter,
+    report_job_end,
+)
+from src.common.serializers import JobEndSerializer
+from src.common.types import (
+    JobEndActionType,
+    JobType,
+)
+from src.common.utils import (
+    get_current_utc_datetime,
+    get_error_log,
+    get_norm_path,
+    read_config_file,
+    write_log_file,
+)
+from src.infrastructure.clients import (
+    api_batch_chunk_size,
+    api_client,
+    api_progress_interval,
+)
+from src.infrastructure.storages import (
+    lfs_files_dir_path,
+    lfs_spectra_dir_path,
+)
+
+
+@shared_task(bind=True, pydantic=True, name=JobType.CATALOG_INGESTION)
+def catalog_ingestion_job(self, dto: JobStartDTO) -> None:
+    """
+    Celery task to publish the header metadata of raw spectra to the spectra catalog for a given Catalog Ingestion job.
+
+    This task will:
+      1. Construct absolute paths for the job’s config.json and log.txt under the shared filesystem.
+      2. Read and validate the JSON config into a CatalogIngestionConfig.
+      3. Normalize the raw spectra directory path under the shared spectra directory.
+      4. Invoke the `run` helper to scan the spectrum headers and send them to the ML Job API in chunks,
+         reporting the scanned files count to the ML Job API in a rate-limited way.
+      5. Report success or failure back to the ML Job API via JobHttpxAPI.
+      6. Write a log file capturing success with skipped files, manual abort, or error stack trace.
+
+    Parameters:
+        self: Bound task instance, exposing `.request.id` as the job UUID.
+        dto (JobStartDTO): DTO containing `dir_path` where config.json lives.
+    """
+
+    job_id = self.request.id
+    job_api = JobHttpxAPI(api_client)
+    spectrum_api = SpectrumHttpxAPI(api_client)
+    job_progress_reporter = JobProgressReporter(job_api, job_id, api_progress_interval)
+
+    #
+
+    # Build absolute paths for config and log files under LFS
+    config_file_path = get_norm_path(dto.dir_path, prefix=lfs_files_dir_path, child_name="config.json")
+    log_file_path = get_norm_path(dto.dir_path, prefix=lfs_files_dir_path, child_name="log.txt")
+
+    #
+
+    log = None
+    started_at = get_current_utc_datetime()
+
+    try:
+        # Start heartbeats, so the API keeps the job lease while it is running
+        job_progress_reporter.start()
+
+        # Load Catalog Ingestion configuration
+        config_file_data = read_config_file(config_file_path)
+
+        # Validate Catalog Ingestion configuration
+        config = CatalogIngestionConfig.model_validate(config_file_data)
+        config.data_dir_path = get_norm_path(config.data_dir_path, prefix=lfs_spectra_dir_path)
+
+        # Execute the ingestion pipeline, periodically reporting its progress
+        skipped_file_paths = run(
+            config, lfs_spectra_dir_path, spectrum_api, str(job_id), api_batch_chunk_size, job_progress_reporter
+        )
+
+        #
+
+        # On success, notify the API
+        log = "\n".join(
+            [f"Job was successfully processed! Skipped {len(skipped_file_paths)} invalid files.", *skipped_file_paths]
+        )
+        ended_at = get_current_utc_datetime()
+
+        report_job_end(
+            job_api, job_id, JobEndActionType.COMPLETE, JobEndSerializer(started_at=started_at, ended_at=ended_at)
+        )
+
+    except SystemExit:
+        # Manual abort (e.g. SIGTERM) recorded as user abort
+        log = "Job was manually aborted!"
+
+    except Exception:
+        # Any other exception: capture stack trace, notify API of error
+        log = get_error_log()
+        ended_at = get_current_utc_datetime()
+
+        report_job_end(
+            job_api, job_id, JobEndActionType.ERROR, JobEndSerializer(started_at=started_at, ended_at=ended_at)
+        )
+
+    finally:
+        # Always stop heartbeats and write out the task log
+        job_progress_reporter.stop()
+        write_log_file(log_file_path, log)
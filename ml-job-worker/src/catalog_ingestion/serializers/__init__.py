@@ -0,0 +1,6 @@
+from src.catalog_ingestion.serializers.spectrum_ingest import SpectrumIngestSerializer
+
+
+__all__ = [
+    "SpectrumIngestSerializer",
+]
@@ -0,0 +1,161 @@
+from datetime import datetime
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from src.catalog_ingestion.types import SpectrumType
+
+
+class SpectrumIngestSerializer(BaseModel):
+    """
+    Serializer model for ingesting the header metadata of a spectrum into the catalog.
+    """
+
+    filename: str = Field(
+        ...,
+        min_length=1,
+        max_length=70,
+        description="Name of the FITS file containing the spectrum",
+        examples=["spec-56207-M31011N44B2_sp01-006.fits"],
+    )
+
+    dir_path: str = Field(
+        ...,
+        min_length=1,
+        max_length=255,
+        description="Path of the directory containing the spectrum file, relative to the shared spectra directory",
+        examples=["/M31011N44B2"],
+    )
+
+    targetname: str = Field(
+        ...,
+        min_length=1,
+        max_length=70,
+        description="Target designation from the input catalog (DESIG header key)",
+        examples=["LAMOST J192438.86+365628.7"],
+    )
+
+    observed_at: datetime = Field(
+        ...,
+        description="UTC datetime of the observation (DATE-OBS header key)",
+        examples=["2025-04-04T12:00:00Z"],
+    )
+
+    type: SpectrumType = Field(
+        ...,
+        description="Broad spectral class (CLASS header key)",
+    )
+
+    subtype: str = Field(
+        ...,
+        min_length=1,
+        max_length=30,
+        description="Detailed spectral subtype (SUBCLASS header key)",
+        examples=["G2V"],
+    )
+
+    ra: float = Field(
+        ...,
+        description="Right ascension in decimal degrees from the input catalog (RA header key)",
+        examples=[291.161958],
+    )
+
+    dec: float = Field(
+        ...,
+        description="Declination in decimal degrees from the input catalog (DEC header key)",
+        examples=[36.941333],
+    )
+
+    magtype: str = Field(
+        ...,
+        min_length=1,
+        max_length=20,
+        description="Magnitude type identifier (MAGTYPE header key)",
+        examples=["Kp"],
+    )
+
+    mag_1: float = Field(
+        ...,
+        description="Magnitude in band 1 (MAG1 header key)",
+        examples=[15.67],
+    )
+
+    mag_2: float = Field(
+        ...,
+        description="Magnitude in band 2 (MAG2 header key)",
+        examples=[99.0],
+    )
+
+    mag_3: float = Field(
+        ...,
+        description="Magnitude in band 3 (MAG3 header key)",
+        examples=[99.0],
+    )
+
+    mag_4: float = Field(
+        ...,
+        description="Magnitude in band 4 (MAG4 header key)",
+        examples=[99.0],
+    )
+
+    mag_5: float = Field(
+        ...,
+        description="Magnitude in band 5 (MAG5 header key)",
+        examples=[99.0],
+    )
+
+    mag_6: float = Field(
+        ...,
+        description="Magnitude in band 6 (MAG6 header key)",
+        examples=[99.0],
+    )
+
+    mag_7: float = Field(
+        ...,
+        description="Magnitude in band 7 (MAG7 header key)",
+        examples=[99.0],
+    )
+
+    sn_u: float = Field(
+        ...,
+        description="Signal-to-noise ratio in the u band (SN_U header key)",
+        examples=[1.26],
+    )
+
+    sn_g: float = Field(
+        ...,
+        description="Signal-to-noise ratio in the g band (SN_G header key)",
+        examples=[6.29],
+    )
+
+    sn_r: float = Field(
+        ...,
+        description="Signal-to-noise ratio in the r band (SN_R header key)",
+        examples=[17.65],
+    )
+
+    sn_i: float = Field(
+        ...,
+        description="Signal-to-noise ratio in the i band (SN_I header key)",
+        examples=[22.46],
+    )
+
+    sn_z: float = Field(
+        ...,
+        description="Signal-to-noise ratio in the z band (SN_Z header key)",
+        examples=[16.34],
+    )
+
+    z: float = Field(
+        ...,
+        description="Measured redshift from the spectrum (Z header key)",
+        examples=[-0.00032162],
+    )
+
+    z_err: float = Field(
+        ...,
+        description="Uncertainty of the measured redshift (Z_ERR header key)",
+        examples=[0.0000021],
+    )
@@ -0,0 +1,6 @@
+from src.catalog_ingestion.types.spectrum import SpectrumType
+
+
+__all__ = [
+    "SpectrumType",
+]
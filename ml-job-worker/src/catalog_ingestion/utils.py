@@ -0,0 +1,161 @@
+import os
+import re
+from collections.abc import Iterator
+from datetime import (
+    datetime,
+    timezone,
+)
+from typing import Any
+
+from astropy.io import fits
+
+from src.catalog_ingestion.clients import SpectrumHttpxAPI
+from src.catalog_ingestion.config import CatalogIngestionConfig
+from src.catalog_ingestion.serializers import SpectrumIngestSerializer
+from src.common.reporters import JobProgressReporter
+from src.common.utils import get_norm_path
+
+
+# LAMOST naming convention of the spectrum files served by the ML Job API
+spectrum_filename_pattern = re.compile(r"^spec-\d+-[A-Za-z0-9]+_sp\d+-\d+\.fits$")
+
+
+#
+
+
+def read_spectrum_header(file_path: str) -> dict[str, Any]:
+    """
+    Read the header metadata of a single FITS spectrum file, without reading its data arrays.
+
+    Only the primary header is read, so scanning a file costs a few kilobytes of I/O
+    regardless of the size of its flux and wavelength arrays.
+
+    Parameters:
+        file_path (str): Absolute path to the FITS file.
+
+    Returns:
+        dict[str, Any]: A mapping of the catalog fields to the header values of the spectrum.
+    """
+
+    header = fits.getheader(file_path, 0)
+
+    # Observation datetimes of LAMOST headers are in UTC without an explicit offset
+    observed_at = datetime.fromisoformat(header["DATE-OBS"])
+
+    if observed_at.tzinfo is None:
+        observed_at = observed_at.replace(tzinfo=timezone.utc)
+
+    raw_spectrum_header = dict(
+        targetname=header["DESIG"],
+        observed_at=observed_at,
+        type=str(header["CLASS"]).upper(),
+        subtype=header["SUBCLASS"],
+        ra=header["RA"],
+        dec=header["DEC"],
+        magtype=header["MAGTYPE"],
+        mag_1=header["MAG1"],
+        mag_2=header["MAG2"],
+        mag_3=header["MAG3"],
+        mag_4=header["MAG4"],
+        mag_5=header["MAG5"],
+        mag_6=header["MAG6"],
+        mag_7=header["MAG7"],
+        sn_u=header["SN_U"],
+        sn_g=header["SN_G"],
+        sn_r=header["SN_R"],
+        sn_i=header["SN_I"],
+        sn_z=header["SN_Z"],
+        z=header["Z"],
+        z_err=header["Z_ERR"],
+    )
+
+    return raw_spectrum_header
+
+
+def iterate_spectrum_files(data_dir_path: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively iterate the spectrum files of a directory tree, following the LAMOST naming convention.
+
+    Directories are scanned lazily one at a time, so arbitrarily large archives are never listed in memory.
+
+    Parameters:
+        data_dir_path (str): Directory containing raw FITS files, possibly in nested directories.
+
+    Returns:
+        Iterator[os.DirEntry]: Directory entries of the spectrum files.
+    """
+
+    dir_paths = [data_dir_path]
+
+    while dir_paths:
+        with os.scandir(dir_paths.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dir_paths.append(entry.path)
+
+                elif entry.is_file() and spectrum_filename_pattern.match(entry.name):
+                    yield entry
+
+
+#
+
+
+def run(
+    config: CatalogIngestionConfig,
+    spectra_dir_path: str,
+    spectrum_api: SpectrumHttpxAPI,
+    idempotency_key: str,
+    chunk_size: int,
+    reporter: JobProgressReporter | None = None,
+) -> list[str]:
+    """
+    Execute the full catalog ingestion workflow.
+
+    1. Scans the directory tree at `config.data_dir_path`, reading the header of each spectrum file.
+    2. Sends the headers to the ML Job API in chunks of `chunk_size`, as soon as each chunk is full.
+
+    Files with missing or invalid header keys are skipped, so a few corrupt files never fail the whole scan.
+
+    Parameters:
+        config (CatalogIngestionConfig): Validated configuration object containing all job parameters.
+        spectra_dir_path (str): Absolute path to the shared spectra directory the catalog paths are relative to.
+        spectrum_api (SpectrumHttpxAPI): HTTP client for the ML Job API spectra endpoints.
+        idempotency_key (str): Key identifying the ingestion, e.g. the ID of the job, suffixed per chunk.
+        chunk_size (int): Maximum number of spectra sent in one request.
+        reporter (JobProgressReporter | None): Optional reporter of the job execution progress.
+
+    Returns:
+        list[str]: Paths of the skipped files, relative to the shared spectra directory.
+    """
+
+    if reporter:
+        reporter.update(stage="INGESTING")
+
+    batch = []
+    skipped_file_paths = []
+    chunk_index = 0
+
+    for files_processed, spectrum_file in enumerate(iterate_spectrum_files(config.data_dir_path), start=1):
+        rel_dir_path = get_norm_path(f"/{os.path.relpath(os.path.dirname(spectrum_file.path), spectra_dir_path)}")
+
+        try:
+            spectrum_header = read_spectrum_header(spectrum_file.path)
+            batch.append(
+                SpectrumIngestSerializer(filename=spectrum_file.name, dir_path=rel_dir_path, **spectrum_header)
+            )
+
+        except (OSError, KeyError, ValueError):
+            skipped_file_paths.append(get_norm_path(rel_dir_path, child_name=spectrum_file.name))
+
+        if len(batch) >= chunk_size:
+            spectrum_api.ingest_spectra_batch(batch, f"{idempotency_key}:{chunk_index}")
+            batch = []
+            chunk_index += 1
+
+        if reporter:
+            reporter.update(files_processed=files_processed)
+
+    if batch:
+        spectrum_api.ingest_spectra_batch(batch, f"{idempotency_key}:{chunk_index}")
+
+    return skipped_file_paths
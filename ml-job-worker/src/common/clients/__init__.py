@@ -1,6 +1,8 @@
 from src.common.clients.job_api import JobHttpxAPI
+from src.common.clients.transport import ResilientHTTPTransport
 
 
 __all__ = [
     "JobHttpxAPI",
+    "ResilientHTTPTransport",
 ]
@@ -2,7 +2,10 @@ from uuid import UUID
 
 from httpx import Client
 
-from src.common.serializers import JobEndSerializer
+from src.common.serializers import (
+    JobEndSerializer,
+    JobProgressSerializer,
+)
 from src.common.types import JobEndActionType
 
 
@@ -28,14 +31,35 @@ class JobHttpxAPI:
         Send a request to mark a job as completed or errored.
 
         This method serializes the end-of-job metrics into JSON and POSTs them to the
-        `/jobs/{job_id}/end/{job_end_action}` endpoint.
+        `/jobs/{job_id}/end/{job_end_action}` endpoint. The request carries an `Idempotency-Key`
+        header, so it is retried after transient failures.
 
         Parameters:
             job_id (UUID): Unique identifier of the job to end.
             job_end_action (JobEndActionType): The action type, either COMPLETE or ERROR.
             serializer (JobEndSerializer): Serializer data model containing job execution metrics.
+
+        Raises:
+            HTTPError: If the request fails after all retries.
         """
 
         response = serializer.model_dump(mode="json")
+        headers = {"Idempotency-Key": f"{job_id}:{job_end_action}"}
+
+        self.api.post(f"/jobs/{job_id}/end/{job_end_action}", json=response, headers=headers).raise_for_status()
+
+    def progress_job_by_job_id(self, job_id: UUID, serializer: JobProgressSerializer) -> None:
+        """
+        Send a request to report the execution progress of a running job.
+
+        This method serializes the progress snapshot into JSON and POSTs it to the
+        `/jobs/{job_id}/progress` endpoint. The request is not retried, since the next report supersedes it.
+
+        Parameters:
+            job_id (UUID): Unique identifier of the running job.
+            serializer (JobProgressSerializer): Serializer data model containing job execution progress.
+        """
+
+        response = serializer.model_dump(mode="json", exclude_none=True)
 
-        self.api.post(f"/jobs/{job_id}/end/{job_end_action}", json=response)
+        self.api.post(f"/jobs/{job_id}/progress", json=response)
@@ -0,0 +1,134 @@
+import gzip
+import random
+import time
+
+from httpx import (
+    BaseTransport,
+    Request,
+    Response,
+    TransportError,
+)
+
+
+class ResilientHTTPTransport(BaseTransport):
+    """
+    HTTP transport wrapper adding gzip request compression and retries with exponential backoff.
+
+    Request bodies of at least `gzip_min_size` bytes are sent with `Content-Encoding: gzip`.
+    Retry-safe requests, i.e. requests with an idempotent method or an `Idempotency-Key` header,
+    are retried after transport errors and 429/5xx responses, waiting an exponential backoff
+    with full jitter or the `Retry-After` header value between attempts.
+    """
+
+    retry_status_codes = {429, 500, 502, 503, 504}
+
+    idempotent_methods = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+    def __init__(
+        self, transport: BaseTransport, retries: int, backoff: float, backoff_max: float, gzip_min_size: int
+    ) -> None:
+        """
+        Wrap an HTTP transport.
+
+        Parameters:
+            transport (BaseTransport): The wrapped transport actually sending requests.
+            retries (int): Maximum number of retries of a retry-safe request.
+            backoff (float): Base seconds of the exponential backoff.
+            backoff_max (float): Maximum seconds of the backoff.
+            gzip_min_size (int): Minimum size in bytes of a request body to be compressed.
+        """
+
+        self.transport = transport
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.gzip_min_size = gzip_min_size
+
+    def _compress(self, request: Request) -> Request:
+        """
+        Build a gzip-compressed copy of a request with a large enough body.
+
+        Parameters:
+            request (Request): The original request.
+
+        Returns:
+            Request: The compressed request, or the original one if compression does not apply.
+        """
+
+        content = request.read()
+
+        if len(content) < self.gzip_min_size or "Content-Encoding" in request.headers:
+            return request
+
+        compressed_content = gzip.compress(content)
+        headers = request.headers.copy()
+        headers["Content-Encoding"] = "gzip"
+        headers["Content-Length"] = str(len(compressed_content))
+
+        return Request(
+            method=request.method,
+            url=request.url,
+            headers=headers,
+            content=compressed_content,
+            extensions=request.extensions,
+        )
+
+    def _get_delay(self, attempt: int, response: Response | None = None) -> float:
+        """
+        Compute seconds to wait before the next attempt.
+
+        Parameters:
+            attempt (int): Zero-based number of the failed attempt.
+            response (Response | None): The failed attempt response, if any.
+
+        Returns:
+            float: Seconds to wait.
+        """
+
+        if response is not None and "Retry-After" in response.headers:
+            try:
+                return min(self.backoff_max, float(response.headers["Retry-After"]))
+
+            except ValueError:
+                pass
+
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2**attempt))
+
+    def handle_request(self, request: Request) -> Response:
+        """
+        Send a request, retrying retry-safe requests after transient failures.
+
+        Parameters:
+            request (Request): The request to send.
+
+        Returns:
+            Response: The response of the last attempt.
+        """
+
+        request = self._compress(request)
+        is_retry_safe = request.method in self.idempotent_methods or "Idempotency-Key" in request.headers
+        retries = self.retries if is_retry_safe else 0
+
+        for attempt in range(retries + 1):
+            try:
+                response = self.transport.handle_request(request)
+
+            except TransportError:
+                if attempt == retries:
+                    raise
+
+                time.sleep(self._get_delay(attempt))
+                continue
+
+            if response.status_code not in self.retry_status_codes or attempt == retries:
+                return response
+
+            response.close()
+            time.sleep(self._get_delay(attempt, response))
+
+    def close(self) -> None:
+        """
+        Close the wrapped transport.
+        """
+
+        self.transport.close()
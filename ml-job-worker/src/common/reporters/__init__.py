@@ -0,0 +1,8 @@
+from src.common.reporters.job_end import report_job_end
+from src.common.reporters.job_progress import JobProgressReporter
+
+
+__all__ = [
+    "JobProgressReporter",
+    "report_job_end",
+]
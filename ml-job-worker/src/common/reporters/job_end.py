@@ -0,0 +1,59 @@
+from uuid import UUID
+
+from celery.utils.log import get_task_logger
+from httpx import (
+    HTTPError,
+    HTTPStatusError,
+    codes,
+)
+
+from src.common.clients import JobHttpxAPI
+from src.common.serializers import JobEndSerializer
+from src.common.types import JobEndActionType
+
+
+logger = get_task_logger(__name__)
+
+
+#
+
+
+def report_job_end(
+    job_api: JobHttpxAPI, job_id: UUID, job_end_action: JobEndActionType, serializer: JobEndSerializer
+) -> bool:
+    """
+    Report the end of a job to the API without ever raising.
+
+    A 409 response means the API already ended the job, e.g. it was aborted or its lease expired,
+    so the report is terminal and only logged. Other failures, after the retries of the transport,
+    are logged as well, since a job whose results are stored must not be reported as errored
+    because of an unreachable API.
+
+    Parameters:
+        job_api (JobHttpxAPI): HTTP client for the ML Job API jobs endpoints.
+        job_id (UUID): Unique identifier of the ended job.
+        job_end_action (JobEndActionType): The action type, either COMPLETE or ERROR.
+        serializer (JobEndSerializer): Serializer data model containing job execution metrics.
+
+    Returns:
+        bool: Whether the API accepted the report.
+    """
+
+    try:
+        job_api.end_job_by_job_id_and_job_end_action(job_id, job_end_action, serializer)
+
+    except HTTPStatusError as e:
+        if e.response.status_code == codes.CONFLICT:
+            logger.warning("Job with ID=%s was already ended by the API, not reported as %s.", job_id, job_end_action)
+
+        else:
+            logger.exception("Cannot report job with ID=%s as %s.", job_id, job_end_action)
+
+        return False
+
+    except HTTPError:
+        logger.exception("Cannot report job with ID=%s as %s.", job_id, job_end_action)
+
+        return False
+
+    return True
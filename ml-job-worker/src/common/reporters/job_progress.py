@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import Any
+from uuid import UUID
+
+from httpx import HTTPError
+
+from src.common.clients import JobHttpxAPI
+from src.common.serializers import JobProgressSerializer
+
+
+class JobProgressReporter:
+    """
+    Rate-limited reporter of the execution progress of a running job.
+
+    Progress updates are merged into a single snapshot, which is sent to the API at most once
+    per `interval` seconds, so tight loops (per file, per epoch, per batch) may report freely.
+    While started, a background thread also resends the snapshot every `interval` seconds,
+    so the API keeps receiving heartbeats during long steps without progress updates.
+    Reporting is best effort: HTTP failures never interrupt the job itself.
+    """
+
+    def __init__(self, job_api: JobHttpxAPI, job_id: UUID, interval: float) -> None:
+        """
+        Initialize the reporter for a single job execution.
+
+        Parameters:
+            job_api (JobHttpxAPI): HTTP client for the ML Job API jobs endpoints.
+            job_id (UUID): Unique identifier of the running job.
+            interval (float): Minimum seconds between two reports sent to the API.
+        """
+
+        self.job_api = job_api
+        self.job_id = job_id
+        self.interval = interval
+        self.progress: dict[str, Any] = {}
+        self.reported_at: float | None = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.heartbeat_thread: threading.Thread | None = None
+
+    def _beat(self) -> None:
+        """
+        Resend the current snapshot whenever no report was sent for `interval` seconds, until stopped.
+        """
+
+        while not self.stopped.wait(self.interval):
+            if time.monotonic() - self.reported_at >= self.interval:
+                self.flush()
+
+    def start(self) -> None:
+        """
+        Send the first heartbeat and start the background heartbeat thread.
+        """
+
+        self.flush()
+
+        self.stopped.clear()
+        self.heartbeat_thread = threading.Thread(target=self._beat, name=f"heartbeat-{self.job_id}", daemon=True)
+        self.heartbeat_thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background heartbeat thread.
+        """
+
+        self.stopped.set()
+
+        if self.heartbeat_thread:
+            self.heartbeat_thread.join()
+            self.heartbeat_thread = None
+
+    def update(self, **progress: Any) -> None:
+        """
+        Merge new progress values into the snapshot and report it if the interval has elapsed.
+
+        A change of the execution stage is reported immediately.
+
+        Parameters:
+            **progress (Any): Progress fields of JobProgressSerializer to update.
+        """
+
+        with self.lock:
+            is_stage_changed = "stage" in progress and progress["stage"] != self.progress.get("stage")
+
+            self.progress.update(progress)
+
+        if is_stage_changed or self.reported_at is None or time.monotonic() - self.reported_at >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Send the current progress snapshot to the API regardless of the interval.
+        """
+
+        with self.lock:
+            self.reported_at = time.monotonic()
+            serializer = JobProgressSerializer(**self.progress)
+
+        try:
+            self.job_api.progress_job_by_job_id(self.job_id, serializer)
+
+        except HTTPError:
+            pass
@@ -1,6 +1,8 @@
 from src.common.serializers.job_end import JobEndSerializer
+from src.common.serializers.job_progress import JobProgressSerializer
 
 
 __all__ = [
     "JobEndSerializer",
+    "JobProgressSerializer",
 ]
@@ -0,0 +1,66 @@
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+
+class JobProgressSerializer(BaseModel):
+    """
+    Serializer model used by workers to report the execution progress of a running job.
+    """
+
+    stage: str | None = Field(
+        None,
+        min_length=1,
+        max_length=30,
+        description="Name of the execution stage the worker is currently in",
+        examples=["TRAINING"],
+    )
+
+    files_processed: int | None = Field(
+        None,
+        ge=0,
+        description="Number of input files processed so far",
+        examples=[1200],
+    )
+
+    files_total: int | None = Field(
+        None,
+        ge=0,
+        description="Total number of input files to process",
+        examples=[45000],
+    )
+
+    epoch: int | None = Field(
+        None,
+        ge=0,
+        description="Number of model training epochs finished so far",
+        examples=[12],
+    )
+
+    epochs_total: int | None = Field(
+        None,
+        ge=0,
+        description="Maximum number of model training epochs",
+        examples=[1000],
+    )
+
+    loss: float | None = Field(
+        None,
+        description="Model training loss of the latest finished epoch",
+        examples=[0.4213],
+    )
+
+    prediction_batch: int | None = Field(
+        None,
+        ge=0,
+        description="Number of model prediction batches finished so far",
+        examples=[3],
+    )
+
+    prediction_batches_total: int | None = Field(
+        None,
+        ge=0,
+        description="Total number of model prediction batches",
+        examples=[8],
+    )
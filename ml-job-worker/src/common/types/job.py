@@ -8,3 +8,4 @@ class JobType(StrEnum):
 
     DATA_PREPROCESSING = "DATA_PREPROCESSING"
     ACTIVE_ML = "ACTIVE_ML"
+    CATALOG_INGESTION = "CATALOG_INGESTION"
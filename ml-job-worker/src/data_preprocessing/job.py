@@ -2,6 +2,10 @@ from celery import shared_task
 
 from src.common.clients import JobHttpxAPI
 from src.common.dto import JobStartDTO
+from src.common.reporters import (
+    JobProgressReporter,
+    report_job_end,
+)
 from src.common.serializers import JobEndSerializer
 from src.common.types import (
     JobEndActionType,
@@ -16,7 +20,10 @@ from src.common.utils import (
 )
 from src.data_preprocessing.config import DataPreprocessingConfig
 from src.data_preprocessing.utils import run
-from src.infrastructure.clients import api_client
+from src.infrastructure.clients import (
+    api_client,
+    api_progress_interval,
+)
 from src.infrastructure.storages import (
     lfs_files_dir_path,
     lfs_spectra_dir_path,
@@ -32,7 +39,8 @@ def data_preprocessing_job(self, dto: JobStartDTO) -> None:
       1. Construct absolute paths for the job’s config.json, result.h5, and log.txt under the shared filesystem.
       2. Read and validate the JSON config into a DataPreprocessingConfig.
       3. Normalize the raw spectra directory path and assign the output HDF5 path.
-      4. Invoke the `run` helper to interpolate and scale spectra, then write the HDF5.
+      4. Invoke the `run` helper to interpolate and scale spectra, then write the HDF5,
+         reporting the processed files count to the ML Job API in a rate-limited way.
       5. Report success or failure back to the ML Job API via JobHttpxAPI.
       6. Write a log file capturing success, manual abort, or error stack trace.
 
@@ -43,6 +51,7 @@ def data_preprocessing_job(self, dto: JobStartDTO) -> None:
 
     job_id = self.request.id
     job_api = JobHttpxAPI(api_client)
+    job_progress_reporter = JobProgressReporter(job_api, job_id, api_progress_interval)
 
     #
 
@@ -57,6 +66,9 @@ def data_preprocessing_job(self, dto: JobStartDTO) -> None:
     started_at = get_current_utc_datetime()
 
     try:
+        # Start heartbeats, so the API keeps the job lease while it is running
+        job_progress_reporter.start()
+
         # Load Data Preprocessing configuration
         config_file_data = read_config_file(config_file_path)
 
@@ -65,8 +77,8 @@ def data_preprocessing_job(self, dto: JobStartDTO) -> None:
         config.data_dir_path = get_norm_path(config.data_dir_path, prefix=lfs_spectra_dir_path)
         config.result_file_path = result_file_path
 
-        # Execute the preprocessing pipeline
-        run(config)
+        # Execute the preprocessing pipeline, periodically reporting its progress
+        run(config, job_progress_reporter)
 
         #
 
@@ -74,8 +86,8 @@ def data_preprocessing_job(self, dto: JobStartDTO) -> None:
         log = "Job was successfully processed!"
         ended_at = get_current_utc_datetime()
 
-        job_api.end_job_by_job_id_and_job_end_action(
-            job_id, JobEndActionType.COMPLETE, JobEndSerializer(started_at=started_at, ended_at=ended_at)
+        report_job_end(
+            job_api, job_id, JobEndActionType.COMPLETE, JobEndSerializer(started_at=started_at, ended_at=ended_at)
         )
 
     except SystemExit:
@@ -87,10 +99,11 @@ def data_preprocessing_job(self, dto: JobStartDTO) -> None:
         log = get_error_log()
         ended_at = get_current_utc_datetime()
 
-        job_api.end_job_by_job_id_and_job_end_action(
-            job_id, JobEndActionType.ERROR, JobEndSerializer(started_at=started_at, ended_at=ended_at)
+        report_job_end(
+            job_api, job_id, JobEndActionType.ERROR, JobEndSerializer(started_at=started_at, ended_at=ended_at)
         )
 
     finally:
-        # Always write out the task log
+        # Always stop heartbeats and write out the task log
+        job_progress_reporter.stop()
         write_log_file(log_file_path, log)
@@ -7,6 +7,7 @@ from astropy.io import fits
 from numpy.typing import NDArray
 from sklearn.preprocessing import minmax_scale
 
+from src.common.reporters import JobProgressReporter
 from src.data_preprocessing.config import DataPreprocessingConfig
 
 
@@ -69,7 +70,11 @@ def write_preprocessed_file(
 
 
 def preprocess_data_dir(
-    data_dir_path: str, wave_start_point: float, wave_end_point: float, wave_point_count: int
+    data_dir_path: str,
+    wave_start_point: float,
+    wave_end_point: float,
+    wave_point_count: int,
+    reporter: JobProgressReporter | None = None,
 ) -> tuple[NDArray[str], NDArray[float], NDArray[float]]:
     """
     Scan a directory of FITS spectra, interpolate and scale their flux arrays.
@@ -84,6 +89,7 @@ def preprocess_data_dir(
         wave_start_point (float): Minimum wavelength (Å) of the output grid.
         wave_end_point (float): Maximum wavelength (Å) of the output grid.
         wave_point_count (int): Number of points in the output grid.
+        reporter (JobProgressReporter | None): Optional reporter of the processed files count.
 
     Returns:
         Tuple[NDArray[str], NDArray[float], NDArray[float]]:
@@ -97,12 +103,17 @@ def preprocess_data_dir(
     uniform_wave = np.linspace(wave_start_point, wave_end_point, wave_point_count, dtype=float)
 
     with os.scandir(data_dir_path) as spectrum_files:
-        for spectrum_file in spectrum_files:
-            spectrum_file_data = read_spectrum_file(spectrum_file.path)
-            interpolated_flux = np.interp(uniform_wave, spectrum_file_data["wave"], spectrum_file_data["flux"])
+        spectrum_files = list(spectrum_files)
 
-            filenames.append(spectrum_file_data["filename"])
-            fluxes.append(interpolated_flux)
+    for files_processed, spectrum_file in enumerate(spectrum_files, start=1):
+        spectrum_file_data = read_spectrum_file(spectrum_file.path)
+        interpolated_flux = np.interp(uniform_wave, spectrum_file_data["wave"], spectrum_file_data["flux"])
+
+        filenames.append(spectrum_file_data["filename"])
+        fluxes.append(interpolated_flux)
+
+        if reporter:
+            reporter.update(files_processed=files_processed, files_total=len(spectrum_files))
 
     prepared_filenames = np.array(filenames, dtype=str)
     interpolated_fluxes = minmax_scale(np.array(fluxes, dtype=float), feature_range=(-1, 1), axis=1)
@@ -113,7 +124,7 @@ def preprocess_data_dir(
 #
 
 
-def run(config: DataPreprocessingConfig) -> None:
+def run(config: DataPreprocessingConfig, reporter: JobProgressReporter | None = None) -> None:
     """
     Execute the full preprocessing workflow.
 
@@ -123,10 +134,17 @@ def run(config: DataPreprocessingConfig) -> None:
 
     Parameters:
         config (DataPreprocessingConfig): Validated configuration object containing all job parameters.
+        reporter (JobProgressReporter | None): Optional reporter of the job execution progress.
     """
 
+    if reporter:
+        reporter.update(stage="PREPROCESSING")
+
     filenames, fluxes, wave = preprocess_data_dir(
-        config.data_dir_path, config.wave_start_point, config.wave_end_point, config.wave_point_count
+        config.data_dir_path, config.wave_start_point, config.wave_end_point, config.wave_point_count, reporter
     )
 
+    if reporter:
+        reporter.update(stage="WRITING")
+
     write_preprocessed_file(config.result_file_path, filenames, fluxes, wave)
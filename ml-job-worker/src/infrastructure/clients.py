@@ -1,13 +1,39 @@
-from httpx import Client
+from httpx import (
+    Client,
+    HTTPTransport,
+    Limits,
+)
 
+from src.common.clients import ResilientHTTPTransport
 from src.settings.clients import api_settings
 
 
 #
 
 
+# HTTP transport keeping connections to the ML Job API alive, compressing and retrying requests
+api_transport = ResilientHTTPTransport(
+    transport=HTTPTransport(
+        limits=Limits(
+            max_keepalive_connections=api_settings.api_max_keepalive_connections,
+            keepalive_expiry=api_settings.api_keepalive_expiry,
+        ),
+    ),
+    retries=api_settings.api_request_retries,
+    backoff=api_settings.api_request_backoff,
+    backoff_max=api_settings.api_request_backoff_max,
+    gzip_min_size=api_settings.api_gzip_min_size,
+)
+
 # HTTP client for sending requests to the ML Job API microservice
 api_client = Client(
     base_url=api_settings.api_url,
     timeout=api_settings.api_connection_timeout,
+    transport=api_transport,
 )
+
+# Minimum seconds between two job progress reports sent to the ML Job API microservice
+api_progress_interval = api_settings.api_progress_interval
+
+# Maximum number of items sent to the ML Job API microservice in one chunk of a large batch
+api_batch_chunk_size = api_settings.api_batch_chunk_size
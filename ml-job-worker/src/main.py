@@ -9,6 +9,7 @@ app = Celery()
 # Include task modules so Celery can discover and register tasks
 app.conf.include = [
     "src.active_ml",
+    "src.catalog_ingestion",
     "src.data_preprocessing",
 ]
 
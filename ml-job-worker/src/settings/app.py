@@ -62,6 +62,16 @@ class AppSettings(BaseSettings):
         description="Enable emission of job-related events for monitoring and inspection",
     )
 
+    task_queue_max_priority: int = Field(
+        9,
+        description="Maximum job priority supported by the queues declared by the worker",
+    )
+
+    task_default_priority: int = Field(
+        5,
+        description="Priority of jobs received without an explicit priority",
+    )
+
     @field_validator("broker_url")
     def build_broker_url(cls, broker_url: str) -> str:
         broker_dsn = AmqpDsn(broker_url)
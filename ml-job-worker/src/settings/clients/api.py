@@ -22,6 +22,46 @@ class APISettings(BaseSettings):
         description="Maximum seconds to wait when establishing or reusing an HTTP connection to the API",
     )
 
+    api_progress_interval: float = Field(
+        10,
+        description="Minimum seconds between two job progress reports sent to the API",
+    )
+
+    api_request_retries: int = Field(
+        5,
+        description="Maximum number of retries of a retry-safe API request after transport errors or 429/5xx responses",
+    )
+
+    api_request_backoff: float = Field(
+        0.5,
+        description="Base seconds of the exponential backoff with full jitter between two API request retries",
+    )
+
+    api_request_backoff_max: float = Field(
+        30,
+        description="Maximum seconds of the backoff between two API request retries",
+    )
+
+    api_gzip_min_size: int = Field(
+        1024,
+        description="Minimum size in bytes of an API request body to be sent gzip-compressed",
+    )
+
+    api_max_keepalive_connections: int = Field(
+        4,
+        description="Maximum number of idle keep-alive connections to the API kept open for reuse",
+    )
+
+    api_keepalive_expiry: float = Field(
+        60,
+        description="Seconds an idle keep-alive connection to the API is kept open",
+    )
+
+    api_batch_chunk_size: int = Field(
+        1000,
+        description="Maximum number of items sent to the API in one chunk of a large batch",
+    )
+
     @field_validator("api_url")
     def build_api_url(cls, api_url: str) -> str:
         http_url = HttpUrl(api_url)